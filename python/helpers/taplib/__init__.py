@@ -1,5 +1,7 @@
+from .dma import BdPattern, DmaBdLimits, DmaTransfer, bd_report, minimize_bds
 from .tap import TensorAccessPattern
 from .tas import (
     TensorAccessSequence,
 )
 from .tensortiler2d import TensorTiler2D
+from .tensortilernd import TensorTilerND
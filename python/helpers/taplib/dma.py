@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+import itertools
+import math
+from typing import Sequence
+
+from .tap import TensorAccessPattern
+from .tas import TensorAccessSequence
+from .utils import canonicalize_sizes_strides
+
+
+class DmaBdLimits:
+    """
+    The limits of the buffer descriptors (BDs) of a DMA, as checked by the compiler
+    (see AIEX::verifyStridesWraps). A BD has up to 4 dimensions: d0 (innermost), d1 and d2,
+    and an iteration dimension d3. Sizes and strides are counted in address generation
+    words, except the iteration size.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        wrap_bits: int,
+        step_bits: int,
+        iter_bits: int = 6,
+        address_granularity: int = 4,
+        num_bds: int = 16,
+        max_burst_bytes: int | None = None,
+        max_repeat_count: int = 255,
+    ):
+        """
+        Args:
+            name (str): Name of the DMA, e.g. "shim".
+            wrap_bits (int): Bits of the d0 and d1 sizes.
+            step_bits (int): Bits of the strides.
+            iter_bits (int, optional): Bits of the iteration size. Defaults to 6.
+            address_granularity (int, optional): Bytes per address generation word. Defaults to 4.
+            num_bds (int, optional): Number of BDs of the DMA. Defaults to 16.
+            max_burst_bytes (int | None, optional): Longest burst to memory, for DMAs accessing external memory. Defaults to None.
+            max_repeat_count (int, optional): Largest repeat count of a task. Defaults to 255.
+        """
+        self.name = name
+        self.max_wrap = (1 << wrap_bits) - 1
+        self.max_step = 1 << step_bits
+        self.max_iter = 1 << iter_bits
+        self.address_granularity = address_granularity
+        self.num_bds = num_bds
+        self.max_burst_bytes = max_burst_bytes
+        self.max_repeat_count = max_repeat_count
+
+    @classmethod
+    def shim_tile(cls, max_burst_bytes: int = 256) -> DmaBdLimits:
+        """The limits of a shim NOC tile DMA (512 byte bursts on NPU2)."""
+        return cls("shim", 10, 20, max_burst_bytes=max_burst_bytes)
+
+    @classmethod
+    def mem_tile(cls) -> DmaBdLimits:
+        """The limits of a mem tile DMA."""
+        return cls("memtile", 10, 17, num_bds=48)
+
+    @classmethod
+    def core_tile(cls) -> DmaBdLimits:
+        """The limits of a core tile DMA."""
+        return cls("core", 8, 13)
+
+    @classmethod
+    def from_target_model(cls, target_model, col: int, row: int) -> DmaBdLimits:
+        """
+        The limits of the DMA of a tile, from the target model bindings
+        (e.g. aie.dialects.aie.get_target_model(device)).
+
+        Raises:
+            ValueError: The tile has no supported DMA
+        """
+        if target_model.is_shim_noc_tile(col, row):
+            limits = cls.shim_tile()
+        elif target_model.is_mem_tile(col, row):
+            limits = cls.mem_tile()
+        elif target_model.is_core_tile(col, row):
+            limits = cls.core_tile()
+        else:
+            raise ValueError(
+                f"Unsupported tile type at ({col}, {row}); must be ShimNOC, Mem or Core"
+            )
+        limits.num_bds = target_model.get_num_bds(col, row)
+        return limits
+
+    def violations(
+        self, sizes: Sequence[int], strides: Sequence[int], elem_bytes: int = 4
+    ) -> list[str]:
+        """
+        Check whether a pattern can be expressed by one BD.
+
+        Args:
+            sizes (Sequence[int]): Sizes of the pattern, outermost first, at most 4
+            strides (Sequence[int]): Strides of the pattern in elements
+            elem_bytes (int, optional): Bytes per element. Defaults to 4.
+
+        Returns:
+            list[str]: Descriptions of the violated limits; empty if the BD is legal
+        """
+        if len(sizes) > 4:
+            return [f"{len(sizes)} dimensions exceed the 4 dimensions of a BD"]
+        # Pad to d3, d2, d1, d0
+        sizes = [1] * (4 - len(sizes)) + list(sizes)
+        strides = [0] * (4 - len(strides)) + list(strides)
+        word = self.address_granularity
+        errors = []
+        if sizes[3] * elem_bytes % word != 0:
+            errors.append(
+                f"Transfer size {sizes[3] * elem_bytes} bytes is not a multiple of {word} bytes"
+            )
+        if sizes[3] > 1 and strides[3] != 1:
+            if elem_bytes != word or strides[3] < 1:
+                errors.append(f"Stride 0 must be 1 for {elem_bytes} byte elements")
+            elif strides[3] > self.max_step:
+                errors.append(f"Stride 0 exceeds the [1:{self.max_step}] range")
+        if sizes[3] * elem_bytes // word > self.max_wrap:
+            errors.append(f"Size 0 exceeds the [0:{self.max_wrap}] range")
+        if sizes[2] > self.max_wrap:
+            errors.append(f"Size 1 exceeds the [0:{self.max_wrap}] range")
+        if sizes[0] > self.max_iter:
+            errors.append(f"Size 3 exceeds the [1:{self.max_iter}] range")
+        for d, i in ((1, 2), (2, 1), (3, 0)):
+            if sizes[i] == 1:
+                continue
+            if strides[i] < 1 and not (d == 3 and strides[i] == 0):
+                errors.append(f"Stride {d} must be a positive integer")
+            elif strides[i] * elem_bytes % word != 0:
+                errors.append(
+                    f"Stride {d} is {strides[i] * elem_bytes} bytes, which is not divisible by {word}"
+                )
+            elif strides[i] * elem_bytes // word > self.max_step:
+                errors.append(f"Stride {d} exceeds the [1:{self.max_step}] range")
+        return errors
+
+    def __str__(self) -> str:
+        return f"DmaBdLimits({self.name})"
+
+
+class BdPattern:
+    """
+    The access pattern of one BD: up to 4 sizes and strides (in elements, outermost first),
+    an offset, and the number of times the BD is repeated after the first run.
+    """
+
+    def __init__(
+        self,
+        offset: int,
+        sizes: Sequence[int],
+        strides: Sequence[int],
+        repeat_count: int = 0,
+    ):
+        self.offset = offset
+        self.sizes = list(sizes)
+        self.strides = list(strides)
+        self.repeat_count = repeat_count
+
+    def to_tap(self, tensor_dims: Sequence[int]) -> TensorAccessPattern:
+        """
+        The TensorAccessPattern of the BD, including its repeats.
+
+        Args:
+            tensor_dims (Sequence[int]): Dimensions of the tensor
+
+        Returns:
+            TensorAccessPattern: The access pattern
+        """
+        sizes, strides = self.sizes, self.strides
+        if self.repeat_count > 0:
+            sizes = [self.repeat_count + 1] + sizes
+            strides = [0] + strides
+        return TensorAccessPattern(tensor_dims, self.offset, sizes, strides)
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return (
+                self.offset == other.offset
+                and self.sizes == other.sizes
+                and self.strides == other.strides
+                and self.repeat_count == other.repeat_count
+            )
+        return False
+
+    def __str__(self) -> str:
+        return f"BdPattern(offset={self.offset}, sizes={self.sizes}, strides={self.strides}, repeat_count={self.repeat_count})"
+
+    __repr__ = __str__
+
+
+class DmaTransfer:
+    """
+    The BDs implementing one transfer: one TensorAccessPattern of a TensorAccessSequence,
+    or consecutive patterns folded together.
+    """
+
+    def __init__(
+        self,
+        taps: Sequence[TensorAccessPattern],
+        bds: Sequence[BdPattern],
+        elem_bytes: int,
+        contiguous_elems: int,
+        limits: DmaBdLimits,
+    ):
+        self.taps = list(taps)
+        self.bds = list(bds)
+        self.elem_bytes = elem_bytes
+        self._contiguous_elems = contiguous_elems
+        self._limits = limits
+
+    @property
+    def num_bds(self) -> int:
+        """Number of BDs (descriptors) of the transfer"""
+        return len(self.bds)
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes transferred, including repeats"""
+        return self.elem_bytes * sum(
+            math.prod(bd.sizes) * (bd.repeat_count + 1) for bd in self.bds
+        )
+
+    @property
+    def contiguous_bytes(self) -> int:
+        """Bytes accessed contiguously by the innermost dimension"""
+        return self._contiguous_elems * self.elem_bytes
+
+    @property
+    def burst_bytes(self) -> int:
+        """Estimated burst size: the contiguous bytes, up to the longest burst of the DMA"""
+        if self._limits.max_burst_bytes is None:
+            return self.contiguous_bytes
+        return min(self.contiguous_bytes, self._limits.max_burst_bytes)
+
+    def __str__(self) -> str:
+        return f"DmaTransfer({len(self.taps)} taps, {self.num_bds} BDs, {self.total_bytes} bytes, burst {self.burst_bytes} bytes)"
+
+
+def _largest_divisor(n: int, limit: int, multiple_of: int = 1) -> int:
+    # The largest divisor of n that is at most limit and a multiple of multiple_of, or 0
+    for d in range(min(n, limit), 0, -1):
+        if n % d == 0 and d % multiple_of == 0:
+            return d
+    return 0
+
+
+def _stride_ok(stride: int, elem_bytes: int, limits: DmaBdLimits) -> bool:
+    word = limits.address_granularity
+    return (
+        stride >= 1
+        and stride * elem_bytes % word == 0
+        and stride * elem_bytes // word <= limits.max_step
+    )
+
+
+def _split_runs(
+    offset: int, dims: list[tuple[int, int]], chunk: int
+) -> list[BdPattern]:
+    # Contiguous runs with no even split into d0 transfers: every run is one BD of full
+    # transfers and one BD of the remainder
+    size = dims[-1][0]
+    count, rest = divmod(size, chunk)
+    bds = []
+    for idx in itertools.product(*[range(s) for s, _ in dims[:-1]]):
+        run_offset = offset + sum(i * t for i, (_, t) in zip(idx, dims))
+        bds.append(BdPattern(run_offset, [count, 1, chunk], [chunk, chunk, 1]))
+        if rest:
+            bds.append(BdPattern(run_offset + count * chunk, [rest], [1]))
+    return bds
+
+
+def _map_to_bds(
+    offset: int,
+    sizes: list[int],
+    strides: list[int],
+    elem_bytes: int,
+    limits: DmaBdLimits,
+) -> list[BdPattern]:
+    # Greedily maps a canonical pattern to BDs: the innermost dimensions are split to fit the
+    # BD dimensions, and the dimensions that do not fit are enumerated as separate BDs, except
+    # for outer repeats (stride 0), which become the repeat count.
+    word = limits.address_granularity
+    dims = list(zip(sizes, strides))
+    # The outermost repeats are not mapped to a BD dimension: the lowering turns a stride 0
+    # iteration dimension into the repeat count, so a BD can not have both
+    outer = []
+    while len(dims) > 1 and dims[0][1] == 0:
+        outer.append(dims.pop(0))
+    hw = []  # BD dimensions, innermost first
+    while dims and len(hw) < 4:
+        size, stride = dims[-1]
+        p = len(hw)
+        if p == 0:
+            if size == 1:
+                # A single access, e.g. the canonical [1]/[0]
+                stride = 1
+            if stride != 1 and (
+                elem_bytes != word or not _stride_ok(stride, 4, limits)
+            ):
+                raise ValueError(
+                    f"The innermost dimension (size {size}, stride {stride}) of {elem_bytes} byte elements can not be transferred by a DMA"
+                )
+            align = word // math.gcd(word, elem_bytes)
+            limit = limits.max_wrap * word // elem_bytes
+        elif p == 3:
+            if stride != 0 and not _stride_ok(stride, elem_bytes, limits):
+                break
+            align, limit = 1, limits.max_iter
+        else:
+            if stride == 0:
+                # Only the iteration dimension repeats; pad the dimensions in between
+                hw.append((1, 0))
+                continue
+            if not _stride_ok(stride, elem_bytes, limits):
+                break
+            align, limit = 1, (limits.max_wrap if p == 1 else size)
+        if size > limit:
+            inner = _largest_divisor(size, limit, align)
+            if inner <= 1 and p == 0:
+                if stride != 1 or size % align != 0:
+                    raise ValueError(
+                        f"The innermost dimension (size {size}) can not be split into legal BD transfers"
+                    )
+                return _split_runs(offset, dims, limit - limit % align)
+            if inner <= 1:
+                break
+            dims[-1] = (size // inner, stride * inner)
+            size = inner
+        else:
+            dims.pop()
+        if p == 0 and size % align != 0:
+            raise ValueError(
+                f"Transfers of {size} elements of {elem_bytes} bytes are not multiples of {word} bytes"
+            )
+        hw.append((size, stride))
+
+    hw_sizes = [s for s, _ in reversed(hw)]
+    hw_strides = [t for _, t in reversed(hw)]
+    # Outer repeats become the repeat count of the BDs, but only if nothing else is
+    # enumerated: each BD replays its own accesses, so repeating a BD of an enumerated
+    # dimension would reorder the accesses
+    repeats = 1
+    if outer and not dims:
+        total = math.prod(s for s, _ in outer)
+        repeats = _largest_divisor(total, limits.max_repeat_count + 1)
+        dims = [(total // repeats, 0)]
+    else:
+        dims = outer + dims
+    bds = []
+    for idx in itertools.product(*[range(s) for s, _ in dims]):
+        bd_offset = offset + sum(i * t for i, (_, t) in zip(idx, dims))
+        bds.append(BdPattern(bd_offset, hw_sizes, hw_strides, repeats - 1))
+    return bds
+
+
+def _canonical_dims(
+    tap: TensorAccessPattern, allow_reorder: bool
+) -> tuple[int, list[int], list[int]]:
+    if tap._wraps():
+        raise ValueError(f"{tap} wraps around the tensor; it can not be a DMA transfer")
+    offset, sizes, strides = canonicalize_sizes_strides(
+        tap.offset, tap.sizes, tap.strides
+    )
+    if allow_reorder:
+        # The smallest strides innermost give the longest contiguous runs; repeats go outermost
+        order = sorted(range(len(sizes)), key=lambda i: (strides[i] != 0, -strides[i]))
+        offset, sizes, strides = canonicalize_sizes_strides(
+            offset, [sizes[i] for i in order], [strides[i] for i in order]
+        )
+    return offset, sizes, strides
+
+
+def _fold(patterns: list[tuple[int, list[int], list[int]]]):
+    # Folds consecutive canonical patterns with the same sizes and strides and a constant
+    # offset step into one pattern with an outer dimension
+    _, sizes, strides = patterns[0]
+    if any(p[1] != sizes or p[2] != strides for p in patterns):
+        return None
+    step = patterns[1][0] - patterns[0][0] if len(patterns) > 1 else 0
+    if step < 0 or any(
+        b[0] - a[0] != step for a, b in zip(patterns[:-1], patterns[1:])
+    ):
+        return None
+    return canonicalize_sizes_strides(
+        patterns[0][0], [len(patterns)] + sizes, [step] + strides
+    )
+
+
+def minimize_bds(
+    tas: TensorAccessSequence | Sequence[TensorAccessPattern],
+    limits: DmaBdLimits,
+    elem_bytes: int = 4,
+    allow_reorder: bool = False,
+    merge_transfers: bool = False,
+) -> list[DmaTransfer]:
+    """
+    Express the TensorAccessPatterns of a sequence with few hardware-legal BDs.
+
+    Each pattern is put in canonical form (merging dimensions that iterate as one), then its
+    innermost dimensions are folded into the 4 BD dimensions, splitting dimensions that exceed the
+    size limits. Dimensions that still do not fit are enumerated as separate BDs, except outer
+    repeats, which become repeat counts.
+
+    Args:
+        tas (TensorAccessSequence | Sequence[TensorAccessPattern]): The access patterns, e.g. from TensorTiler2D.
+        limits (DmaBdLimits): The limits of the DMA.
+        elem_bytes (int, optional): Bytes per element of the tensor. Defaults to 4.
+        allow_reorder (bool, optional): Reorder the dimensions of each pattern to access the longest contiguous runs.
+            This changes the order of the accessed elements, so it is only valid for transfers where the
+            order does not matter. Defaults to False.
+        merge_transfers (bool, optional): Fold consecutive patterns that differ only by a constant offset into a
+            single transfer when that takes fewer BDs, e.g. for patterns issued back to back on one channel. Defaults to False.
+
+    Raises:
+        ValueError: A pattern can not be transferred by the DMA
+
+    Returns:
+        list[DmaTransfer]: The transfers, in the order of the patterns
+    """
+    taps = list(tas)
+    canonical = [_canonical_dims(t, allow_reorder) for t in taps]
+
+    def transfer(first, last):
+        offset, sizes, strides = (
+            canonical[first] if last - first == 1 else _fold(canonical[first:last])
+        )
+        bds = _map_to_bds(offset, sizes, strides, elem_bytes, limits)
+        contiguous = sizes[-1] if strides[-1] == 1 else 1
+        return DmaTransfer(taps[first:last], bds, elem_bytes, contiguous, limits)
+
+    transfers = []
+    first = 0
+    while first < len(taps):
+        last = first + 1
+        if merge_transfers:
+            # Extend the group while folding keeps reducing the number of BDs
+            while last < len(taps) and _fold(canonical[first : last + 1]) is not None:
+                last += 1
+            while last - first > 1:
+                folded = transfer(first, last)
+                separate = sum(transfer(i, i + 1).num_bds for i in range(first, last))
+                if folded.num_bds < separate:
+                    break
+                last -= 1
+        transfers.append(transfer(first, last))
+        first = last
+    return transfers
+
+
+def bd_report(transfers: Sequence[DmaTransfer]) -> str:
+    """
+    A table with the number of BDs, the bytes and the estimated burst size of each transfer.
+
+    Args:
+        transfers (Sequence[DmaTransfer]): The transfers, from minimize_bds
+
+    Returns:
+        str: The report
+    """
+    lines = [f"{'transfer':>8} {'taps':>5} {'BDs':>5} {'bytes':>10} {'burst':>6}"]
+    for i, t in enumerate(transfers):
+        lines.append(
+            f"{i:>8} {len(t.taps):>5} {t.num_bds:>5} {t.total_bytes:>10} {t.burst_bytes:>6}"
+        )
+    lines.append(
+        f"{'total':>8} {sum(len(t.taps) for t in transfers):>5} "
+        f"{sum(t.num_bds for t in transfers):>5} {sum(t.total_bytes for t in transfers):>10}"
+    )
+    return "\n".join(lines)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from copy import deepcopy
+import math
 import numpy as np
 import itertools
 from typing import Sequence, Generator
 
 from .utils import (
+    canonicalize_sizes_strides,
     validate_and_clean_sizes_strides,
     validate_offset,
     validate_tensor_dims,
@@ -20,6 +22,8 @@ class TensorAccessPattern:
     """
 
     _DTYPE = np.int32
+    # Maximum number of access indices computed at once
+    _CHUNK_SIZE = 1 << 20
 
     def __init__(
         self,
@@ -139,42 +143,115 @@ class TensorAccessPattern:
         self, calc_order: bool, calc_count: bool
     ) -> tuple[np.ndarray, np.ndarray]:
         # This is an internal method for calculating both the access_order and access_count
-        # arrays. If needed, it will create both at once to avoid looping through the tensor
-        # more than necessary.
+        # arrays. The arrays are cached, so copies are returned.
+        access_order_tensor, access_count_tensor = self._cached_accesses(
+            calc_order, calc_count
+        )
+        if calc_order:
+            access_order_tensor = access_order_tensor.reshape(self._tensor_dims).copy()
+        if calc_count:
+            access_count_tensor = access_count_tensor.reshape(self._tensor_dims).copy()
+        return access_order_tensor, access_count_tensor
 
-        # TODO: should access order be a list of lists instead of generate two separate tensors?
-        # TODO: for performance, should cache and return copies? Or just cache?
+    def _cached_accesses(
+        self, calc_order: bool, calc_count: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Returns the flat access_order and access_count arrays, computing the missing
+        # ones. The arrays are shared with the cache and must not be modified.
         if not calc_order and not calc_count:
             raise ValueError("Must select calc_order, calc_count, or both")
 
+        # The cache is keyed by the pattern, so it is invalidated if the pattern changes
+        key = (
+            tuple(self._tensor_dims),
+            self._offset,
+            tuple(self._sizes),
+            tuple(self._strides),
+        )
+        cache = getattr(self, "_access_cache", None)
+        if cache is None or cache[0] != key:
+            cache = [key, None, None]
+            self._access_cache = cache
+        calc_order = calc_order and cache[1] is None
+        calc_count = calc_count and cache[2] is None
+        if not calc_order and not calc_count:
+            return cache[1], cache[2]
+
         # Initialize access order and count maps; we create them as flat arrays
-        total_elems = np.prod(self._tensor_dims)
-        access_order_tensor = None
+        total_elems = int(np.prod(self._tensor_dims))
         if calc_order:
             access_order_tensor = np.full(total_elems, -1, dtype=self._DTYPE)
             access_count = 0
-        access_count_tensor = None
         if calc_count:
-            access_count_tensor = np.full(total_elems, 0, dtype=self._DTYPE)
-
-        # Get an iterator for the access indices
-        access_idx_generator = self.access_generator()
+            access_count_tensor = np.zeros(total_elems, dtype=self._DTYPE)
 
-        for access_idx in access_idx_generator:
+        for access_idx in self._access_chunks():
             # Count the accesses
             if calc_count:
-                access_count_tensor[access_idx] += 1
-            # Enumerate the accesses
+                access_count_tensor += np.bincount(
+                    access_idx, minlength=total_elems
+                ).astype(self._DTYPE)
+            # Enumerate the accesses; the sequence numbers increase, so taking the
+            # maximum keeps the last access to each element
             if calc_order:
-                access_order_tensor[access_idx] = access_count
-                access_count += 1
+                np.maximum.at(
+                    access_order_tensor,
+                    access_idx,
+                    np.arange(
+                        access_count,
+                        access_count + len(access_idx),
+                        dtype=self._DTYPE,
+                    ),
+                )
+                access_count += len(access_idx)
 
-        # Reshape to match tensor type since we created them initially as flat arrays
         if calc_order:
-            access_order_tensor = access_order_tensor.reshape(self._tensor_dims)
+            cache[1] = access_order_tensor
         if calc_count:
-            access_count_tensor = access_count_tensor.reshape(self._tensor_dims)
-        return access_order_tensor, access_count_tensor
+            cache[2] = access_count_tensor
+        return cache[1], cache[2]
+
+    def _access_chunks(self) -> Generator[np.ndarray, None, None]:
+        # Yields the access indices into the flattened tensor, in order, as arrays of
+        # at most _CHUNK_SIZE elements (or the size of the last dimension, if larger).
+        # The indices of the innermost dimensions are computed once with broadcasted
+        # index arithmetic, and offset for blocks of indices of the next dimension so
+        # that chunks stay large even if the innermost dimensions are small.
+        total_elems = int(np.prod(self._tensor_dims))
+        num_inner = len(self._sizes) - 1
+        inner_elems = self._sizes[-1]
+        while (
+            num_inner > 0
+            and inner_elems * self._sizes[num_inner - 1] <= self._CHUNK_SIZE
+        ):
+            num_inner -= 1
+            inner_elems *= self._sizes[num_inner]
+
+        inner_idx = np.zeros((), dtype=np.int64)
+        for size, stride in zip(self._sizes[num_inner:], self._strides[num_inner:]):
+            inner_idx = np.add.outer(
+                inner_idx, np.arange(size, dtype=np.int64) * stride
+            )
+        inner_idx = inner_idx.reshape(-1)
+        if num_inner == 0:
+            yield (self._offset + inner_idx) % total_elems
+            return
+
+        # The dimension outside the innermost ones is split into blocks of indices
+        block_dim = num_inner - 1
+        block_size = self._sizes[block_dim]
+        block_stride = self._strides[block_dim]
+        block_len = max(1, self._CHUNK_SIZE // inner_elems)
+        outer_strides = self._strides[:block_dim]
+        for dims in itertools.product(*[range(0, n) for n in self._sizes[:block_dim]]):
+            base = self._offset + sum(d * s for d, s in zip(dims, outer_strides))
+            for start in range(0, block_size, block_len):
+                block_idx = (
+                    np.arange(start, min(start + block_len, block_size), dtype=np.int64)
+                    * block_stride
+                )
+                access_idx = np.add.outer(block_idx, inner_idx).reshape(-1)
+                yield (base + access_idx) % total_elems
 
     def access_generator(self) -> Generator[int, None, None]:
         """This function returns an iterator that returns the access index
@@ -184,21 +261,85 @@ class TensorAccessPattern:
         Yields:
             int: The next access index
         """
-        total_elems = np.prod(self._tensor_dims)
+        for access_idx in self._access_chunks():
+            yield from access_idx.tolist()
 
-        # Use itertools.product to collapse len(sizes) nested forloop into one forloop
-        for dims in itertools.product(*[range(0, n) for n in self._sizes]):
-            yield (
-                self._offset + np.sum(np.multiply(dims, self._strides))
-            ) % total_elems
+    def canonical_form(self) -> tuple[int, list[int], list[int]]:
+        """
+        The canonical (offset, sizes, strides) of the access pattern: dimensions of
+        size 1 are dropped, adjacent dimensions iterating as one are merged, and the offset
+        and strides are reduced modulo the number of elements of the tensor.
+
+        Access patterns into tensors with the same number of elements access the same
+        indices in the same order if and only if their canonical forms are equal.
+
+        Returns:
+            tuple[int, list[int], list[int]]: canonical offset, sizes, strides
+        """
+        return canonicalize_sizes_strides(
+            self._offset, self._sizes, self._strides, int(np.prod(self._tensor_dims))
+        )
+
+    def _wraps(self) -> bool:
+        # Whether some access index exceeds the tensor and wraps around to its start
+        last_idx = self._offset + sum(
+            (size - 1) * stride for size, stride in zip(self._sizes, self._strides)
+        )
+        return last_idx >= np.prod(self._tensor_dims)
+
+    def _box(self) -> list[tuple[int, int, int]] | None:
+        # The accessed elements as a cartesian product of one arithmetic progression
+        # (start, step, count) per tensor dimension, or None if they are not one.
+        if self._wraps():
+            return None
+        offset, sizes, strides = canonicalize_sizes_strides(
+            self._offset, self._sizes, self._strides
+        )
+        dims = self._tensor_dims
+        row_strides = [int(np.prod(dims[d + 1 :])) for d in range(len(dims))]
+        box = [(int(c), 1, 1) for c in np.unravel_index(offset, dims)]
+        for size, stride in zip(sizes, strides):
+            # Repeated accesses (stride 0) do not change the accessed elements
+            while size > 1 and stride > 0:
+                d = next(
+                    (
+                        d
+                        for d in range(len(dims))
+                        if dims[d] > 1 and stride >= row_strides[d]
+                    ),
+                    None,
+                )
+                if d is None or stride % row_strides[d] != 0 or box[d][2] > 1:
+                    return None
+                start, step = box[d][0], stride // row_strides[d]
+                if start + (size - 1) * step < dims[d]:
+                    box[d] = (start, step, size)
+                    break
+                # A dimension running over whole rows of tensor dimension d (e.g. after
+                # merging) continues in the next outer tensor dimension
+                if start != 0 or step != 1 or size % dims[d] != 0:
+                    return None
+                box[d] = (0, 1, dims[d])
+                size //= dims[d]
+                stride *= dims[d]
+        return box
+
+    def _check_same_tensor(self, other: TensorAccessPattern):
+        if not isinstance(other, TensorAccessPattern):
+            raise ValueError("Can only compare against another TensorAccessPattern")
+        if self._tensor_dims != other._tensor_dims:
+            raise ValueError(
+                f"TensorAccessPatterns have different tensor dimensions ({self._tensor_dims} and {other._tensor_dims})"
+            )
 
     def compare_access_orders(self, other: TensorAccessPattern) -> bool:
         """
         This function creates an alternative way to compare access patterns.
         Sometimes access patterns with different sizes/strides are functionally equivalent;
-        to detect functional equivalency, this function uses iterators produced by
-        access_generator() to compare the access patterns. This is more performant than
-        comparing the numpy array access_order or access_count tensors.
+        to detect functional equivalency, this function compares the canonical forms of the
+        access patterns (see canonical_form()), without enumerating the accesses. Only
+        patterns into tensors of different sizes, with accesses that wrap around the tensor,
+        are compared access by access.
 
         Args:
             other (TensorAccessPattern): The TensorAccessPattern to compare to
@@ -209,12 +350,17 @@ class TensorAccessPattern:
         Returns:
             bool: True if the TensorAccessPatterns are functionally equivalent; false otherwise.
         """
-        # This function compares using access generators, which is more performant
-        # than actually generating the access order or access count tensors.
         if not isinstance(other, TensorAccessPattern):
             raise ValueError(
                 "Can only compare access order against another TensorAccessPattern"
             )
+        if np.prod(self._tensor_dims) == np.prod(other._tensor_dims):
+            return self.canonical_form() == other.canonical_form()
+        if not self._wraps() and not other._wraps():
+            return canonicalize_sizes_strides(
+                self._offset, self._sizes, self._strides
+            ) == canonicalize_sizes_strides(other._offset, other._sizes, other._strides)
+
         my_generator = self.access_generator()
         other_generator = other.access_generator()
         return all(
@@ -224,6 +370,76 @@ class TensorAccessPattern:
             )
         )
 
+    def contains(self, other: TensorAccessPattern) -> bool:
+        """
+        Whether every element accessed by other is also accessed by this access pattern.
+        This is decided from the sizes and strides when the accessed elements of both patterns
+        form boxes (e.g. strided tiles) in the tensor, and from the access counts otherwise.
+
+        Args:
+            other (TensorAccessPattern): An access pattern into the same tensor
+
+        Raises:
+            ValueError: other must be a TensorAccessPattern into a tensor of the same dimensions
+
+        Returns:
+            bool: True if other accesses a subset of the elements accessed by self
+        """
+        self._check_same_tensor(other)
+        my_box, other_box = self._box(), other._box()
+        if my_box is not None and other_box is not None:
+            return all(
+                _progression_contains(mine, theirs)
+                for mine, theirs in zip(my_box, other_box)
+            )
+        _, my_count = self._cached_accesses(calc_order=False, calc_count=True)
+        _, other_count = other._cached_accesses(calc_order=False, calc_count=True)
+        return not np.any((other_count > 0) & (my_count == 0))
+
+    def overlaps(self, other: TensorAccessPattern) -> bool:
+        """
+        Whether some element is accessed by both access patterns.
+        This is decided from the sizes and strides when the accessed elements of both patterns
+        form boxes (e.g. strided tiles) in the tensor, or when their index ranges are disjoint,
+        and from the access counts otherwise.
+
+        Args:
+            other (TensorAccessPattern): An access pattern into the same tensor
+
+        Raises:
+            ValueError: other must be a TensorAccessPattern into a tensor of the same dimensions
+
+        Returns:
+            bool: True if the access patterns access a common element
+        """
+        self._check_same_tensor(other)
+        my_box, other_box = self._box(), other._box()
+        if my_box is not None and other_box is not None:
+            return all(
+                _progressions_intersect(mine, theirs)
+                for mine, theirs in zip(my_box, other_box)
+            )
+        if not self._wraps() and not other._wraps():
+            my_last = self._offset + sum(
+                (size - 1) * stride for size, stride in zip(self._sizes, self._strides)
+            )
+            other_last = other._offset + sum(
+                (size - 1) * stride
+                for size, stride in zip(other._sizes, other._strides)
+            )
+            if my_last < other._offset or other_last < self._offset:
+                return False
+        _, my_count = self._cached_accesses(calc_order=False, calc_count=True)
+        _, other_count = other._cached_accesses(calc_order=False, calc_count=True)
+        return bool(np.any((my_count > 0) & (other_count > 0)))
+
+    def _num_accessed_elements(self) -> int | None:
+        # The number of distinct elements accessed, if the pattern is a box
+        box = self._box()
+        if box is None:
+            return None
+        return math.prod(count for _, _, count in box)
+
     def visualize(
         self,
         show_arrows: bool | None = None,
@@ -282,3 +498,40 @@ class TensorAccessPattern:
 
     def __ne__(self, other):
         return not self.__eq__(other)
+
+
+def _progression_bounds(p: tuple[int, int, int]) -> tuple[int, int, int]:
+    # The first and last element and the modulus of an arithmetic progression
+    start, step, count = p
+    return start, start + (count - 1) * step, step if count > 1 else 1
+
+
+def _progression_contains(p: tuple[int, int, int], q: tuple[int, int, int]) -> bool:
+    # Whether the progression (start, step, count) p contains the progression q
+    p_first, p_last, p_mod = _progression_bounds(p)
+    q_first, q_last, q_mod = _progression_bounds(q)
+    return (
+        p_first <= q_first
+        and q_last <= p_last
+        and (q_first - p_first) % p_mod == 0
+        and (q_mod % p_mod == 0 or q_first == q_last)
+    )
+
+
+def _progressions_intersect(p: tuple[int, int, int], q: tuple[int, int, int]) -> bool:
+    # Whether the progressions (start, step, count) p and q have a common element
+    p_first, p_last, p_mod = _progression_bounds(p)
+    q_first, q_last, q_mod = _progression_bounds(q)
+    low, high = max(p_first, q_first), min(p_last, q_last)
+    if low > high:
+        return False
+    # Solve x = p_first (mod p_mod), x = q_first (mod q_mod)
+    g = math.gcd(p_mod, q_mod)
+    if (q_first - p_first) % g != 0:
+        return False
+    lcm = p_mod // g * q_mod
+    k = (q_first - p_first) // g * pow(p_mod // g, -1, q_mod // g) % (q_mod // g)
+    x = p_first + k * p_mod
+    # The smallest solution that is at least low
+    x += -((x - low) // lcm) * lcm
+    return x <= high
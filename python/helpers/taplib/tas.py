@@ -206,10 +206,11 @@ class TensorAccessSequence(abc.MutableSequence, abc.Iterable):
         # arrays. If needed, it will create both at once to avoid looping through the tensor
         # more than necessary.
 
-        # TODO: this function is not particularly efficient, and could be improved.
         if not calc_order and not calc_count:
             raise ValueError("Must select calc_order, calc_count, or both")
 
+        # The per-pattern arrays come from the cache of each TensorAccessPattern,
+        # so they are aggregated without copying or recomputing them.
         total_elems = np.prod(self._tensor_dims)
         combined_access_order_tensor = None
         combined_access_count_tensor = None
@@ -217,30 +218,38 @@ class TensorAccessSequence(abc.MutableSequence, abc.Iterable):
         if calc_order:
             combined_access_order_tensor = np.full(
                 total_elems, 0, TensorAccessPattern._DTYPE
-            ).reshape(self._tensor_dims)
+            )
             highest_count = 0
         if calc_count:
             combined_access_count_tensor = np.full(
                 total_elems, 0, TensorAccessPattern._DTYPE
-            ).reshape(self._tensor_dims)
+            )
         for t in self._taps:
-            if calc_order and calc_count:
-                t_access_order, t_access_count = t.accesses()
-            elif calc_order:
-                t_access_order = t.access_order()
-            else:
-                t_access_count = t.access_count()
+            t_access_order, t_access_count = t._cached_accesses(calc_order, calc_count)
 
             if calc_order:
-                t_access_order[t_access_order != -1] += 1 + highest_count
-                t_access_order[t_access_order == -1] = 0
-                combined_access_order_tensor += t_access_order
-                highest_count = np.max(combined_access_order_tensor)
+                accessed = t_access_order != -1
+                combined_access_order_tensor[accessed] += (
+                    t_access_order[accessed] + 1 + highest_count
+                )
+                # Only accessed elements increased, so the maximum is among them
+                if accessed.any():
+                    highest_count = max(
+                        highest_count,
+                        int(combined_access_order_tensor[accessed].max()),
+                    )
             if calc_count:
                 combined_access_count_tensor += t_access_count
 
         if calc_order:
             combined_access_order_tensor -= 1
+            combined_access_order_tensor = combined_access_order_tensor.reshape(
+                self._tensor_dims
+            )
+        if calc_count:
+            combined_access_count_tensor = combined_access_count_tensor.reshape(
+                self._tensor_dims
+            )
         return (combined_access_order_tensor, combined_access_count_tensor)
 
     def animate(self, title: str | None = None, animate_access_count: bool = False):
@@ -343,10 +352,10 @@ class TensorAccessSequence(abc.MutableSequence, abc.Iterable):
         """
         This function creates an alternative way to compare access pattern sequences.
         Sometimes access patterns with different sizes/strides are functionally equivalent;
-        to detect functional equivalency, this function uses iterators produced by
-        access_generator() to compare the access patterns. This is more performant than
-        comparing the numpy array access_order or access_count tensors, particularly
-        when comparing sequences containing multiple tensor access patterns.
+        to detect functional equivalency, this function compares the access patterns pairwise
+        with TensorAccessPattern.compare_access_orders(), which compares their canonical forms.
+        This is more performant than comparing the numpy array access_order or access_count
+        tensors, particularly when comparing sequences containing multiple tensor access patterns.
 
         Args:
             other (TensorAccessSequence): The TensorAccessSequence to compare to
@@ -361,6 +370,50 @@ class TensorAccessSequence(abc.MutableSequence, abc.Iterable):
                 return False
         return True
 
+    def covers(self) -> bool:
+        """
+        Whether every element of the tensor is accessed by some TensorAccessPattern in the sequence.
+        When the accessed elements of every pattern form a box (e.g. a strided tile) and the boxes
+        do not overlap, this is decided from the sizes and strides, without enumerating the accesses.
+
+        Returns:
+            bool: True if the sequence covers the tensor
+        """
+        total_elems = np.prod(self._tensor_dims)
+        if self._find_overlaps(enumerate_accesses=False) is False:
+            num_accessed = [t._num_accessed_elements() for t in self._taps]
+            if all(n is not None for n in num_accessed):
+                return sum(num_accessed) == total_elems
+        accessed = np.zeros(total_elems, dtype=bool)
+        for t in self._taps:
+            _, t_access_count = t._cached_accesses(calc_order=False, calc_count=True)
+            accessed |= t_access_count > 0
+        return bool(accessed.all())
+
+    def has_overlaps(self) -> bool:
+        """
+        Whether some element of the tensor is accessed by more than one TensorAccessPattern in
+        the sequence, e.g. two tiles writing the same element. Pairs of patterns are compared with
+        TensorAccessPattern.overlaps(), which decides most cases from the sizes and strides.
+
+        Returns:
+            bool: True if some patterns overlap
+        """
+        return self._find_overlaps(enumerate_accesses=True)
+
+    def _find_overlaps(self, enumerate_accesses: bool) -> bool | None:
+        # Without enumerate_accesses, pairs of patterns that are not both boxes are not
+        # compared, and None is returned if no other pair overlaps.
+        boxes = [t._box() for t in self._taps]
+        undecided = False
+        for i in range(len(self._taps)):
+            for j in range(i + 1, len(self._taps)):
+                if not enumerate_accesses and (boxes[i] is None or boxes[j] is None):
+                    undecided = True
+                elif self._taps[i].overlaps(self._taps[j]):
+                    return True
+        return None if undecided else False
+
     def __contains__(self, tap: TensorAccessPattern):
         return tap in self._taps
 
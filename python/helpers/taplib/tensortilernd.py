@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import itertools
+import math
+from typing import Sequence
+
+from .dma import DmaBdLimits, minimize_bds
+from .tap import TensorAccessPattern
+from .tas import TensorAccessSequence
+from .utils import ceildiv, canonicalize_sizes_strides, validate_tensor_dims
+
+
+class TensorTilerND:
+    """
+    This is a generator (similar to factory pattern) class which produces TensorAccessSequences
+    for tiling patterns of tensors of any number of dimensions. It generalizes the TensorTiler2D;
+    instead of row/column major flags, the iteration order of each level is given as a permutation of
+    the tensor dimensions, outermost first (row major is (0, 1, ..., n - 1)).
+    """
+
+    # Dimensions of the sizes and strides of a DMA transfer
+    _MAX_DIMS = 4
+
+    def __init__(self):
+        raise Exception(
+            f"{self.__class__} cannot be instantiated. Use it as a factory/generator of TensorAccessSequences."
+        )
+
+    @classmethod
+    def simple_tiler(
+        cls,
+        tensor_dims: Sequence[int],
+        tile_dims: Sequence[int] | None = None,
+        tile_dim_order: Sequence[int] | None = None,
+        iter_dim_order: Sequence[int] | None = None,
+        pattern_repeat: int = 1,
+    ) -> TensorAccessSequence:
+        """The simple_tiler is a special case of the group_tiler. The simple_tiler produces a TensorAccessSequence
+        with one TensorAccessPattern per tile.
+
+        Args:
+            tensor_dims (Sequence[int]): The dimensions of the tensor to tile.
+            tile_dims (Sequence[int] | None, optional): The dimensions of the tile. If None, the tile_dims is set equal to the tensor_dims. Defaults to None.
+            tile_dim_order (Sequence[int] | None, optional): Order of the dimensions within each tile. Defaults to row major.
+            iter_dim_order (Sequence[int] | None, optional): Order of the dimensions over tiles within the TensorAccessSequence. Defaults to row major.
+            pattern_repeat (int, optional): Access a tile n times per TensorAccessPattern. Defaults to 1.
+
+        Returns:
+            TensorAccessSequence: A TensorAccessSequence with one TensorAccessPattern per tile
+        """
+        if tile_dims is None:
+            tile_dims = tensor_dims
+        return cls.group_tiler(
+            tensor_dims=tensor_dims,
+            tile_dims=tile_dims,
+            tile_dim_order=tile_dim_order,
+            iter_dim_order=iter_dim_order,
+            pattern_repeat=pattern_repeat,
+        )
+
+    @classmethod
+    def group_tiler(
+        cls,
+        tensor_dims: Sequence[int],
+        tile_dims: Sequence[int],
+        tile_group_dims: Sequence[int] | None = None,
+        tile_dim_order: Sequence[int] | None = None,
+        tile_group_dim_order: Sequence[int] | None = None,
+        iter_dim_order: Sequence[int] | None = None,
+        pattern_repeat: int = 1,
+        allow_partial: bool = False,
+    ) -> TensorAccessSequence:
+        """The group_tiler is a special case of the step_tiler. The group_tiler produces a TensorAccessSequence
+        with a group of tiles per TensorAccessPattern in the sequence.
+
+        Args:
+            tensor_dims (Sequence[int]): The dimensions of the tensor to tile.
+            tile_dims (Sequence[int]): The dimensions of the tile (a contiguous group of elements)
+            tile_group_dims (Sequence[int] | None, optional): Dimensions of the grouping of tiles, specified by number of tiles (not elements).
+                If None, assumed to be (1, ..., 1). Defaults to None.
+            tile_dim_order (Sequence[int] | None, optional): Order of the dimensions within each tile. Defaults to row major.
+            tile_group_dim_order (Sequence[int] | None, optional): Order of the dimensions between tiles in a group. Defaults to row major.
+            iter_dim_order (Sequence[int] | None, optional): Order of the dimensions over groups within the TensorAccessSequence. Defaults to row major.
+            pattern_repeat (int, optional): Apply a pattern n times within a single TensorAccessPattern. Defaults to 1.
+            allow_partial (bool, optional): If True, groups at the end of a dimension may have fewer tiles. Defaults to False.
+
+        Returns:
+            TensorAccessSequence: A TensorAccessSequence with one tile grouping per TensorAccessPattern
+        """
+        if tile_group_dims is None:
+            tile_group_dims = (1,) * len(tile_dims)
+        return cls.step_tiler(
+            tensor_dims=tensor_dims,
+            tile_dims=tile_dims,
+            tile_group_repeats=tile_group_dims,
+            tile_dim_order=tile_dim_order,
+            tile_group_dim_order=tile_group_dim_order,
+            iter_dim_order=iter_dim_order,
+            pattern_repeat=pattern_repeat,
+            allow_partial=allow_partial,
+        )
+
+    @classmethod
+    def step_tiler(
+        cls,
+        tensor_dims: Sequence[int],
+        tile_dims: Sequence[int],
+        tile_group_repeats: Sequence[int],
+        tile_group_steps: Sequence[int] | None = None,
+        tile_dim_order: Sequence[int] | None = None,
+        tile_group_dim_order: Sequence[int] | None = None,
+        iter_dim_order: Sequence[int] | None = None,
+        allow_partial: bool = False,
+        pattern_repeat: int = 1,
+    ) -> TensorAccessSequence:
+        """The step_tiler produces a TensorAccessSequence where each TensorAccessPattern accesses a group of
+        tiles, with tile_group_steps tiles between consecutive tiles of a group in each dimension.
+
+        The sizes and strides of each TensorAccessPattern are in canonical form: dimensions that iterate as one
+        are merged, so that patterns need as few dimensions as possible. Each pattern must fit in the 4 dimensions
+        of a DMA transfer (Runtime.fill/Runtime.drain); tilings that need more raise a ValueError.
+
+        Args:
+            tensor_dims (Sequence[int]): The dimensions of the tensor to tile.
+            tile_dims (Sequence[int]): The dimensions of the tile (a contiguous group of elements)
+            tile_group_repeats (Sequence[int]): Number of times a tile appears in each dimension in each TensorAccessPattern.
+            tile_group_steps (Sequence[int] | None, optional): Space between each tile repeat in each dimension, given in units of tile size. Defaults to None.
+            tile_dim_order (Sequence[int] | None, optional): Order of the dimensions within each tile. Defaults to row major.
+            tile_group_dim_order (Sequence[int] | None, optional): Order of the dimensions between tiles in a group. Defaults to row major.
+            iter_dim_order (Sequence[int] | None, optional): Order of the dimensions over groups within the TensorAccessSequence. Defaults to row major.
+            allow_partial (bool, optional): If True, groups at the end of a dimension may have fewer tiles. Defaults to False.
+            pattern_repeat (int, optional): Apply a pattern n times within a single TensorAccessPattern. Defaults to 1.
+
+        Raises:
+            ValueError: The parameters are validated
+            ValueError: If allow_partial is False, an error will be thrown if partial TensorAccessPatterns are needed to fully tile the tensor.
+            ValueError: Some patterns are not expressible in only 4 dimensions of sizes/strides
+
+        Returns:
+            TensorAccessSequence: A TensorAccessSequence with one tile grouping per TensorAccessPattern,
+                where the tile grouping may or may not be contiguous.
+        """
+        tensor_dims = validate_tensor_dims(tensor_dims)
+        num_dims = len(tensor_dims)
+        if tile_group_steps is None:
+            tile_group_steps = (1,) * num_dims
+        tile_dims = validate_tensor_dims(tile_dims, expected_dims=num_dims)
+        tile_group_repeats = validate_tensor_dims(
+            tile_group_repeats, expected_dims=num_dims
+        )
+        tile_group_steps = validate_tensor_dims(
+            tile_group_steps, expected_dims=num_dims
+        )
+        tile_dim_order = cls.__validate_order(tile_dim_order, num_dims)
+        tile_group_dim_order = cls.__validate_order(tile_group_dim_order, num_dims)
+        iter_dim_order = cls.__validate_order(iter_dim_order, num_dims)
+
+        # Check tensor is tileable by tile size
+        for i, (tensor_dim, tile_dim) in enumerate(zip(tensor_dims, tile_dims)):
+            if tensor_dim % tile_dim != 0:
+                raise ValueError(
+                    f"Tensor dimension {i} ({tensor_dim}) is not divisible by tile dim ({tile_dim})"
+                )
+        if not isinstance(pattern_repeat, int) or pattern_repeat < 1:
+            raise ValueError(f"Pattern repeat must be >= 1 but is {pattern_repeat}")
+        if not allow_partial:
+            for i, (tensor_dim, tile_dim, repeat_dim, step_dim) in enumerate(
+                zip(tensor_dims, tile_dims, tile_group_repeats, tile_group_steps)
+            ):
+                if tile_dim * repeat_dim * step_dim > tensor_dim:
+                    raise ValueError(
+                        f"Tile pattern exceeds tensor size in dimension {i} ({tile_dim}x{repeat_dim}x{step_dim} > {tensor_dim})"
+                    )
+                if tensor_dim % (tile_dim * repeat_dim * step_dim) != 0:
+                    raise ValueError(
+                        f"allow_partial={allow_partial} but tensor does not divide evenly into tile groups in dimension {i}"
+                    )
+
+        # Elements between consecutive indices of each dimension
+        dim_strides = [math.prod(tensor_dims[i + 1 :]) for i in range(num_dims)]
+        groups_per_dim = []
+        for tensor_dim, tile_dim, repeat, step in zip(
+            tensor_dims, tile_dims, tile_group_repeats, tile_group_steps
+        ):
+            groups_per_dim.append(cls.__groups(tensor_dim // tile_dim, repeat, step))
+
+        taps = []
+        for iter_idx in itertools.product(
+            *[range(len(groups_per_dim[d])) for d in iter_dim_order]
+        ):
+            group_idx = [0] * num_dims
+            for d, i in zip(iter_dim_order, iter_idx):
+                group_idx[d] = i
+            groups = [groups_per_dim[d][i] for d, i in enumerate(group_idx)]
+            offset = sum(
+                first * tile_dim * dim_stride
+                for (first, _, _), tile_dim, dim_stride in zip(
+                    groups, tile_dims, dim_strides
+                )
+            )
+            sizes, strides = [pattern_repeat], [0]
+            for d in tile_group_dim_order:
+                _, repeat, step = groups[d]
+                sizes.append(repeat)
+                strides.append(step * tile_dims[d] * dim_strides[d])
+            for d in tile_dim_order:
+                sizes.append(tile_dims[d])
+                strides.append(dim_strides[d])
+            offset, sizes, strides = canonicalize_sizes_strides(offset, sizes, strides)
+            if len(sizes) > cls._MAX_DIMS:
+                raise ValueError(
+                    f"Ran out of dimensions: the pattern needs {len(sizes)} dimensions (sizes={sizes}, strides={strides}), but a DMA transfer has {cls._MAX_DIMS}"
+                )
+            taps.append(TensorAccessPattern(tensor_dims, offset, sizes, strides))
+        return TensorAccessSequence.from_taps(taps)
+
+    @classmethod
+    def search_tile_dims(
+        cls,
+        tensor_dims: Sequence[int],
+        elem_bytes: int,
+        budget_bytes: int | None = None,
+        target_model=None,
+        memory: str = "L1",
+        num_buffers: int = 2,
+        tile_multiples: Sequence[int] | None = None,
+        max_burst_bytes: int | None = None,
+        limits: DmaBdLimits | None = None,
+    ) -> tuple[int, ...]:
+        """
+        Search the tile dimensions that divide a tensor, with the longest contiguous bursts that fit in a memory budget.
+
+        Candidate tiles divide the tensor evenly, are accessed row major and fit in 4 DMA dimensions. Among the tiles whose num_buffers
+        buffers fit in the budget, the search picks the longest contiguous run of elements (up to max_burst_bytes,
+        beyond which longer runs do not help), then the largest tile, so the fewest transfers.
+
+        Args:
+            tensor_dims (Sequence[int]): The dimensions of the tensor to tile.
+            elem_bytes (int): Bytes per element of the tensor.
+            budget_bytes (int | None, optional): Bytes available for the tile buffers. If None, the local memory size of the
+                target model is used. Defaults to None.
+            target_model (optional): Target model of the device (e.g. aie.dialects.aie.get_target_model(device)), used
+                if budget_bytes is None. Defaults to None.
+            memory (str, optional): "L1" for the data memory of a core tile (get_local_memory_size), "L2" for a mem tile
+                (get_mem_tile_size). Defaults to "L1".
+            num_buffers (int, optional): Number of tile buffers sharing the budget, e.g. 2 for double buffering. Defaults to 2.
+            tile_multiples (Sequence[int] | None, optional): Each tile dimension must be a multiple of these, e.g. the vector
+                width of a kernel. Defaults to None.
+            max_burst_bytes (int | None, optional): Longest useful burst, e.g. 256 bytes for a shim DMA. Defaults to None (no limit).
+            limits (DmaBdLimits | None, optional): If given, each tile must be transferred by a single BD of this DMA. Defaults to None.
+
+        Raises:
+            ValueError: The parameters are validated
+            ValueError: No tile fits in the budget
+
+        Returns:
+            tuple[int, ...]: The tile dimensions
+        """
+        tensor_dims = validate_tensor_dims(tensor_dims)
+        num_dims = len(tensor_dims)
+        if budget_bytes is None:
+            if target_model is None:
+                raise ValueError("Either budget_bytes or target_model must be given")
+            if memory == "L1":
+                budget_bytes = target_model.get_local_memory_size()
+            elif memory == "L2":
+                budget_bytes = target_model.get_mem_tile_size()
+            else:
+                raise ValueError(f"Memory must be 'L1' or 'L2' but is {memory}")
+        if num_buffers < 1:
+            raise ValueError(f"Number of buffers must be >= 1 but is {num_buffers}")
+        if tile_multiples is None:
+            tile_multiples = (1,) * num_dims
+        tile_multiples = validate_tensor_dims(tile_multiples, expected_dims=num_dims)
+        max_elems = budget_bytes // (num_buffers * elem_bytes)
+
+        candidates = []
+        for d, (tensor_dim, multiple) in enumerate(zip(tensor_dims, tile_multiples)):
+            divisors = [
+                t
+                for t in range(multiple, tensor_dim + 1, multiple)
+                if tensor_dim % t == 0
+            ]
+            if not divisors:
+                raise ValueError(
+                    f"Tensor dimension {d} ({tensor_dim}) has no tile size that is a multiple of {multiple}"
+                )
+            candidates.append(divisors)
+
+        def score(tile_dims):
+            burst = cls._contiguous_elems(tensor_dims, tile_dims) * elem_bytes
+            if max_burst_bytes is not None:
+                burst = min(burst, max_burst_bytes)
+            return burst, math.prod(tile_dims), tuple(tile_dims)
+
+        fitting = [
+            t
+            for t in itertools.product(*candidates)
+            if math.prod(t) <= max_elems
+            and cls.__num_tile_dims(tensor_dims, t) <= cls._MAX_DIMS
+        ]
+        for tile_dims in sorted(fitting, key=score, reverse=True):
+            if limits is None or cls.__single_bd(
+                tensor_dims, tile_dims, elem_bytes, limits
+            ):
+                return tile_dims
+        raise ValueError(
+            f"No tile of tensor {tensor_dims} fits {num_buffers} buffers in {budget_bytes} bytes"
+        )
+
+    @classmethod
+    def auto_tiler(
+        cls,
+        tensor_dims: Sequence[int],
+        elem_bytes: int,
+        budget_bytes: int | None = None,
+        target_model=None,
+        memory: str = "L1",
+        num_buffers: int = 2,
+        tile_multiples: Sequence[int] | None = None,
+        max_burst_bytes: int | None = None,
+        limits: DmaBdLimits | None = None,
+        iter_dim_order: Sequence[int] | None = None,
+    ) -> TensorAccessSequence:
+        """A simple_tiler with the tile dimensions found by search_tile_dims. The TensorAccessPatterns can be
+        passed to Runtime.fill and Runtime.drain one tile at a time.
+
+        Args:
+            tensor_dims (Sequence[int]): The dimensions of the tensor to tile.
+            elem_bytes (int): Bytes per element of the tensor.
+            budget_bytes (int | None, optional): See search_tile_dims. Defaults to None.
+            target_model (optional): See search_tile_dims. Defaults to None.
+            memory (str, optional): See search_tile_dims. Defaults to "L1".
+            num_buffers (int, optional): See search_tile_dims. Defaults to 2.
+            tile_multiples (Sequence[int] | None, optional): See search_tile_dims. Defaults to None.
+            max_burst_bytes (int | None, optional): See search_tile_dims. Defaults to None.
+            limits (DmaBdLimits | None, optional): See search_tile_dims. Defaults to None.
+            iter_dim_order (Sequence[int] | None, optional): Order of the dimensions over tiles. Defaults to row major.
+
+        Returns:
+            TensorAccessSequence: A TensorAccessSequence with one TensorAccessPattern per tile
+        """
+        tile_dims = cls.search_tile_dims(
+            tensor_dims,
+            elem_bytes,
+            budget_bytes=budget_bytes,
+            target_model=target_model,
+            memory=memory,
+            num_buffers=num_buffers,
+            tile_multiples=tile_multiples,
+            max_burst_bytes=max_burst_bytes,
+            limits=limits,
+        )
+        return cls.simple_tiler(tensor_dims, tile_dims, iter_dim_order=iter_dim_order)
+
+    @staticmethod
+    def __num_tile_dims(tensor_dims: Sequence[int], tile_dims: Sequence[int]) -> int:
+        # Dimensions of the canonical sizes and strides of a row major tile
+        dim_strides = [math.prod(tensor_dims[i + 1 :]) for i in range(len(tensor_dims))]
+        _, sizes, _ = canonicalize_sizes_strides(0, tile_dims, dim_strides)
+        return len(sizes)
+
+    @staticmethod
+    def _contiguous_elems(tensor_dims: Sequence[int], tile_dims: Sequence[int]) -> int:
+        # Length of the contiguous runs of a row major tile: the innermost dimensions, up to
+        # the first one the tile does not span
+        run = 1
+        for tensor_dim, tile_dim in zip(reversed(tensor_dims), reversed(tile_dims)):
+            run *= tile_dim
+            if tile_dim != tensor_dim:
+                break
+        return run
+
+    @classmethod
+    def __single_bd(
+        cls,
+        tensor_dims: Sequence[int],
+        tile_dims: Sequence[int],
+        elem_bytes: int,
+        limits: DmaBdLimits,
+    ) -> bool:
+        tap = cls.simple_tiler(tensor_dims, tile_dims)[0]
+        try:
+            return minimize_bds([tap], limits, elem_bytes)[0].num_bds == 1
+        except ValueError:
+            return False
+
+    @staticmethod
+    def __groups(num_tiles: int, repeat: int, step: int) -> list[tuple[int, int, int]]:
+        # The (first tile, repeat, step) of the groups along one dimension. Groups are
+        # interleaved within blocks of repeat * step tiles; the groups of a partial block
+        # at the end of the dimension have fewer tiles, down to one if the step exceeds them.
+        repeat = min(repeat, ceildiv(num_tiles, step))
+        block = repeat * step
+        groups = []
+        for block_start in range(0, num_tiles, block):
+            for j in range(step):
+                first = block_start + j
+                if first >= num_tiles:
+                    break
+                groups.append(
+                    (first, min(repeat, ceildiv(num_tiles - first, step)), step)
+                )
+        return groups
+
+    @staticmethod
+    def __validate_order(order: Sequence[int] | None, num_dims: int) -> list[int]:
+        if order is None:
+            return list(range(num_dims))
+        if sorted(order) != list(range(num_dims)):
+            raise ValueError(
+                f"Dimension order {order} is not a permutation of the {num_dims} tensor dimensions"
+            )
+        return list(order)
@@ -173,3 +173,57 @@ def validate_offset(offset: int, tensor_dims: Sequence[int] | None) -> int:
                 f"Offset too large: {offset}. Max value allowed for tensor: {np.prod(tensor_dims)}"
             )
     return offset
+
+
+def canonicalize_sizes_strides(
+    offset: int,
+    sizes: Sequence[int],
+    strides: Sequence[int],
+    total_elems: int | None = None,
+) -> tuple[int, list[int], list[int]]:
+    """
+    This is a helper function to compute the canonical form of an access pattern.
+    Dimensions of size 1 are dropped, and adjacent dimensions that iterate as a single
+    dimension (the outer stride is the inner size times the inner stride) are merged.
+
+    If total_elems is given, accesses wrap around a tensor of total_elems elements, so the
+    offset and strides are reduced modulo total_elems. Two access patterns into tensors with the
+    same number of elements then access the same indices in the same order if and only if
+    their canonical forms are equal.
+
+    Args:
+        offset (int): The offset of the access pattern
+        sizes (Sequence[int]): The transformation sizes
+        strides (Sequence[int]): The transformation strides
+        total_elems (int | None, optional): Number of elements of the tensor. Defaults to None (no wrap-around).
+
+    Returns:
+        tuple[int, list[int], list[int]]: The canonical offset, sizes, and strides. A single access
+        has sizes [1] and strides [0].
+    """
+    offset = int(offset)
+    if total_elems:
+        offset %= total_elems
+    merged = []
+    # Merge from the innermost dimension outwards; merging into the innermost kept
+    # dimension never changes its stride, so one pass finds all merges.
+    for size, stride in zip(reversed(sizes), reversed(strides)):
+        size, stride = int(size), int(stride)
+        if size == 1:
+            continue
+        if total_elems:
+            stride %= total_elems
+        if merged:
+            inner_size, inner_stride = merged[-1]
+            span = inner_size * inner_stride
+            if stride == (span % total_elems if total_elems else span):
+                merged[-1] = (inner_size * size, inner_stride)
+                continue
+        merged.append((size, stride))
+    if not merged:
+        return offset, [1], [0]
+    return (
+        offset,
+        [size for size, _ in reversed(merged)],
+        [stride for _, stride in reversed(merged)],
+    )
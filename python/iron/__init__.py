@@ -20,7 +20,7 @@ from .worker import Worker, WorkerRuntimeBarrier
 from .runtime import Runtime
 from .dataflow import ObjectFifo
 from .dtype import str_to_dtype, dtype_to_str
-from aie.utils.jit import jit
+from aie.utils.jit import jit, compile_async, precompile
 from aie.utils import (
     tensor,
     ones,
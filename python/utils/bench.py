@@ -0,0 +1,384 @@
+# bench.py -*- Python -*-
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+"""
+Benchmarking utilities for NPU kernels.
+
+* `benchmark`
+    * Runs a kernel `warmup + iters` times and returns a `BenchmarkResult`
+      with the NPU time and the host-side breakdown of every iteration.
+* `sweep`
+    * Benchmarks a kernel over a set of parameter points, compiling the
+      variants once, e.g. instead of running `make` for every point.
+* `write_summary_csv`
+    * Writes one row of statistics per result of a sweep.
+"""
+import csv
+import json
+import time
+
+import numpy as np
+
+from .hostruntime.tensor_class import Tensor
+
+# Percentiles reported by `BenchmarkResult.stats`
+PERCENTILES = (50, 90, 99)
+
+# Per-iteration measurements, in nanoseconds:
+#   sync_to_device: syncing the argument tensors to the device
+#   launch: launching the kernel
+#   wait: waiting for the kernel to complete
+#   sync_from_device: syncing the argument tensors from the device
+#   total: all of the above
+#   npu_time: the execution time reported by the runtime
+METRICS = ("npu_time", "sync_to_device", "launch", "wait", "sync_from_device", "total")
+
+
+class BenchmarkResult:
+    """Measurements of the iterations of a `benchmark`."""
+
+    def __init__(self, mode, samples, wall_time, params=None):
+        """
+        Initialize the BenchmarkResult.
+
+        Args:
+            mode (str): "latency" or "throughput".
+            samples (dict): Per-iteration measurements in nanoseconds, by metric name.
+            wall_time (int): Nanoseconds the measured iterations took.
+            params (dict, optional): Parameters of the benchmarked variant, see `sweep`.
+        """
+        self.mode = mode
+        self.samples = {k: np.asarray(v, dtype=np.int64) for k, v in samples.items()}
+        self.wall_time = wall_time
+        self.params = dict(params or {})
+
+    @property
+    def iters(self) -> int:
+        """Number of measured iterations."""
+        return len(self.samples["npu_time"])
+
+    @property
+    def throughput(self) -> float:
+        """Iterations per second."""
+        return self.iters / (self.wall_time / 1e9) if self.wall_time else 0.0
+
+    def stats(self, metric="npu_time"):
+        """
+        Statistics of a metric.
+
+        Args:
+            metric (str, optional): One of `METRICS`. Defaults to "npu_time".
+
+        Returns:
+            dict: mean, std, min, max and the `PERCENTILES` (as "p50", ...),
+            in nanoseconds.
+        """
+        values = self.samples[metric]
+        if not len(values):
+            return {}
+        stats = {
+            "mean": float(np.mean(values)),
+            "std": float(np.std(values)),
+            "min": int(np.min(values)),
+            "max": int(np.max(values)),
+        }
+        for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            stats[f"p{p}"] = float(v)
+        return stats
+
+    def summary(self):
+        """
+        Returns:
+            dict: The statistics of every measured metric, by metric name.
+        """
+        return {metric: self.stats(metric) for metric in self.samples}
+
+    def to_csv(self, path):
+        """Write one row per iteration, with a column per metric."""
+        metrics = list(self.samples)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["iteration", *metrics])
+            for i in range(self.iters):
+                writer.writerow([i, *(int(self.samples[m][i]) for m in metrics)])
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: The mode, parameters, wall time, throughput, statistics and
+            samples, which can be serialized to JSON.
+        """
+        return {
+            "mode": self.mode,
+            "params": self.params,
+            "iters": self.iters,
+            "wall_time": self.wall_time,
+            "throughput": self.throughput,
+            "stats": self.summary(),
+            "samples": {k: v.tolist() for k, v in self.samples.items()},
+        }
+
+    def to_json(self, path):
+        """Write `to_dict` as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    def __str__(self):
+        lines = [
+            f"{self.mode} benchmark, {self.iters} iterations, {self.throughput:.1f} it/s"
+        ]
+        for metric, s in self.summary().items():
+            if s:
+                lines.append(
+                    f"  {metric:<17} mean {s['mean'] / 1e3:10.2f}us"
+                    f"  min {s['min'] / 1e3:10.2f}us"
+                    f"  p50 {s['p50'] / 1e3:10.2f}us"
+                    f"  p99 {s['p99'] / 1e3:10.2f}us"
+                    f"  max {s['max'] / 1e3:10.2f}us"
+                )
+        return "\n".join(lines)
+
+
+def benchmark(
+    npu_kernel,
+    args,
+    warmup=10,
+    iters=100,
+    mode="latency",
+    sync=True,
+    runtime=None,
+    params=None,
+    depth=2,
+):
+    """
+    Run a kernel repeatedly and measure every iteration.
+
+    In "latency" mode every iteration syncs the argument tensors to the
+    device, launches the kernel, waits for it and syncs the tensors back, as
+    a host program running one kernel at a time does. With `sync=False` the
+    tensors are not synced, only the launch and wait are measured.
+
+    In "throughput" mode the iterations are launched back to back with
+    `run_async` without host accesses in between. A run owns its tensors
+    until it completes, so the iterations rotate through `depth` copies of
+    the argument tensors and up to `depth` runs are in flight together.
+    `throughput` of the result is the number of completed iterations per
+    second.
+
+    Args:
+        npu_kernel (NPUKernel): The kernel.
+        args (list): Arguments to pass to the kernel.
+        warmup (int, optional): Iterations run before measuring. Defaults to 10.
+        iters (int, optional): Measured iterations. Defaults to 100.
+        mode (str, optional): "latency" or "throughput". Defaults to "latency".
+        sync (bool, optional): Sync the tensors in latency mode. Defaults to True.
+        runtime (HostRuntime, optional): Defaults to the DefaultNPURuntime.
+        params (dict, optional): Recorded in the result, see `sweep`.
+        depth (int, optional): Runs in flight in throughput mode. Defaults to 2.
+
+    Returns:
+        BenchmarkResult: The measurements.
+
+    Raises:
+        ValueError: If the mode or depth is invalid or the kernel is traced.
+    """
+    if mode not in ("latency", "throughput"):
+        raise ValueError(f"Unknown benchmark mode '{mode}'")
+    if depth < 1:
+        raise ValueError(f"depth must be at least 1, got {depth}")
+    if npu_kernel.trace_config:
+        raise ValueError("Benchmarking traced kernels is not supported")
+    if runtime is None:
+        from . import DefaultNPURuntime
+
+        if DefaultNPURuntime is None:
+            raise Exception("Cannot benchmark kernel; DefaultNPURuntime not set.")
+        runtime = DefaultNPURuntime
+
+    args = list(args)
+    handle = runtime.load(npu_kernel)
+    if mode == "latency":
+
+        def run(n):
+            return _latency_iterations(runtime, handle, args, n, sync)
+
+    else:
+        # Copies of the tensors for the other runs in flight
+        arg_sets = [args] + [[_copy_tensor(a) for a in args] for _ in range(depth - 1)]
+
+        def run(n):
+            return _throughput_iterations(runtime, handle, arg_sets, n)
+
+    run(warmup)
+    samples, wall_time = run(iters)
+    return BenchmarkResult(mode, samples, wall_time, params)
+
+
+def _latency_iterations(runtime, handle, args, iters, sync):
+    tensors = [a for a in args if isinstance(a, Tensor)] if sync else []
+    samples = {metric: [] for metric in METRICS}
+    if not sync:
+        del samples["sync_to_device"], samples["sync_from_device"]
+    clock = time.perf_counter_ns
+    start = clock()
+    for _ in range(iters):
+        for t in tensors:
+            # Marks the tensor as written by the host
+            t.numpy()
+        t0 = clock()
+        for t in tensors:
+            t.to("npu")
+        t1 = clock()
+        future = runtime.run_async(handle, args)
+        t2 = clock()
+        result = future.wait()
+        t3 = clock()
+        for t in tensors:
+            t.to("cpu")
+        t4 = clock()
+        samples["npu_time"].append(result.npu_time)
+        samples["launch"].append(t2 - t1)
+        samples["wait"].append(t3 - t2)
+        samples["total"].append(t4 - t0)
+        if sync:
+            samples["sync_to_device"].append(t1 - t0)
+            samples["sync_from_device"].append(t4 - t3)
+    return samples, clock() - start
+
+
+def _copy_tensor(arg):
+    if not isinstance(arg, Tensor):
+        return arg
+    return type(arg)(arg.__array__().copy(), dtype=arg.dtype, device=arg.device)
+
+
+def _throughput_iterations(runtime, handle, arg_sets, iters):
+    clock = time.perf_counter_ns
+    launch = []
+    futures = []
+    start = clock()
+    for i in range(iters):
+        t0 = clock()
+        futures.append(runtime.run_async(handle, arg_sets[i % len(arg_sets)]))
+        launch.append(clock() - t0)
+    results = [future.wait() for future in futures]
+    wall_time = clock() - start
+    samples = {
+        "npu_time": [r.npu_time for r in results],
+        "launch": launch,
+    }
+    return samples, wall_time
+
+
+def sweep(
+    kernel,
+    points,
+    make_args,
+    warmup=10,
+    iters=100,
+    mode="latency",
+    sync=True,
+    runtime=None,
+    depth=2,
+):
+    """
+    Benchmark a kernel at several parameter points.
+
+    Every variant is compiled once. `kernel` is either
+        - a function decorated with `jit`: the variants of all points are
+          compiled in parallel first, and cached like any jitted call, or
+        - a callable returning the NPUKernel of a point, `kernel(**point)`,
+          whose result is reused for points with the same parameters.
+
+    Args:
+        kernel (callable): See above.
+        points (iterable[dict]): The parameters of every point.
+        make_args (callable): `make_args(**point)` returns the arguments of a
+            point; for jitted functions, the arguments of the function.
+        warmup (int, optional): See `benchmark`. Defaults to 10.
+        iters (int, optional): See `benchmark`. Defaults to 100.
+        mode (str, optional): See `benchmark`. Defaults to "latency".
+        sync (bool, optional): See `benchmark`. Defaults to True.
+        runtime (HostRuntime, optional): See `benchmark`.
+        depth (int, optional): See `benchmark`. Defaults to 2.
+
+    Returns:
+        list[BenchmarkResult]: The results, with the parameters of each point
+        as `params`, in the order of `points`.
+    """
+    points = [dict(p) for p in points]
+    if callable(getattr(kernel, "compile", None)):
+        from .jit import _filter_tensor_args, compile_async
+
+        # Compile the variants in parallel before measuring anything
+        futures = [compile_async(kernel, *make_args(**p)) for p in points]
+        variants = [future.result() for future in futures]
+        del futures
+
+        def get_args(p):
+            return _filter_tensor_args(make_args(**p))
+
+    else:
+        built = {}
+        variants = []
+        for p in points:
+            key = tuple(sorted(p.items()))
+            if key not in built:
+                built[key] = kernel(**p)
+            variants.append(built[key])
+
+        def get_args(p):
+            return make_args(**p)
+
+    results = []
+    for p, npu_kernel in zip(points, variants):
+        results.append(
+            benchmark(
+                npu_kernel,
+                get_args(p),
+                warmup=warmup,
+                iters=iters,
+                mode=mode,
+                sync=sync,
+                runtime=runtime,
+                params=p,
+                depth=depth,
+            )
+        )
+    return results
+
+
+def write_summary_csv(results, path, metrics=("npu_time",)):
+    """
+    Write one row per result: its parameters, throughput and the statistics
+    of `metrics`, e.g. for the results of a `sweep`.
+
+    Args:
+        results (list[BenchmarkResult]): The results.
+        path (str | Path): The CSV file.
+        metrics (tuple, optional): Metrics to write. Defaults to ("npu_time",).
+    """
+    param_names = list(dict.fromkeys(k for r in results for k in r.params))
+    stat_names = ["mean", "std", "min", "max", *(f"p{p}" for p in PERCENTILES)]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                *param_names,
+                "mode",
+                "iters",
+                "throughput",
+                *(f"{m}_{s}" for m in metrics for s in stat_names),
+            ]
+        )
+        for r in results:
+            row = [r.params.get(k, "") for k in param_names]
+            row += [r.mode, r.iters, r.throughput]
+            for m in metrics:
+                stats = r.stats(m) if m in r.samples else {}
+                row += [stats.get(s, "") for s in stat_names]
+            writer.writerow(row)
@@ -11,12 +11,32 @@ import os
 from pathlib import Path
 
 from .utils import (
+    NPU_COMPILE_WORKERS,
     compile_cxx_core_function,
     compile_mlir_module,
     compile_external_kernel,
+    compile_external_kernels,
+    set_compile_workers,
 )
+from .cache.disk_cache import parse_size
 
 # Compiled kernels are cached inside the `NPU_CACHE_HOME` directory.
 NPU_CACHE_HOME = Path(
     os.environ.get("NPU_CACHE_HOME", Path.home() / ".npu" / "cache")
 ).resolve()
+
+# Limits of `NPU_CACHE_HOME`: its size (e.g. "8G") and the number of days an
+# unused kernel is kept. Least recently used kernels are evicted first; 0
+# disables a limit.
+NPU_CACHE_MAX_SIZE = parse_size(os.environ.get("NPU_CACHE_MAX_SIZE", "8G"))
+NPU_CACHE_MAX_AGE_DAYS = float(os.environ.get("NPU_CACHE_MAX_AGE_DAYS", "30"))
+
+# Number of compiled kernels the JIT keeps loaded in each process.
+NPU_JIT_CACHE_SIZE = int(os.environ.get("NPU_JIT_CACHE_SIZE", "32"))
+
+# How the JIT finds the kernel of a call it has not seen in this process:
+# "validate" (the default) generates the MLIR and warns if the kernel compiled
+# for the same call by an earlier process differs, "fast" runs that kernel
+# without generating MLIR, and "off" does not record calls. "fast" does not
+# notice changes to module globals, imported helpers or the IRON sources.
+NPU_JIT_DISPATCH = os.environ.get("NPU_JIT_DISPATCH", "validate").lower()
@@ -0,0 +1,336 @@
+# disk_cache.py -*- Python -*-
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+from .utils import _release_lock, _try_acquire_lock, file_lock
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+DISPATCH_FILE = "dispatch.json"
+INDEX_LOCK_FILE = ".index.lock"
+ENTRY_LOCK_FILE = ".lock"
+
+# Artifacts a cache entry must have to be used. They are published in this
+# order, so an entry with final.xclbin is complete.
+INSTS_FILENAME = "insts.bin"
+XCLBIN_FILENAME = "final.xclbin"
+ARTIFACTS = (INSTS_FILENAME, XCLBIN_FILENAME)
+
+_SIZE_SUFFIXES = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_size(size):
+    """
+    Parse a size in bytes given as an int or a string such as "512M" or "8G".
+
+    Returns:
+        int: The size in bytes.
+    """
+    if isinstance(size, int):
+        return size
+    size = str(size).strip().upper().removesuffix("B")
+    scale = _SIZE_SUFFIXES.get(size[-1:], 1)
+    if size[-1:] in _SIZE_SUFFIXES:
+        size = size[:-1]
+    return int(float(size) * scale)
+
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class KernelDiskCache:
+    """
+    Index of the compiled kernels kept in a cache directory.
+
+    Every kernel lives in its own directory `<root>/<key>`. The index
+    (`<root>/index.json`) records the size, creation time, last use and
+    compile time of each entry, and is used to evict entries when the cache
+    grows larger than `max_bytes` or an entry was not used for `max_age`
+    seconds. Entries that are being compiled (their `.lock` is held) are
+    never evicted. Directories without an index entry, e.g. created by an
+    older version, are added to the index the next time it is scanned.
+    """
+
+    def __init__(self, root, max_bytes=0, max_age=0):
+        """
+        Args:
+            root (str | Path): Cache directory.
+            max_bytes (int, optional): Size limit of the cache, 0 for none.
+            max_age (float, optional): Seconds an unused entry is kept, 0 for
+                no limit.
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._dispatch = {}
+
+    def entry_dir(self, key):
+        return self.root / key
+
+    def contains(self, key):
+        """Whether a complete entry exists for the key."""
+        entry_dir = self.entry_dir(key)
+        return all(os.path.exists(entry_dir / name) for name in ARTIFACTS)
+
+    # --------------------------------------------------------------------------
+    # Index
+    # --------------------------------------------------------------------------
+
+    def _read_index(self):
+        try:
+            with open(self.root / INDEX_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.root / f".{INDEX_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.root / INDEX_FILE)
+
+    def _scan(self, index):
+        """Add untracked entry directories to the index and drop entries
+        whose directory is gone."""
+        present = set()
+        if os.path.isdir(self.root):
+            for entry in os.scandir(self.root):
+                if entry.is_dir() and not entry.name.startswith("."):
+                    present.add(entry.name)
+        for key in list(index):
+            if key not in present:
+                del index[key]
+        for key in present - set(index):
+            mtime = os.path.getmtime(self.entry_dir(key))
+            index[key] = {
+                "size": _dir_size(self.entry_dir(key)),
+                "created": mtime,
+                "last_used": mtime,
+                "compile_time": None,
+            }
+        return index
+
+    def entries(self):
+        """
+        dict of key to its index record, with the size in bytes, the creation
+        and last use times and the compile time in seconds.
+        """
+        with file_lock(self.root / INDEX_LOCK_FILE):
+            index = self._scan(self._read_index())
+            self._write_index(index)
+        return index
+
+    def size(self):
+        """Total size of the cached entries in bytes."""
+        return sum(e["size"] for e in self.entries().values())
+
+    def touch(self, key):
+        """Record a use of an entry."""
+        with file_lock(self.root / INDEX_LOCK_FILE):
+            index = self._read_index()
+            if key not in index:
+                index[key] = {
+                    "size": _dir_size(self.entry_dir(key)),
+                    "created": time.time(),
+                    "compile_time": None,
+                }
+            index[key]["last_used"] = time.time()
+            self._write_index(index)
+
+    # --------------------------------------------------------------------------
+    # Dispatch table
+    # --------------------------------------------------------------------------
+
+    def _read_dispatch(self):
+        try:
+            with open(self.root / DISPATCH_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def lookup_dispatch(self, dispatch_key):
+        """
+        Find the entry recorded for a dispatch key with `record_dispatch`.
+
+        The record is only used if the entry is complete and none of the
+        files it depends on were modified since it was recorded.
+
+        Returns:
+            str | None: The key of the entry.
+        """
+        record = self._dispatch.get(dispatch_key)
+        if record is None:
+            # Another process may have recorded it since the table was read
+            self._dispatch = self._read_dispatch()
+            record = self._dispatch.get(dispatch_key)
+        if record is None or not self.contains(record["key"]):
+            return None
+        for path, mtime in record["files"].items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return None
+            except OSError:
+                return None
+        return record["key"]
+
+    def record_dispatch(self, dispatch_key, key, files=()):
+        """
+        Record that calls with `dispatch_key` compile to the entry `key`,
+        as long as `files` are not modified.
+        """
+        files = {
+            os.fspath(path): os.stat(path).st_mtime_ns
+            for path in files
+            if os.path.exists(path)
+        }
+        with file_lock(self.root / INDEX_LOCK_FILE):
+            table = self._read_dispatch()
+            table[dispatch_key] = {"key": key, "files": files}
+            # Drop the records of evicted entries
+            table = {
+                k: r
+                for k, r in table.items()
+                if os.path.isdir(self.entry_dir(r["key"]))
+            }
+            tmp_path = self.root / f".{DISPATCH_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(table, f)
+            os.replace(tmp_path, self.root / DISPATCH_FILE)
+        self._dispatch = table
+
+    # --------------------------------------------------------------------------
+    # Publishing
+    # --------------------------------------------------------------------------
+
+    def publish(self, key, staging_dir, compile_time=None):
+        """
+        Move the files compiled in `staging_dir` into the entry of `key`.
+
+        Every file is moved with an atomic rename and final.xclbin is moved
+        last, so other processes never see a partially written entry. The
+        entry is then added to the index and the cache is trimmed to its
+        limits.
+
+        Returns:
+            list[str]: Keys of the evicted entries.
+        """
+        entry_dir = self.entry_dir(key)
+        os.makedirs(entry_dir, exist_ok=True)
+        names = sorted(
+            os.listdir(staging_dir), key=lambda name: name == XCLBIN_FILENAME
+        )
+        for name in names:
+            dst = entry_dir / name
+            if os.path.isdir(dst) and not os.path.islink(dst):
+                shutil.rmtree(dst)
+            os.replace(os.path.join(staging_dir, name), dst)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+        now = time.time()
+        with file_lock(self.root / INDEX_LOCK_FILE):
+            index = self._read_index()
+            index[key] = {
+                "size": _dir_size(entry_dir),
+                "created": now,
+                "last_used": now,
+                "compile_time": compile_time,
+            }
+            evicted = self._evict(index, keep={key})
+            self._write_index(index)
+        return evicted
+
+    # --------------------------------------------------------------------------
+    # Eviction
+    # --------------------------------------------------------------------------
+
+    def evict(self, keep=()):
+        """
+        Remove entries unused for longer than `max_age`, then the least
+        recently used ones until the cache fits in `max_bytes`.
+
+        Args:
+            keep (iterable, optional): Keys that must not be evicted.
+
+        Returns:
+            list[str]: Keys of the evicted entries.
+        """
+        with file_lock(self.root / INDEX_LOCK_FILE):
+            index = self._read_index()
+            evicted = self._evict(index, keep=set(keep))
+            self._write_index(index)
+        return evicted
+
+    def _evict(self, index, keep):
+        if not self.max_bytes and not self.max_age:
+            return []
+        self._scan(index)
+        now = time.time()
+        total = sum(e["size"] for e in index.values())
+        evicted = []
+        for key in sorted(index, key=lambda k: index[k]["last_used"]):
+            expired = self.max_age and now - index[key]["last_used"] > self.max_age
+            too_large = self.max_bytes and total > self.max_bytes
+            if not expired and not too_large:
+                continue
+            if key in keep or not self._remove_unlocked(key):
+                continue
+            total -= index.pop(key)["size"]
+            evicted.append(key)
+        if evicted:
+            logger.debug("Evicted %d kernels from %s", len(evicted), self.root)
+        return evicted
+
+    def _remove_unlocked(self, key):
+        """Remove an entry unless another process holds its lock."""
+        entry_dir = self.entry_dir(key)
+        lock_path = entry_dir / ENTRY_LOCK_FILE
+        if not os.path.exists(lock_path):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return True
+        with open(lock_path, "a+") as lock_file:
+            if not _try_acquire_lock(lock_file):
+                return False
+            try:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            finally:
+                _release_lock(lock_file)
+        return True
+
+    def remove(self, key):
+        """Remove one entry, returning whether it was removed."""
+        with file_lock(self.root / INDEX_LOCK_FILE):
+            index = self._read_index()
+            removed = self._remove_unlocked(key)
+            if removed:
+                index.pop(key, None)
+            self._write_index(index)
+        return removed
+
+    def clear(self):
+        """Remove every entry that is not being compiled."""
+        with file_lock(self.root / INDEX_LOCK_FILE):
+            index = self._scan(self._read_index())
+            for key in list(index):
+                if self._remove_unlocked(key):
+                    del index[key]
+            self._write_index(index)
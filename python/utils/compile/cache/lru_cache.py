@@ -0,0 +1,70 @@
+# lru_cache.py -*- Python -*-
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Mapping with a bounded number of entries that evicts the least recently
+    used entry when full. Lookups, insertions and evictions are O(1).
+
+    A lookup with `in` does not count as a use; `[]` and `get` do.
+    """
+
+    def __init__(self, max_size):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self.cache = OrderedDict()
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self.cache
+
+    def __getitem__(self, key):
+        value = self.cache[key]
+        self.cache.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key not in self.cache:
+            return default
+        return self[key]
+
+    def __setitem__(self, key, value):
+        self.cache[key] = value
+        self.cache.move_to_end(key)
+        self._evict()
+
+    def __delitem__(self, key):
+        del self.cache[key]
+
+    def pop(self, key, default=None):
+        return self.cache.pop(key, default)
+
+    def __len__(self):
+        return len(self.cache)
+
+    def keys(self):
+        """Keys from least to most recently used."""
+        return list(self.cache)
+
+    def resize(self, max_size):
+        """Change the capacity, evicting entries if it shrinks."""
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self._evict()
+
+    def clear(self):
+        self.cache.clear()
+
+    def _evict(self):
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+            self.evictions += 1
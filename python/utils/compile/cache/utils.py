@@ -6,9 +6,13 @@
 #
 # (c) Copyright 2025-2026 Advanced Micro Devices, Inc.
 import contextlib
+import hashlib
+import inspect
 import os
 import time
 
+import numpy as np
+
 # Cross-platform file locking:
 # - POSIX: fcntl.flock
 # - Windows: msvcrt.locking
@@ -115,13 +119,106 @@ def _create_function_cache_key(function, args, kwargs):
     return (func_name, signature)
 
 
+def _code_digest(code):
+    """Digest of a code object that is the same in every process."""
+    parts = [code.co_code.hex(), repr(code.co_names)]
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            parts.append(_code_digest(const))
+        elif isinstance(const, frozenset):
+            parts.append(repr(sorted(const, key=repr)))
+        else:
+            parts.append(repr(const))
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _stable_arg_repr(value):
+    """
+    Representation of a JIT argument that is the same in every process, or
+    None if the argument has none. Unlike `hash()`, it does not depend on
+    string hash randomization or object addresses.
+    """
+    from aie.iron.kernel import ExternalFunction, Kernel
+
+    if isinstance(value, Tensor):
+        return f"tensor_{value.shape}_{value.dtype}"
+    if isinstance(value, ExternalFunction):
+        # ExternalFunction.__hash__ digests its source and compiler options
+        return f"extfn_{hash(value)}"
+    if isinstance(value, Kernel):
+        return f"kernel_{value._name}_{value.object_file_name}_{value._arg_types}"
+    if isinstance(value, (bool, int, float, str, bytes, np.generic, np.dtype)):
+        return f"{type(value).__name__}_{value!r}"
+    if value is None:
+        return "None"
+    if isinstance(value, (tuple, list)):
+        items = [_stable_arg_repr(v) for v in value]
+        if None in items:
+            return None
+        return f"{type(value).__name__}({','.join(items)})"
+    if callable(value) and hasattr(value, "__code__"):
+        defaults = _stable_arg_repr(value.__defaults__)
+        closure = _closure_repr(value)
+        if defaults is None or closure is None:
+            return None
+        return f"function_{_code_digest(value.__code__)}_{defaults}_{closure}"
+    return None
+
+
+def _closure_repr(function):
+    """
+    Stable representation of the variables captured by a function, or None if
+    one of them has none. Functions built by a factory share their code, so
+    their captured values must be part of the key.
+    """
+    cells = []
+    for cell in function.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # The variable is not assigned yet
+            return None
+        cells.append(_stable_arg_repr(contents))
+    if None in cells:
+        return None
+    return f"closure({','.join(cells)})"
+
+
+def _create_dispatch_key(function, args, kwargs, *extra):
+    """
+    Create a cache key for a function call that is the same in every process,
+    from the function's code and captured variables, the stable representations
+    of its arguments and any `extra` strings. Module globals the function reads
+    are not part of the key.
+
+    Returns:
+        str | None: The key, or None if an argument or captured variable has no
+        stable representation.
+    """
+    arg_reprs = [_stable_arg_repr(arg) for arg in args]
+    kwarg_reprs = {k: _stable_arg_repr(v) for k, v in sorted(kwargs.items())}
+    closure = _closure_repr(function)
+    if None in arg_reprs or None in kwarg_reprs.values() or closure is None:
+        return None
+    parts = [
+        function.__module__,
+        function.__qualname__,
+        _code_digest(function.__code__),
+        closure,
+        *arg_reprs,
+        *(f"{k}={v}" for k, v in kwarg_reprs.items()),
+    ]
+    parts.extend(extra)
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
 @contextlib.contextmanager
 def file_lock(lock_file_path, timeout_seconds=60):
     """
     Context manager for file locking using flock to prevent race conditions.
     Args:
         lock_file_path (str): Path to the lock file
-        timeout_seconds (int): Maximum time to wait for lock acquisition in seconds
+        timeout_seconds (int | None): Maximum time to wait for lock acquisition in seconds, None to wait until the lock is released
     """
     lock_file = None
     try:
@@ -136,17 +233,16 @@ def file_lock(lock_file_path, timeout_seconds=60):
 
         # Try to acquire exclusive lock with timeout
         start_time = time.time()
-        while True:
-            try:
-                if _try_acquire_lock(lock_file):
-                    break
-            except OSError:
-                # Lock is held by another process
-                if time.time() - start_time > timeout_seconds:
-                    raise TimeoutError(
-                        f"Could not acquire lock on {lock_file_path} within {timeout_seconds} seconds"
-                    )
-                time.sleep(0.1)
+        while not _try_acquire_lock(lock_file):
+            # Lock is held by another process or thread
+            if (
+                timeout_seconds is not None
+                and time.time() - start_time > timeout_seconds
+            ):
+                raise TimeoutError(
+                    f"Could not acquire lock on {lock_file_path} within {timeout_seconds} seconds"
+                )
+            time.sleep(0.1)
 
         yield lock_file
 
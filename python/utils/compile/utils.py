@@ -11,12 +11,39 @@ import logging
 import os
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import aie.compiler.aiecc.main as aiecc
 import aie.utils.config as config
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of compiler subprocesses (Peano, aiecc) a process runs at once.
+NPU_COMPILE_WORKERS = int(os.environ.get("NPU_COMPILE_WORKERS", os.cpu_count() or 1))
+_compile_slots = threading.BoundedSemaphore(NPU_COMPILE_WORKERS)
+
+
+def set_compile_workers(workers):
+    """
+    Set the maximum number of compiler subprocesses run at once.
+
+    Args:
+        workers (int): Number of subprocesses.
+    """
+    global NPU_COMPILE_WORKERS, _compile_slots
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    NPU_COMPILE_WORKERS = workers
+    _compile_slots = threading.BoundedSemaphore(workers)
+
+
+def _run_compiler(cmd, **kwargs):
+    """subprocess.run, waiting for one of the NPU_COMPILE_WORKERS slots."""
+    slots = _compile_slots
+    with slots:
+        return subprocess.run(cmd, **kwargs)
+
 
 def compile_cxx_core_function(
     source_path: str,
@@ -64,7 +91,7 @@ def compile_cxx_core_function(
         cmd.extend(compile_args)
 
     logger.debug("Compiling with: %s", " ".join(cmd))
-    ret = subprocess.run(
+    ret = _run_compiler(
         cmd,
         cwd=cwd,
         check=False,
@@ -118,6 +145,7 @@ def compile_mlir_module(
         args.append("--verbose")
     if options:
         args.extend(options)
+    mlir_str = str(mlir_module)
     # When work_dir is provided, invoke the aiecc binary as a subprocess so
     # that it resolves relative link_with paths (e.g. "add_one.o") against the
     # same directory where compile_external_kernel placed the compiled objects.
@@ -134,8 +162,8 @@ def compile_mlir_module(
             )
         mlir_file = os.path.join(work_dir, "aie.mlir")
         with open(mlir_file, "w") as f:
-            f.write(str(mlir_module))
-        result = subprocess.run(
+            f.write(mlir_str)
+        result = _run_compiler(
             [aiecc_bin, mlir_file] + args, capture_output=True, text=True
         )
         if result.stdout:
@@ -154,6 +182,26 @@ def compile_mlir_module(
         except Exception as e:
             raise RuntimeError("[aiecc] Compilation failed") from e
 
+    # Trace is configured by register writes in the runtime sequence, so
+    # modules without any do not need to be parsed again
+    if insts_path and "npu.write32" in mlir_str:
+        _write_trace_event_sidecar(mlir_str, insts_path)
+
+
+def _write_trace_event_sidecar(mlir_str, insts_path):
+    """Record the trace event configuration of a compiled design next to its
+    instructions, so its traces can be parsed without the MLIR module."""
+    from aie.ir import MLIRError
+    from aie.utils.trace.parse import (
+        trace_event_sidecar_path,
+        write_trace_event_sidecar,
+    )
+
+    try:
+        write_trace_event_sidecar(mlir_str, trace_event_sidecar_path(insts_path))
+    except (MLIRError, ValueError, OSError) as e:
+        logger.debug("Could not write trace event sidecar: %s", e)
+
 
 def compile_external_kernel(func, kernel_dir, target_arch):
     """
@@ -173,7 +221,10 @@ def compile_external_kernel(func, kernel_dir, target_arch):
     # Skip if already compiled in this session.
     if func._compiled:
         return
+    _compile_external_kernel_into(func, kernel_dir, target_arch)
 
+
+def _compile_external_kernel_into(func, kernel_dir, target_arch):
     # Skip if the object file already exists (cache hit).
     output_file = os.path.join(kernel_dir, func.object_file_name)
     if os.path.exists(output_file):
@@ -218,3 +269,49 @@ def _cleanup_failed_compilation(cache_dir):
             os.remove(item_path)
         elif os.path.isdir(item_path):
             shutil.rmtree(item_path)
+
+
+def compile_external_kernels(funcs, kernel_dir, target_arch):
+    """
+    Compile ExternalFunctions to object files in the kernel directory, in
+    parallel.
+
+    Unlike ``compile_external_kernel``, a function that was already compiled
+    in this session is compiled again if its object file is not in
+    ``kernel_dir``. Functions sharing a source or object file name are
+    compiled one after the other; the others run concurrently, at most
+    ``NPU_COMPILE_WORKERS`` compilers at a time.
+
+    Args:
+        funcs (list): ExternalFunction instances to compile.
+        kernel_dir: Directory where the compiled object files will be placed.
+        target_arch: Peano target architecture string (e.g., "aie2", "aie2p").
+
+    Raises:
+        RuntimeError: The first compilation error, after all compilations ended.
+    """
+    # Group the functions that share a source or object file name
+    groups = {}
+    group_of = {}
+    for i, func in enumerate(funcs):
+        files = (f"{func._name}.cc", func.object_file_name)
+        members = [i]
+        for g in {group_of[f] for f in files if f in group_of}:
+            members += groups.pop(g)
+        groups[i] = sorted(members)
+        for j in members:
+            for f in (f"{funcs[j]._name}.cc", funcs[j].object_file_name):
+                group_of[f] = i
+
+    def compile_group(group):
+        for j in group:
+            _compile_external_kernel_into(funcs[j], kernel_dir, target_arch)
+
+    if len(groups) <= 1:
+        for group in groups.values():
+            compile_group(group)
+        return
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        futures = [executor.submit(compile_group, g) for g in groups.values()]
+    for future in futures:
+        future.result()
@@ -0,0 +1,230 @@
+# context_budget.py -*- Python -*-
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+
+
+# Windows: os.kill terminates the process, so its exit code is queried instead
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_STILL_ACTIVE = 259
+_ERROR_ACCESS_DENIED = 5
+
+
+def _windows_process_alive(pid):
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.GetExitCodeProcess.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        # The process can not be opened if it belongs to another user
+        return ctypes.get_last_error() == _ERROR_ACCESS_DENIED
+    try:
+        exit_code = wintypes.DWORD()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return True
+        return exit_code.value == _STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _process_alive(pid):
+    if os.name == "nt":
+        return _windows_process_alive(pid)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class ContextBudget:
+    """
+    Budget of NPU hardware contexts shared by the processes of a machine.
+
+    Hardware contexts are a system-wide resource, so processes that each
+    cache contexts can exhaust them. Every process records the contexts it
+    holds in a slot table, a JSON file protected by `file_lock`, and
+    reserves a slot before creating a context. A process holds at most
+    `quota` slots. When all `total` slots are taken, the process holding the
+    least recently used slot is asked to evict a context: processes collect
+    these requests with `eviction_requests` and `release` the slot of the
+    context they evicted. Slots of processes that exited are reclaimed.
+
+    The table maps the pid of every process to its slots, with the last use
+    time of each, and the pids of the processes waiting for it to evict.
+    """
+
+    # Seconds between updates of the last use time of a slot, and between
+    # checks for eviction requests
+    UPDATE_INTERVAL = 1.0
+
+    def __init__(self, path, total, quota=None):
+        """
+        Args:
+            path (str | Path): The slot table.
+            total (int): Number of contexts of all processes.
+            quota (int, optional): Number of contexts of one process.
+                Defaults to `total`.
+        """
+        self.path = Path(path)
+        self.total = total
+        self.quota = min(quota or total, total)
+        self._last_update = {}
+        self._last_request_check = 0.0
+
+    @property
+    def pid(self):
+        # Not cached, forked processes have their own slots
+        return os.getpid()
+
+    # --------------------------------------------------------------------------
+    # Table
+    # --------------------------------------------------------------------------
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @contextlib.contextmanager
+    def _table(self):
+        """The table, locked and written back on exit, without dead processes."""
+        from aie.utils.compile.cache.utils import file_lock
+
+        with file_lock(self.path.with_suffix(".lock")):
+            table = {
+                pid: entry
+                for pid, entry in self._read().items()
+                if _process_alive(int(pid))
+            }
+            entry = table.setdefault(str(self.pid), {})
+            entry.setdefault("slots", {})
+            entry.setdefault("requests", [])
+            yield table
+            tmp_path = self.path.with_name(f".{self.path.name}.{self.pid}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(table, f)
+            os.replace(tmp_path, self.path)
+
+    # --------------------------------------------------------------------------
+    # Slots
+    # --------------------------------------------------------------------------
+
+    def reserve(self, key):
+        """
+        Reserve a slot for the context `key` of this process.
+
+        Returns:
+            int | None: None if the slot was reserved. Otherwise the pid of
+            the process that has to evict a context first: this process if
+            it reached its quota or holds the least recently used slot, or
+            another process, which was asked to evict one.
+        """
+        now = time.time()
+        with self._table() as table:
+            mine = table[str(self.pid)]
+            used = sum(len(entry["slots"]) for entry in table.values())
+            if key in mine["slots"] or (
+                len(mine["slots"]) < self.quota and used < self.total
+            ):
+                mine["slots"][key] = now
+                self._last_update[key] = now
+                return None
+            if len(mine["slots"]) >= self.quota:
+                return self.pid
+            victim = min(
+                (
+                    (last_used, pid)
+                    for pid, entry in table.items()
+                    for last_used in entry["slots"].values()
+                ),
+                default=(None, str(self.pid)),
+            )[1]
+            if victim != str(self.pid) and self.pid not in table[victim]["requests"]:
+                table[victim]["requests"].append(self.pid)
+            return int(victim)
+
+    def claim(self, key):
+        """
+        Record the context `key` of this process, which was created without
+        a reserved slot, even if the budget is exhausted.
+        """
+        now = time.time()
+        with self._table() as table:
+            table[str(self.pid)]["slots"][key] = now
+        self._last_update[key] = now
+
+    def release(self, key):
+        """Release the slot of the context `key` of this process."""
+        self._last_update.pop(key, None)
+        with self._table() as table:
+            table[str(self.pid)]["slots"].pop(key, None)
+
+    def release_all(self):
+        """Release every slot of this process."""
+        self._last_update.clear()
+        with self._table() as table:
+            del table[str(self.pid)]
+
+    def touch(self, key):
+        """Record a use of the context `key`, at most every `UPDATE_INTERVAL`."""
+        now = time.time()
+        if now - self._last_update.get(key, 0.0) < self.UPDATE_INTERVAL:
+            return
+        self._last_update[key] = now
+        with self._table() as table:
+            slots = table[str(self.pid)]["slots"]
+            if key in slots:
+                slots[key] = now
+
+    def eviction_requests(self, force=False):
+        """
+        Collect the requests of other processes to evict a context. Unless
+        `force` is set, the table is read at most every `UPDATE_INTERVAL`.
+
+        Returns:
+            int: The number of contexts to evict.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_request_check < self.UPDATE_INTERVAL:
+            return 0
+        self._last_request_check = now
+        # Only lock the table if there are requests
+        if not self._read().get(str(self.pid), {}).get("requests"):
+            return 0
+        with self._table() as table:
+            requests = table[str(self.pid)]["requests"]
+            table[str(self.pid)]["requests"] = []
+        return len(requests)
+
+    def slots(self):
+        """
+        Returns:
+            dict: The number of slots held by each process, by pid.
+        """
+        return {
+            int(pid): len(entry.get("slots", {}))
+            for pid, entry in self._read().items()
+            if _process_alive(int(pid))
+        }
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 import logging
 import numpy as np
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -95,6 +97,158 @@ class KernelResult(ABC):
         pass
 
 
+class KernelFuture:
+    """
+    Handle to a kernel run launched with `HostRuntime.run_async`.
+
+    The run owns its argument tensors until it completes: host accesses to
+    them wait for the completion, and they are marked as written by the
+    device afterwards. The future can be awaited from a coroutine.
+    """
+
+    # Seconds between polls of the run state by the callback thread
+    POLL_INTERVAL = 0.0005
+
+    def __init__(self, args=()):
+        """
+        Initialize the KernelFuture.
+
+        Args:
+            args (list[Tensor], optional): The tensors owned by the run.
+        """
+        self._args = list(args)
+        self._lock = threading.Lock()
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+        self._poller = None
+        for a in self._args:
+            a._pending = self
+
+    # Implemented by runtimes that launch kernels asynchronously
+    def _poll(self) -> bool:
+        """Whether the run completed, without blocking."""
+        return True
+
+    def _wait(self, timeout: float | None) -> bool:
+        """Block until the run completes or `timeout` seconds passed."""
+        return True
+
+    def _collect(self) -> KernelResult:
+        """Create the result of the completed run."""
+        return self._result
+
+    def _finish(self):
+        callbacks = []
+        with self._lock:
+            if self._done:
+                return
+            try:
+                self._result = self._collect()
+            except Exception as e:
+                self._exception = e
+            for a in self._args:
+                if a._pending is self:
+                    a._pending = None
+                    a.mark_device_dirty()
+            self._args = []
+            self._done = True
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            self._invoke(fn)
+
+    def _invoke(self, fn):
+        try:
+            fn(self)
+        except Exception:
+            logger.exception("Exception in KernelFuture callback %r", fn)
+
+    def _join(self, timeout: float | None = None) -> bool:
+        """Wait for the completion without raising the run's exception."""
+        if not self._done:
+            if not self._wait(timeout):
+                return False
+            self._finish()
+        return True
+
+    def done(self) -> bool:
+        """
+        Check whether the run completed, without blocking.
+
+        Returns:
+            bool: True if the run completed.
+        """
+        if not self._done and self._poll():
+            self._finish()
+        return self._done
+
+    def wait(self, timeout: float | None = None) -> KernelResult:
+        """
+        Wait for the run to complete.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait. Defaults to None (no limit).
+
+        Returns:
+            KernelResult: The result of the run.
+
+        Raises:
+            TimeoutError: If the run did not complete within `timeout`.
+            HostRuntimeError: If the run failed.
+        """
+        if not self._join(timeout):
+            raise TimeoutError(f"Kernel run did not complete in {timeout}s")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    result = wait
+
+    def exception(self, timeout: float | None = None) -> Exception | None:
+        """
+        Wait for the run to complete and return the exception it raised, if any.
+        """
+        if not self._join(timeout):
+            raise TimeoutError(f"Kernel run did not complete in {timeout}s")
+        return self._exception
+
+    def add_done_callback(self, fn):
+        """
+        Call `fn(future)` when the run completes, from a helper thread. If
+        the run already completed, `fn` is called immediately.
+
+        Args:
+            fn (callable): The callback.
+        """
+        with self._lock:
+            if not self._done:
+                self._callbacks.append(fn)
+                if self._poller is None:
+                    self._poller = threading.Thread(target=self._poll_loop, daemon=True)
+                    self._poller.start()
+                return
+        self._invoke(fn)
+
+    def _poll_loop(self):
+        while not self.done():
+            time.sleep(self.POLL_INTERVAL)
+
+    def __await__(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        completed = loop.create_future()
+
+        def _set_completed():
+            if not completed.done():
+                completed.set_result(None)
+
+        self.add_done_callback(lambda _: loop.call_soon_threadsafe(_set_completed))
+        yield from completed.__await__()
+        return self.wait()
+
+
 class HostRuntime(ABC):
     """An abstract class for a generic host runtime"""
 
@@ -149,6 +303,35 @@ class HostRuntime(ABC):
         """
         pass
 
+    def run_async(
+        self,
+        kernel_handle: KernelHandle,
+        args,
+        **kwargs,
+    ) -> KernelFuture:
+        """
+        Launch a loaded kernel and return without waiting for it to complete.
+
+        The argument tensors are owned by the run until it completes; see
+        `KernelFuture`. Runtimes that can not launch kernels asynchronously
+        run the kernel to completion and return a completed future.
+
+        Args:
+            kernel_handle (KernelHandle): The handle to the loaded kernel.
+            args: Arguments to pass to the kernel.
+            **kwargs: Additional arguments passed to `run`.
+
+        Returns:
+            KernelFuture: The future of the run.
+        """
+        future = KernelFuture()
+        try:
+            future._result = self.run(kernel_handle, args, **kwargs)
+        except Exception as e:
+            future._exception = e
+        future._done = True
+        return future
+
     def load_and_run(
         self,
         npu_kernel: NPUKernel,
@@ -0,0 +1,344 @@
+# instrumentation.py -*- Python -*-
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+"""
+Instrumentation of the host runtimes.
+
+The runtimes report the steps they take as `Event`s to the listeners added
+with `add_listener`: spans, such as loading a kernel or waiting for a run,
+and counts, such as context cache hits or bytes synced. Without listeners,
+reporting an event costs a function call.
+
+Events reported by the XRT runtimes:
+    spans: load, xclbin, register_xclbin, hw_context, insts, launch, wait,
+        run (from the launch to the completion of a kernel), sync_to_device,
+        sync_from_device
+    counts: context_cache_hit, context_cache_miss, context_eviction,
+        bytes_to_device, bytes_from_device
+
+`MetricsRegistry` aggregates the events, `ChromeTraceRecorder` records them
+on a timeline that can be merged with the AIE trace.
+"""
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Timestamps of events, in nanoseconds
+now = time.perf_counter_ns
+
+_listeners = ()
+_listeners_lock = threading.Lock()
+
+
+class Event:
+    """A step of a host runtime."""
+
+    __slots__ = ("kind", "name", "start", "duration", "kernel", "value", "thread")
+
+    def __init__(self, kind, name, start, duration=0, kernel=None, value=1):
+        """
+        Args:
+            kind (str): "span" or "count".
+            name (str): What happened, e.g. "load".
+            start (int): When it started, see `now`.
+            duration (int, optional): Nanoseconds it took, for spans.
+            kernel (str, optional): Name of the kernel it concerns.
+            value (int, optional): The count, e.g. a number of bytes.
+        """
+        self.kind = kind
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.kernel = kernel
+        self.value = value
+        self.thread = threading.get_ident()
+
+    def __repr__(self):
+        return (
+            f"Event({self.kind!r}, {self.name!r}, kernel={self.kernel!r}, "
+            f"duration={self.duration}, value={self.value})"
+        )
+
+
+def add_listener(listener):
+    """
+    Call `listener(event)` for every event reported from now on, in the
+    thread that reports it.
+
+    Args:
+        listener (callable): The listener.
+    """
+    global _listeners
+    with _listeners_lock:
+        _listeners = _listeners + (listener,)
+
+
+def remove_listener(listener):
+    """Stop calling a listener added with `add_listener`."""
+    global _listeners
+    with _listeners_lock:
+        _listeners = tuple(l for l in _listeners if l is not listener)
+
+
+@contextlib.contextmanager
+def listening(listener):
+    """
+    Add a listener for the duration of a `with` block.
+
+    Yields:
+        The listener.
+    """
+    add_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+def enabled() -> bool:
+    """Whether any listener receives events."""
+    return bool(_listeners)
+
+
+def _emit(event):
+    for listener in _listeners:
+        try:
+            listener(event)
+        except Exception:
+            logger.exception("Exception in instrumentation listener %r", listener)
+
+
+def span(name, start, kernel=None, end=None):
+    """
+    Report that `name` ran from `start` until `end`.
+
+    Args:
+        name (str): The step.
+        start (int): The result of `now` when it started.
+        kernel (str, optional): Name of the kernel it concerns.
+        end (int, optional): When it ended. Defaults to now.
+    """
+    if _listeners:
+        end = now() if end is None else end
+        _emit(Event("span", name, start, end - start, kernel))
+
+
+def count(name, value=1, kernel=None):
+    """
+    Report a count, e.g. a cache hit or a number of bytes.
+
+    Args:
+        name (str): What is counted.
+        value (int, optional): The count. Defaults to 1.
+        kernel (str, optional): Name of the kernel it concerns.
+    """
+    if _listeners:
+        _emit(Event("count", name, now(), 0, kernel, value))
+
+
+class MetricsRegistry:
+    """
+    Listener aggregating the events per name and kernel: the total of the
+    counts, and the number, total, minimum and maximum duration of spans.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._timings = {}
+
+    def __call__(self, event):
+        key = (event.name, event.kernel)
+        with self._lock:
+            if event.kind == "count":
+                self._counters[key] = self._counters.get(key, 0) + event.value
+                return
+            timing = self._timings.get(key)
+            if timing is None:
+                self._timings[key] = [1, event.duration, event.duration, event.duration]
+            else:
+                timing[0] += 1
+                timing[1] += event.duration
+                timing[2] = min(timing[2], event.duration)
+                timing[3] = max(timing[3], event.duration)
+
+    def counter(self, name, kernel=None) -> int:
+        """
+        The total of a count, for one kernel or, if `kernel` is None, for
+        all events.
+        """
+        with self._lock:
+            return sum(
+                v
+                for (n, k), v in self._counters.items()
+                if n == name and (kernel is None or k == kernel)
+            )
+
+    def timing(self, name, kernel=None) -> dict:
+        """
+        Statistics of a span, for one kernel or, if `kernel` is None, for all
+        events.
+
+        Returns:
+            dict: count, total, mean, min and max, in nanoseconds.
+        """
+        with self._lock:
+            timings = [
+                t
+                for (n, k), t in self._timings.items()
+                if n == name and (kernel is None or k == kernel)
+            ]
+        return self._stats(timings)
+
+    @staticmethod
+    def _stats(timings):
+        if not timings:
+            return {"count": 0, "total": 0, "mean": 0.0, "min": 0, "max": 0}
+        n = sum(t[0] for t in timings)
+        total = sum(t[1] for t in timings)
+        return {
+            "count": n,
+            "total": total,
+            "mean": total / n,
+            "min": min(t[2] for t in timings),
+            "max": max(t[3] for t in timings),
+        }
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: "counters" and "timings", each by name and then by kernel
+            name ("" for events without a kernel).
+        """
+        snapshot = {"counters": {}, "timings": {}}
+        with self._lock:
+            counters = dict(self._counters)
+            timings = {key: list(t) for key, t in self._timings.items()}
+        for (name, kernel), value in counters.items():
+            snapshot["counters"].setdefault(name, {})[kernel or ""] = value
+        for (name, kernel), t in timings.items():
+            snapshot["timings"].setdefault(name, {})[kernel or ""] = self._stats([t])
+        return snapshot
+
+    def reset(self):
+        """Drop all aggregated events."""
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+class ChromeTraceRecorder:
+    """
+    Listener recording the events in the Chrome Trace Event Format, which
+    Perfetto and chrome://tracing display: spans as complete ("X") events
+    and the running total of counts as counter ("C") events.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = []
+        self._totals = {}
+        self.pid = os.getpid()
+
+    def __call__(self, event):
+        with self._lock:
+            if event.kind == "span":
+                self._events.append(
+                    {
+                        "name": event.name,
+                        "ph": "X",
+                        "ts": event.start / 1e3,
+                        "dur": event.duration / 1e3,
+                        "pid": self.pid,
+                        "tid": event.thread,
+                        "args": {"kernel": event.kernel} if event.kernel else {},
+                    }
+                )
+            else:
+                total = self._totals.get(event.name, 0) + event.value
+                self._totals[event.name] = total
+                self._events.append(
+                    {
+                        "name": event.name,
+                        "ph": "C",
+                        "ts": event.start / 1e3,
+                        "pid": self.pid,
+                        "args": {event.name: total},
+                    }
+                )
+
+    def trace_events(self) -> list:
+        """
+        Returns:
+            list[dict]: The recorded events, with timestamps in microseconds.
+        """
+        with self._lock:
+            events = list(self._events)
+        metadata = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": self.pid,
+            "args": {"name": "host runtime"},
+        }
+        return [metadata] + events
+
+    def merge_aie_trace(self, aie_trace_events, clock_mhz=1000.0, start=None):
+        """
+        Place the events of an AIE trace, e.g. from `parse_trace`, on the
+        timeline of the host events.
+
+        AIE trace timestamps count cycles from an arbitrary origin. The first
+        AIE event is placed at `start`, by default the launch of the last
+        recorded kernel run.
+
+        Args:
+            aie_trace_events (iterable[dict]): The AIE trace events.
+            clock_mhz (float, optional): Clock frequency of the AIE array.
+                Defaults to 1000.
+            start (float, optional): Host timestamp of the first AIE event, in
+                microseconds.
+
+        Returns:
+            list[dict]: The host and the AIE events.
+        """
+        events = self.trace_events()
+        aie_events = [dict(e) for e in aie_trace_events]
+        if start is None:
+            runs = [e["ts"] for e in events if e["name"] == "run" and e["ph"] == "X"]
+            start = runs[-1] if runs else 0.0
+        origin = min((e["ts"] for e in aie_events if "ts" in e), default=0)
+        for e in aie_events:
+            if "ts" in e:
+                e["ts"] = start + (e["ts"] - origin) / clock_mhz
+        return events + aie_events
+
+    def write(self, path, aie_trace_events=None, **kwargs):
+        """
+        Write the events as a JSON trace, merged with an AIE trace if given.
+
+        Args:
+            path (str | Path): The trace file.
+            aie_trace_events (iterable[dict], optional): See `merge_aie_trace`.
+            **kwargs: Passed to `merge_aie_trace`.
+        """
+        if aie_trace_events is None:
+            events = self.trace_events()
+        else:
+            events = self.merge_aie_trace(aie_trace_events, **kwargs)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events}, f)
+
+    def clear(self):
+        """Drop the recorded events."""
+        with self._lock:
+            self._events.clear()
+            self._totals.clear()
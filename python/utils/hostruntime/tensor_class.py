@@ -17,6 +17,15 @@ class Tensor(ABC):
     The class provides commom tensor operations such as creation,
     filling with values, and accessing data.
 
+    NPU tensors track which copy of the data is current. Reads sync from
+    the device only after the device wrote to the buffer (see
+    `mark_device_dirty`), and host writes are recorded as a dirty byte range
+    that is synced to the device on the next `to("npu")`, or when the buffer
+    is handed to a kernel. Writes through the array returned by `numpy()`
+    can not be tracked, so it marks the whole buffer host-dirty. While a
+    kernel launched with `run_async` owns the tensor, host accesses wait
+    for the kernel to complete.
+
     """
 
     DEVICES = ["cpu", "npu"]
@@ -39,6 +48,12 @@ class Tensor(ABC):
             raise ValueError(f"Unsupported device: {device}")
         self.device = device
         self.dtype = dtype
+        # Coherence state: whether the host copy is current, and the byte
+        # range [start, end) written on the host but not synced to the device
+        self._host_valid = True
+        self._host_dirty = None
+        # Future of the kernel run the tensor was passed to, until it completes
+        self._pending = None
 
     @property
     @abstractmethod
@@ -68,8 +83,7 @@ class Tensor(ABC):
 
         Note: This method may implicitly trigger data synchronization to devices.
         """
-        if self.device == "npu":
-            self._sync_from_device()
+        self._ensure_host()
         array_str = np.array2string(self.data, separator=",")
         return f"{self.__class__.__name__}({array_str}, device='{self.device}')"
 
@@ -86,11 +100,10 @@ class Tensor(ABC):
         Returns:
             np.ndarray: A NumPy array containing the tensor's data.
 
-        Note: For NPU tensors, this method causes implicit data synchronization from device to host
-        to ensure the returned array reflects the current device state.
+        Note: For NPU tensors, this method syncs from device to host if the
+        device wrote to the tensor since the last sync.
         """
-        if self.device == "npu":
-            self._sync_from_device()
+        self._ensure_host()
         if dtype:
             return self.data.astype(dtype)
         return self.data
@@ -105,11 +118,10 @@ class Tensor(ABC):
         Returns:
             The value at the specified index.
 
-        Note: For NPU tensors, this method causes implicit data synchronization from device to host
-        to ensure the retrieved value reflects the current device state.
+        Note: For NPU tensors, this method syncs from device to host if the
+        device wrote to the tensor since the last sync.
         """
-        if self.device == "npu":
-            self._sync_from_device()
+        self._ensure_host()
         return self.data[index]
 
     def __setitem__(self, index, value):
@@ -120,15 +132,13 @@ class Tensor(ABC):
             index (int): The index of the value to set.
             value: The new value to assign.
 
-        Note: For NPU tensors, this method causes implicit data synchronization from device to host
-        before modification and back to device after modification to ensure
-        data consistency across device and host memory.
+        Note: For NPU tensors, this method syncs from device to host if the
+        device wrote to the tensor since the last sync. The modified bytes are
+        synced back to the device lazily, see `to`.
         """
-        if self.device == "npu":
-            self._sync_from_device()
+        self._ensure_host()
         self.data[index] = value
-        if self.device == "npu":
-            self._sync_to_device()
+        self._mark_host_dirty(*self._byte_range(index))
 
     def __len__(self):
         """
@@ -162,31 +172,113 @@ class Tensor(ABC):
         """
         Moves the tensor to a specified target device.
 
+        Moving to 'npu' syncs the host writes that were not synced yet, also
+        if the tensor is already on the 'npu'. Moving to 'cpu' syncs from the
+        device if the device wrote to the tensor.
+
         Args:
             target_device (str): The target device.
 
         Returns:
            The tensor object on the target device.
         """
-        if target_device == self.device:
-            # nothing to do
-            pass
-        elif target_device == "npu":
-            self._sync_to_device()
+        if target_device == "npu":
+            self._ensure_device()
             self.device = "npu"
         elif target_device == "cpu":
-            self._sync_from_device()
+            self._ensure_host()
             self.device = "cpu"
         else:
             raise ValueError(f"Unknown device '{target_device}'")
         return self
 
+    def mark_device_dirty(self):
+        """
+        Record that the device wrote to the tensor, e.g. because it was passed
+        to a kernel. The next host access syncs the data from the device.
+        """
+        self._host_valid = False
+        self._host_dirty = None
+
+    def _wait_pending(self):
+        """Wait until the kernel run that owns the tensor completes."""
+        if self._pending is not None:
+            self._pending._join()
+
+    def _ensure_host(self):
+        """Sync from the device if the host copy is stale."""
+        self._wait_pending()
+        if not self._host_valid:
+            self._sync_from_device()
+            self._host_valid = True
+
+    def _ensure_device(self):
+        """Sync the host writes that were not synced to the device yet."""
+        if self._host_dirty is not None:
+            start, end = self._host_dirty
+            if start == 0 and end >= self.nbytes:
+                self._sync_to_device()
+            else:
+                self._sync_to_device(end - start, start)
+            self._host_dirty = None
+
+    def _mark_host_dirty(self, start=0, end=None):
+        """
+        Record that the bytes [start, end) were written on the host. Dirty
+        ranges are merged into one range that covers all of them.
+        """
+        end = self.nbytes if end is None else end
+        if end <= start:
+            return
+        if self._host_dirty is not None:
+            start = min(start, self._host_dirty[0])
+            end = max(end, self._host_dirty[1])
+        self._host_dirty = (start, end)
+
+    def _byte_range(self, index):
+        """
+        Byte range [start, end) of the tensor covered by `index`, or the whole
+        tensor if the index selects elements that are not a strided view (e.g.
+        integer array or boolean indexing).
+        """
+        data = self.data
+        selected = data[index]
+        if isinstance(selected, np.ndarray):
+            if selected.size == 0:
+                return 0, 0
+            if not np.may_share_memory(selected, data) or not data.flags.c_contiguous:
+                return 0, self.nbytes
+            start = selected.ctypes.data - data.ctypes.data
+            end = start + selected.itemsize
+            for dim, stride in zip(selected.shape, selected.strides):
+                if stride < 0:
+                    start += (dim - 1) * stride
+                else:
+                    end += (dim - 1) * stride
+            return start, end
+        # A single element selected with integer indices
+        indices = index if isinstance(index, tuple) else (index,)
+        if (
+            data.ndim == 0
+            or len(indices) != data.ndim
+            or not all(isinstance(i, (int, np.integer)) for i in indices)
+            or not data.flags.c_contiguous
+        ):
+            return 0, self.nbytes
+        indices = tuple(int(i) % dim for i, dim in zip(indices, data.shape))
+        start = int(np.ravel_multi_index(indices, data.shape)) * data.itemsize
+        return start, start + data.itemsize
+
     @abstractmethod
-    def _sync_to_device(self):
+    def _sync_to_device(self, size=None, offset=0):
         """
         Syncs the tensor data from the host to the device memory.
 
         This method should be implemented by subclasses to handle device-specific synchronization.
+
+        Args:
+            size (int, optional): Number of bytes to sync. Defaults to the whole tensor.
+            offset (int, optional): Byte offset of the synced range. Defaults to 0.
         """
         ...
 
@@ -233,6 +325,7 @@ class Tensor(ABC):
                     "Provided `out` tensor must match shape, dtype, and device"
                 )
             t = out
+            t._wait_pending()
         else:
             t = cls(shape, dtype=dtype, device=device, **kwargs)
         return t
@@ -247,11 +340,13 @@ class Tensor(ABC):
         Returns:
             np.ndarray: The tensor's data as a NumPy array.
 
-        Note: For NPU tensors, this method causes implicit data synchronization from device to host
-        to ensure the returned array reflects the current device state.
+        Note: For NPU tensors, this method syncs from device to host if the
+        device wrote to the tensor since the last sync. Since the returned
+        array may be modified, the whole tensor is synced back to the device
+        on the next `to("npu")`.
         """
-        if self.device == "npu":
-            self._sync_from_device()
+        self._ensure_host()
+        self._mark_host_dirty()
         return self.data
 
     def to_torch(self):
@@ -282,13 +377,34 @@ class Tensor(ABC):
         return torch.from_numpy(array)
 
     @classmethod
-    def from_torch(cls, torch_tensor, device=None, **kwargs):
+    def wrap(cls, array, device=None, **kwargs):
+        """
+        Returns a tensor that shares the memory of a NumPy array if the tensor
+        class supports it, and has a copy of the data otherwise.
+
+        Args:
+            array (np.ndarray): The source array.
+            device (str, optional): The target device. Defaults to None.
+            **kwargs: Additional arguments for tensor creation.
+
+        Returns:
+            Tensor: A tensor containing the data of the array.
+        """
+        array = np.asarray(array)
+        return cls(
+            array, dtype=array.dtype, device=device or cls.DEFAULT_DEVICE, **kwargs
+        )
+
+    @classmethod
+    def from_torch(cls, torch_tensor, device=None, copy=True, **kwargs):
         """
         Returns a tensor with a copy of the data in the torch_tensor.
 
         Args:
             torch_tensor (torch.Tensor): The source torch tensor.
             device (str, optional): The target device. Defaults to None.
+            copy (bool, optional): If False, share the memory of the torch
+                tensor when possible, see `wrap`. Defaults to True.
             **kwargs: Additional arguments for tensor creation.
 
         Returns:
@@ -321,6 +437,8 @@ class Tensor(ABC):
         else:
             np_array = t.numpy()
 
+        if not copy:
+            return cls.wrap(np_array, device=device, **kwargs)
         return cls(
             np_array,
             dtype=np_array.dtype,
@@ -335,11 +453,28 @@ class Tensor(ABC):
         Args:
             value: The scalar value to fill the tensor with.
 
-        Note: For NPU tensors, this method syncs the filled data to device after modification.
+        Note: For NPU tensors, the filled data is synced to device lazily, see `to`.
         """
+        self._wait_pending()
         self.data.fill(value)
-        if self.device == "npu":
-            self._sync_to_device()
+        self._host_valid = True
+        self._mark_host_dirty()
+
+    def copy_(self, src):
+        """
+        Copies an array into the tensor (in-place operation), broadcasting it
+        to the shape of the tensor.
+
+        Every element is overwritten, so unlike `tensor[:] = src`, data the
+        device wrote is not synced from the device first.
+
+        Args:
+            src (array-like): The data to copy.
+        """
+        self._wait_pending()
+        np.copyto(self.data, src, casting="unsafe")
+        self._host_valid = True
+        self._mark_host_dirty()
 
     def numel(self):
         """
@@ -414,8 +549,8 @@ class Tensor(ABC):
             t.data.fill(random_val)
         else:
             t.data[:] = random_val
-        if device == "npu":
-            t._sync_to_device()
+        t._host_valid = True
+        t._mark_host_dirty()
         return t
 
     @classmethod
@@ -458,8 +593,8 @@ class Tensor(ABC):
             t.data.fill(random_val)
         else:
             t.data[:] = random_val
-        if device == "npu":
-            t._sync_to_device()
+        t._host_valid = True
+        t._mark_host_dirty()
         return t
 
     @classmethod
@@ -499,15 +634,15 @@ class Tensor(ABC):
                 raise ValueError(
                     "Provided `out` tensor must match shape, dtype, and device"
                 )
+            out._wait_pending()
             out.data[...] = data
-            if device == "npu":
-                out._sync_to_device()
+            out._host_valid = True
+            out._mark_host_dirty()
             return out
 
         t = cls((data.size,), dtype=dtype, device=device, **kwargs)
         t.data[...] = data
-        if device == "npu":
-            t._sync_to_device()
+        t._mark_host_dirty()
         return t
 
     @classmethod
@@ -528,10 +663,7 @@ class Tensor(ABC):
         device = device or other.device
         t = cls(other.shape, dtype=dtype, device=device, **kwargs)
         t.data.fill(0)
-
-        if device == "npu":
-            t._sync_to_device()
-
+        t._mark_host_dirty()
         return t
 
 
@@ -582,7 +714,7 @@ class CPUOnlyTensor(Tensor):
         """
         return self._shape
 
-    def _sync_to_device(self):
+    def _sync_to_device(self, size=None, offset=0):
         """
         Syncs the tensor data from the host to the device memory.
         For CPUOnlyTensor, this is a no-op.
@@ -0,0 +1,242 @@
+# bo_pool.py -*- Python -*-
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+import logging
+import os
+import threading
+from collections import defaultdict
+
+import numpy as np
+import pyxrt as xrt
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 4096
+
+# Number of bytes of free buffer objects the pool keeps for reuse.
+XRT_BO_POOL_SIZE = int(os.environ.get("XRT_BO_POOL_SIZE_MB", "256")) << 20
+
+_device = None
+_device_lock = threading.Lock()
+
+
+def get_device(device_index=0):
+    """
+    The XRT device handle shared by all tensors of the process.
+
+    Args:
+        device_index (int, optional): Index of the device. Only 0 is supported.
+
+    Returns:
+        pyxrt.device: The device.
+    """
+    global _device
+    if device_index != 0:
+        return xrt.device(device_index)
+    with _device_lock:
+        if _device is None:
+            _device = xrt.device(0)
+        return _device
+
+
+def aligned_empty(shape, dtype=np.uint8, alignment=PAGE_SIZE):
+    """
+    Allocate an uninitialized NumPy array whose data starts at an address
+    aligned to `alignment` bytes, so `XRTTensor.wrap` can use its memory
+    without a copy where the XRT bindings support it.
+
+    Args:
+        shape (int | tuple): Shape of the array.
+        dtype (np.dtype, optional): Data type. Defaults to np.uint8.
+        alignment (int, optional): Alignment in bytes. Defaults to the page size.
+
+    Returns:
+        np.ndarray: The array.
+    """
+    dtype = np.dtype(dtype)
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -buffer.ctypes.data % alignment
+    return buffer[offset : offset + nbytes].view(dtype).reshape(shape)
+
+
+_userptr_supported = True
+
+
+def userptr_bo(device, array, flags=xrt.bo.host_only, group_id=0):
+    """
+    Create a buffer object that uses the memory of a C-contiguous, page
+    aligned array instead of allocating its own.
+
+    Returns:
+        pyxrt.bo | None: The buffer object, or None if the XRT bindings can
+        not create buffer objects from user memory.
+    """
+    global _userptr_supported
+    if not _userptr_supported:
+        return None
+    try:
+        return xrt.bo(device, array, array.nbytes, flags, group_id)
+    except TypeError:
+        # No binding of the user pointer constructor
+        _userptr_supported = False
+        return None
+
+
+def size_class(nbytes):
+    """
+    Capacity of the buffer objects used for `nbytes` bytes: a whole number
+    of pages, rounded up to one of four sizes between consecutive powers of
+    two, so less than a quarter of a buffer larger than 4 pages is unused.
+    """
+    pages = max(1, -(-nbytes // PAGE_SIZE))
+    if pages > 4:
+        step = 1 << (pages.bit_length() - 3)
+        pages = -(-pages // step) * step
+    return pages * PAGE_SIZE
+
+
+class BufferPool:
+    """
+    Pool of XRT buffer objects that are reused by size class instead of
+    being freed, since allocating and mapping a buffer object can cost more
+    than running a small kernel.
+
+    Free buffers are kept per (capacity, flags, group id) until they hold
+    more than `max_bytes`, after which released buffers are freed. `trim`
+    frees cached buffers explicitly.
+    """
+
+    def __init__(self, max_bytes=XRT_BO_POOL_SIZE):
+        """
+        Args:
+            max_bytes (int, optional): Number of bytes of free buffers kept.
+        """
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._free = defaultdict(list)
+        self._cached_bytes = 0
+        self._in_use_bytes = 0
+        self._stats = defaultdict(int)
+
+    def acquire(self, nbytes, flags=xrt.bo.host_only, group_id=0, device=None):
+        """
+        Get a buffer object of at least `nbytes` bytes.
+
+        Returns:
+            tuple[pyxrt.bo, int]: The buffer object and its capacity in bytes.
+        """
+        capacity = size_class(nbytes)
+        key = (capacity, flags, group_id)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                bo = free.pop()
+                self._cached_bytes -= capacity
+                self._stats["reuses"] += 1
+            else:
+                bo = None
+                self._stats["allocations"] += 1
+            self._in_use_bytes += capacity
+            self._stats["peak_in_use_bytes"] = max(
+                self._stats["peak_in_use_bytes"], self._in_use_bytes
+            )
+        if bo is None:
+            bo = xrt.bo(device or get_device(), capacity, flags, group_id)
+        return bo, capacity
+
+    def release(self, bo, capacity, flags=xrt.bo.host_only, group_id=0):
+        """
+        Return a buffer object obtained with `acquire`. It is kept for reuse
+        unless the pool is full.
+        """
+        with self._lock:
+            self._in_use_bytes -= capacity
+            self._stats["releases"] += 1
+            if self._cached_bytes + capacity > self.max_bytes:
+                self._stats["frees"] += 1
+                return
+            self._free[(capacity, flags, group_id)].append(bo)
+            self._cached_bytes += capacity
+            self._stats["peak_cached_bytes"] = max(
+                self._stats["peak_cached_bytes"], self._cached_bytes
+            )
+
+    def discard(self, capacity):
+        """Record that a buffer obtained with `acquire` was freed instead of
+        being released, e.g. because its memory is still referenced."""
+        with self._lock:
+            self._in_use_bytes -= capacity
+            self._stats["frees"] += 1
+
+    def trim(self, max_bytes=0):
+        """
+        Free cached buffers, largest first, until at most `max_bytes` bytes
+        are cached.
+
+        Returns:
+            int: Number of bytes freed.
+        """
+        freed = 0
+        with self._lock:
+            for key in sorted(self._free, key=lambda k: k[0], reverse=True):
+                free = self._free[key]
+                while free and self._cached_bytes > max_bytes:
+                    free.pop()
+                    self._cached_bytes -= key[0]
+                    freed += key[0]
+                    self._stats["frees"] += 1
+                if not free:
+                    del self._free[key]
+        if freed:
+            logger.debug("Freed %d bytes of cached buffer objects", freed)
+        return freed
+
+    def stats(self):
+        """
+        Statistics to size the pool: the number of allocations, reuses,
+        releases and frees, the bytes of buffers in use and cached, and
+        their high-water marks.
+
+        Returns:
+            dict: The statistics.
+        """
+        with self._lock:
+            stats = {
+                "allocations": 0,
+                "reuses": 0,
+                "releases": 0,
+                "frees": 0,
+                "peak_in_use_bytes": 0,
+                "peak_cached_bytes": 0,
+            }
+            stats.update(self._stats)
+            stats["in_use_bytes"] = self._in_use_bytes
+            stats["cached_bytes"] = self._cached_bytes
+            stats["cached_buffers"] = sum(len(f) for f in self._free.values())
+        return stats
+
+    def reset_stats(self):
+        """Reset the counters and set the high-water marks to the current usage."""
+        with self._lock:
+            self._stats = defaultdict(int)
+            self._stats["peak_in_use_bytes"] = self._in_use_bytes
+            self._stats["peak_cached_bytes"] = self._cached_bytes
+
+
+_pool = BufferPool()
+
+
+def get_buffer_pool():
+    """
+    The buffer pool used by `XRTTensor`.
+
+    Returns:
+        BufferPool: The pool.
+    """
+    return _pool
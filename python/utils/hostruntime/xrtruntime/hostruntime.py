@@ -13,13 +13,24 @@ import shutil
 import time
 import weakref
 import gc
+import hashlib
+import itertools
+import threading
 import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING
 import numpy as np
 import pyxrt
 
-from ..hostruntime import HostRuntime, HostRuntimeError, KernelHandle, KernelResult
+from .. import instrumentation
+from ..context_budget import ContextBudget
+from ..hostruntime import (
+    HostRuntime,
+    HostRuntimeError,
+    KernelFuture,
+    KernelHandle,
+    KernelResult,
+)
 
 if TYPE_CHECKING:
     from aie.iron.device import Device
@@ -34,7 +45,7 @@ class XRTKernelHandle(KernelHandle):
     Handle for a loaded XRT kernel.
     """
 
-    def __init__(self, kernel, xclbin, context, insts, insts_bo=None):
+    def __init__(self, kernel, xclbin, context, insts, insts_bo=None, kernel_name=None):
         """
         Initialize the XRTKernelHandle.
 
@@ -44,12 +55,25 @@ class XRTKernelHandle(KernelHandle):
             context: The XRT context object.
             insts: The instructions for the kernel.
             insts_bo (optional): The instruction buffer object. Defaults to None.
+            kernel_name (str, optional): Name of the kernel, used to report instrumentation events. Defaults to None.
         """
         self.kernel = kernel
         self.xclbin = xclbin
         self.context = context
         self.insts = insts
         self.insts_bo = insts_bo
+        self.kernel_name = kernel_name
+        self._finalizer = None
+
+    def release(self):
+        """
+        Release the resources the handle shares with other handles, such as
+        its instruction buffer. This happens automatically when the handle
+        is garbage collected.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+        self.insts_bo = None
 
 
 class XRTKernelResult(KernelResult):
@@ -68,6 +92,217 @@ class XRTKernelResult(KernelResult):
         return self.ret == pyxrt.ert_cmd_state.ERT_CMD_STATE_COMPLETED
 
 
+class XRTKernelFuture(KernelFuture):
+    """Future of a kernel run launched with `XRTHostRuntime.run_async`"""
+
+    # Command states of a run that did not complete yet
+    PENDING_STATES = (
+        pyxrt.ert_cmd_state.ERT_CMD_STATE_NEW,
+        pyxrt.ert_cmd_state.ERT_CMD_STATE_QUEUED,
+        pyxrt.ert_cmd_state.ERT_CMD_STATE_RUNNING,
+        pyxrt.ert_cmd_state.ERT_CMD_STATE_SUBMITTED,
+    )
+
+    def __init__(
+        self,
+        run_handle,
+        args,
+        start: int,
+        fail_on_error: bool = True,
+        resources=(),
+        kernel_name=None,
+    ):
+        """
+        Initialize the XRTKernelFuture.
+
+        Args:
+            run_handle (pyxrt.run): The run returned by the kernel call.
+            args (list[XRTTensor]): The tensors owned by the run.
+            start (int): Time the run was launched at, in nanoseconds.
+            fail_on_error (bool, optional): Whether to raise an exception if the run fails. Defaults to True.
+            resources (tuple, optional): Objects to keep alive until the run completes.
+            kernel_name (str, optional): Name of the kernel, used to report instrumentation events. Defaults to None.
+        """
+        super().__init__(args)
+        self._run = run_handle
+        self._start = start
+        self._stop = None
+        self._state = None
+        self._fail_on_error = fail_on_error
+        self._resources = resources
+        self._kernel_name = kernel_name
+        self._launched = instrumentation.now()
+
+    def _poll(self) -> bool:
+        if self._stop is None:
+            state = self._run.state()
+            if state in self.PENDING_STATES:
+                return False
+            self._state, self._stop = state, time.time_ns()
+        return True
+
+    def _wait(self, timeout: float | None) -> bool:
+        if self._stop is not None:
+            return True
+        waited = instrumentation.now()
+        if timeout is None:
+            self._state = self._run.wait()
+            self._stop = time.time_ns()
+        else:
+            deadline = time.monotonic() + timeout
+            while not self._poll():
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(self.POLL_INTERVAL)
+        instrumentation.span("wait", waited, self._kernel_name)
+        return True
+
+    def _collect(self) -> XRTKernelResult:
+        self._run = None
+        self._resources = ()
+        instrumentation.span(
+            "run",
+            self._launched,
+            self._kernel_name,
+            end=self._launched + self._stop - self._start,
+        )
+        if (
+            self._fail_on_error
+            and self._state != pyxrt.ert_cmd_state.ERT_CMD_STATE_COMPLETED
+        ):
+            raise HostRuntimeError(f"Kernel returned {str(self._state)}")
+        return XRTKernelResult(self._state, self._stop - self._start)
+
+
+class XRTRunList:
+    """
+    Kernel runs that are submitted to the NPU together as XRT runlists,
+    without a host round trip per run. Create one with
+    `XRTHostRuntime.runlist`.
+
+    The runs execute in the order they were added. Kernels loaded from
+    different xclbins run on different hardware contexts: consecutive runs
+    on the same context are submitted as one runlist, and the runlists are
+    executed one after the other. If the XRT Python bindings have no
+    runlist support, the runs are started back to back instead.
+    """
+
+    def __init__(self, runtime: "XRTHostRuntime"):
+        """
+        Initialize the XRTRunList.
+
+        Args:
+            runtime (XRTHostRuntime): The runtime the kernels were loaded with.
+        """
+        self._runtime = runtime
+        self._entries = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, kernel_handle: XRTKernelHandle, args) -> int:
+        """
+        Append a run of a loaded kernel.
+
+        The kernel and its context are kept alive by the run list, so they
+        may be evicted from a context cache before the list is run.
+
+        Args:
+            kernel_handle (XRTKernelHandle): The handle to the loaded kernel.
+            args: Arguments to pass to the kernel.
+
+        Returns:
+            int: Index of the run in the results of `run`.
+        """
+        args = self._runtime._check_args(args)
+        insts_bo, insts_bytes = self._runtime._insts_args(kernel_handle)
+        self._entries.append(
+            (kernel_handle.kernel, kernel_handle.context, insts_bo, insts_bytes, args)
+        )
+        return len(self._entries) - 1
+
+    def run(self, fail_on_error: bool = True) -> list[XRTKernelResult]:
+        """
+        Submit the runs and wait for them to complete. A run list can be run
+        more than once.
+
+        Args:
+            fail_on_error (bool, optional): Whether to raise an exception if a run fails. Defaults to True.
+
+        Returns:
+            list[XRTKernelResult]: The result of every run, in the order they
+            were added. The npu_time of a run is the time from the completion
+            of the previous run, or the submission of the first, to its
+            completion.
+
+        Raises:
+            HostRuntimeError: If a run fails (and fail_on_error is True).
+        """
+        self._runtime.check_device_consistency()
+        runs = []
+        for kernel, context, insts_bo, insts_bytes, args in self._entries:
+            buffers = self._runtime._prepare_args(args)
+            run = pyxrt.run(kernel)
+            kernel_args = [3, 0 if insts_bo is None else insts_bo, insts_bytes]
+            for i, arg in enumerate(kernel_args + buffers):
+                run.set_arg(i, arg)
+            runs.append((context, run))
+
+        results = []
+        try:
+            previous = time.time_ns()
+            failed = False
+            for _, segment in itertools.groupby(runs, key=lambda r: id(r[0])):
+                segment = list(segment)
+                runlist = self._submit(segment[0][0], [run for _, run in segment])
+                for _, run in segment:
+                    # The runs after a failed run of a runlist are never started
+                    if failed:
+                        break
+                    while run.state() in XRTKernelFuture.PENDING_STATES:
+                        time.sleep(XRTKernelFuture.POLL_INTERVAL)
+                    now = time.time_ns()
+                    results.append(XRTKernelResult(run.state(), now - previous))
+                    previous = now
+                    failed = not results[-1].is_success()
+                if runlist is not None:
+                    try:
+                        runlist.wait()
+                    except RuntimeError:
+                        # Raised for the failed run, which is reported below
+                        if not failed:
+                            raise
+                if failed:
+                    break
+            # Runs after a failed run are not started
+            for _, run in runs[len(results) :]:
+                results.append(XRTKernelResult(run.state(), 0))
+        finally:
+            # The kernels may have written to any of their buffers
+            for *_, args in self._entries:
+                for a in args:
+                    a.mark_device_dirty()
+
+        if fail_on_error:
+            for i, r in enumerate(results):
+                if not r.is_success():
+                    raise HostRuntimeError(f"Run {i} of the run list returned {r.ret}")
+        return results
+
+    @staticmethod
+    def _submit(context, runs):
+        """Start the runs, returning the runlist they were submitted with."""
+        if hasattr(pyxrt, "runlist"):
+            runlist = pyxrt.runlist(context)
+            for run in runs:
+                runlist.add(run)
+            runlist.execute()
+            return runlist
+        for run in runs:
+            run.start()
+        return None
+
+
 class XRTHostRuntime(HostRuntime):
     """Singleton manager for AIE XRT resources."""
 
@@ -84,6 +319,10 @@ class XRTHostRuntime(HostRuntime):
         """
         Initialize the XRTHostRuntime.
         """
+        # Instruction buffers by (instruction hash, group id), shared by the
+        # kernel handles loading identical instructions: [insts_bo, #handles]
+        self._insts_bos = {}
+        self._insts_lock = threading.Lock()
         # Retry logic for device acquisition to handle transient failures
         max_retries = 5
         for attempt in range(max_retries):
@@ -193,10 +432,16 @@ class XRTHostRuntime(HostRuntime):
                 f"insts {insts_path} does not exist or is not a file."
             )
 
+        loaded = t = instrumentation.now()
         xclbin = pyxrt.xclbin(str(xclbin_path))
+        instrumentation.span("xclbin", t, kernel_name)
+        t = instrumentation.now()
         self._device.register_xclbin(xclbin)
+        instrumentation.span("register_xclbin", t, kernel_name)
         xclbin_uuid = xclbin.get_uuid()
+        t = instrumentation.now()
         context = pyxrt.hw_context(self._device, xclbin_uuid)
+        instrumentation.span("hw_context", t, kernel_name)
 
         if kernel_name is None:
             kernels = xclbin.get_kernels()
@@ -209,15 +454,56 @@ class XRTHostRuntime(HostRuntime):
                     f"Kernel {kernel_name} not found in xclbin (kernels found: {[k.get_name() for k in xclbin.get_kernels()]})"
                 )
 
+        t = instrumentation.now()
         insts = self.read_insts(insts_path)
+        insts_key = insts_bo = None
         if hasattr(pyxrt, "module") and isinstance(insts, pyxrt.module):
             kernel = pyxrt.ext.kernel(context, insts, kernel_name)
         else:
             kernel = pyxrt.kernel(context, kernel_name)
-
-        kernel_handle = XRTKernelHandle(kernel, xclbin, context, insts)
+            insts_key, insts_bo = self._acquire_insts_bo(insts, kernel.group_id(1))
+        instrumentation.span("insts", t, kernel_name)
+
+        kernel_handle = XRTKernelHandle(
+            kernel, xclbin, context, insts, insts_bo, kernel_name
+        )
+        if insts_bo is not None:
+            kernel_handle._finalizer = weakref.finalize(
+                kernel_handle, self._release_insts_bo, insts_key
+            )
+        instrumentation.span("load", loaded, kernel_name)
         return kernel_handle
 
+    def _acquire_insts_bo(self, insts, group_id):
+        """
+        Get the instruction buffer for an instruction stream, uploading it
+        only if no other live handle loaded identical instructions.
+
+        Returns:
+            tuple: The cache key to release the buffer with, and the buffer.
+        """
+        key = (hashlib.sha256(insts).hexdigest(), group_id)
+        with self._insts_lock:
+            entry = self._insts_bos.get(key)
+            if entry is None:
+                insts_bo = self._tensor_class(
+                    insts,
+                    flags=pyxrt.bo.cacheable,
+                    group_id=group_id,
+                ).buffer_object()
+                entry = self._insts_bos[key] = [insts_bo, 0]
+            entry[1] += 1
+            return key, entry[0]
+
+    def _release_insts_bo(self, key):
+        """Drop a handle's reference to a shared instruction buffer."""
+        with self._insts_lock:
+            entry = self._insts_bos.get(key)
+            if entry is not None:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._insts_bos[key]
+
     def run(
         self,
         kernel_handle: XRTKernelHandle,
@@ -242,46 +528,122 @@ class XRTHostRuntime(HostRuntime):
         Raises:
             HostRuntimeError: If arguments are invalid or kernel execution fails (and fail_on_error is True).
         """
+        return self.run_async(
+            kernel_handle, args, trace_config, fail_on_error, **kwargs
+        ).wait()
+
+    def run_async(
+        self,
+        kernel_handle: XRTKernelHandle,
+        args,
+        trace_config=None,
+        fail_on_error: bool = True,
+        read_only=(),
+        **kwargs,
+    ) -> "XRTKernelFuture":
+        """
+        Launch a loaded XRT kernel without waiting for it to complete.
+
+        Several runs may be in flight on the same hardware context. The
+        argument tensors are owned by the run until it completes, see
+        `KernelFuture`. If an argument is owned by another run, that run is
+        waited for before launching this one.
+
+        Tensors in `read_only`, such as weights passed to every run, are not
+        owned by the run, so several runs can use them at once. The kernel
+        must not write to them, and the host must not write to them until
+        the runs complete.
+
+        Args:
+            kernel_handle (XRTKernelHandle): The handle to the loaded kernel.
+            args: Arguments to pass to the kernel.
+            trace_config (optional): Configuration for tracing. Defaults to None.
+            fail_on_error (bool, optional): Whether waiting on the future raises an exception on kernel failure. Defaults to True.
+            read_only (Sequence[XRTTensor], optional): Arguments the run reads but does not own. Defaults to ().
+            **kwargs: Additional arguments.
+
+        Returns:
+            XRTKernelFuture: The future of the run.
+
+        Raises:
+            HostRuntimeError: If arguments are invalid.
+        """
         self.check_device_consistency()
-        # Filter out callable functions and check arg types
+        launched = instrumentation.now()
+        args = self._check_args(args)
+        buffers = self._prepare_args(args)
+        insts_bo, insts_bytes = self._insts_args(kernel_handle)
+
+        start = time.time_ns()
+        h = kernel_handle.kernel(3, insts_bo, insts_bytes, *buffers)
+        # The future keeps the kernel, its context and a locally created
+        # insts buffer alive until the run completes, even if the handle is
+        # evicted from a cache in the meantime.
+        owned = [a for a in args if not any(a is r for r in read_only)]
+        future = XRTKernelFuture(
+            h,
+            owned,
+            start,
+            fail_on_error=fail_on_error,
+            resources=(
+                kernel_handle.kernel,
+                kernel_handle.context,
+                insts_bo,
+                *read_only,
+            ),
+            kernel_name=kernel_handle.kernel_name,
+        )
+        instrumentation.span("launch", launched, kernel_handle.kernel_name)
+        return future
+
+    def _check_args(self, args):
+        """Filter out callable functions and check arg types."""
         args = [a for a in args if not callable(a)]
         if not all([isinstance(a, self._tensor_class) for a in args]):
             raise HostRuntimeError(
                 f"The {self.__class__.__name__} can only take {self._tensor_class.__name__} as arguments, but got: {args}"
             )
-        [a.to("npu") for a in args]
-        buffers = [a.buffer_object() for a in args]
+        return args
 
-        insts_bo = None
-        insts_bytes = 0
-        try:
-            is_module = hasattr(pyxrt, "module") and isinstance(
-                kernel_handle.insts, pyxrt.module
-            )
-            if not is_module:
-                insts_bytes = kernel_handle.insts.nbytes
-                if kernel_handle.insts_bo:
-                    insts_bo = kernel_handle.insts_bo
-                else:
-                    insts_bo = self._tensor_class(
-                        kernel_handle.insts,
-                        flags=pyxrt.bo.cacheable,
-                        group_id=kernel_handle.kernel.group_id(1),
-                    ).buffer_object()
+    def _prepare_args(self, args):
+        """
+        Wait for the runs that own the tensors and sync them to the device.
 
-            start = time.time_ns()
-            h = kernel_handle.kernel(3, insts_bo, insts_bytes, *buffers)
-            r = h.wait()
-            stop = time.time_ns()
+        Returns:
+            list: The buffer objects of the tensors.
+        """
+        for a in args:
+            a._wait_pending()
+            a.to("npu")
+        return [a.buffer_object() for a in args]
 
-            if fail_on_error and r != pyxrt.ert_cmd_state.ERT_CMD_STATE_COMPLETED:
-                raise HostRuntimeError(f"Kernel returned {str(r)}")
-        finally:
-            # delete insts buffer if it was created locally
-            if insts_bo and not kernel_handle.insts_bo:
-                del insts_bo
+    def _insts_args(self, kernel_handle: XRTKernelHandle):
+        """
+        The instruction buffer and its size in bytes to pass to the kernel,
+        which are None and 0 for ELF kernels.
+        """
+        is_module = hasattr(pyxrt, "module") and isinstance(
+            kernel_handle.insts, pyxrt.module
+        )
+        if is_module:
+            return None, 0
+        if kernel_handle.insts_bo:
+            return kernel_handle.insts_bo, kernel_handle.insts.nbytes
+        insts_bo = self._tensor_class(
+            kernel_handle.insts,
+            flags=pyxrt.bo.cacheable,
+            group_id=kernel_handle.kernel.group_id(1),
+        ).buffer_object()
+        return insts_bo, kernel_handle.insts.nbytes
+
+    def runlist(self) -> "XRTRunList":
+        """
+        Create a run list to submit several kernel runs together.
 
-        return XRTKernelResult(r, stop - start)
+        Returns:
+            XRTRunList: An empty run list.
+        """
+        return XRTRunList(self)
 
     def device(self) -> "Device":
         """
@@ -313,7 +675,7 @@ class CachedXRTKernelHandle(XRTKernelHandle):
     A cached handle for a loaded XRT kernel.
     """
 
-    def __init__(self, kernel, xclbin, context, insts, insts_bo=None):
+    def __init__(self, kernel, xclbin, context, insts, insts_bo=None, kernel_name=None):
         """
         Initialize the CachedXRTKernelHandle.
 
@@ -323,8 +685,9 @@ class CachedXRTKernelHandle(XRTKernelHandle):
             context: The XRT context object.
             insts: The instructions for the kernel.
             insts_bo (optional): The instruction buffer object. Defaults to None.
+            kernel_name (str, optional): Name of the kernel, used to report instrumentation events. Defaults to None.
         """
-        super().__init__(kernel, xclbin, context, insts, insts_bo)
+        super().__init__(kernel, xclbin, context, insts, insts_bo, kernel_name)
         self._is_valid = True
 
     def invalidate(self):
@@ -349,6 +712,14 @@ class CachedXRTRuntime(XRTHostRuntime):
     A cached version of XRTHostRuntime that caches up to n contexts,
     depending on the type of NPU.
     It reuses contexts for the same xclbin (identified by path and mtime).
+
+    Hardware contexts are shared by all processes of the machine, so the
+    runtime reserves a slot in a `ContextBudget` before creating a context.
+    When the budget is exhausted, the process holding the least recently
+    used context is asked to evict it, which it does on its next `load`.
+    As that process may be idle, the context is created while the request
+    is pending if the driver has room for it, and only if that fails, the
+    runtime waits up to `CONTEXT_WAIT_TIMEOUT` seconds for a slot.
     """
 
     # I got these values through experimentation on two machines
@@ -357,13 +728,16 @@ class CachedXRTRuntime(XRTHostRuntime):
     # able to create a new context. At the driver level, the cached contexts are
     # a system-wide constrained resource, so caching on systems with many concurrent
     # processes trying to create contexts (as in parallel CI jobs) can be flaky.
-    # TODO: use some sort of file system artifact or figure out how to query the driver
-    # for the state of the cache, and how to make loading operations atomic between processes.
+    # Processes coordinate through the slot table of a `ContextBudget`, see
+    # `XRT_CONTEXT_BUDGET`.
     NPU_CONTEXT_CACHE_SIZE = {
         "npu1": 6,
         "npu2": 32,
     }
 
+    # Seconds to wait for other processes to free a context slot
+    CONTEXT_WAIT_TIMEOUT = 10.0
+
     def __init__(self):
         """
         Initialize the CachedXRTRuntime.
@@ -385,6 +759,27 @@ class CachedXRTRuntime(XRTHostRuntime):
         # Error if no default and no env var
         if self._cache_size is None:
             raise HostRuntimeError(f"No known cache size for {self.npu_str}")
+        self._cache_size = int(self._cache_size)
+
+        # Contexts of all processes; 0 disables the coordination
+        budget_size = int(
+            os.environ.get(
+                "XRT_CONTEXT_BUDGET",
+                self.NPU_CONTEXT_CACHE_SIZE.get(self.npu_str, self._cache_size),
+            )
+        )
+        self._budget = None
+        if budget_size > 0:
+            # The slot table is kept in NPU_CACHE_HOME, like the compiled
+            # kernels, without importing the compiler
+            cache_home = Path(
+                os.environ.get("NPU_CACHE_HOME", Path.home() / ".npu" / "cache")
+            ).resolve()
+            self._budget = ContextBudget(
+                cache_home / f"xrt_contexts_{self.npu_str}.json",
+                budget_size,
+                quota=self._cache_size,
+            )
 
         atexit.register(self.cleanup)
 
@@ -397,9 +792,11 @@ class CachedXRTRuntime(XRTHostRuntime):
         while self._insts_cache:
             self._evict_insts()
         gc.collect()  # Make sure contexts are garbage collected.
+        if self._budget is not None:
+            self._budget.release_all()
 
     def _cleanup_entry(self, entry):
-        context = entry["context"]
+        context = entry.pop("context")
         handles = entry["handles"]
 
         # Invalidate all handles
@@ -410,11 +807,76 @@ class CachedXRTRuntime(XRTHostRuntime):
 
         # Explicitly delete context
         del context
+        # Other processes may create a context once the slot is released
+        if self._budget is not None:
+            self._budget.release(entry["slot"])
 
     def _evict(self):
         # Pop the oldest item
         key, entry = self._context_cache.popitem(last=False)
         self._cleanup_entry(entry)
+        instrumentation.count("context_eviction")
+
+    def _evict_requested(self, force=False):
+        """Evict the contexts other processes asked this process to free."""
+        if self._budget is None:
+            return
+        requests = self._budget.eviction_requests(force=force)
+        if requests:
+            for _ in range(min(requests, len(self._context_cache))):
+                self._evict()
+            gc.collect()  # Make sure contexts are garbage collected.
+
+    def _reserve_slot(self, slot, create_context):
+        """
+        Reserve a slot of the context budget and create the context in it,
+        evicting the least recently used context of this process or waiting
+        for other processes to evict one.
+
+        While other processes are asked to evict a context, the context is
+        created anyway if the driver has room for it, and recorded in the
+        slot table so that later misses account for it. Waiting for a slot
+        only starts once that fails.
+
+        Args:
+            slot (str): The slot of the context.
+            create_context (Callable): Creates the context, evicting contexts
+                of this process if the driver has no room for it unless called
+                with `evict=False`, and raising a RuntimeError if it still has
+                no room.
+
+        Returns:
+            The created context.
+        """
+        if self._budget is None:
+            return create_context()
+        deadline = time.monotonic() + self.CONTEXT_WAIT_TIMEOUT
+        while True:
+            holder = self._budget.reserve(slot)
+            if holder is None:
+                return create_context()
+            if holder == os.getpid() and self._context_cache:
+                self._evict()
+                gc.collect()  # Make sure contexts are garbage collected.
+                continue
+            # The holder may be idle and never serve the request; the contexts
+            # of this process are only evicted for it once the wait timed out
+            timed_out = time.monotonic() > deadline
+            try:
+                context = create_context(evict=timed_out)
+            except RuntimeError:
+                if timed_out:
+                    logger.warning(
+                        "No NPU hardware context was freed by other processes within %s seconds",
+                        self.CONTEXT_WAIT_TIMEOUT,
+                    )
+                    raise
+            else:
+                self._budget.claim(slot)
+                return context
+            # Serve the requests of processes that wait for this one
+            self._evict_requested(force=True)
+            time.sleep(0.05)
 
     def _cleanup_insts_entry(self, entry):
         insts_bo = entry["insts_bo"]
@@ -450,6 +912,44 @@ class CachedXRTRuntime(XRTHostRuntime):
         Raises:
             HostRuntimeError: If arguments are invalid, kernel execution fails, or kernel is not loaded (if only_if_loaded=True).
         """
+        return super().run(
+            kernel_handle,
+            args,
+            trace_config,
+            fail_on_error,
+            only_if_loaded=only_if_loaded,
+            **kwargs,
+        )
+
+    def run_async(
+        self,
+        kernel_handle: XRTKernelHandle,
+        args,
+        trace_config=None,
+        fail_on_error: bool = True,
+        only_if_loaded: bool = False,
+        **kwargs,
+    ) -> XRTKernelFuture:
+        """
+        Launch a loaded XRT kernel without waiting for it to complete.
+
+        Evicting the kernel from the cache while it runs is safe: the future
+        keeps its context alive until the run completes.
+
+        Args:
+            kernel_handle (XRTKernelHandle): The handle to the loaded kernel.
+            args: Arguments to pass to the kernel.
+            trace_config (optional): Configuration for tracing. Defaults to None.
+            fail_on_error (bool, optional): Whether waiting on the future raises an exception on kernel failure. Defaults to True.
+            only_if_loaded (bool, optional): If True, only run if the kernel is currently loaded in the cache. Defaults to False.
+            **kwargs: Additional arguments.
+
+        Returns:
+            XRTKernelFuture: The future of the run.
+
+        Raises:
+            HostRuntimeError: If arguments are invalid, or kernel is not loaded (if only_if_loaded=True).
+        """
         if only_if_loaded:
             if (
                 isinstance(kernel_handle, CachedXRTKernelHandle)
@@ -457,7 +957,9 @@ class CachedXRTRuntime(XRTHostRuntime):
             ):
                 raise HostRuntimeError("Kernel not loaded (evicted from cache)")
 
-        return super().run(kernel_handle, args, trace_config, fail_on_error, **kwargs)
+        return super().run_async(
+            kernel_handle, args, trace_config, fail_on_error, **kwargs
+        )
 
     def load(
         self,
@@ -496,13 +998,20 @@ class CachedXRTRuntime(XRTHostRuntime):
         xclbin_mtime = xclbin_path.stat().st_mtime
         insts_mtime = insts_path.stat().st_mtime
 
+        loaded = instrumentation.now()
+        self._evict_requested()
+
         # Context Cache Lookup
         context_key = (str(xclbin_path), xclbin_mtime)
+        slot = f"{xclbin_path}:{xclbin_mtime}"
 
         try:
             if context_key in self._context_cache:
+                instrumentation.count("context_cache_hit", kernel=kernel_name)
                 entry = self._context_cache[context_key]
                 self._context_cache.move_to_end(context_key)
+                if self._budget is not None:
+                    self._budget.touch(slot)
                 context = entry["context"]
                 xclbin = entry["xclbin"]
                 # Clean up dead handles
@@ -510,40 +1019,50 @@ class CachedXRTRuntime(XRTHostRuntime):
                     ref for ref in entry["handles"] if ref() is not None
                 ]
             else:
+                instrumentation.count("context_cache_miss", kernel=kernel_name)
+                t = instrumentation.now()
                 xclbin = pyxrt.xclbin(str(xclbin_path))
                 xclbin_uuid = xclbin.get_uuid()
+                instrumentation.span("xclbin", t, kernel_name)
 
                 if len(self._context_cache) >= self._cache_size:
                     self._evict()
 
+                t = instrumentation.now()
                 self._device.register_xclbin(xclbin)
+                instrumentation.span("register_xclbin", t, kernel_name)
 
                 # Try to create context, evicting if necessary
-                context = None
-                retries = 0
-                max_retries = len(self._context_cache) if retry else 0
-                while context is None:
-                    try:
-                        context = pyxrt.hw_context(self._device, xclbin_uuid)
-                    except RuntimeError as e:
-                        # If we hit a resource limit (err=-2 usually means EMFILE/ENFILE or similar resource exhaustion)
-                        # and we have items in the cache, try evicting.
-                        if (
-                            "No such file or directory" in str(e)
-                            and self._context_cache
-                            and retries < max_retries
-                        ):
-                            self._evict()
-                            gc.collect()  # Make sure contexts are garbage collected.
-                            retries += 1
-                        else:
-                            raise e
+                def create_context(evict=True):
+                    retries = 0
+                    max_retries = len(self._context_cache) if retry and evict else 0
+                    while True:
+                        try:
+                            return pyxrt.hw_context(self._device, xclbin_uuid)
+                        except RuntimeError as e:
+                            # If we hit a resource limit (err=-2 usually means EMFILE/ENFILE or similar resource exhaustion)
+                            # and we have items in the cache, try evicting.
+                            if (
+                                "No such file or directory" in str(e)
+                                and self._context_cache
+                                and retries < max_retries
+                            ):
+                                self._evict()
+                                gc.collect()  # Make sure contexts are garbage collected.
+                                retries += 1
+                            else:
+                                raise e
+
+                t = instrumentation.now()
+                context = self._reserve_slot(slot, create_context)
+                instrumentation.span("hw_context", t, kernel_name)
 
                 entry = {
                     "context": context,
                     "xclbin": xclbin,
                     "handles": [],
                     "uuid": xclbin_uuid,
+                    "slot": slot,
                 }
                 self._context_cache[context_key] = entry
 
@@ -559,6 +1078,7 @@ class CachedXRTRuntime(XRTHostRuntime):
                         f"Kernel {kernel_name} not found in xclbin (kernels found: {[k.get_name() for k in xclbin.get_kernels()]})"
                     )
 
+            t = instrumentation.now()
             insts = self.read_insts(insts_path)
             insts_bo = None
             if hasattr(pyxrt, "module") and isinstance(insts, pyxrt.module):
@@ -589,12 +1109,14 @@ class CachedXRTRuntime(XRTHostRuntime):
                         "insts_bo": insts_bo,
                     }
                     self._insts_cache[insts_key] = insts_entry
+            instrumentation.span("insts", t, kernel_name)
 
             kernel_handle = CachedXRTKernelHandle(
-                kernel, xclbin, context, insts, insts_bo
+                kernel, xclbin, context, insts, insts_bo, kernel_name
             )
             entry["handles"].append(weakref.ref(kernel_handle))
 
+            instrumentation.span("load", loaded, kernel_name)
             return kernel_handle
 
         except Exception:
@@ -607,4 +1129,6 @@ class CachedXRTRuntime(XRTHostRuntime):
                 if not entry["handles"]:
                     del self._context_cache[context_key]
                     self._cleanup_entry(entry)
+            elif self._budget is not None:
+                self._budget.release(slot)
             raise
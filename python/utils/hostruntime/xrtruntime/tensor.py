@@ -6,12 +6,19 @@
 #
 # (c) Copyright 2025-2026 Advanced Micro Devices, Inc.
 
+import weakref
+
 import numpy as np
 import pyxrt as xrt
 
+from .. import instrumentation
 from ..tensor_class import Tensor
+from .bo_pool import PAGE_SIZE, get_buffer_pool, get_device, userptr_bo
 from aie.helpers.util import np_ndarray_type_get_shape
 
+# XRTTensors by the id of the array all views of their memory derive from
+_tensors_by_raw = weakref.WeakValueDictionary()
+
 
 class XRTTensor(Tensor):
     """
@@ -20,6 +27,11 @@ class XRTTensor(Tensor):
     The class provides common tensor operations such as creation,
     filling with values, and accessing data.
 
+    The buffer objects come from a process-wide pool (see `bo_pool`) and are
+    returned to it when the tensor is deleted, unless views of the tensor's
+    memory were handed out by `numpy()`, `to_torch()`, NumPy conversion,
+    slicing or `wrap`, which may outlive the tensor.
+
     """
 
     def __init__(
@@ -44,7 +56,7 @@ class XRTTensor(Tensor):
         """
         super().__init__(shape_or_data, dtype=dtype, device=device)
         device_index = 0
-        self.xrt_device = xrt.device(device_index)
+        self.xrt_device = get_device(device_index)
 
         # Extract the shape
         if isinstance(shape_or_data, tuple):
@@ -65,23 +77,99 @@ class XRTTensor(Tensor):
 
         # Eventually, xrt:ext::bo uses the 0 magic number that shall be fixed in the future, so that is used as a default.
         # https://github.com/Xilinx/XRT/blob/9b114f18c4fcf4e3558291aa2d78f6d97c406365/src/runtime_src/core/common/api/xrt_bo.cpp#L1626
-        self._bo = xrt.bo(
-            self.xrt_device,
-            int(np.prod(self._shape) * np.dtype(self.dtype).itemsize),
-            flags,
-            group_id,
+        nbytes = int(np.prod(self._shape) * np.dtype(self.dtype).itemsize)
+        self._flags = flags
+        self._group_id = group_id
+        self._bo, self._capacity = get_buffer_pool().acquire(
+            nbytes, flags, group_id, self.xrt_device
         )
 
-        ptr = self._bo.map()
-        self._data = np.frombuffer(ptr, dtype=self.dtype).reshape(self._shape)
+        # Every view of the memory is a view of `_raw`, which `wrap` uses to
+        # find the tensor of a view.
+        self._raw = np.frombuffer(self._bo.map(), dtype=np.uint8)
+        self._data = self._raw[:nbytes].view(self.dtype).reshape(self._shape)
+        _tensors_by_raw[id(self._raw)] = self
+        # Set once views of the memory were handed out; the buffer object is
+        # then not reused
+        self._views_exported = False
 
         if not isinstance(shape_or_data, tuple):
             np.copyto(self._data, np_data)
         else:
             self._data.fill(0)
 
-        if self.device == "npu":
-            self._sync_to_device()
+        # Synced on first use on the device
+        self._mark_host_dirty()
+
+    @classmethod
+    def wrap(cls, array, device=None, flags=xrt.bo.host_only, group_id=0):
+        """
+        Create a tensor that shares the memory of a NumPy array when possible,
+        and has a copy of it otherwise.
+
+        The memory is shared if `array` is C-contiguous and either
+            - it is a view of the memory of another XRTTensor, e.g. returned by
+              its `numpy()`; the tensor then uses a sub-buffer of that tensor's
+              buffer object, or
+            - it starts at a page-aligned address (see `bo_pool.aligned_empty`)
+              and the XRT Python bindings can create buffer objects from user
+              memory.
+
+        Writes through `array` are not tracked like writes through the tensor:
+        call `numpy()` on the tensor, which marks it as modified on the host,
+        before passing it to a kernel again.
+
+        Args:
+            array (np.ndarray): The array.
+            device (str, optional): Device string identifier. Defaults to 'npu'.
+            flags (optional): XRT buffer object flags. Defaults to xrt.bo.host_only.
+            group_id (int, optional): XRT buffer object group ID. Defaults to 0.
+
+        Returns:
+            XRTTensor: The tensor.
+        """
+        array = np.asarray(array)
+        device = device or cls.DEFAULT_DEVICE
+        if array.flags.c_contiguous and array.nbytes:
+            bo = cls._shared_bo(array, flags, group_id)
+            if bo is not None:
+                t = cls.__new__(cls)
+                Tensor.__init__(t, array.shape, dtype=array.dtype, device=device)
+                t.xrt_device = get_device()
+                t._shape = array.shape
+                t._flags = flags
+                t._group_id = group_id
+                # Not from the pool; `array` keeps the memory alive
+                t._bo, t._capacity = bo, None
+                t._raw = None
+                t._data = array
+                t._mark_host_dirty()
+                return t
+        return cls(
+            array, dtype=array.dtype, device=device, flags=flags, group_id=group_id
+        )
+
+    @classmethod
+    def _shared_bo(cls, array, flags, group_id):
+        """A buffer object using the memory of `array`, or None."""
+        root = array
+        while isinstance(root.base, np.ndarray):
+            root = root.base
+        owner = _tensors_by_raw.get(id(root))
+        if owner is not None and owner._raw is root:
+            if (owner._flags, owner._group_id) != (flags, group_id):
+                return None
+            owner._views_exported = True
+            offset = array.ctypes.data - root.ctypes.data
+            if offset == 0 and array.nbytes == owner._capacity:
+                return owner._bo
+            try:
+                return xrt.bo(owner._bo, array.nbytes, offset)
+            except (RuntimeError, TypeError):
+                return None
+        if array.ctypes.data % PAGE_SIZE == 0:
+            return userptr_bo(get_device(), array, flags, group_id)
+        return None
 
     @property
     def data(self):
@@ -103,33 +191,86 @@ class XRTTensor(Tensor):
         """
         return self._shape
 
-    def _sync_to_device(self):
+    def _sync_to_device(self, size=None, offset=0):
         """
         Syncs the tensor data from the host to the device memory.
+
+        Args:
+            size (int, optional): Number of bytes to sync. Defaults to the whole tensor.
+            offset (int, optional): Byte offset of the synced range. Defaults to 0.
         """
-        return self._bo.sync(xrt.xclBOSyncDirection.XCL_BO_SYNC_BO_TO_DEVICE)
+        # The buffer object may be larger than the tensor
+        size = self.nbytes if size is None else size
+        if size:
+            start = instrumentation.now()
+            self._bo.sync(xrt.xclBOSyncDirection.XCL_BO_SYNC_BO_TO_DEVICE, size, offset)
+            instrumentation.span("sync_to_device", start)
+            instrumentation.count("bytes_to_device", size)
 
     def _sync_from_device(self):
         """
         Syncs the tensor data from the device to the host memory.
         """
-        return self._bo.sync(xrt.xclBOSyncDirection.XCL_BO_SYNC_BO_FROM_DEVICE)
+        if self.nbytes:
+            start = instrumentation.now()
+            self._bo.sync(
+                xrt.xclBOSyncDirection.XCL_BO_SYNC_BO_FROM_DEVICE, self.nbytes, 0
+            )
+            instrumentation.span("sync_from_device", start)
+            instrumentation.count("bytes_from_device", self.nbytes)
 
     def __del__(self):
         """
         Destructor for Tensor.
 
-        Releases associated device memory (e.g., XRT buffer object).
+        Returns the XRT buffer object to the pool, or frees it if views of its
+        memory are still alive.
         """
-        if hasattr(self, "_bo"):
-            del self._bo
-            self._bo = None
+        bo = getattr(self, "_bo", None)
+        if bo is None:
+            return
+        if self._capacity is None:
+            # Shares the memory of an array, see `wrap`
+            self._bo = self._data = None
+            return
+        self._bo = self._raw = self._data = None
+        try:
+            if getattr(self, "_views_exported", True):
+                get_buffer_pool().discard(self._capacity)
+            else:
+                get_buffer_pool().release(
+                    bo, self._capacity, self._flags, self._group_id
+                )
+        except (AttributeError, TypeError):
+            # Module globals are already cleared at interpreter shutdown
+            pass
+
+    def __array__(self, dtype=None):
+        array = super().__array__(dtype)
+        if dtype is None:
+            self._views_exported = True
+        return array
+
+    def __getitem__(self, index):
+        value = super().__getitem__(index)
+        if isinstance(value, np.ndarray):
+            self._views_exported = True
+        return value
+
+    def numpy(self):
+        # Covers to_torch, which shares the memory of numpy()
+        self._views_exported = True
+        return super().numpy()
 
     def buffer_object(self):
         """
         Returns the XRT buffer object associated with this tensor.
 
+        Host writes that were not synced yet are synced to the device first,
+        so the buffer object can be passed to a kernel.
+
         Returns:
             buffer_object: The XRT buffer object associated with this tensor.
         """
+        self._ensure_device()
         return self._bo
@@ -10,28 +10,89 @@
 import os
 import functools
 import hashlib
+import inspect
+import logging
+import shutil
+import threading
+import time
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 from aie.extras.context import mlir_mod_ctx
-from .compile import compile_mlir_module, compile_external_kernel
+from .compile import compile_mlir_module, compile_external_kernels
 from .npukernel import NPUKernel
 from aie.dialects.aie import AIEDevice
-from .compile.cache.circular_cache import CircularCache
-from .compile.cache.utils import _create_function_cache_key, file_lock
-from .compile import NPU_CACHE_HOME
+from .compile.cache.disk_cache import (
+    INSTS_FILENAME,
+    XCLBIN_FILENAME,
+    KernelDiskCache,
+)
+from .compile.cache.lru_cache import LRUCache
+from .compile.cache.utils import (
+    _create_dispatch_key,
+    _create_function_cache_key,
+    file_lock,
+)
+from .compile import (
+    NPU_CACHE_HOME,
+    NPU_CACHE_MAX_AGE_DAYS,
+    NPU_CACHE_MAX_SIZE,
+    NPU_COMPILE_WORKERS,
+    NPU_JIT_CACHE_SIZE,
+    NPU_JIT_DISPATCH,
+)
 from .compile.utils import _cleanup_failed_compilation
 from aie.iron.kernel import ExternalFunction, Kernel
 
+logger = logging.getLogger(__name__)
+
 # Global cache for compiled kernels at the function level
 # Key: (function_name, args_signature) -> NPUKernel instance
 # There is a limit on the number of kernels we have in cache
-_compiled_kernels = CircularCache(max_size=1)
+_compiled_kernels = LRUCache(max_size=NPU_JIT_CACHE_SIZE)
+
+# Compiled artifacts on disk, one directory per module hash
+_disk_cache = KernelDiskCache(
+    NPU_CACHE_HOME,
+    max_bytes=NPU_CACHE_MAX_SIZE,
+    max_age=NPU_CACHE_MAX_AGE_DAYS * 24 * 3600,
+)
+
+_STAT_NAMES = (
+    "memory_hits",
+    "memory_misses",
+    "disk_hits",
+    "dispatch_hits",
+    "dispatch_mismatches",
+    "compiles",
+    "compile_time",
+    "disk_evictions",
+)
+_cache_stats = dict.fromkeys(_STAT_NAMES, 0)
+
+# Serializes running design functions to generate MLIR
+_generate_lock = threading.Lock()
+
+# Runs compile_async requests; created on first use
+_compile_executor = None
+_compile_executor_lock = threading.Lock()
 
 
 def jit(function=None, is_placed=True, use_cache=True):
     """
     Decorator to compile an NPU kernel into a binary to run on the NPU.
 
+    Compiled kernels are cached in memory and in `NPU_CACHE_HOME`. With
+    `NPU_JIT_DISPATCH` set to "fast", a call that was compiled by an earlier
+    process with the same arguments is dispatched to its cached kernel
+    without running the function, unless its source file changed. The call
+    is identified by the function's code, the values it captures and its
+    arguments, but not by the module globals it reads, the helpers it
+    imports or the IRON sources, so "fast" is only safe for designs that do
+    not depend on those. By default ("validate"), the MLIR module is always
+    generated.
+
     Args:
         function (callable, optional): The function to compile.
         is_placed (bool, optional): Whether the kernel is using explicit or implicit placement. Defaults to True.
@@ -45,35 +106,87 @@ def jit(function=None, is_placed=True, use_cache=True):
 
     @functools.wraps(function)
     def decorator(*args, **kwargs):
-        from aie.iron.device import NPU1, NPU2, NPU1Col1, NPU2Col1
-        from . import DefaultNPURuntime
+        kernel, cached = _get_kernel(function, is_placed, use_cache, args, kwargs)
+        # Filter out non-tensor arguments (ExternalFunction, scalars)
+        # Only tensor args should be passed to the kernel
+        tensor_args = _filter_tensor_args(args)
+        if cached:
+            return kernel(*tensor_args, **kwargs)
+        kernel(*tensor_args)
 
-        if DefaultNPURuntime is None:
-            raise Exception("Cannot use JIT; DefaultNPURuntime not set.")
+    def compile(*args, **kwargs):
+        """Compile the kernel for these arguments, without running it, and cache it."""
+        return _get_kernel(function, is_placed, use_cache, args, kwargs)[0]
 
-        trace_config = kwargs.get("trace_config")
+    decorator.compile = compile
+    return decorator
 
-        # TODO: Functions referencing variables from outside its scope have stale cache
-        # issue if the variable is updated after the first run. For now we skip caching
-        # if we detect closures.
-        has_closures = any(_has_closure(arg) for arg in args) or any(
-            _has_closure(v) for v in kwargs.values()
-        )
-        effective_use_cache = use_cache and not has_closures
 
-        # Check if we already have a compiled kernel for this function signature
-        cache_key = _create_function_cache_key(function, args, kwargs)
-        if effective_use_cache and cache_key in _compiled_kernels:
-            cached_kernel = _compiled_kernels[cache_key]
-            if cached_kernel is None:
-                raise RuntimeError(
-                    f"Cached kernel for '{function.__name__}' is None; this is a bug."
-                )
-            # Filter out non-tensor arguments (ExternalFunction, scalars)
-            # Only tensor args should be passed to the kernel
-            tensor_args = _filter_tensor_args(args)
-            return cached_kernel(*tensor_args, **kwargs)
+def _get_kernel(function, is_placed, use_cache, args, kwargs):
+    """
+    Find the kernel of a call to a jitted function in the caches, or compile it.
+
+    Returns:
+        tuple: The NPUKernel and whether it was found in the in-process cache.
+    """
+    from . import DefaultNPURuntime
+
+    if DefaultNPURuntime is None:
+        raise Exception("Cannot use JIT; DefaultNPURuntime not set.")
+
+    trace_config = kwargs.get("trace_config")
 
+    # TODO: Functions referencing variables from outside its scope have stale cache
+    # issue if the variable is updated after the first run. For now we skip caching
+    # if we detect closures.
+    has_closures = any(_has_closure(arg) for arg in args) or any(
+        _has_closure(v) for v in kwargs.values()
+    )
+    effective_use_cache = use_cache and not has_closures
+
+    # Check if we already have a compiled kernel for this function signature
+    cache_key = _create_function_cache_key(function, args, kwargs)
+    if effective_use_cache and cache_key in _compiled_kernels:
+        cached_kernel = _compiled_kernels[cache_key]
+        if cached_kernel is None:
+            raise RuntimeError(
+                f"Cached kernel for '{function.__name__}' is None; this is a bug."
+            )
+        # The artifacts may have been evicted from disk by another process
+        if os.path.exists(cached_kernel.xclbin_path):
+            _cache_stats["memory_hits"] += 1
+            return cached_kernel, True
+        del _compiled_kernels[cache_key]
+    _cache_stats["memory_misses"] += 1
+
+    target_arch = _target_arch(DefaultNPURuntime.device())
+
+    # A kernel compiled for the same call by an earlier process can be
+    # found without generating the MLIR module.
+    dispatch_key = None
+    if effective_use_cache and NPU_JIT_DISPATCH in ("fast", "validate"):
+        dispatch_key = _create_dispatch_key(
+            function, args, kwargs, target_arch, _compiler_id()
+        )
+    recorded_hash = None
+    if dispatch_key is not None:
+        recorded_hash = _disk_cache.lookup_dispatch(dispatch_key)
+    if recorded_hash is not None and NPU_JIT_DISPATCH == "fast":
+        lock_path = _disk_cache.entry_dir(recorded_hash) / ".lock"
+        with file_lock(lock_path, timeout_seconds=None):
+            dispatched = _disk_cache.contains(recorded_hash)
+            if dispatched:
+                _disk_cache.touch(recorded_hash)
+        if dispatched:
+            _cache_stats["dispatch_hits"] += 1
+            kernel = _load_kernel(
+                recorded_hash, cache_key, effective_use_cache, trace_config
+            )
+            return kernel, False
+
+    # Generating MLIR is not thread safe (ExternalFunction._instances is
+    # shared), so concurrent compilations only overlap in the compilers.
+    with _generate_lock:
         # Collect ExternalFunction instances that need JIT compilation.
         # Note: bare Kernel instances (pre-compiled .o) are intentionally
         # excluded here — they require no compilation step. Both Kernel and
@@ -119,76 +232,214 @@ def jit(function=None, is_placed=True, use_cache=True):
                 external_kernels.append(func)
                 seen.add(id(func))
 
-        current_device = DefaultNPURuntime.device()
-
-        # Determine target architecture based on device type
-        if isinstance(current_device, (NPU2, NPU2Col1)):
-            target_arch = "aie2p"
-        elif isinstance(current_device, (NPU1, NPU1Col1)):
-            target_arch = "aie2"
-        elif current_device in (AIEDevice.npu2, AIEDevice.npu2_1col):
-            target_arch = "aie2p"
-        elif current_device in (AIEDevice.npu1, AIEDevice.npu1_1col):
-            target_arch = "aie2"
-        else:
-            raise RuntimeError(f"Unsupported device type: {type(current_device)}")
-
         # Hash of the IR string, ExternalFunction compiler options, and target architecture
+        mlir_module = str(mlir_module)
         module_hash = hash_module(mlir_module, external_kernels, target_arch)
-        kernel_dir = NPU_CACHE_HOME / f"{module_hash}"
-        lock_file_path = kernel_dir / ".lock"
-        mlir_path = kernel_dir / "aie.mlir"
-
-        # Use file locking to prevent race conditions when accessing cache directory
-        with file_lock(lock_file_path):
-            # Ensure cache directory exists
-            os.makedirs(kernel_dir, exist_ok=True)
-
-            # Write MLIR to file if not already cached
-            inst_filename = "insts.bin"
-            xclbin_filename = "final.xclbin"
-            xclbin_path = kernel_dir / xclbin_filename
-            inst_path = kernel_dir / inst_filename
-
-            xclbin_exists = os.path.exists(xclbin_path)
-            inst_exists = os.path.exists(inst_path)
-
-            if not effective_use_cache or not xclbin_exists or not inst_exists:
-                try:
-                    with open(mlir_path, "w", encoding="utf-8") as f:
-                        print(mlir_module, file=f)
-
-                    # Compile ExternalFunctions from inside the JIT compilation directory
-                    for func in external_kernels:
-                        compile_external_kernel(func, kernel_dir, target_arch)
-
-                    # Compile the MLIR module
-                    compile_mlir_module(
-                        mlir_module=mlir_module,
-                        insts_path=inst_path,
-                        xclbin_path=xclbin_path,
-                        work_dir=kernel_dir,
-                    )
-                except Exception as e:
-                    # Clean up cache directory on any compilation failure to avoid any corrupted objects in the cache
+    kernel_dir = _disk_cache.entry_dir(module_hash)
+    lock_file_path = kernel_dir / ".lock"
+
+    # Use file locking to prevent race conditions when accessing cache directory.
+    # Another process or thread may hold it for a whole compilation.
+    with file_lock(lock_file_path, timeout_seconds=None):
+        # Ensure cache directory exists
+        os.makedirs(kernel_dir, exist_ok=True)
+
+        if effective_use_cache and _disk_cache.contains(module_hash):
+            _cache_stats["disk_hits"] += 1
+            _disk_cache.touch(module_hash)
+        else:
+            # Compile into a staging directory and publish the artifacts
+            # into the cache directory once they are all written.
+            staging_dir = kernel_dir / ".staging"
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            os.makedirs(staging_dir)
+            start = time.perf_counter()
+            try:
+                with open(staging_dir / "aie.mlir", "w", encoding="utf-8") as f:
+                    print(mlir_module, file=f)
+
+                # Compile ExternalFunctions from inside the JIT compilation directory
+                compile_external_kernels(external_kernels, staging_dir, target_arch)
+
+                # Compile the MLIR module
+                compile_mlir_module(
+                    mlir_module=mlir_module,
+                    insts_path=staging_dir / INSTS_FILENAME,
+                    xclbin_path=staging_dir / XCLBIN_FILENAME,
+                    work_dir=staging_dir,
+                )
+            except Exception as e:
+                # Clean up cache directory on any compilation failure to avoid any corrupted objects in the cache
+                if _disk_cache.contains(module_hash):
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                else:
                     _cleanup_failed_compilation(kernel_dir)
-                    raise e
+                raise e
+            compile_time = time.perf_counter() - start
+            _cache_stats["compiles"] += 1
+            _cache_stats["compile_time"] += compile_time
+            evicted = _disk_cache.publish(module_hash, staging_dir, compile_time)
+            _cache_stats["disk_evictions"] += len(evicted)
+
+    if dispatch_key is not None:
+        if recorded_hash is not None and recorded_hash != module_hash:
+            _cache_stats["dispatch_mismatches"] += 1
+            logger.warning(
+                "'%s' compiled to kernel %s, but an earlier run recorded %s "
+                "for the same call; its MLIR depends on more than its "
+                "arguments and source file.",
+                function.__name__,
+                module_hash,
+                recorded_hash,
+            )
+        if recorded_hash != module_hash:
+            # The record is only valid while the source files are unchanged
+            files = [inspect.getsourcefile(function)] + [
+                func._source_file for func in external_kernels
+            ]
+            _disk_cache.record_dispatch(dispatch_key, module_hash, filter(None, files))
+
+    kernel = _load_kernel(module_hash, cache_key, effective_use_cache, trace_config)
+    return kernel, False
+
+
+def _load_kernel(module_hash, cache_key, use_cache, trace_config):
+    """Create the kernel cached on disk under `module_hash`."""
+    kernel_dir = _disk_cache.entry_dir(module_hash)
+    kernel = NPUKernel(
+        kernel_dir / XCLBIN_FILENAME,
+        kernel_dir / INSTS_FILENAME,
+        kernel_name="MLIR_AIE",
+        trace_config=trace_config,
+    )
+    if use_cache:
+        _compiled_kernels[cache_key] = kernel
+    return kernel
+
+
+def _target_arch(current_device):
+    """Peano target architecture of a device."""
+    from aie.iron.device import NPU1, NPU2, NPU1Col1, NPU2Col1
+
+    if isinstance(current_device, (NPU2, NPU2Col1)):
+        return "aie2p"
+    elif isinstance(current_device, (NPU1, NPU1Col1)):
+        return "aie2"
+    elif current_device in (AIEDevice.npu2, AIEDevice.npu2_1col):
+        return "aie2p"
+    elif current_device in (AIEDevice.npu1, AIEDevice.npu1_1col):
+        return "aie2"
+    raise RuntimeError(f"Unsupported device type: {type(current_device)}")
+
+
+@functools.cache
+def _compiler_id():
+    """Identifies the installed compiler, so kernels recorded for dispatch
+    are not reused after mlir-aie is updated."""
+    parts = []
+    for path in [shutil.which("aiecc"), __file__]:
+        if path and os.path.exists(path):
+            parts.append(f"{path}@{os.stat(path).st_mtime_ns}")
+    return "|".join(parts)
+
+
+def compile_async(function, *args, **kwargs):
+    """
+    Compile a jitted function for the given arguments in the background.
 
-        kernel = NPUKernel(
-            xclbin_path,
-            inst_path,
-            kernel_name="MLIR_AIE",
-            trace_config=trace_config,
-        )
-        if effective_use_cache:
-            _compiled_kernels[cache_key] = kernel
+    The kernel is added to the caches, so calling `function` with the same
+    arguments later runs it without compiling. Several compilations run
+    concurrently; their compiler subprocesses are bounded by
+    `NPU_COMPILE_WORKERS`.
 
-        # Filter out non-tensor arguments (ExternalFunction, scalars) before calling kernel
-        # Only tensor args should be passed to the kernel
-        tensor_args = _filter_tensor_args(args)
-        kernel(*tensor_args)
+    Args:
+        function (callable): A function decorated with `jit`.
+        *args: Arguments the function will be called with.
+        **kwargs: Keyword arguments the function will be called with.
 
-    return decorator
+    Returns:
+        concurrent.futures.Future: Resolves to the compiled NPUKernel.
+    """
+    global _compile_executor
+    if not callable(getattr(function, "compile", None)):
+        raise TypeError(f"{function!r} is not decorated with @jit")
+    with _compile_executor_lock:
+        if _compile_executor is None:
+            _compile_executor = ThreadPoolExecutor(
+                max_workers=NPU_COMPILE_WORKERS, thread_name_prefix="aie-jit"
+            )
+    return _compile_executor.submit(function.compile, *args, **kwargs)
+
+
+def precompile(calls):
+    """
+    Compile several jitted calls in parallel, e.g. to warm the caches when a
+    service starts.
+
+    Args:
+        calls (list): (function, args) or (function, args, kwargs) tuples,
+            with `function` decorated with `jit`.
+
+    Returns:
+        list[NPUKernel]: The compiled kernels, in the order of `calls`.
+
+    Raises:
+        Exception: The first compilation error, after all compilations ended.
+    """
+    futures = []
+    for function, args, *kwargs in calls:
+        futures.append(compile_async(function, *args, **(kwargs[0] if kwargs else {})))
+    concurrent.futures.wait(futures)
+    return [future.result() for future in futures]
+
+
+def cache_stats():
+    """
+    Get the counters of the JIT kernel cache of this process.
+
+    Returns:
+        dict: With keys
+            memory_hits / memory_misses: calls served or not by the in-process cache,
+            disk_hits: misses whose artifacts were found in `NPU_CACHE_HOME`,
+            dispatch_hits: misses dispatched to a kernel recorded by an earlier process,
+            dispatch_mismatches: recorded kernels that the generated MLIR did not match,
+            compiles / compile_time: kernels compiled and the seconds spent on it,
+            memory_evictions / disk_evictions: kernels evicted from each cache,
+            memory_entries / memory_capacity: size and capacity of the in-process cache.
+    """
+    stats = dict(_cache_stats)
+    stats["memory_evictions"] = _compiled_kernels.evictions
+    stats["memory_entries"] = len(_compiled_kernels)
+    stats["memory_capacity"] = _compiled_kernels.max_size
+    return stats
+
+
+def reset_cache_stats():
+    """Reset the counters returned by `cache_stats`."""
+    _cache_stats.update(dict.fromkeys(_STAT_NAMES, 0))
+    _compiled_kernels.evictions = 0
+
+
+def set_cache_size(max_size):
+    """
+    Set how many compiled kernels are kept in the in-process cache.
+
+    Args:
+        max_size (int): Number of kernels, evicting the least recently used ones if smaller than before.
+    """
+    _compiled_kernels.resize(max_size)
+
+
+def clear_cache(disk=False):
+    """
+    Drop the kernels of the in-process cache.
+
+    Args:
+        disk (bool, optional): Also remove the compiled artifacts from `NPU_CACHE_HOME`. Defaults to False.
+    """
+    _compiled_kernels.clear()
+    if disk:
+        _disk_cache.clear()
 
 
 def _filter_tensor_args(args):
@@ -13,14 +13,19 @@ ML related utilties
 * `unpickle`
 * `fuse_single_conv_bn_pair`
 * class `DataShaper`
+* class `LayoutPlan`
+* `layout_plan`
 """
 
 import csv
+import functools
 import json
 import math
 import numpy as np
 import os
+import threading
 import torch
+from concurrent.futures import ThreadPoolExecutor
 
 # class ImageNetKaggle(Dataset):
 #     def __init__(self, root, split, transform=None):
@@ -181,6 +186,203 @@ def fuse_single_conv_bn_pair(bn_mean, bn_var, bn_wts, bn_bias, conv_wts):
     return W
 
 
+# Bytes above which LayoutPlan copies data with several threads
+PARALLEL_COPY_THRESHOLD = 4 << 20
+_copy_pool = None
+_copy_pool_workers = 0
+_copy_pool_lock = threading.Lock()
+
+
+def _parallel_copyto(dst, src, axis, threads):
+    """Copy `src` into `dst` in slices along `axis`, one per thread."""
+    global _copy_pool, _copy_pool_workers
+    if threads is None:
+        threads = 1
+        if dst.size * dst.itemsize >= PARALLEL_COPY_THRESHOLD:
+            threads = min(8, os.cpu_count() or 1)
+    threads = min(threads, dst.shape[axis])
+    if threads <= 1:
+        np.copyto(dst, src)
+        return
+    with _copy_pool_lock:
+        if _copy_pool_workers < threads:
+            # Copies already submitted to the old pool still complete
+            if _copy_pool is not None:
+                _copy_pool.shutdown(wait=False)
+            _copy_pool = ThreadPoolExecutor(max_workers=threads)
+            _copy_pool_workers = threads
+        # Submitted under the lock, so the pool is not shut down in between
+        bounds = np.linspace(0, dst.shape[axis], threads + 1).astype(int)
+        index = [slice(None)] * dst.ndim
+        jobs = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            index[axis] = slice(start, stop)
+            jobs.append(
+                _copy_pool.submit(np.copyto, dst[tuple(index)], src[tuple(index)])
+            )
+    for job in jobs:
+        job.result()
+
+
+class LayoutPlan:
+    """
+    The reorder of `DataShaper.reorder_mat` for one shape and order, decoded
+    once. `apply` and `invert` write the reordered data directly into an
+    output array, such as the host buffer of an NPU tensor, with a single
+    strided copy instead of a chain of padded and transposed intermediates.
+
+    Plans are immutable and shared; get them from `layout_plan`.
+    """
+
+    def __init__(self, shape, order, defOrder):
+        """
+        Initialize the LayoutPlan.
+
+        Args:
+            shape (tuple): Shape of the data in the default order.
+            order (str): The order of the data in memory.
+            defOrder (str): The default order, one letter per dimension of `shape`.
+        """
+        self.shape = tuple(shape)
+        self.order = order
+        self.defOrder = defOrder
+        self.decoded = DataShaper(defOrder)._reorder_decode(self.shape, order)
+        pad_im, size, perm, pad_ex, brdcst, align = self.decoded
+        self._pad_im = tuple(pad_im)
+        self._size = tuple(size)
+        self._perm = tuple(perm)
+        self.invertible = (
+            sum(pad_im) == 0
+            and sum(pad_ex) == 0
+            and np.prod(brdcst) == 1
+            and np.prod(align) == 1
+        )
+        # Sizes of the dimensions in memory order. Each one is followed by an
+        # axis repeating it for broadcasting, so that the output is viewed as
+        # (dims[0], brdcst[0], dims[1], brdcst[1], ...) with strides accounting
+        # for the explicit padding and the alignment.
+        self._dims = tuple(size[p] for p in perm)
+        view_shape, strides = [], []
+        extent = 1
+        for i in reversed(range(len(self._dims))):
+            if align[i] > 1:
+                extent = -(-extent // align[i]) * align[i]
+            view_shape[:0] = [self._dims[i], brdcst[i]]
+            strides[:0] = [extent * brdcst[i], extent]
+            extent *= brdcst[i] * (self._dims[i] + pad_ex[i])
+        self._view_shape = tuple(view_shape)
+        self._view_strides = tuple(strides)
+        # Number of elements of the reordered data
+        self.size = extent
+        self._holes = extent != np.prod(self._dims) * np.prod(brdcst)
+        # Without padding and broadcasting, the output is a plain array
+        self._dense = not self._holes and np.prod(brdcst) == 1
+        # Copies are split along the outermost dimension that is long enough
+        # to give every thread a slice, or else the longest one
+        self._split_axis = next(
+            (i for i, d in enumerate(self._dims) if d >= 8),
+            int(np.argmax(self._dims)) if self._dims else 0,
+        )
+
+    def _check_out(self, out, size, dtype):
+        if out is None:
+            return np.empty(size, dtype=dtype)
+        if out.size != size:
+            raise ValueError(f"Output has {out.size} elements, expected {size}")
+        if not out.flags.c_contiguous:
+            raise ValueError("Output must be C-contiguous")
+        return out
+
+    def apply(self, src, out=None, threads=None):
+        """
+        Reorder data from the default order to `order`.
+
+        Args:
+            src (np.ndarray): The data, of shape `shape`.
+            out (np.ndarray, optional): C-contiguous array of `size` elements to write to, e.g. from `Tensor.numpy()`.
+            threads (int, optional): Number of threads copying the data. Defaults to one per core for data larger than PARALLEL_COPY_THRESHOLD, and one otherwise.
+
+        Returns:
+            np.ndarray: The reordered data, flattened; a view of `out` if given.
+
+        Raises:
+            ValueError: If src or out do not match the plan.
+        """
+        src = np.asarray(src)
+        if src.shape != self.shape:
+            raise ValueError(f"Expected data of shape {self.shape}, got {src.shape}")
+        out = self._check_out(out, self.size, src.dtype).reshape(-1)
+        if any(self._pad_im):
+            padded = np.zeros(
+                tuple(s + p for s, p in zip(self.shape, self._pad_im)), src.dtype
+            )
+            padded[tuple(slice(0, s) for s in self.shape)] = src
+            src = padded
+        src = src.reshape(self._size).transpose(self._perm)
+        if self._dense:
+            _parallel_copyto(out.reshape(self._dims), src, self._split_axis, threads)
+            return out
+        src = src[(slice(None), None) * len(self._dims)]
+        if self._holes:
+            out.fill(0)
+        dst = np.lib.stride_tricks.as_strided(
+            out,
+            self._view_shape,
+            tuple(s * out.itemsize for s in self._view_strides),
+            writeable=True,
+        )
+        _parallel_copyto(dst, src, 2 * self._split_axis, threads)
+        return out
+
+    def invert(self, src, out=None, threads=None):
+        """
+        Reorder data from `order` back to the default order.
+
+        Args:
+            src (np.ndarray): The reordered data, of `size` elements.
+            out (np.ndarray, optional): C-contiguous array with as many elements as `shape` to write to.
+            threads (int, optional): See `apply`.
+
+        Returns:
+            np.ndarray: The data in the default order, flattened; a view of `out` if given.
+
+        Raises:
+            ValueError: If the order pads, broadcasts or aligns data, or
+                src or out do not match the plan.
+        """
+        if not self.invertible:
+            raise ValueError(
+                "Reverse of padding, broadcasting or alignment not supported"
+            )
+        src = np.asarray(src)
+        if src.size != self.size:
+            raise ValueError(f"Expected {self.size} elements, got {src.size}")
+        out = self._check_out(out, self.size, src.dtype).reshape(-1)
+        dst = out.reshape(self._size).transpose(self._perm)
+        _parallel_copyto(dst, src.reshape(self._dims), self._split_axis, threads)
+        return out
+
+
+@functools.lru_cache(maxsize=256)
+def _layout_plan(shape, order, defOrder):
+    return LayoutPlan(shape, order, defOrder)
+
+
+def layout_plan(shape, order, defOrder="RC") -> LayoutPlan:
+    """
+    Get the LayoutPlan of a reorder, decoding it on the first use.
+
+    Args:
+        shape (tuple): Shape of the data in the default order.
+        order (str): The order of the data in memory.
+        defOrder (str, optional): The default order. Defaults to "RC".
+
+    Returns:
+        LayoutPlan: The plan, shared by all callers.
+    """
+    return _layout_plan(tuple(int(s) for s in shape), order, defOrder)
+
+
 class DataShaper:
     def __init__(self, defOrder="RC", print_info=False):
         self.defOrder = defOrder
@@ -324,48 +526,40 @@ class DataShaper:
                     off = 0
                 d[idx] -= 1
                 p -= 1
+        decoded = pad_im, size, perm, pad_ex, brdcst, align
         if self.print_info:
-            self.log_msg.append(
-                "[INFO]: reorder s={:<15} o={:<15} -> pi={:<15} s={:<30} p={:<30} pe={:<30}, b={:<30}, a={:<30}".format(
-                    *map(str, (shape, order, pad_im, size, perm, pad_ex, brdcst, align))
-                )
-            )
-        return pad_im, size, perm, pad_ex, brdcst, align
+            self._log_decode(shape, order, decoded)
+        return decoded
 
-    def reorder_mat(self, mat, order, defOrder=None, inverse=False):
-        pad_im, size, perm, pad_ex, brdcst, align = self._reorder_decode(
-            mat.shape, order, defOrder
+    def _log_decode(self, shape, order, decoded):
+        self.log_msg.append(
+            "[INFO]: reorder s={:<15} o={:<15} -> pi={:<15} s={:<30} p={:<30} pe={:<30}, b={:<30}, a={:<30}".format(
+                *map(str, (shape, order, *decoded))
+            )
         )
-        if not inverse:
-            if sum(pad_im) > 0:
-                mat = np.pad(mat, tuple(zip([0] * len(pad_im), pad_im)), "constant")
-            mat = mat.reshape(*size).transpose(perm)
-            if sum(pad_ex) > 0:
-                mat = np.pad(mat, tuple(zip([0] * len(pad_ex), pad_ex)), "constant")
-            if np.prod(brdcst) > 1:
-                for idx, b in enumerate(brdcst):
-                    if b > 1:
-                        mat = np.repeat(mat, b, axis=idx)
-            if np.prod(align) > 1:
-                for idx, a in reversed(tuple(enumerate(align))):
-                    if a > 1:
-                        mat = mat.reshape(mat.shape[: idx + 1] + (-1,))
-                        pad = a - (mat.shape[-1] % a)
-                        if pad < a:
-                            mp = np.zeros((len(mat.shape), 2), dtype=np.int)
-                            mp[-1, -1] = pad
-                            mat = np.pad(mat, mp, "constant")
-        else:
-            assert sum(pad_im) == 0, "Reverse of implicit padding not supported"
-            assert sum(pad_ex) == 0, "Reverse of explicit padding not supported"
-            assert np.prod(brdcst) == 1, "Reverse of broadcasting not supported"
-            assert np.prod(align) == 1, "Reverse of alignment not supported"
-            perm_inv = [perm.index(p) for p in range(len(perm))]
-            size_inv = [size[p] for p in perm]
-            mat = mat.reshape(*size_inv)
-            mat = mat.transpose(perm_inv)
-
-        return mat.reshape(-1)
+
+    def plan(self, shape, order, defOrder=None) -> LayoutPlan:
+        """
+        Get the LayoutPlan reordering data of a shape to `order`.
+
+        Args:
+            shape (tuple): Shape of the data in the default order.
+            order (str): The order of the data in memory.
+            defOrder (str, optional): The default order. Defaults to the one of the DataShaper.
+
+        Returns:
+            LayoutPlan: The plan.
+        """
+        plan = layout_plan(shape, order, defOrder or self.defOrder)
+        if self.print_info:
+            self._log_decode(plan.shape, order, plan.decoded)
+        return plan
+
+    def reorder_mat(self, mat, order, defOrder=None, inverse=False, out=None):
+        plan = self.plan(mat.shape, order, defOrder)
+        if inverse:
+            return plan.invert(mat, out)
+        return plan.apply(mat, out)
 
     def get_dim_steps(
         self, shape, order, defOrder=None, bits=8, ebs=None, sparse_ratio=1
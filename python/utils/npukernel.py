@@ -100,3 +100,24 @@ class NPUKernel:
             list(args),
             **kwargs,
         )
+
+    def run_async(self, *args, **kwargs):
+        """
+        Launch the kernel with the given arguments without waiting for it
+        to complete. Tracing is not supported; use ``__call__`` instead.
+
+        Args:
+            *args: Arguments passed to the kernel.
+            **kwargs: Additional arguments passed to the runtime load method.
+
+        Returns:
+            KernelFuture: The future of the run, see ``HostRuntime.run_async``.
+        """
+        from . import DefaultNPURuntime
+
+        if DefaultNPURuntime is None:
+            raise Exception("Cannot run kernel; DefaultNPURuntime not set.")
+        if self._trace_config:
+            raise ValueError("run_async does not support tracing")
+        handle = DefaultNPURuntime.load(self, **kwargs)
+        return DefaultNPURuntime.run_async(handle, list(args))
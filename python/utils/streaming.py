@@ -0,0 +1,169 @@
+# streaming.py -*- Python -*-
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+"""
+Streaming of inputs larger than one kernel invocation through an NPU kernel.
+"""
+from collections import deque
+
+import numpy as np
+
+
+class StreamingExecutor:
+    """
+    Runs a kernel on consecutive chunks of a large input, overlapping the
+    host work of a chunk with the execution of the previous ones.
+
+    The kernel is called as `kernel(input_chunk, output_chunk, *extra_args)`.
+    The executor rotates through a ring of `depth` input and output tensors,
+    allocated once: while up to `depth - 1` chunks execute on the NPU, the
+    next chunk is copied into its input tensor and synced to the device, and
+    the output of the oldest chunk is synced back and copied out. Outputs are
+    returned in the order of the inputs.
+    """
+
+    def __init__(
+        self,
+        npu_kernel,
+        chunk_shape,
+        depth=2,
+        dtype=np.int32,
+        out_shape=None,
+        out_dtype=None,
+        extra_args=(),
+        runtime=None,
+        tensor_class=None,
+    ):
+        """
+        Initialize the StreamingExecutor.
+
+        Args:
+            npu_kernel (NPUKernel): The kernel.
+            chunk_shape (tuple): Shape of the input of one invocation.
+            depth (int, optional): Number of chunks in flight, at least 1. Defaults to 2.
+            dtype (np.dtype, optional): Data type of the input. Defaults to np.int32.
+            out_shape (tuple, optional): Shape of the output of one invocation. Defaults to `chunk_shape`.
+            out_dtype (np.dtype, optional): Data type of the output. Defaults to `dtype`.
+            extra_args (tuple, optional): Tensors passed to every invocation after the output, e.g. weights.
+                They are passed to the runtime as `read_only`, so the invocations in flight share them; the kernel must not
+                write to them.
+            runtime (HostRuntime, optional): Defaults to the DefaultNPURuntime.
+            tensor_class (type, optional): Class of the tensors of the ring. Defaults to the default tensor class.
+
+        Raises:
+            ValueError: If depth is less than 1 or the kernel is traced.
+        """
+        if depth < 1:
+            raise ValueError(f"depth must be at least 1, got {depth}")
+        if npu_kernel.trace_config:
+            raise ValueError("StreamingExecutor does not support tracing")
+        if runtime is None:
+            from . import DefaultNPURuntime
+
+            if DefaultNPURuntime is None:
+                raise Exception("Cannot stream kernel; DefaultNPURuntime not set.")
+            runtime = DefaultNPURuntime
+        if tensor_class is None:
+            from . import DEFAULT_TENSOR_CLASS as tensor_class
+
+        self.chunk_shape = tuple(chunk_shape)
+        self.out_shape = tuple(out_shape or chunk_shape)
+        self.dtype = np.dtype(dtype)
+        self.out_dtype = np.dtype(out_dtype or dtype)
+        self.depth = depth
+        self._runtime = runtime
+        self._handle = runtime.load(npu_kernel)
+        self._extra_args = list(extra_args)
+        # The extra arguments are shared by the runs in flight
+        self._run_kwargs = {"read_only": self._extra_args} if extra_args else {}
+        self._ring = [
+            (
+                tensor_class(self.chunk_shape, dtype=self.dtype),
+                tensor_class(self.out_shape, dtype=self.out_dtype),
+            )
+            for _ in range(depth)
+        ]
+
+    def stream(self, chunks):
+        """
+        Run the kernel on every chunk of an iterable.
+
+        A chunk smaller than `chunk_shape`, such as the end of an input, is
+        padded with zeros.
+
+        Args:
+            chunks (iterable[np.ndarray]): The inputs.
+
+        Yields:
+            np.ndarray: The output of every chunk, in order.
+        """
+        in_flight = deque()
+        try:
+            for i, chunk in enumerate(chunks):
+                if len(in_flight) == self.depth:
+                    yield self._collect(in_flight.popleft())
+                slot = self._ring[i % self.depth]
+                self._fill(slot[0], chunk)
+                future = self._runtime.run_async(
+                    self._handle,
+                    [slot[0], slot[1], *self._extra_args],
+                    **self._run_kwargs,
+                )
+                in_flight.append((future, slot[1]))
+            while in_flight:
+                yield self._collect(in_flight.popleft())
+        finally:
+            # Runs still in flight if the consumer stopped early
+            for future, _ in in_flight:
+                future.exception()
+
+    def map(self, array):
+        """
+        Run the kernel on a large array, split into chunks along its first
+        axis.
+
+        Args:
+            array (np.ndarray): The input, whose other axes are those of `chunk_shape`.
+
+        Returns:
+            np.ndarray: The outputs concatenated along the first axis. If the
+            output of a chunk has as many rows as its input, the rows of the
+            padding of the last chunk are dropped.
+        """
+        array = np.asarray(array)
+        rows = self.chunk_shape[0]
+        chunks = (array[i : i + rows] for i in range(0, len(array), rows))
+        outputs = list(self.stream(chunks))
+        if not outputs:
+            return np.empty((0, *self.out_shape[1:]), dtype=self.out_dtype)
+        result = np.concatenate(outputs)
+        if self.out_shape[0] == rows:
+            result = result[: len(array)]
+        return result
+
+    def _fill(self, tensor, chunk):
+        chunk = np.asarray(chunk)
+        if chunk.shape == self.chunk_shape:
+            tensor.copy_(chunk)
+            return
+        if chunk.ndim != len(self.chunk_shape) or any(
+            c > s for c, s in zip(chunk.shape, self.chunk_shape)
+        ):
+            raise ValueError(
+                f"Chunk of shape {chunk.shape} does not fit in {self.chunk_shape}"
+            )
+        padded = np.zeros(self.chunk_shape, dtype=self.dtype)
+        padded[tuple(slice(0, c) for c in chunk.shape)] = chunk
+        tensor.copy_(padded)
+
+    @staticmethod
+    def _collect(entry):
+        future, out = entry
+        future.wait()
+        # Read without marking the tensor as written on the host, which would
+        # sync it back to the device on the next launch
+        return out.__array__().copy()
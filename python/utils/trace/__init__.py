@@ -453,11 +453,18 @@ parse_trace.py --input trace.txt --mlir build/aie_trace.mlir --output parse_even
 ```
 
 * **--filename** : Input trace packet text file. This is generated during the running of our python host code
-* **--mlir**     : MLIR source. This is needed to parse what events and tiles we are monitoring to generate labels for our waveform visualizer.
+    Binary trace files written by `TraceConfig.write_trace` with a `.bin` (raw little-endian uint32 words, the default `trace.bin`) or `.npy` file name are also accepted and are memory-mapped instead of parsed as text. They are much faster to read and write for large traces; `TraceConfig.export_text` converts them back to the text format.
+* **--mlir**     : MLIR source. This is needed to parse what events and tiles we are monitoring to generate labels for our waveform visualizer. Instead of the MLIR source, this can also be the `insts.bin` of the design, whose register writes hold the same trace configuration, or the `<insts>.trace_events.json` file written next to it by `compile_mlir_module`. Either avoids parsing the MLIR module again.
 * **--colshift (optional)** : runtime column shift. This specifies how much the actual design was shifted from the default position when it was scheduled and called. The reason we need this is becuase even if our design is configured for column 0, the actual loading and execution of the design may place it in column 1, 2, 3 etc. We account for this shift since the parser needs to match the actual column location of the generated trace data. For npu devices (phoenix), this is typically 1 while npu2 (strix) uses 0. The script should be able to automatically figure out the starting column and set this correctly but can be overrided via this argument.
 
     **NOTE** - the underlying tools currently default to column 1 to avoid using column 0 on Ryzen AI since that column does not have a shimDMA and is therefore avoided at the moment.
-* **--output** : output json file
+* **--output** : output json file, or `-` to write to stdout
+* **--workers (optional)** : number of processes decoding the traced tiles in parallel (the `workers=` argument of `parse_trace`). Each (packet type, tile) stream is decoded independently; events after the metadata are then written in (pid, tid, ts) order. `utils/trace_parse_benchmark.py` measures the scaling on a synthetic 32-tile trace.
+* **--chunk-words (optional)** : decode the trace this many 32-bit words at a time and write events to the output as they are decoded. Memory use then stays bounded for traces too large to expand in memory at once. The library equivalent is `iter_trace_events(trace_source, mlir_module_str)`, a generator that reads the trace (a file path or a numpy array) in chunks.
+
+`parse_trace(..., columnar=True)` returns the events as a `TraceEventStore` ([store.py](./store.py)) rather than a list of dicts: NumPy columns for pid, tid, name (an index into a string table), phase and timestamp, plus the metadata events. It takes a few bytes per event, iterating over it yields the same dicts as the list, and it can be exported with `to_json`, `to_perfetto` (Perfetto protobuf), `to_parquet` (needs pyarrow) and `to_npz`/`from_npz`. `get_cycles`, `get_cycles_summary` and `get_vector_time` accept a `TraceEventStore`, a list of events or a trace JSON path and run as array queries over the store.
+
+`TraceAnalysis` ([analysis.py](./analysis.py)) is built once from a parsed trace (a `TraceEventStore`, list of events or trace JSON path). It indexes the events by tile (pid) and event name and pairs begin/end events into intervals, and then answers per tile: kernel cycles between `INSTR_EVENT_0` and `INSTR_EVENT_1` (`kernel_cycles`, `latency_histogram`), cycles spent in each event state (`state_cycles`), lock/DMA/stream/memory stall fractions (`stall_fractions`) and how long tiles were busy at the same time (`overlap`, `overlap_matrix`). `summary`/`format_summary` give a table of all of it; [get_trace_summary.py](./get_trace_summary.py) prints it with `--table`, and kernel cycle histograms with `--histogram BINS`.
 
 
 ### <u>Trace parser - eventIR based ([event_ir.py](./event_ir.py))</u>
@@ -524,7 +531,9 @@ which reduces the timer from 11,091,042 cycles to 381,175 seems to fix it.
 """
 
 from .config import TraceConfig
-from .parse import parse_trace
+from .parse import parse_trace, iter_trace_events
+from .store import TraceEventStore
+from .analysis import TraceAnalysis
 from .setup import (
     configure_coremem_tracing_aie2,
     configure_coretile_tracing_aie2,
@@ -548,4 +557,5 @@ from .utils import (
     get_cycles,
     get_cycles_summary,
     get_vector_time,
+    load_trace_events,
 )
@@ -0,0 +1,302 @@
+# Copyright (C) 2026 Advanced Micro Devices, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""Indexed queries over a parsed trace.
+
+TraceAnalysis is built once from a parsed trace (a TraceEventStore, a list of
+events in Trace Event Format or a trace JSON file). It indexes the events by
+tile (pid) and event name, and pairs begin/end events into intervals, so the
+queries below are array operations instead of passes over the whole trace.
+"""
+
+import re
+
+import numpy as np
+
+from .utils import load_trace_events, match_kernel_markers
+
+KERNEL_START = "INSTR_EVENT_0"
+KERNEL_END = "INSTR_EVENT_1"
+
+# Event name patterns counted by TraceAnalysis.stall_fractions. A DMA channel
+# waiting on a lock (e.g. DMA_S2MM_0_STALLED_LOCK) counts as both.
+STALL_CATEGORIES = {
+    "lock": r"LOCK_STALL|STALLED_LOCK",
+    "dma": r"^DMA_.*(STALL|STARVATION|BACKPRESSURE)",
+    "stream": r"STREAM_STALL|PORT_STALLED",
+    "memory": r"^MEMORY_STALL$",
+}
+
+
+def _group_bounds(keys):
+    """dict of key to (lo, hi) for the runs of equal values in sorted keys."""
+    starts = np.flatnonzero(np.diff(keys, prepend=keys[:1] - 1)) if len(keys) else []
+    bounds = np.append(starts, len(keys)).tolist()
+    return {keys[lo].item(): (lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])}
+
+
+def _union(starts, ends):
+    """Merge intervals into sorted, disjoint (starts, ends)."""
+    if len(starts) == 0:
+        return starts, ends
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], np.maximum.accumulate(ends[order])
+    new = np.ones(len(starts), dtype=bool)
+    new[1:] = starts[1:] > ends[:-1]
+    last = np.append(np.flatnonzero(new)[1:] - 1, len(starts) - 1)
+    return starts[new], ends[last]
+
+
+def _length(starts, ends):
+    return int((ends - starts).sum())
+
+
+def _union_length(starts, ends):
+    return _length(*_union(starts, ends))
+
+
+def _clip(starts, ends, window):
+    if window is None:
+        return starts, ends
+    starts = np.maximum(starts, window[0])
+    ends = np.minimum(ends, window[1])
+    keep = ends > starts
+    return starts[keep], ends[keep]
+
+
+class TraceAnalysis:
+    """Per-tile analytics of a parsed trace.
+
+    Every pid of the trace is one (trace type, tile) stream, named by its
+    process_name metadata event. Begin/end events of each (pid, tid) are
+    paired into intervals; an event still active at the end of the trace is
+    closed at the last timestamp of the trace.
+
+    Args:
+        trace: TraceEventStore, list of events in Trace Event Format or the
+            path of a trace JSON file
+    """
+
+    def __init__(self, trace):
+        self.events = load_trace_events(trace)
+        events = self.events
+        self.names = events.names
+        self.tile_names = events.process_names()
+        self.end = int(events.ts.max()) if len(events.ts) else 0
+
+        # Events sorted by (pid, name, ts), ties kept in trace order
+        num_names = max(len(self.names), 1)
+        order = np.lexsort((events.ts, events.name, events.pid))
+        self._pos = order
+        self._ts = events.ts[order]
+        self._ph = events.ph[order]
+        keys = events.pid[order].astype(np.int64) * num_names + events.name[order]
+        self._num_names = num_names
+        self._index = _group_bounds(keys)
+
+        # Begin/end intervals of each (pid, tid), sorted by (pid, name, start)
+        order = np.lexsort((events.ts, events.tid, events.pid))
+        ts, ph = events.ts[order], events.ph[order]
+        stream = events.pid[order].astype(np.int64) << 32 | events.tid[order]
+        is_begin = ph == b"B"
+        next_end = np.zeros(len(ts), dtype=bool)
+        next_end[:-1] = (ph[1:] == b"E") & (stream[1:] == stream[:-1])
+        last_of_stream = np.ones(len(ts), dtype=bool)
+        last_of_stream[:-1] = stream[1:] != stream[:-1]
+        closed = is_begin & next_end
+        open_at_end = is_begin & last_of_stream
+        begin = closed | open_at_end
+        iv_end = np.where(closed, np.append(ts[1:], self.end), self.end)[begin]
+        iv_pid = events.pid[order][begin]
+        iv_name = events.name[order][begin]
+        iv_start = ts[begin]
+        order = np.lexsort((iv_start, iv_name, iv_pid))
+        self._iv_start = iv_start[order]
+        self._iv_end = iv_end[order]
+        self._iv_pid = iv_pid[order]
+        self._iv_name = iv_name[order]
+        keys = self._iv_pid.astype(np.int64) * num_names + self._iv_name
+        self._iv_index = _group_bounds(keys)
+        self._iv_pid_index = _group_bounds(self._iv_pid)
+
+    # --------------------------------------------------------------------------
+    # Index lookups
+    # --------------------------------------------------------------------------
+
+    def pids(self):
+        """Sorted pids of all tiles with a process name or events."""
+        return sorted(set(self.tile_names) | set(np.unique(self.events.pid).tolist()))
+
+    def event_names(self, pid):
+        """Names of the events seen in a tile."""
+        return sorted(
+            self.names[k % self._num_names]
+            for k in self._index
+            if k // self._num_names == pid
+        )
+
+    def _bounds(self, index, pid, name):
+        name_id = self.events.name_id(name)
+        if name_id < 0:
+            return 0, 0
+        return index.get(pid * self._num_names + name_id, (0, 0))
+
+    def timestamps(self, pid, name, ph="B"):
+        """Sorted timestamps of one event of a tile."""
+        lo, hi = self._bounds(self._index, pid, name)
+        ts = self._ts[lo:hi]
+        return ts[self._ph[lo:hi] == ph.encode()]
+
+    def intervals(self, pid, name=None):
+        """(starts, ends) of the intervals an event of a tile was active,
+        or of all its events if name is None."""
+        if name is None:
+            lo, hi = self._iv_pid_index.get(pid, (0, 0))
+        else:
+            lo, hi = self._bounds(self._iv_index, pid, name)
+        return self._iv_start[lo:hi], self._iv_end[lo:hi]
+
+    def span(self, pid):
+        """(first, last) timestamp of a tile's events."""
+        lo, hi = self._iv_pid_index.get(pid, (0, 0))
+        if lo == hi:
+            return 0, 0
+        return int(self._iv_start[lo:hi].min()), int(self._iv_end[lo:hi].max())
+
+    # --------------------------------------------------------------------------
+    # Kernel latency
+    # --------------------------------------------------------------------------
+
+    def kernel_intervals(self, pid, start=KERNEL_START, end=KERNEL_END):
+        """(starts, ends) of the kernel invocations of a tile, from each
+        start event to the following end event. Extra start and end events
+        are ignored, as in get_cycles_summary."""
+        lo0, hi0 = self._bounds(self._index, pid, start)
+        lo1, hi1 = self._bounds(self._index, pid, end)
+        begin0 = self._ph[lo0:hi0] == b"B"
+        begin1 = self._ph[lo1:hi1] == b"B"
+        ts = np.concatenate((self._ts[lo0:hi0][begin0], self._ts[lo1:hi1][begin1]))
+        pos = np.concatenate((self._pos[lo0:hi0][begin0], self._pos[lo1:hi1][begin1]))
+        is_end = np.arange(len(ts)) >= begin0.sum()
+        order = np.argsort(pos, kind="stable")
+        return match_kernel_markers(ts[order], is_end[order])
+
+    def kernel_cycles(self, pid, start=KERNEL_START, end=KERNEL_END):
+        """Cycles of each kernel invocation of a tile."""
+        starts, ends = self.kernel_intervals(pid, start, end)
+        return ends - starts
+
+    def latency_histogram(self, pid, bins=10, start=KERNEL_START, end=KERNEL_END):
+        """np.histogram of the kernel cycles of a tile."""
+        return np.histogram(self.kernel_cycles(pid, start, end), bins=bins)
+
+    # --------------------------------------------------------------------------
+    # Event states
+    # --------------------------------------------------------------------------
+
+    def state_cycles(self, pid, window=None):
+        """dict of event name to the cycles the event was active in a tile,
+        optionally clipped to a (start, end) window."""
+        cycles = {}
+        for name in self.event_names(pid):
+            starts, ends = _clip(*self.intervals(pid, name), window)
+            if len(starts):
+                cycles[name] = _union_length(starts, ends)
+        return cycles
+
+    def stall_fractions(self, pid, window=None, categories=STALL_CATEGORIES):
+        """dict of stall category to the fraction of time a tile was stalled.
+
+        Args:
+            pid: tile to query
+            window: (start, end) to measure, the span of the tile by default
+            categories: dict of category to a regular expression matching the
+                event names that count as that stall
+        """
+        window = window or self.span(pid)
+        duration = window[1] - window[0]
+        names = self.event_names(pid)
+        fractions = {}
+        for category, pattern in categories.items():
+            parts = [
+                _clip(*self.intervals(pid, name), window)
+                for name in names
+                if re.search(pattern, name)
+            ]
+            if not parts or duration <= 0:
+                fractions[category] = 0.0
+                continue
+            starts = np.concatenate([p[0] for p in parts])
+            ends = np.concatenate([p[1] for p in parts])
+            fractions[category] = _union_length(starts, ends) / duration
+        return fractions
+
+    # --------------------------------------------------------------------------
+    # Overlap between tiles
+    # --------------------------------------------------------------------------
+
+    def busy_intervals(self, pid, name=None):
+        """Disjoint (starts, ends) a tile was busy: running its kernel if name
+        is None, otherwise with the given event active."""
+        if name is None:
+            return _union(*self.kernel_intervals(pid))
+        return _union(*self.intervals(pid, name))
+
+    def overlap(self, pid_a, pid_b, name=None):
+        """Cycles two tiles were busy at the same time (see busy_intervals)."""
+        a = self.busy_intervals(pid_a, name)
+        b = self.busy_intervals(pid_b, name)
+        union = _union(np.concatenate((a[0], b[0])), np.concatenate((a[1], b[1])))
+        return _length(*a) + _length(*b) - _length(*union)
+
+    def overlap_matrix(self, pids=None, name=None):
+        """Matrix of overlap cycles between every pair of tiles."""
+        pids = self.pids() if pids is None else pids
+        matrix = np.zeros((len(pids), len(pids)), dtype=np.int64)
+        for i, a in enumerate(pids):
+            for j in range(i, len(pids)):
+                matrix[i, j] = matrix[j, i] = self.overlap(a, pids[j], name)
+        return matrix
+
+    # --------------------------------------------------------------------------
+    # Summary
+    # --------------------------------------------------------------------------
+
+    def summary(self):
+        """One dict per tile with its kernel cycles and stall fractions."""
+        rows = []
+        for pid in self.pids():
+            cycles = self.kernel_cycles(pid)
+            row = {
+                "pid": pid,
+                "tile": self.tile_names.get(pid, str(pid)),
+                "invocations": len(cycles),
+                "first": int(cycles[0]) if len(cycles) else None,
+                "min": int(cycles.min()) if len(cycles) else None,
+                "avg": float(cycles.mean()) if len(cycles) else None,
+                "max": int(cycles.max()) if len(cycles) else None,
+            }
+            for category, fraction in self.stall_fractions(pid).items():
+                row[f"{category}_stall"] = fraction
+            rows.append(row)
+        return rows
+
+    def format_summary(self):
+        """The summary as a text table."""
+        rows = self.summary()
+        if not rows:
+            return ""
+        columns = list(rows[0])
+
+        def fmt(value):
+            if value is None:
+                return "-"
+            if isinstance(value, float):
+                return f"{value:.3f}"
+            return str(value)
+
+        cells = [columns] + [[fmt(row[c]) for c in columns] for row in rows]
+        widths = [max(len(r[i]) for r in cells) for i in range(len(columns))]
+        lines = ["  ".join(c.ljust(w) for c, w in zip(r, widths)) for r in cells]
+        lines.insert(1, "  ".join("-" * w for w in widths))
+        return "\n".join(line.rstrip() for line in lines)
@@ -3,8 +3,8 @@
 
 import numpy as np
 import json
-from .parse import parse_trace
-from .utils import parity, extract_tile
+from .parse import parse_trace, read_trace_event_config
+from .utils import parity, extract_tile, read_trace_words, write_trace_words
 
 
 class TraceConfig:
@@ -13,7 +13,7 @@ class TraceConfig:
     def __init__(
         self,
         trace_size: int,
-        trace_file: str = "trace.txt",
+        trace_file: str = "trace.bin",
         trace_after_last_tensor: bool = False,
         enable_ctrl_pkts: bool = False,
         last_tensor_shape=None,
@@ -29,23 +29,30 @@ class TraceConfig:
         self.last_tensor_dtype = last_tensor_dtype
 
     def write_trace(self, trace):
-        out_str = "\n".join(f"{i:0{8}x}" for i in trace if i != 0)
-        with open(self.trace_file, "w") as f:
-            f.write(out_str)
+        """Write the trace buffer to trace_file.
+
+        A trace_file ending in .bin (the default) or .npy is written in binary
+        form, which read_trace memory-maps; any other name uses the hex text
+        format, which export_text also writes.
+        """
+        write_trace_words(self.trace_file, trace)
 
     def read_trace(self):
-        with open(self.trace_file, "r") as f:
-            trace_data = [int(line.strip(), 16) for line in f if line.strip()]
-        return np.array(trace_data, dtype=np.uint32)
+        return read_trace_words(self.trace_file)
+
+    def export_text(self, output_name: str = "trace.txt"):
+        """Export the trace to the hex text format read by parse.py."""
+        write_trace_words(output_name, self.read_trace())
 
     def trace_to_json(self, mlir_file: str, output_name: str = "trace.json"):
-        """Wrapper over parse_trace.py utility."""
-        trace_buffer = self.read_trace()
+        """Wrapper over parse_trace.py utility.
 
-        with open(mlir_file, "r") as f:
-            mlir_module_str = f.read()
+        mlir_file can also be the design's instruction binary (.bin) or trace
+        event sidecar (.json), which avoids parsing the MLIR module.
+        """
+        trace_buffer = self.read_trace()
 
-        trace_events = parse_trace(trace_buffer, mlir_module_str)
+        trace_events = parse_trace(trace_buffer, read_trace_event_config(mlir_file))
 
         with open(output_name, "w") as f:
             json.dump(trace_events, f, indent=2)
@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
 # (c) Copyright 2026 Advanced Micro Devices, Inc.
-import json
 import argparse
 import logging
 import sys
-import re
-from aie.utils.trace.utils import get_cycles_summary
+from aie.utils.trace.analysis import TraceAnalysis
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +11,17 @@ logger = logging.getLogger(__name__)
 def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument("--input", help="Trace file", required=True)
+    parser.add_argument(
+        "--table",
+        action="store_true",
+        help="Print a table of kernel cycles and stall fractions for every tile",
+    )
+    parser.add_argument(
+        "--histogram",
+        type=int,
+        metavar="BINS",
+        help="Also print a histogram of the kernel cycles of every tile",
+    )
     # parser.add_argument("--mlir", help="mlir source file", required=True)
     # parser.add_argument(
     #    "--colshift", help="column shift adjustment to source mlir", required=False
@@ -24,24 +33,44 @@ def parse_args():
     return parser.parse_args(sys.argv[1:])
 
 
-if __name__ == "__main__":
-    opts = parse_args()
-    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stderr)
-    cycles = get_cycles_summary(opts.input)
-
-    logger.debug("cycles: %s", cycles)
-    for i in range(len(cycles)):
-        print(cycles[i][0])
-        runs = len(cycles[i]) - 1
+def print_cycles(analysis):
+    for pid in analysis.tile_names:
+        cycles = analysis.kernel_cycles(pid).tolist()
+        logger.debug("pid %s cycles: %s", pid, cycles)
+        print(analysis.tile_names[pid])
+        runs = len(cycles)
         print("Total number of full kernel invocations is " + str(runs))
         if runs > 0:
             print(
                 "First/Min/Avg/Max cycles is "
-                + str(cycles[i][1])
+                + str(cycles[0])
                 + "/ "
-                + str(min(cycles[i][1:]))
+                + str(min(cycles))
                 + "/ "
-                + str(sum(cycles[i][1:]) / (len(cycles[i]) - 1))
+                + str(sum(cycles) / runs)
                 + "/ "
-                + str(max(cycles[i][1:]))
+                + str(max(cycles))
             )
+
+
+def print_histograms(analysis, bins):
+    for pid in analysis.pids():
+        counts, edges = analysis.latency_histogram(pid, bins)
+        if counts.sum() == 0:
+            continue
+        print(analysis.tile_names.get(pid, pid))
+        for count, lo, hi in zip(counts, edges[:-1], edges[1:]):
+            print(f"  [{lo:10.1f}, {hi:10.1f}) {count}")
+
+
+if __name__ == "__main__":
+    opts = parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stderr)
+    analysis = TraceAnalysis(opts.input)
+
+    if opts.table:
+        print(analysis.format_summary())
+    else:
+        print_cycles(analysis)
+    if opts.histogram:
+        print_histograms(analysis, opts.histogram)
@@ -2,9 +2,14 @@
 # (c) Copyright 2026 Advanced Micro Devices, Inc.
 import json
 import argparse
+import concurrent.futures
+import functools
+import importlib
 import logging
+import os
 import sys
 import re
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +23,20 @@ from aie.utils.trace.utils import (
     convert_to_byte_stream,
     convert_to_commands,
     trim_trace_pkts,
+    trace_words_de_interleave,
+    convert_words_to_byte_stream,
+    trim_trace_words,
+    read_trace_words,
+    trace_words_end,
+    trace_header_keys,
+    trace_stream_loc,
+    split_trace_words,
+    trace_words_to_byte_stream,
+    decode_trace_commands,
+    decode_trace_command_prefix,
+    commands_to_dicts,
 )
+from aie.utils.trace.store import TraceEventStore
 from aie.utils.trace.events import (
     NUM_TRACE_TYPES,
     PacketType,
@@ -33,16 +51,41 @@ import aie.dialects.aie as aiedialect
 import aie.dialects.aiex as aiexdialect
 
 NUM_EVENTS = 8  # number of events we can view per trace
+DEFAULT_CHUNK_WORDS = 1 << 18  # trace words decoded at a time when streaming
 
 
 def parse_args():
     parser = argparse.ArgumentParser()
-    parser.add_argument("--input", help="Input trace file", required=True)
-    parser.add_argument("--mlir", help="mlir source file", required=True)
+    parser.add_argument(
+        "--input",
+        help="Input trace file (hex text, or binary .bin/.npy)",
+        required=True,
+    )
+    parser.add_argument(
+        "--mlir",
+        help="mlir source file, or the design's instruction binary (.bin) or "
+        "trace event sidecar (.json)",
+        required=True,
+    )
     parser.add_argument(
         "--colshift", help="column shift adjustment to source mlir", required=False
     )
-    parser.add_argument("--output", help="Output json file", required=True)
+    parser.add_argument(
+        "--output", help="Output json file ('-' for stdout)", required=True
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes decoding the traced tiles in parallel",
+        required=False,
+    )
+    parser.add_argument(
+        "--chunk-words",
+        type=int,
+        help="Decode the trace this many words at a time and write events as "
+        "they are decoded, to bound memory use on large traces",
+        required=False,
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -58,10 +101,17 @@ def parse_args():
 # Check for valid trace packets data
 # 1) if only 1 trace packet
 # 2) if first trace packet is all 0's
+# trace_pkts can be a list of hex strings or an array of uint32 words.
 def check_for_valid_trace(filename, trace_pkts):
     logger.debug("len(trace_pkts): %s", len(trace_pkts))
-    logger.debug("trace_pkts[0]: %s", trace_pkts[0] if trace_pkts else "<empty>")
-    if len(trace_pkts) < 2 or trace_pkts[0] == "00000000":
+    logger.debug("trace_pkts[0]: %s", trace_pkts[0] if len(trace_pkts) else "<empty>")
+    if len(trace_pkts) < 2:
+        first = 0
+    elif isinstance(trace_pkts[0], str):
+        first = int(trace_pkts[0], 16)
+    else:
+        first = int(trace_pkts[0])
+    if first == 0:
         logger.error("Empty trace file. Valid trace was not written to %s", filename)
         logger.error(
             "See https://github.com/Xilinx/mlir-aie/tree/main/programming_guide/section-4/section-4b#Additional-Debug-Hints for additional trace debug tips."
@@ -147,6 +197,17 @@ def lookupEventNameInStr(event, pid, pid_events):
     #         return "Mm2s1FinishedTask"
 
 
+# Append a begin/end event to trace_events, which is either a list of events in
+# Trace Event Format or a TraceEventStore.
+def append_trace_event(trace_events, name, ts, ph, pid, tid):
+    if isinstance(trace_events, TraceEventStore):
+        trace_events.add(name, ts, ph, pid, tid)
+    else:
+        trace_events.append(
+            {"name": name, "ts": ts, "ph": ph, "pid": pid, "tid": tid, "args": {}}
+        )
+
+
 # This function assert an end event for all active events if:
 # 1) the cycles from the last event is > 0
 # 2) active event is not in list of new events (multiples)
@@ -178,17 +239,16 @@ def deactivate_events(
         if cycles > 0 or (cycles == 0 and not k in multiples):
             # if not k in multiples: # active event it not in multiples list
             if active_events[k] > 0:
-                trace_event = {
-                    "name": lookup_event_name_by_type(
+                append_trace_event(
+                    trace_events,
+                    lookup_event_name_by_type(
                         trace_type, pid_events[trace_type][loc][k], events_module
-                    )
-                }  # TODO remove
-                trace_event["ts"] = timer
-                trace_event["ph"] = "E"
-                trace_event["pid"] = pid
-                trace_event["tid"] = k
-                trace_event["args"] = {}
-                trace_events.append(trace_event)
+                    ),
+                    timer,
+                    "E",
+                    pid,
+                    k,
+                )
             active_events[k] = 0
 
 
@@ -198,82 +258,130 @@ def activate_event(
 ):
     try:
         if active_events[event] == 0:
-            trace_event = {
-                "name": lookup_event_name_by_type(
+            append_trace_event(
+                trace_events,
+                lookup_event_name_by_type(
                     tt, pid_events[tt][loc][event], events_module
-                )
-            }
-            trace_event["ts"] = timer
-            trace_event["ph"] = "B"
-            trace_event["pid"] = pid
-            trace_event["tid"] = event
-            trace_event["args"] = {}
-            trace_events.append(trace_event)
+                ),
+                timer,
+                "B",
+                pid,
+                event,
+            )
             active_events[event] = 1
     except KeyError:
         pass
 
 
-# def convert_commands_to_json(trace_events, commands, pid, pid_events):
-# TODO iterate over commands which is ...
-#
-# commands:  list (idx = trace type, value = byte_stream_dict)
-# byte_stream_dict: dict (key = row,col, value = list of commands)
-def convert_commands_to_json(trace_events, commands, pid_events, events_module):
-    # byte_stream_dict for each trace type.
-    for [tt, byte_stream_dict] in enumerate(commands):  # tt = trace type
+class TileTraceState:
+    """Decoder state of one (trace type, tile) stream.
 
-        for loc, command in byte_stream_dict.items():  # row,col with list of commands
-            timer = 0  # TODO Some way to set this or sync this between trace types and row,col
-            # timer on each execution is the time for the last execution
-            # so we by default will increment it by 1 for each event
-            logger.debug("tt: %s, loc: %s, NUM_EVENTS: %s", tt, loc, NUM_EVENTS)
+    Holds everything needed to resume decoding the stream where a previous
+    chunk of trace data ended: the undecoded bytes of a command split across
+    chunks, the running timer, the active events and the last Single/Multiple
+    command, which Repeat commands replay.
+    """
 
-            if loc in pid_events[tt]:
-                pid = pid_events[tt][loc][NUM_EVENTS]
-            else:
-                logger.error(
-                    "tile in %s not found in trace packet data file (e.g trace.txt).",
-                    loc,
-                )
-                tiles = []
-                for tt_tmp in range(len(commands)):
-                    for keys in pid_events[tt_tmp]:
-                        tiles.append(keys)
-                logger.error("Defined tiles in design are at: %s", tiles)
-                logger.error(
-                    "Consider changing --colshift value if you think this is an error."
-                )
-                sys.exit(1)
-
-            active_events = dict()
-            for i in range(8):  # 8 max events at a time
-                active_events[i] = 0
-
-            logger.debug("num commands: %s", len(command))
-            for c in command:
-                t = c["type"]
-                if "Single" in t:
-                    event = c["event"]
-                    cycles = int(c["cycles"])
-                    timer = timer + 1
-                    multiple_list = list()
-                    multiple_list.append(c["event"])
-                    deactivate_events(
-                        multiple_list,
-                        active_events,
-                        timer,
-                        cycles,
-                        pid,
-                        tt,
-                        loc,
-                        pid_events,
-                        trace_events,
-                        events_module,
-                    )
-                    timer = timer + cycles
+    def __init__(self):
+        self.pending = np.zeros(0, dtype=np.uint8)
+        # TODO Some way to set this or sync this between trace types and row,col
+        self.timer = 0
+        self.active_events = dict()
+        for i in range(8):  # 8 max events at a time
+            self.active_events[i] = 0
+        self.cycles = 0
+        self.multiple_list = list()
+        self.event = None
+
+
+def lookup_pid(pid_events, tt, loc):
+    if loc in pid_events[tt]:
+        return pid_events[tt][loc][NUM_EVENTS]
+    logger.error(
+        "tile in %s not found in trace packet data file (e.g trace.txt).",
+        loc,
+    )
+    tiles = []
+    for tt_tmp in range(len(pid_events)):
+        for keys in pid_events[tt_tmp]:
+            tiles.append(keys)
+    logger.error("Defined tiles in design are at: %s", tiles)
+    logger.error("Consider changing --colshift value if you think this is an error.")
+    sys.exit(1)
+
+
+# Convert the commands of one (trace type, tile) stream, continuing from and
+# updating `state`.
+def convert_tile_commands_to_json(
+    trace_events, command, tt, loc, pid, pid_events, events_module, state
+):
+    # timer on each execution is the time for the last execution
+    # so we by default will increment it by 1 for each event
+    timer = state.timer
+    active_events = state.active_events
+    cycles = state.cycles
+    multiple_list = state.multiple_list
+    event = state.event
+
+    logger.debug("num commands: %s", len(command))
+    for c in command:
+        t = c["type"]
+        if "Single" in t:
+            event = c["event"]
+            cycles = int(c["cycles"])
+            timer = timer + 1
+            multiple_list = list()
+            multiple_list.append(c["event"])
+            deactivate_events(
+                multiple_list,
+                active_events,
+                timer,
+                cycles,
+                pid,
+                tt,
+                loc,
+                pid_events,
+                trace_events,
+                events_module,
+            )
+            timer = timer + cycles
+            activate_event(
+                event,
+                tt,
+                loc,
+                timer,
+                pid,
+                active_events,
+                pid_events,
+                trace_events,
+                events_module,
+            )
+
+        elif "Multiple" in t:
+            cycles = int(c["cycles"])
+            timer = timer + 1
+            multiple_list = list()
+            for k in c.keys():
+                if "event" in k:
+                    multiple_list.append(c[k])
+            deactivate_events(
+                multiple_list,
+                active_events,
+                timer,
+                cycles,
+                pid,
+                tt,
+                loc,
+                pid_events,
+                trace_events,
+                events_module,
+            )
+            timer = timer + cycles
+
+            for k in c.keys():
+                if "event" in k:
                     activate_event(
-                        event,
+                        c[k],
                         tt,
                         loc,
                         timer,
@@ -284,13 +392,14 @@ def convert_commands_to_json(trace_events, commands, pid_events, events_module):
                         events_module,
                     )
 
-                elif "Multiple" in t:
-                    cycles = int(c["cycles"])
+        elif "Repeat" in t:
+            if (
+                cycles == 0
+            ):  # last event has cycles == 0 so we just extend it by the repaet count
+                timer = timer + int(c["repeats"])
+            else:
+                for repeats_cnt in range(int(c["repeats"])):
                     timer = timer + 1
-                    multiple_list = list()
-                    for k in c.keys():
-                        if "event" in k:
-                            multiple_list.append(c[k])
                     deactivate_events(
                         multiple_list,
                         active_events,
@@ -304,59 +413,11 @@ def convert_commands_to_json(trace_events, commands, pid_events, events_module):
                         events_module,
                     )
                     timer = timer + cycles
-
-                    for k in c.keys():
-                        if "event" in k:
-                            activate_event(
-                                c[k],
-                                tt,
-                                loc,
-                                timer,
-                                pid,
-                                active_events,
-                                pid_events,
-                                trace_events,
-                                events_module,
-                            )
-
-                elif "Repeat" in t:
-                    if (
-                        cycles == 0
-                    ):  # last event has cycles == 0 so we just extend it by the repaet count
-                        timer = timer + int(c["repeats"])
-                    else:
-                        for repeats_cnt in range(int(c["repeats"])):
-                            timer = timer + 1
-                            deactivate_events(
-                                multiple_list,
-                                active_events,
-                                timer,
-                                cycles,
-                                pid,
-                                tt,
-                                loc,
-                                pid_events,
-                                trace_events,
-                                events_module,
-                            )
-                            timer = timer + cycles
-                            if len(multiple_list) > 1:
-                                for k in c.keys():
-                                    if "event" in k:
-                                        activate_event(
-                                            c[k],
-                                            tt,
-                                            loc,
-                                            timer,
-                                            pid,
-                                            active_events,
-                                            pid_events,
-                                            trace_events,
-                                            events_module,
-                                        )
-                            else:
+                    if len(multiple_list) > 1:
+                        for k in c.keys():
+                            if "event" in k:
                                 activate_event(
-                                    event,
+                                    c[k],
                                     tt,
                                     loc,
                                     timer,
@@ -366,6 +427,44 @@ def convert_commands_to_json(trace_events, commands, pid_events, events_module):
                                     trace_events,
                                     events_module,
                                 )
+                    else:
+                        activate_event(
+                            event,
+                            tt,
+                            loc,
+                            timer,
+                            pid,
+                            active_events,
+                            pid_events,
+                            trace_events,
+                            events_module,
+                        )
+
+    state.timer = timer
+    state.cycles = cycles
+    state.multiple_list = multiple_list
+    state.event = event
+
+
+# commands:  list (idx = trace type, value = byte_stream_dict)
+# byte_stream_dict: dict (key = row,col, value = list of commands)
+def convert_commands_to_json(trace_events, commands, pid_events, events_module):
+    # byte_stream_dict for each trace type.
+    for [tt, byte_stream_dict] in enumerate(commands):  # tt = trace type
+
+        for loc, command in byte_stream_dict.items():  # row,col with list of commands
+            logger.debug("tt: %s, loc: %s, NUM_EVENTS: %s", tt, loc, NUM_EVENTS)
+            pid = lookup_pid(pid_events, tt, loc)
+            convert_tile_commands_to_json(
+                trace_events,
+                command,
+                tt,
+                loc,
+                pid,
+                pid_events,
+                events_module,
+                TileTraceState(),
+            )
 
 
 def process_name_metadata(trace_events, pid, trace_type, loc):
@@ -400,20 +499,127 @@ def thread_name_metadata(
     trace_events.append(trace_event)
 
 
+# Trace event select registers of each module, i.e. the Trace_Event0 and
+# Trace_Event1 registers in the register database (aie_registers_aie2.json):
+# offset -> (trace type, first of the 4 event slots the register selects).
+# The core and shim modules use the same offsets; on row 0 they are the shim's.
+DEFAULT_TRACE_EVENT_REGISTERS = {
+    0x340E0: (PacketType.CORE, 0),
+    0x340E4: (PacketType.CORE, 4),
+    0x140E0: (PacketType.MEM, 0),
+    0x140E4: (PacketType.MEM, 4),
+    0x940E0: (PacketType.MEMTILE, 0),
+    0x940E4: (PacketType.MEMTILE, 4),
+}
+
+_REGDB_MODULE_TRACE_TYPES = {
+    "core": PacketType.CORE,
+    "memory": PacketType.MEM,
+    "memory_tile": PacketType.MEMTILE,
+}
+
+# devGen field of the instruction binary header -> device
+INSTS_DEVICES = {3: "npu1", 4: "npu2"}
+# Address layout of the AIE2 array the instruction binaries target
+INSTS_COL_SHIFT = 25
+INSTS_ROW_SHIFT = 20
+
+# Opcodes of the instruction binary (XAie_TxnOpcode)
+_TXN_WRITE = 0x00
+_TXN_BLOCKWRITE = 0x01
+_TXN_MASKWRITE = 0x03
+_TXN_PREEMPT = 0x06
+_TXN_LOADPDI = 0x08
+_TXN_CUSTOM_OP_TCT = 0x80
+_TXN_CUSTOM_OP_DDR_PATCH = 0x81
+
+
+@functools.lru_cache(maxsize=None)
+def trace_event_registers(arch="aie2"):
+    """
+    Table of the trace event select registers of an architecture
+
+    The table is read from the register database when it is installed and
+    falls back to DEFAULT_TRACE_EVENT_REGISTERS otherwise. It is cached, so
+    callers must not modify it.
+
+    Returns:
+        dict: register offset -> (trace type, first event slot)
+    """
+    try:
+        from aie.utils.config import root_path
+
+        db_path = os.path.join(
+            root_path(), "lib", "regdb", f"aie_registers_{arch}.json"
+        )
+        with open(db_path, "r") as f:
+            modules = json.load(f)["modules"]
+    except Exception:
+        return DEFAULT_TRACE_EVENT_REGISTERS
+
+    registers = {}
+    for module, trace_type in _REGDB_MODULE_TRACE_TYPES.items():
+        for register in modules.get(module, {}).get("registers", []):
+            m = re.fullmatch(r"Trace_Event(\d)", register.get("name", ""))
+            if m:
+                registers[int(register["offset"], 16)] = (
+                    trace_type,
+                    4 * int(m.group(1)),
+                )
+    return registers or DEFAULT_TRACE_EVENT_REGISTERS
+
+
 # pid_events: list(idx=pkt_type, value=labels_dict)
 # label_dict: dict(key=row,col, value=labels list)
 # labels_list: list(idx=label idx, value=label code)
 #
-# This searches for npu.write32 and categorizes them based on address and row.
-# It's probably not the best way to do it but it's the initial implementation.
-# memtile and core/shim tiles have different addresses. For now, we distinguish
-# between core and shim tile by row=0
-def parse_mlir_trace_events(mlir_module_str, colshift=None):
-
+# writes: iterable of (address, row, col, value) register writes, where
+# address is the offset within the tile. Writes to a trace event register set
+# the event codes of 4 slots; all other writes are ignored.
+def decode_trace_event_writes(writes, arch="aie2", colshift=None):
+    registers = trace_event_registers(arch)
     pid_events = list()
     for t in range(NUM_TRACE_TYPES):
         pid_events.append(dict())
 
+    for address, row, col, value in writes:
+        register = registers.get(address)
+        if register is None:
+            continue
+        trace_type, slot = register
+        if trace_type == PacketType.CORE and row == 0:
+            trace_type = PacketType.SHIMTILE
+
+        # Adjust column based on colshift
+        if colshift is not None:
+            col = col + colshift
+        key = str(row) + "," + str(col)
+
+        logger.debug(
+            "Trace events %s-%s of %s configured to be %s",
+            slot,
+            slot + 3,
+            key,
+            hex(value),
+        )
+        events = pid_events[trace_type].setdefault(key, [0] * 8)
+        for i in range(4):
+            events[slot + i] = (value >> (8 * i)) & 0xFF
+
+    logger.debug("Found labels: %s", pid_events)
+    return pid_events
+
+
+def events_module_arch(events_module):
+    return events_module.__name__.rsplit(".", 1)[-1]
+
+
+# Find the device and all npu.write32 ops of a module, as (address, row, col,
+# value) with address relative to the tile. Parsing the module needs an MLIR
+# context, so the result is cached for the last few modules.
+@functools.lru_cache(maxsize=16)
+def mlir_trace_event_writes(mlir_module_str):
+    writes = []
     with Context(), Location.unknown():
         module = Module.parse(mlir_module_str)
 
@@ -425,116 +631,173 @@ def parse_mlir_trace_events(mlir_module_str, colshift=None):
             module.operation,
             lambda o: isinstance(o.operation.opview, aiedialect.DeviceOp),
         )
+        if not device:
+            raise ValueError("No device in the MLIR module")
         device = aiedialect.AIEDevice(int(device[0].device))
         target_model = aiedialect.get_target_model(device)
-        events_module = get_events_for_device(str(device))
-
-    for write32 in write32s:
-        address = None
-        row = None
-        col = None
-        value = None
-        if write32.address:
-            address = write32.address.value
-        if write32.row:
-            row = write32.row.value
-        if write32.column:
-            col = write32.column.value
-        if write32.value:
-            value = write32.value.value
-
-        if row is None and col is None:
-            row = (address >> target_model.get_row_shift()) & 0x1F
-            col = (address >> target_model.get_column_shift()) & 0x1F
-            address = address & 0xFFFFF  # 20 bits address
 
-        logger.debug(
-            "write32: address=%s, row=%s, col=%s, value=%s",
-            hex(address) if address is not None else None,
-            row,
-            col,
-            hex(value) if value is not None else None,
-        )
-        if None in [row, col, address, value]:
-            logger.error("Could not decode write32 op '%s'", write32)
-            sys.exit(1)
+        for write32 in write32s:
+            address = None
+            row = None
+            col = None
+            value = None
+            if write32.address:
+                address = write32.address.value
+            if write32.row:
+                row = write32.row.value
+            if write32.column:
+                col = write32.column.value
+            if write32.value:
+                value = write32.value.value
+
+            if row is None and col is None:
+                row = (address >> target_model.get_row_shift()) & 0x1F
+                col = (address >> target_model.get_column_shift()) & 0x1F
+                address = address & 0xFFFFF  # 20 bits address
+
+            logger.debug(
+                "write32: address=%s, row=%s, col=%s, value=%s",
+                hex(address) if address is not None else None,
+                row,
+                col,
+                hex(value) if value is not None else None,
+            )
+            if None in [row, col, address, value]:
+                raise ValueError(f"Could not decode write32 op '{write32}'")
+            writes.append((address, row, col, value))
+
+    return str(device), tuple(writes)
+
+
+def insts_trace_event_writes(insts):
+    """
+    Find the device and the register writes of an NPU instruction binary
 
-        # Adjust column based on colshift
-        if colshift is not None:
-            col = col + colshift
-        key = str(row) + "," + str(col)
+    Args:
+        insts: path of an instruction binary (e.g. insts.bin), or its bytes
+            or uint32 words
 
-        # core event 0
-        if address == 0x340E0:  # 213216, match ignoring case
-            if row == 0:  # shim
-                if pid_events[2].get(key) == None:
-                    pid_events[2][key] = [0] * 8
-                logger.debug("Trace event 0 configured to be %s", hex(value))
-                pid_events[2][key][0] = value & 0xFF
-                pid_events[2][key][1] = (value >> 8) & 0xFF
-                pid_events[2][key][2] = (value >> 16) & 0xFF
-                pid_events[2][key][3] = (value >> 24) & 0xFF
-            else:  # core
-                if pid_events[0].get(key) == None:
-                    pid_events[0][key] = [0] * 8
-                logger.debug("Trace event 0 configured to be %s", hex(value))
-                pid_events[0][key][0] = value & 0xFF
-                pid_events[0][key][1] = (value >> 8) & 0xFF
-                pid_events[0][key][2] = (value >> 16) & 0xFF
-                pid_events[0][key][3] = (value >> 24) & 0xFF
-        # core event 1
-        elif address == 0x340E4:  # 213220, match ignoring case
-            if row == 0:  # shim
-                if pid_events[2].get(key) == None:
-                    pid_events[2][key] = [0] * 8
-                pid_events[2][key][4] = value & 0xFF
-                pid_events[2][key][5] = (value >> 8) & 0xFF
-                pid_events[2][key][6] = (value >> 16) & 0xFF
-                pid_events[2][key][7] = (value >> 24) & 0xFF
-            else:  # core
-                if pid_events[0].get(key) == None:
-                    pid_events[0][key] = [0] * 8
-                pid_events[0][key][4] = value & 0xFF
-                pid_events[0][key][5] = (value >> 8) & 0xFF
-                pid_events[0][key][6] = (value >> 16) & 0xFF
-                pid_events[0][key][7] = (value >> 24) & 0xFF
-        # mem event 0
-        elif address == 0x140E0:  # 82144
-            if pid_events[1].get(key) == None:
-                pid_events[1][key] = [0] * 8
-            logger.debug("Trace event 0 configured to be %s", hex(value))
-            pid_events[1][key][0] = value & 0xFF
-            pid_events[1][key][1] = (value >> 8) & 0xFF
-            pid_events[1][key][2] = (value >> 16) & 0xFF
-            pid_events[1][key][3] = (value >> 24) & 0xFF
-        # mem event 1
-        elif address == 0x140E4:  # 82148
-            if pid_events[1].get(key) == None:
-                pid_events[1][key] = [0] * 8
-            pid_events[1][key][4] = value & 0xFF
-            pid_events[1][key][5] = (value >> 8) & 0xFF
-            pid_events[1][key][6] = (value >> 16) & 0xFF
-            pid_events[1][key][7] = (value >> 24) & 0xFF
-        # memtile event 0
-        elif address == 0x940E0:  # 606432
-            if pid_events[3].get(key) == None:
-                pid_events[3][key] = [0] * 8
-            logger.debug("Trace event 0 configured to be %s", hex(value))
-            pid_events[3][key][0] = value & 0xFF
-            pid_events[3][key][1] = (value >> 8) & 0xFF
-            pid_events[3][key][2] = (value >> 16) & 0xFF
-            pid_events[3][key][3] = (value >> 24) & 0xFF
-        # memtile event 1
-        elif address == 0x940E4:  # 606436
-            if pid_events[3].get(key) == None:
-                pid_events[3][key] = [0] * 8
-            pid_events[3][key][4] = value & 0xFF
-            pid_events[3][key][5] = (value >> 8) & 0xFF
-            pid_events[3][key][6] = (value >> 16) & 0xFF
-            pid_events[3][key][7] = (value >> 24) & 0xFF
-        # TODO shim event 0, 1 needs to also be defined
+    Returns:
+        tuple: (device, writes) with writes as (address, row, col, value)
+    """
+    if isinstance(insts, (str, os.PathLike)):
+        with open(insts, "rb") as f:
+            data = f.read()
+    else:
+        data = np.asarray(insts).astype("<u4", copy=False).tobytes()
+
+    def read32(offset):
+        return int.from_bytes(data[offset : offset + 4], "little")
+
+    major, minor, dev_gen = data[0], data[1], data[2]
+    if dev_gen not in INSTS_DEVICES:
+        raise ValueError(f"Unknown device generation {dev_gen} in instructions")
+    if (major, minor) not in [(0, 1), (1, 0)]:
+        raise ValueError(f"Unsupported instruction binary version {major}.{minor}")
+    v01 = (major, minor) == (0, 1)
+    num_ops = read32(8)
+
+    writes = []
+    i = 16  # header size
+    for _ in range(num_ops):
+        opcode = data[i]
+        if opcode == _TXN_WRITE:
+            if v01:
+                address, value, size = read32(i + 8), read32(i + 16), read32(i + 20)
+            else:
+                address, value, size = read32(i + 4), read32(i + 8), 12
+            row = (address >> INSTS_ROW_SHIFT) & 0x1F
+            col = (address >> INSTS_COL_SHIFT) & 0x1F
+            writes.append((address & 0xFFFFF, row, col, value))
+        elif opcode == _TXN_BLOCKWRITE:
+            size = read32(i + 12) if v01 else read32(i + 8)
+        elif opcode == _TXN_MASKWRITE:
+            size = read32(i + 24) if v01 else 16
+        elif opcode in [_TXN_CUSTOM_OP_TCT, _TXN_CUSTOM_OP_DDR_PATCH]:
+            size = read32(i + 4)
+        elif opcode == _TXN_PREEMPT:
+            size = 4
+        elif opcode == _TXN_LOADPDI:
+            size = 16
+        else:
+            raise ValueError(f"Unhandled opcode {opcode} at byte {i} of instructions")
+        i += size
 
-    logger.debug("Found labels: %s", pid_events)
+    return INSTS_DEVICES[dev_gen], tuple(writes)
+
+
+def trace_event_sidecar_path(insts_path):
+    """Path of the trace event sidecar written next to an instruction binary."""
+    return os.path.splitext(os.fspath(insts_path))[0] + ".trace_events.json"
+
+
+def write_trace_event_sidecar(mlir_module_str, path):
+    """
+    Write the device and trace event register writes of a module to a JSON
+    sidecar, so parsing its traces does not need to parse the module again.
+    Only writes to trace event registers are kept; nothing is written for a
+    module that does not configure trace.
+
+    Returns:
+        bool: whether the sidecar was written
+    """
+    device, writes = mlir_trace_event_writes(str(mlir_module_str))
+    registers = trace_event_registers(events_module_arch(get_events_for_device(device)))
+    writes = [w for w in writes if w[0] in registers]
+    if not writes:
+        return False
+    with open(path, "w") as f:
+        json.dump({"device": device, "writes": writes}, f)
+    return True
+
+
+def read_trace_event_sidecar(path):
+    with open(path, "r") as f:
+        sidecar = json.load(f)
+    return sidecar["device"], tuple(tuple(w) for w in sidecar["writes"])
+
+
+def parse_mlir_trace_events(mlir_module_str, colshift=None):
+    device, writes = mlir_trace_event_writes(mlir_module_str)
+    events_module = get_events_for_device(device)
+    pid_events = decode_trace_event_writes(
+        writes, events_module_arch(events_module), colshift
+    )
+    return pid_events, events_module
+
+
+def load_trace_event_config(trace_config, colshift=None):
+    """
+    Find which events each traced tile records
+
+    Args:
+        trace_config: MLIR module string with the trace configuration, or the
+            path of the design's instruction binary (.bin) or trace event
+            sidecar (.json). For an instruction binary, the sidecar written
+            next to it at compile time is used if present.
+        colshift: optional column shift adjustment (int or None)
+
+    Returns:
+        tuple: (pid_events, events_module)
+    """
+    path = None
+    if isinstance(trace_config, os.PathLike):
+        path = os.fspath(trace_config)
+    elif isinstance(trace_config, str) and trace_config.endswith((".bin", ".json")):
+        path = trace_config
+    if path is None:
+        return parse_mlir_trace_events(trace_config, colshift)
+
+    if path.endswith(".bin") and os.path.exists(trace_event_sidecar_path(path)):
+        path = trace_event_sidecar_path(path)
+    if path.endswith(".json"):
+        device, writes = read_trace_event_sidecar(path)
+    else:
+        device, writes = insts_trace_event_writes(path)
+    events_module = get_events_for_device(device)
+    pid_events = decode_trace_event_writes(
+        writes, events_module_arch(events_module), colshift
+    )
     return pid_events, events_module
 
 
@@ -702,61 +965,259 @@ def align_column_start_index(events, commands):
 # ------------------------------------------------------------------------------
 
 
-def parse_trace(trace_buffer, mlir_module_str, colshift=None):
+def parse_trace(
+    trace_buffer, mlir_module_str, colshift=None, workers=None, columnar=False
+):
     """
     Parse AIE trace buffer and return trace events as list in Trace Event Format
 
     Args:
-        trace_buffer: numpy array containing trace data (uint32 words)
-        mlir_module_str: string containing MLIR module with trace configuration
+        trace_buffer: numpy array containing trace data (uint32 words), e.g.
+            as returned (memory-mapped) by TraceConfig.read_trace
+        mlir_module_str: string containing MLIR module with trace configuration,
+            or the path of the design's instruction binary or trace event
+            sidecar (see load_trace_event_config)
         colshift: optional column shift adjustment (int or None for auto-align)
+        workers: optional number of processes decoding the per-tile streams in
+            parallel. If greater than 1, the events following the metadata
+            are ordered by (pid, tid, ts).
+        columnar: if True, return the events as a TraceEventStore instead of
+            a list of dicts
 
     Returns:
-        list: trace events in Trace Event Format
+        list or TraceEventStore: trace events in Trace Event Format
     """
-
-    # Convert numpy array to list of hex strings (format expected by existing functions)
-    trace_pkts = []
-    for word in trace_buffer:
-        # Convert uint32 to 8-character hex string (lowercase, no '0x' prefix)
-        hex_str = f"{int(word):08x}"
-        trace_pkts.append(hex_str)
+    trace_words = np.asarray(trace_buffer, dtype=np.uint32).reshape(-1)
 
     # Parse MLIR to extract event configuration
-    pid_events, events_module = parse_mlir_trace_events(mlir_module_str, colshift)
+    pid_events, events_module = load_trace_event_config(mlir_module_str, colshift)
 
     # Check for valid trace
-    if not check_for_valid_trace("<numpy_array>", trace_pkts):
+    if not check_for_valid_trace("<numpy_array>", trace_words):
         raise ValueError("Invalid trace data: empty or all zeros")
 
     # Trim trailing empty packets
-    trimmed_trace_pkts = trim_trace_pkts(trace_pkts)
+    trimmed_trace_words = trim_trace_words(trace_words)
 
     # De-interleave packets by type and location
-    trace_pkts_sorted = trace_pkts_de_interleave(trimmed_trace_pkts)
+    trace_words_sorted = trace_words_de_interleave(trimmed_trace_words)
 
-    # Convert to byte streams
-    byte_streams = convert_to_byte_stream(trace_pkts_sorted)
+    return convert_trace_words_to_json(
+        trace_words_sorted, pid_events, events_module, colshift, workers, columnar
+    )
 
-    # Convert byte streams to command dictionaries
-    commands = convert_to_commands(byte_streams, False)
 
+def convert_trace_words_to_json(
+    trace_words_sorted,
+    pid_events,
+    events_module,
+    colshift=None,
+    workers=None,
+    columnar=False,
+):
+    """
+    Decode de-interleaved trace words into a list of trace events
+
+    Args:
+        trace_words_sorted: per trace type dicts of tile location to trace
+            words, as returned by trace_words_de_interleave
+        pid_events: event configuration from parse_mlir_trace_events
+        events_module: events module from parse_mlir_trace_events
+        colshift: optional column shift adjustment (int or None for auto-align)
+        workers: optional number of processes decoding tiles in parallel
+        columnar: if True, collect the events in a TraceEventStore
+
+    Returns:
+        list or TraceEventStore: trace events in Trace Event Format
+    """
     # Auto-align column indices if colshift not provided
     if colshift is None:
-        pid_events = align_column_start_index(pid_events, commands)
+        pid_events = align_column_start_index(pid_events, trace_words_sorted)
 
     # Initialize trace events list
-    trace_events = []
+    trace_events = TraceEventStore() if columnar else []
 
     # Setup metadata (process names, thread names, assign PIDs)
     setup_trace_metadata(trace_events, pid_events, events_module)
 
+    if workers is not None and workers > 1:
+        tile_events = convert_tiles_in_parallel(
+            trace_words_sorted, pid_events, events_module, workers
+        )
+        if columnar:
+            return TraceEventStore.concatenate([trace_events, tile_events])
+        trace_events.extend(tile_events)
+        return trace_events
+
+    # Convert to byte streams
+    byte_streams = convert_words_to_byte_stream(trace_words_sorted)
+    logger.debug("byte streams: %s", byte_streams)
+
+    # Convert byte streams to command dictionaries
+    commands = convert_to_commands(byte_streams, False)
+    logger.debug("commands: %s", commands)
+
     # Convert commands to Chrome Trace Event Format
     convert_commands_to_json(trace_events, commands, pid_events, events_module)
 
     return trace_events
 
 
+def _convert_tile_words_to_json(job):
+    """Decode one tile's trace words into trace events (process pool task)."""
+    tt, loc, words, pid, pid_events, events_module_name = job
+    events_module = importlib.import_module(events_module_name)
+    commands = commands_to_dicts(
+        decode_trace_commands(trace_words_to_byte_stream(words), False)
+    )
+    trace_events = TraceEventStore()
+    convert_tile_commands_to_json(
+        trace_events,
+        commands,
+        tt,
+        loc,
+        pid,
+        pid_events,
+        events_module,
+        TileTraceState(),
+    )
+    trace_events.sort("tid", "ts")
+    return pid, trace_events
+
+
+def convert_tiles_in_parallel(trace_words_sorted, pid_events, events_module, workers):
+    """
+    Decode every (trace type, tile) stream in a pool of `workers` processes
+
+    Streams are independent, so each one is decoded by its own task, which
+    also sorts the stream's events by (tid, ts). Every stream has its own pid,
+    so concatenating the results by pid merges all events in (pid, tid, ts)
+    order, independent of the number of workers. Tasks return their events as
+    a TraceEventStore, which is much cheaper to send between processes than
+    a list of dicts.
+
+    Returns:
+        TraceEventStore: trace events, excluding metadata
+    """
+    jobs = []
+    for tt, words_dict in enumerate(trace_words_sorted):
+        for loc, words in words_dict.items():
+            pid = lookup_pid(pid_events, tt, loc)
+            jobs.append(
+                (tt, loc, np.asarray(words), pid, pid_events, events_module.__name__)
+            )
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_convert_tile_words_to_json, jobs))
+
+    return TraceEventStore.concatenate(
+        tile_events for _, tile_events in sorted(results, key=lambda r: r[0])
+    )
+
+
+def iter_trace_events(
+    trace_source, mlir_module_str, colshift=None, chunk_words=DEFAULT_CHUNK_WORDS
+):
+    """
+    Parse an AIE trace chunk by chunk, yielding events in Trace Event Format
+
+    Unlike parse_trace, only one chunk of trace words and the events decoded
+    from it are held in memory at a time. Each (trace type, tile) stream keeps
+    a TileTraceState across chunk boundaries so the events are the same as
+    those of parse_trace. Metadata events come first; the remaining events are
+    yielded in chunk order rather than grouped by tile.
+
+    Args:
+        trace_source: path of a trace file (binary files are memory-mapped)
+            or a numpy array of uint32 trace words
+        mlir_module_str: string containing MLIR module with trace configuration,
+            or the path of the design's instruction binary or trace event
+            sidecar (see load_trace_event_config)
+        colshift: optional column shift adjustment (int or None for auto-align)
+        chunk_words: number of trace words decoded at a time, rounded down to
+            a whole number of 8-word packets
+
+    Yields:
+        dict: trace events in Trace Event Format
+    """
+    if isinstance(trace_source, (str, os.PathLike)):
+        trace_words = read_trace_words(os.fspath(trace_source))
+    else:
+        trace_words = np.asarray(trace_source, dtype=np.uint32).reshape(-1)
+    chunk_words = max(8, chunk_words - chunk_words % 8)
+
+    pid_events, events_module = load_trace_event_config(mlir_module_str, colshift)
+
+    if not check_for_valid_trace("<trace_source>", trace_words):
+        raise ValueError("Invalid trace data: empty or all zeros")
+
+    end = trace_words_end(trace_words, chunk_words)
+
+    # Auto-alignment needs every traced tile up front, which only requires a
+    # pass over the packet headers.
+    if colshift is None:
+        tiles = [set() for _ in range(NUM_TRACE_TYPES)]
+        for start in range(0, end, chunk_words):
+            hdrs = np.asarray(trace_words[start : min(start + chunk_words, end) : 8])
+            valid, keys = trace_header_keys(hdrs)
+            for key in np.unique(keys[valid]):
+                tt, loc = trace_stream_loc(key)
+                tiles[tt].add(loc)
+        pid_events = align_column_start_index(pid_events, tiles)
+
+    trace_events = []
+    setup_trace_metadata(trace_events, pid_events, events_module)
+    yield from trace_events
+
+    states = {}
+    prev_key = -1
+    for start in range(0, end, chunk_words):
+        chunk = np.asarray(trace_words[start : min(start + chunk_words, end)])
+        streams, prev_key = split_trace_words(chunk, prev_key)
+        trace_events = []
+        for key, payload in streams:
+            tt, loc = trace_stream_loc(key)
+            pid = lookup_pid(pid_events, tt, loc)
+            state = states.setdefault(key, TileTraceState())
+            byte_stream = np.concatenate(
+                (state.pending, trace_words_to_byte_stream(payload))
+            )
+            commands, consumed = decode_trace_command_prefix(byte_stream, False)
+            state.pending = byte_stream[consumed:]
+            convert_tile_commands_to_json(
+                trace_events,
+                commands_to_dicts(commands),
+                tt,
+                loc,
+                pid,
+                pid_events,
+                events_module,
+                state,
+            )
+        yield from trace_events
+    # Bytes still pending belong to commands cut off by the end of the trace,
+    # which parse_trace drops as well.
+
+
+def write_trace_events_json(trace_events, f):
+    """
+    Write trace events to an open text file as a JSON array, one event per
+    line, without holding the whole array in memory.
+
+    Args:
+        trace_events: iterable of trace events, e.g. from iter_trace_events
+        f: file object to write to
+    """
+    sep = "["
+    for trace_event in trace_events:
+        f.write(sep)
+        f.write(json.dumps(trace_event).replace("'", '"'))
+        sep = ",\n"
+    if sep == "[":
+        f.write(sep)
+    f.write("]\n")
+
+
 # ------------------------------------------------------------------------------
 # Script execution start - Open trace file and convert to commands
 # ------------------------------------------------------------------------------
@@ -775,10 +1236,12 @@ def main():
     # set colshift based on optional argument
     colshift = int(opts.colshift) if opts.colshift else None
 
+    if opts.chunk_words:
+        main_streaming(opts, colshift)
+        return
+
     try:
-        with open(opts.input, "r") as f:
-            # Create array of trace packets
-            trace_pkts = f.read().split("\n")
+        trace_words = read_trace_words(opts.input)
     except Exception:
         logger.error(
             "%s could not be opened. Check for valid trace source file.", opts.input
@@ -786,57 +1249,91 @@ def main():
         sys.exit(1)
 
     try:
-        with open(opts.mlir, "r") as mf:
-            mlir_module_str = mf.read()
-        pid_events, events_module = parse_mlir_trace_events(mlir_module_str, colshift)
+        mlir_module_str = read_trace_event_config(opts.mlir)
+        pid_events, events_module = load_trace_event_config(mlir_module_str, colshift)
     except Exception as e:
         logger.error(
             "%s could not be opened. Check for valid MLIR file. %s", opts.mlir, e
         )
         sys.exit(1)
 
-    try:
-        of = open(opts.output, "w")
-    except Exception:
-        logger.error(
-            "%s could not be opened. Check for valid output JSON file.", opts.output
-        )
-        sys.exit(1)
+    of = open_output(opts.output)
 
     logger.debug("pkt type 0: core tile")
     logger.debug("pkt type 1: core mem tile")
     logger.debug("pkt type 2: shim tile")
     logger.debug("pkt type 3: mem tile")
-    logger.debug("trace_pkts: %s", trace_pkts)
+    logger.debug("trace_words: %s", trace_words)
     logger.debug("pid events: %s", pid_events)
 
-    if not check_for_valid_trace(opts.input, trace_pkts):
+    if not check_for_valid_trace(opts.input, trace_words):
         sys.exit(1)
 
-    trimmed_trace_pkts = trim_trace_pkts(trace_pkts)
-    logger.debug("trimmed %s lines", len(trace_pkts) - len(trimmed_trace_pkts))
+    trimmed_trace_words = trim_trace_words(trace_words)
+    logger.debug("trimmed %s lines", len(trace_words) - len(trimmed_trace_words))
 
-    trace_pkts_sorted = trace_pkts_de_interleave(trimmed_trace_pkts)
-    logger.debug("trace_pkts_sorted: %s", trace_pkts_sorted)
+    trace_words_sorted = trace_words_de_interleave(trimmed_trace_words)
+    logger.debug("trace_words_sorted: %s", trace_words_sorted)
 
-    byte_streams = convert_to_byte_stream(trace_pkts_sorted)
-    logger.debug("byte streams: %s", byte_streams)
+    trace_events = convert_trace_words_to_json(
+        trace_words_sorted, pid_events, events_module, colshift, opts.workers
+    )
 
-    commands_0 = convert_to_commands(byte_streams, False)
-    logger.debug("commands_0: %s", commands_0)
+    write_trace_events_json(trace_events, of)
 
-    if colshift is None:
-        pid_events = align_column_start_index(pid_events, commands_0)
+    if of is not sys.stdout:
+        of.close()
 
-    trace_events = list()
 
-    setup_trace_metadata(trace_events, pid_events, events_module)
+def read_trace_event_config(path):
+    """MLIR source read from path, or the path itself for an instruction
+    binary or trace event sidecar."""
+    if path.endswith((".bin", ".json")):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        return path
+    with open(path, "r") as mf:
+        return mf.read()
+
 
-    convert_commands_to_json(trace_events, commands_0, pid_events, events_module)
+def open_output(output):
+    if output == "-":
+        return sys.stdout
+    try:
+        return open(output, "w")
+    except Exception:
+        logger.error(
+            "%s could not be opened. Check for valid output JSON file.", output
+        )
+        sys.exit(1)
 
-    print(json.dumps(trace_events).replace("'", '"').replace(", {", ",\n{"), file=of)
 
-    of.close()
+def main_streaming(opts, colshift):
+    """Parse the trace chunk by chunk with iter_trace_events."""
+    try:
+        mlir_module_str = read_trace_event_config(opts.mlir)
+    except Exception as e:
+        logger.error(
+            "%s could not be opened. Check for valid MLIR file. %s", opts.mlir, e
+        )
+        sys.exit(1)
+
+    of = open_output(opts.output)
+    try:
+        trace_events = iter_trace_events(
+            opts.input, mlir_module_str, colshift, opts.chunk_words
+        )
+        write_trace_events_json(trace_events, of)
+    except OSError:
+        logger.error(
+            "%s could not be opened. Check for valid trace source file.", opts.input
+        )
+        sys.exit(1)
+    except ValueError:
+        sys.exit(1)
+    finally:
+        if of is not sys.stdout:
+            of.close()
 
 
 if __name__ == "__main__":
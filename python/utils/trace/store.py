@@ -0,0 +1,383 @@
+# Copyright (C) 2026 Advanced Micro Devices, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""Columnar storage for parsed trace events.
+
+A TraceEventStore keeps the begin/end events of a parsed trace as NumPy
+columns (pid, tid, name, ph, ts) with event names interned in a string table,
+so a trace with millions of events takes a few bytes per event instead of a
+Python dict each. Metadata ("M") events are few and are kept as dicts.
+"""
+
+import json
+
+import numpy as np
+
+# Perfetto shows timestamps in ns, the Chrome JSON ones are taken as us
+PERFETTO_TS_SCALE = 1000
+
+_COLUMNS = ("pid", "tid", "name", "ph", "ts")
+_DTYPES = {
+    "pid": np.int32,
+    "tid": np.int32,
+    "name": np.int32,
+    "ph": "S1",
+    "ts": np.int64,
+}
+
+
+class TraceEventStore:
+    """Trace events in Trace Event Format, stored column by column.
+
+    The store can be filled like the list of events it replaces, one Trace
+    Event Format dict at a time with `append`, or without creating any dicts
+    with `add`. Iterating over the store yields the metadata events followed
+    by the other events as dicts, so it can be passed wherever a list of
+    trace events is expected. The `args` of non-metadata events are not kept.
+
+    Columns:
+        pid, tid: int32 process and thread ids
+        name: int32 index into `names`
+        ph: phase as a 1-byte string, e.g. b"B" or b"E"
+        ts: int64 timestamp
+    """
+
+    def __init__(self):
+        self.names = []
+        self.metadata = []
+        self._name_ids = {}
+        self._columns = {c: np.zeros(0, dtype=_DTYPES[c]) for c in _COLUMNS}
+        self._pending = {c: [] for c in _COLUMNS}
+
+    # --------------------------------------------------------------------------
+    # Building
+    # --------------------------------------------------------------------------
+
+    def name_id(self, name, create=False):
+        """Index of `name` in the string table, or -1 if it is not there."""
+        idx = self._name_ids.get(name)
+        if idx is None:
+            if not create:
+                return -1
+            idx = len(self.names)
+            self.names.append(name)
+            self._name_ids[name] = idx
+        return idx
+
+    def add(self, name, ts, ph, pid, tid):
+        """Add one event without going through a dict."""
+        pending = self._pending
+        pending["pid"].append(pid)
+        pending["tid"].append(tid)
+        pending["name"].append(self.name_id(name, create=True))
+        pending["ph"].append(ph)
+        pending["ts"].append(ts)
+
+    def append(self, event):
+        """Add one event given as a Trace Event Format dict."""
+        if event["ph"] == "M":
+            self.metadata.append(event)
+        else:
+            self.add(
+                event["name"], event["ts"], event["ph"], event["pid"], event["tid"]
+            )
+
+    def extend(self, events):
+        for event in events:
+            self.append(event)
+
+    def _flush(self):
+        if not self._pending["ts"]:
+            return
+        for c in _COLUMNS:
+            pending = np.asarray(self._pending[c], dtype=_DTYPES[c])
+            self._columns[c] = np.concatenate((self._columns[c], pending))
+            self._pending[c] = []
+
+    def column(self, c):
+        self._flush()
+        return self._columns[c]
+
+    pid = property(lambda self: self.column("pid"))
+    tid = property(lambda self: self.column("tid"))
+    name = property(lambda self: self.column("name"))
+    ph = property(lambda self: self.column("ph"))
+    ts = property(lambda self: self.column("ts"))
+
+    @classmethod
+    def from_columns(cls, names, metadata=(), **columns):
+        """Create a store from existing columns and their string table."""
+        store = cls()
+        store.names = list(names)
+        store._name_ids = {n: i for i, n in enumerate(store.names)}
+        store.metadata = list(metadata)
+        for c in _COLUMNS:
+            store._columns[c] = np.asarray(columns[c], dtype=_DTYPES[c])
+        return store
+
+    @classmethod
+    def from_events(cls, events):
+        """Create a store from an iterable of Trace Event Format dicts."""
+        if isinstance(events, cls):
+            return events
+        store = cls()
+        store.extend(events)
+        return store
+
+    @classmethod
+    def concatenate(cls, stores):
+        """Concatenate stores, merging their string tables."""
+        merged = cls()
+        for store in stores:
+            store._flush()
+            remap = np.array(
+                [merged.name_id(n, create=True) for n in store.names] + [-1],
+                dtype=np.int32,
+            )
+            merged.metadata.extend(store.metadata)
+            for c in _COLUMNS:
+                col = store._columns[c]
+                if c == "name":
+                    col = remap[col]
+                merged._pending[c].append(col)
+        for c in _COLUMNS:
+            parts = [merged._columns[c]] + merged._pending[c]
+            merged._columns[c] = np.concatenate(parts).astype(_DTYPES[c])
+            merged._pending[c] = []
+        return merged
+
+    # --------------------------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.metadata) + len(self.ts)
+
+    def __iter__(self):
+        yield from self.metadata
+        names = self.names
+        for name, ts, ph, pid, tid in zip(
+            self.name.tolist(),
+            self.ts.tolist(),
+            self.ph.tolist(),
+            self.pid.tolist(),
+            self.tid.tolist(),
+        ):
+            yield {
+                "name": names[name],
+                "ts": ts,
+                "ph": ph.decode(),
+                "pid": pid,
+                "tid": tid,
+                "args": {},
+            }
+
+    def mask(self, name=None, ph=None, pid=None, tid=None):
+        """Boolean mask of the events matching all given fields."""
+        mask = np.ones(len(self.ts), dtype=bool)
+        if name is not None:
+            mask &= self.name == self.name_id(name)
+        if ph is not None:
+            mask &= self.ph == ph.encode()
+        if pid is not None:
+            mask &= self.pid == pid
+        if tid is not None:
+            mask &= self.tid == tid
+        return mask
+
+    def select(self, mask):
+        """New store holding the events selected by a mask or an index array."""
+        columns = {c: self.column(c)[mask] for c in _COLUMNS}
+        return TraceEventStore.from_columns(self.names, self.metadata, **columns)
+
+    def sort(self, *keys):
+        """Stable in place sort by the given columns, most significant first."""
+        order = np.lexsort([self.column(c) for c in reversed(keys)])
+        for c in _COLUMNS:
+            self._columns[c] = self._columns[c][order]
+
+    def process_names(self):
+        """dict of pid to process name from the metadata events."""
+        return {
+            e["pid"]: e["args"]["name"]
+            for e in self.metadata
+            if e["name"] == "process_name"
+        }
+
+    def thread_names(self):
+        """dict of (pid, tid) to thread name from the metadata events."""
+        return {
+            (e["pid"], e["tid"]): e["args"]["name"]
+            for e in self.metadata
+            if e["name"] == "thread_name"
+        }
+
+    # --------------------------------------------------------------------------
+    # Import / export
+    # --------------------------------------------------------------------------
+
+    @classmethod
+    def from_json(cls, path):
+        """Load a Chrome JSON trace, e.g. as written by parse.py."""
+        with open(path, "r") as f:
+            return cls.from_events(json.load(f))
+
+    def to_json(self, path):
+        """Write the events as a Chrome JSON trace, one event per line."""
+        with open(path, "w") as f:
+            sep = "["
+            for event in self:
+                f.write(sep)
+                f.write(json.dumps(event))
+                sep = ",\n"
+            if sep == "[":
+                f.write(sep)
+            f.write("]\n")
+
+    @classmethod
+    def from_npz(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            columns = {c: data[c] for c in _COLUMNS}
+            names = data["names"].tolist()
+            metadata = json.loads(str(data["metadata"]))
+        return cls.from_columns(names, metadata, **columns)
+
+    def to_npz(self, path):
+        """Write the columns, string table and metadata to a .npz file."""
+        np.savez_compressed(
+            path,
+            names=np.array(self.names, dtype=str),
+            metadata=np.array(json.dumps(self.metadata)),
+            **{c: self.column(c) for c in _COLUMNS},
+        )
+
+    def to_parquet(self, path):
+        """Write the events as a Parquet table with a dictionary encoded name
+        column. Metadata events are stored in the schema metadata.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow is not installed. Please install it with 'pip install pyarrow'"
+            )
+
+        names = pa.DictionaryArray.from_arrays(
+            pa.array(self.name), pa.array(self.names, type=pa.string())
+        )
+        table = pa.table(
+            {
+                "pid": self.pid,
+                "tid": self.tid,
+                "name": names,
+                "ph": pa.array(self.ph.astype("U1")),
+                "ts": self.ts,
+            }
+        )
+        table = table.replace_schema_metadata(
+            {"trace_metadata": json.dumps(self.metadata)}
+        )
+        pq.write_table(table, path)
+
+    def to_perfetto(self, path):
+        """Write the events as a Perfetto protobuf trace.
+
+        Every pid becomes a process track and every (pid, tid) a child track
+        named after the thread. Timestamps are scaled by PERFETTO_TS_SCALE so
+        they show up the same as in the Chrome JSON trace.
+        """
+        process_names = self.process_names()
+        thread_names = self.thread_names()
+        pids = np.unique(self.pid).tolist()
+        threads = np.unique(
+            self.pid.astype(np.int64) << 32 | self.tid.astype(np.int64)
+        ).tolist()
+
+        with open(path, "wb") as f:
+            for pid in sorted(set(pids) | set(process_names)):
+                process = _pb_varint_field(1, pid)
+                if pid in process_names:
+                    process += _pb_bytes_field(6, process_names[pid].encode())
+                track = _pb_varint_field(1, _process_uuid(pid)) + _pb_bytes_field(
+                    3, process
+                )
+                f.write(_pb_packet(_pb_bytes_field(60, track)))
+            for key in threads:
+                pid, tid = key >> 32, key & 0xFFFFFFFF
+                name = thread_names.get((pid, tid), str(tid))
+                track = (
+                    _pb_varint_field(1, _thread_uuid(pid, tid))
+                    + _pb_bytes_field(2, name.encode())
+                    + _pb_varint_field(5, _process_uuid(pid))
+                )
+                f.write(_pb_packet(_pb_bytes_field(60, track)))
+
+            # The track event part only depends on (name, ph, pid, tid)
+            track_events = {}
+            for name, ts, ph, pid, tid in zip(
+                self.name.tolist(),
+                (self.ts * PERFETTO_TS_SCALE).tolist(),
+                self.ph.tolist(),
+                self.pid.tolist(),
+                self.tid.tolist(),
+            ):
+                key = (name, ph, pid, tid)
+                track_event = track_events.get(key)
+                if track_event is None:
+                    track_event = _pb_bytes_field(
+                        11, _perfetto_track_event(self.names[name], ph, pid, tid)
+                    )
+                    track_events[key] = track_event
+                f.write(_pb_packet(_pb_varint_field(8, ts) + track_event))
+
+
+# ------------------------------------------------------------------------------
+# Minimal protobuf encoding of the Perfetto trace packets used above
+# ------------------------------------------------------------------------------
+
+_TRUSTED_SEQUENCE_ID = b"\x50\x01"  # TracePacket.trusted_packet_sequence_id = 1
+_SLICE_TYPES = {b"B": 1, b"E": 2}  # TrackEvent.Type SLICE_BEGIN, SLICE_END
+_INSTANT = 3  # TrackEvent.Type INSTANT
+
+
+def _process_uuid(pid):
+    return pid + 1
+
+
+def _thread_uuid(pid, tid):
+    return ((pid + 1) << 32) | (tid + 1)
+
+
+def _pb_varint(value):
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _pb_varint_field(number, value):
+    return _pb_varint(number << 3) + _pb_varint(value)
+
+
+def _pb_bytes_field(number, data):
+    return _pb_varint(number << 3 | 2) + _pb_varint(len(data)) + data
+
+
+def _pb_packet(payload):
+    # Trace.packet = 1
+    return _pb_bytes_field(1, payload + _TRUSTED_SEQUENCE_ID)
+
+
+def _perfetto_track_event(name, ph, pid, tid):
+    event_type = _SLICE_TYPES.get(ph, _INSTANT)
+    track_event = _pb_varint_field(9, event_type)
+    track_event += _pb_varint_field(11, _thread_uuid(pid, tid))
+    if event_type != _SLICE_TYPES[b"E"]:
+        track_event += _pb_bytes_field(23, name.encode())
+    return track_event
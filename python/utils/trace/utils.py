@@ -9,6 +9,7 @@ import re
 import os
 import sys
 from .events import NUM_TRACE_TYPES
+from .store import TraceEventStore
 
 logger = logging.getLogger(__name__)
 
@@ -102,61 +103,78 @@ def extract_buffers(test):
     return input_buffers, output_buffers, rtps
 
 
+def load_trace_events(trace):
+    """Return the events of a parsed trace as a TraceEventStore.
+
+    `trace` is a TraceEventStore, a list of events in Trace Event Format or
+    the path of a trace JSON file.
+    """
+    if isinstance(trace, (str, os.PathLike)):
+        return TraceEventStore.from_json(trace)
+    return TraceEventStore.from_events(trace)
+
+
 def get_cycles(trace_path):
     """This helper function should only be used to extract cycle counts
     from NPUEval trace files where the expectation is to have exactly 1 of
     each event0 and event1.
     """
-    with open(trace_path, "r") as f:
-        data = json.load(f)
-
-    event0 = []
-    event1 = []
     try:
-        for x in data:
-            if (x["name"] == "INSTR_EVENT_0") and (x["ph"] == "B"):
-                event0.append(x["ts"])
-                tmp = x["ts"]
-
-            if x["name"] == "INSTR_EVENT_1" and x["ph"] == "B":
-                event1.append(x["ts"])
-
-        return event1[0] - event0[0]
+        events = load_trace_events(trace_path)
+        event0 = events.ts[events.mask("INSTR_EVENT_0", "B")]
+        event1 = events.ts[events.mask("INSTR_EVENT_1", "B")]
+        return int(event1[0] - event0[0])
     except:
         return np.inf
 
 
+def match_kernel_markers(ts, is_end):
+    """Pair kernel start and end markers given in trace order.
+
+    Only the first start after an end (and the first end after a start)
+    counts, so extra starts and ends are ignored.
+
+    Returns:
+        (starts, ends): timestamps of the matched pairs
+    """
+    first = np.ones(len(is_end), dtype=bool)
+    first[1:] = is_end[1:] != is_end[:-1]
+    ts, is_end = ts[first], is_end[first]
+    if len(is_end) and is_end[0]:
+        ts, is_end = ts[1:], is_end[1:]
+    n = len(ts) // 2
+    return ts[0 : 2 * n : 2], ts[1 : 2 * n : 2]
+
+
+def kernel_cycles(events, pid):
+    """Cycles between each INSTR_EVENT_0 and the following INSTR_EVENT_1 of
+    one pid. Extra event0 and event1's are ignored.
+    """
+    begin = events.mask(ph="B", pid=pid)
+    is_event0 = begin & (events.name == events.name_id("INSTR_EVENT_0"))
+    is_event1 = begin & (events.name == events.name_id("INSTR_EVENT_1"))
+    marker = is_event0 | is_event1
+    starts, ends = match_kernel_markers(events.ts[marker], is_event1[marker])
+    return ends - starts
+
+
 def get_cycles_summary(trace_path):
     """This helper function is  used to extract cycle counts from a trace json
     file and returns an array of cycles between pairs of event0 and event1.
     This always assumes each event0 is followed by an event1 and ignores
     extra event0 and event1's.
     """
-    with open(trace_path, "r") as f:
-        data = json.load(f)
-
     try:
+        events = load_trace_events(trace_path)
+        names = [
+            e["args"]["name"] for e in events.metadata if e["name"] == "process_name"
+        ]
+        markers = events.mask("INSTR_EVENT_0", "B") | events.mask("INSTR_EVENT_1", "B")
+        if markers.any() and events.pid[markers].max() >= len(names):
+            raise IndexError("INSTR_EVENT of a pid without process_name")
         deltas = []
-        in_kernel = []
-        event0 = []
-        for x in data:
-            if x["name"] == "process_name":
-                deltas.append([x["args"]["name"]])
-                in_kernel.append(False)
-                event0.append(0)
-
-        for x in data:
-            idx = int(x["pid"])
-            if (x["name"] == "INSTR_EVENT_0") and (x["ph"] == "B"):
-                if in_kernel[idx] == False:
-                    event0[idx] = x["ts"]
-                    in_kernel[idx] = True
-
-            if x["name"] == "INSTR_EVENT_1" and x["ph"] == "B":
-                if in_kernel[idx] == True:
-                    deltas[idx].append(x["ts"] - event0[idx])
-                    in_kernel[idx] = False
-
+        for pid, name in enumerate(names):
+            deltas.append([name] + kernel_cycles(events, pid).tolist())
         return deltas
     except Exception:
         logger.exception("Exception found")
@@ -168,40 +186,38 @@ def get_vector_time(trace):
     from an NPUEval AIE trace (this must have exactly 1 event0 and 1 event1
     sandwiching the kernel call).
     """
-    with open(trace, "r") as f:
-        data = json.load(f)
-
-    start, end = None, None
+    events = load_trace_events(trace)
 
     # find start and end
-    for x in data:
-        if (x["name"] == "INSTR_EVENT_0") and (x["ph"] == "B"):
-            start = x["ts"]
-        if x["name"] == "INSTR_EVENT_1" and x["ph"] == "B":
-            end = x["ts"]
+    event0 = events.ts[events.mask("INSTR_EVENT_0", "B")]
+    event1 = events.ts[events.mask("INSTR_EVENT_1", "B")]
+    start = int(event0[-1]) if len(event0) else None
+    end = int(event1[-1]) if len(event1) else None
 
     if not start or not end:
         return 0
 
-    total_duration = 0
-    stack = []
-
-    for event in data:
-        if event["name"] == "INSTR_VECTOR":
-            if event["ts"] < start:
-                continue
-
-            if event["ts"] > end:
-                continue
-
-            if event["ph"] == "B":
-                stack.append(event)
-            elif event["ph"] == "E" and stack:
-                # Get matching begin event
-                begin_event = stack.pop()
-                # Calculate duration for this pair
-                duration = event["ts"] - begin_event["ts"]
-                total_duration += duration
+    vector = events.mask("INSTR_VECTOR")
+    ts = events.ts[vector]
+    ph = events.ph[vector]
+    keep = (ts >= start) & (ts <= end) & ((ph == b"B") | (ph == b"E"))
+    ts = ts[keep]
+    is_begin = ph[keep] == b"B"
+    is_end = ~is_begin
+
+    # Begin events are pushed on a stack and end events pop the latest one, if
+    # any. The total only depends on which events are matched, not on how they
+    # pair up: an end event is matched if the stack is not empty, a begin event
+    # if the stack later drops below the depth it was pushed to.
+    level = np.cumsum(np.where(is_begin, 1, -1))
+    depth = level - np.minimum(np.minimum.accumulate(level), 0)
+    depth_before = np.concatenate(([0], depth[:-1]))
+    later_min = np.concatenate(
+        (np.minimum.accumulate(depth[::-1])[::-1][1:], [np.iinfo(depth.dtype).max])
+    )
+    matched_end = is_end & (depth_before > 0)
+    matched_begin = is_begin & (later_min < depth)
+    total_duration = int(ts[matched_end].sum() - ts[matched_begin].sum())
 
     return total_duration / (end - start)
 
@@ -281,108 +297,462 @@ def convert_to_byte_stream(toks_list):
     return byte_stream_list
 
 
-def convert_to_commands(byte_stream_list, zero=True):
+def trace_stream_loc(key):
+    """Return (trace type, "row,col" location) for a trace stream key."""
+    key = int(key)
+    return key >> 12, str((key >> 7) & 0x1F) + "," + str(key & 0x7F)
+
+
+def trace_header_keys(hdrs):
+    """Decode an array of packet header words.
+
+    Returns:
+        (valid, key): a mask of the valid headers and, per header, a stream
+        key packing (packet type, row, col) as type << 12 | row << 7 | col.
+    """
+    hdrs = np.asarray(hdrs, dtype=np.uint32)
+    parity_bits = np.zeros(len(hdrs), dtype=np.uint32)
+    for i in range(32):
+        parity_bits ^= (hdrs >> i) & 1
+    valid = (
+        (parity_bits == 1)
+        & (((hdrs >> 5) & 0x7F) == 0)
+        & (((hdrs >> 19) & 0x1) == 0)
+        & (((hdrs >> 28) & 0x7) == 0)
+    )
+    col = (hdrs >> 21) & 0x7F
+    row = (hdrs >> 16) & 0x1F
+    pkt_type = (hdrs >> 12) & 0x3
+    key = ((pkt_type << 12) | (row << 7) | col).astype(np.int64)
+    return valid, key
+
+
+def split_trace_words(words, prev_key=-1):
+    """Split packet-aligned trace words into per-stream payloads.
+
+    Every 8th word is a packet header. Payload words are attributed to the
+    stream named by the most recent valid header, which is found for all
+    packets at once by forward-filling the index of valid headers.
+
+    Args:
+        words: np.ndarray of uint32 trace words, starting at a packet header.
+        prev_key: key of the stream that owns payload before the first valid
+            header (from a previous chunk), or -1 to drop such payload.
+
+    Returns:
+        (streams, last_key): a list of (key, payload words) in the order the
+        streams first appear, and the key owning payload at the end of
+        `words`, to be passed as prev_key for the next chunk.
+    """
+    words = np.asarray(words, dtype=np.uint32)
+    valid, key = trace_header_keys(words[::8])
+
+    # Owning stream of each packet's payload.
+    owner = np.maximum.accumulate(np.where(valid, np.arange(len(key)), -1))
+    pkt_key = np.where(owner >= 0, key[np.maximum(owner, 0)], prev_key)
+
+    payload_idx = np.arange(len(words))
+    payload_idx = payload_idx[(payload_idx % 8) != 0]
+    payload_key = pkt_key[payload_idx // 8]
+    payload_idx = payload_idx[payload_key >= 0]
+    payload_key = payload_key[payload_key >= 0]
+
+    # Streams appear in the order of their first valid header, like the
+    # dict insertion order of trace_pkts_de_interleave.
+    seen = key[valid]
+    if len(payload_key) and payload_key[0] == prev_key:
+        seen = np.concatenate(([prev_key], seen))
+    uniq_keys, first = np.unique(seen, return_index=True)
+
+    order = np.argsort(payload_key, kind="stable")
+    sorted_keys = payload_key[order]
+    streams = []
+    for k in uniq_keys[np.argsort(first, kind="stable")]:
+        lo, hi = np.searchsorted(sorted_keys, [k, k + 1])
+        streams.append((int(k), words[payload_idx[order[lo:hi]]]))
+
+    last_key = int(pkt_key[-1]) if len(pkt_key) else prev_key
+    return streams, last_key
+
+
+def trace_words_de_interleave(words):
+    """Array version of trace_pkts_de_interleave operating on uint32 words.
+
+    Args:
+        words: np.ndarray of uint32 trace words.
+
+    Returns:
+        list indexed by trace type of dicts mapping a "row,col" location to
+        that tile's np.uint32 payload words, in stream order.
+    """
+    trace_pkts_sorted = [dict() for _ in range(NUM_TRACE_TYPES)]
+    streams, _ = split_trace_words(words)
+    for key, payload in streams:
+        tt, loc = trace_stream_loc(key)
+        trace_pkts_sorted[tt][loc] = payload
+    return trace_pkts_sorted
+
+
+def trace_words_to_byte_stream(words):
+    """Drop padding words and expand uint32 words into big-endian bytes."""
+    words = np.asarray(words, dtype=np.uint32)
+    words = words[words != 0xA5A5A5A5]
+    return words.astype(">u4").view(np.uint8)
+
+
+def convert_words_to_byte_stream(words_list):
+    """Array version of convert_to_byte_stream.
+
+    Args:
+        words_list: output of trace_words_de_interleave.
+
+    Returns:
+        list indexed by trace type of dicts mapping location to np.uint8 bytes.
+    """
+    return [
+        {loc: trace_words_to_byte_stream(w) for loc, w in l.items()} for l in words_list
+    ]
+
+
+def trace_words_end(words, chunk_words=None):
+    """Return the length of the trace in `words` as trimmed by trim_trace_words.
+
+    The trace ends after the first 0xFEFEFEFE that is followed by two zero
+    words. If chunk_words is given, `words` (e.g. a memory-mapped file) is
+    scanned chunk_words at a time.
+    """
+    n = len(words)
+    step = chunk_words or max(n, 1)
+    for start in range(0, n - 2, step):
+        seg = np.asarray(words[start : min(start + step + 2, n)])
+        end = (seg[:-2] == 0xFEFEFEFE) & (seg[1:-1] == 0) & (seg[2:] == 0)
+        hits = np.flatnonzero(end)
+        if len(hits):
+            return start + int(hits[0]) + 1
+    return n
+
+
+def trim_trace_words(words):
+    """Array version of trim_trace_pkts.
+
+    Returns the words up to and including the first 0xFEFEFEFE that is
+    followed by two zero words.
+    """
+    words = np.asarray(words, dtype=np.uint32)
+    return words[: trace_words_end(words)]
+
+
+# Trace command types, in the order they are classified by opcode. The names
+# match the "type" field of the dict commands returned by convert_to_commands.
+TRACE_COMMAND_NAMES = (
+    "Start",
+    "Single0",
+    "Single1",
+    "Single2",
+    "Multiple0",
+    "Multiple1",
+    "Multiple2",
+    "Repeat0",
+    "Repeat1",
+    "Event_Sync",
+)
+(
+    CMD_START,
+    CMD_SINGLE0,
+    CMD_SINGLE1,
+    CMD_SINGLE2,
+    CMD_MULTIPLE0,
+    CMD_MULTIPLE1,
+    CMD_MULTIPLE2,
+    CMD_REPEAT0,
+    CMD_REPEAT1,
+    CMD_EVENT_SYNC,
+) = range(len(TRACE_COMMAND_NAMES))
+
+# Decoded trace commands. 'events' is a bitmask of the events asserted by a
+# Single/Multiple command, 'timer' is only set by Start commands.
+TRACE_COMMAND_DTYPE = np.dtype(
+    [
+        ("type", np.uint8),
+        ("events", np.uint8),
+        ("cycles", np.uint32),
+        ("repeats", np.uint16),
+        ("timer", np.uint64),
+    ]
+)
+
+
+def _build_opcode_tables():
+    """Classify all 256 possible leading bytes into (command type, length).
+
+    Bytes that do not produce a command (padding, unused encodings) get a
+    type of -1 and are skipped over by their length.
+    """
+    cmd_type = np.full(256, -1, dtype=np.int8)
+    cmd_len = np.ones(256, dtype=np.uint8)
+    for b in range(256):
+        if (b & 0b11111011) == 0b11110000:
+            cmd_type[b], cmd_len[b] = CMD_START, 8
+        elif (b & 0b11111100) == 0b11011100:
+            cmd_len[b] = 4
+        elif (b & 0b10000000) == 0b00000000:
+            cmd_type[b], cmd_len[b] = CMD_SINGLE0, 1
+        elif (b & 0b11100000) == 0b10000000:
+            cmd_type[b], cmd_len[b] = CMD_SINGLE1, 2
+        elif (b & 0b11100000) == 0b10100000:
+            cmd_type[b], cmd_len[b] = CMD_SINGLE2, 3
+        elif (b & 0b11110000) == 0b11000000:
+            cmd_type[b], cmd_len[b] = CMD_MULTIPLE0, 2
+        elif (b & 0b11111100) == 0b11010000:
+            cmd_type[b], cmd_len[b] = CMD_MULTIPLE1, 3
+        elif (b & 0b11111100) == 0b11010100:
+            cmd_type[b], cmd_len[b] = CMD_MULTIPLE2, 4
+        elif (b & 0b11110000) == 0b11100000:
+            cmd_type[b], cmd_len[b] = CMD_REPEAT0, 1
+        elif (b & 0b11111100) == 0b11011000:
+            cmd_type[b], cmd_len[b] = CMD_REPEAT1, 2
+        elif b == 0b11111111:
+            cmd_type[b], cmd_len[b] = CMD_EVENT_SYNC, 1
+        # 0b11111110 (and unused encodings) are skipped one byte at a time
+    return cmd_type, cmd_len
+
+
+_OPCODE_TYPE, _OPCODE_LEN = _build_opcode_tables()
+
+
+def _command_starts(opcode_len, entry=0, block_size=1 << 14):
+    """Return the byte offsets at which commands start.
+
+    Each command's length is a function of its first byte only, so every
+    offset i has a successor i + len[i]. The command starts are the chain of
+    successors beginning at `entry`. Within a block the chain is found by
+    pointer doubling: successor tables for 1, 2, 4, ... steps are built with
+    array gathers, then applied from the largest to the smallest to expand
+    {entry} into every chain position.
+
+    Returns the start offsets and the offset where the chain leaves the
+    stream (>= len(opcode_len)).
+    """
+    n = len(opcode_len)
+    starts = []
+    pos = entry
+    while pos < n:
+        end = min(pos + block_size, n)
+        m = end - pos
+        nxt = np.empty(m + 1, dtype=np.int32)
+        np.add(np.arange(m, dtype=np.int32), opcode_len[pos:end], out=nxt[:m])
+        np.minimum(nxt[:m], m, out=nxt[:m])
+        nxt[m] = m  # absorbing sentinel for "left the block"
+        tables = [nxt]
+        for _ in range(max(m.bit_length() - 1, 0)):
+            tables.append(tables[-1][tables[-1]])
+        on_chain = np.zeros(m + 1, dtype=bool)
+        on_chain[0] = True
+        chain = np.zeros(1, dtype=np.int32)
+        for table in reversed(tables):
+            reached = table[chain]
+            on_chain[reached] = True
+            chain = np.concatenate((chain, reached[reached < m]))
+        chain = np.flatnonzero(on_chain[:m])
+        starts.append(chain + pos)
+        last = pos + int(chain[-1])
+        pos = last + int(opcode_len[last])
+    if not starts:
+        return np.zeros(0, dtype=np.intp), pos
+    return np.concatenate(starts), pos
+
+
+def decode_trace_commands(byte_stream, zero=True):
+    """Decode a single tile's trace byte stream into a command array.
+
+    Args:
+        byte_stream: sequence or array of bytes (values 0-255).
+        zero: if True, Start commands report a timer value of 0 instead of
+            the 56-bit timer carried in the packet.
+
+    Returns:
+        np.ndarray with dtype TRACE_COMMAND_DTYPE, one entry per command.
+        A command truncated by the end of the stream is dropped.
+    """
+    stream = np.asarray(byte_stream, dtype=np.uint8)
+    starts, _ = _command_starts(_OPCODE_LEN[stream])
+    return _decode_commands_at(stream, starts, zero)
+
+
+def decode_trace_command_prefix(byte_stream, zero=True):
+    """Decode the complete commands at the start of a byte stream.
+
+    Used to decode a stream that continues in a later chunk: a command cut
+    off by the end of `byte_stream` is not decoded.
+
+    Returns:
+        (commands, consumed): the decoded TRACE_COMMAND_DTYPE array and the
+        number of bytes they span. Decoding resumes at byte_stream[consumed:]
+        once more bytes are available.
+    """
+    stream = np.asarray(byte_stream, dtype=np.uint8)
+    starts, exit_pos = _command_starts(_OPCODE_LEN[stream])
+    consumed = len(stream)
+    if exit_pos > len(stream):
+        consumed = int(starts[-1])
+        starts = starts[:-1]
+    return _decode_commands_at(stream[:consumed], starts, zero), consumed
+
+
+def _decode_commands_at(stream, starts, zero):
+    """Extract the fields of the commands starting at `starts` in `stream`."""
+    n = len(stream)
+    opcode_len = _OPCODE_LEN[stream[starts]]
+    ctype = _OPCODE_TYPE[stream[starts]]
+    needed = opcode_len.astype(np.intp)
+    if zero:
+        needed[ctype == CMD_START] = 1
+    keep = (ctype >= 0) & (starts + needed <= n)
+    starts = starts[keep]
+    ctype = ctype[keep]
+
+    padded = np.concatenate((stream, np.zeros(8, dtype=np.uint8)))
+    commands = np.zeros(len(starts), dtype=TRACE_COMMAND_DTYPE)
+    commands["type"] = ctype
+
+    order = np.argsort(ctype, kind="stable")
+    bounds = np.searchsorted(ctype[order], np.arange(len(TRACE_COMMAND_NAMES) + 1))
+    for kind in range(len(TRACE_COMMAND_NAMES)):
+        idx = order[bounds[kind] : bounds[kind + 1]]
+        if len(idx) == 0:
+            continue
+        b = [padded[starts[idx] + i].astype(np.uint32) for i in range(4)]
+        out = commands[idx]
+        if kind == CMD_SINGLE0:
+            out["events"] = 1 << ((b[0] >> 4) & 0b111)
+            out["cycles"] = b[0] & 0b1111
+        elif kind == CMD_SINGLE1:
+            out["events"] = 1 << ((b[0] >> 2) & 0b111)
+            out["cycles"] = ((b[0] & 0b11) << 8) | b[1]
+        elif kind == CMD_SINGLE2:
+            out["events"] = 1 << ((b[0] >> 2) & 0b111)
+            out["cycles"] = ((b[0] & 0b11) << 16) | (b[1] << 8) | b[2]
+        elif kind == CMD_MULTIPLE0:
+            out["events"] = ((b[0] & 0b1111) << 4) | (b[1] >> 4)
+            out["cycles"] = b[1] & 0b1111
+        elif kind == CMD_MULTIPLE1:
+            out["events"] = ((b[0] & 0b11) << 6) | (b[1] >> 2)
+            out["cycles"] = ((b[1] & 0b11) << 8) | b[2]
+        elif kind == CMD_MULTIPLE2:
+            out["events"] = ((b[0] & 0b11) << 6) | (b[1] >> 2)
+            out["cycles"] = ((b[1] & 0b11) << 16) | (b[2] << 8) | b[3]
+        elif kind == CMD_REPEAT0:
+            out["repeats"] = b[0] & 0b1111
+        elif kind == CMD_REPEAT1:
+            out["repeats"] = ((b[0] & 0b11) << 8) | b[1]
+        elif kind == CMD_START and not zero:
+            timer = np.zeros(len(idx), dtype=np.uint64)
+            for i in range(1, 8):
+                timer = (timer << np.uint64(8)) | padded[starts[idx] + i]
+            out["timer"] = timer
+        commands[idx] = out
+
+    return commands
+
+
+def commands_to_dicts(commands):
+    """Convert a TRACE_COMMAND_DTYPE array to the list-of-dict command format."""
+    result = []
+    for ctype, events, cycles, repeats, timer in commands.tolist():
+        name = TRACE_COMMAND_NAMES[ctype]
+        if ctype == CMD_START:
+            result.append({"type": name, "timer_value": timer})
+        elif ctype <= CMD_SINGLE2:
+            event = events.bit_length() - 1
+            result.append({"type": name, "event": event, "cycles": cycles})
+        elif ctype <= CMD_MULTIPLE2:
+            com = {"type": name, "cycles": cycles}
+            for i in range(8):
+                if (events >> i) & 0b1:
+                    com["event" + str(i)] = i
+            result.append(com)
+        elif ctype <= CMD_REPEAT1:
+            result.append({"type": name, "repeats": repeats})
+        else:
+            result.append({"type": name})
+    return result
+
+
+def convert_to_commands(byte_stream_list, zero=True, as_dicts=True):
+    """Decode the byte streams of every (trace type, tile) into commands.
+
+    Args:
+        byte_stream_list: list indexed by trace type of dicts mapping a
+            "row,col" location to that tile's byte stream.
+        zero: if True, Start commands report a timer value of 0.
+        as_dicts: if True (default) each tile's commands are returned as a
+            list of dicts; otherwise as a TRACE_COMMAND_DTYPE array.
+
+    Returns:
+        list indexed by trace type of dicts mapping location to commands.
+    """
     commands = list()
     for t in range(NUM_TRACE_TYPES):
         commands.append(dict())
 
     for t in range(NUM_TRACE_TYPES):
         for key, byte_stream in byte_stream_list[t].items():
-            cursor = 0
-            commands[t][key] = list()
-            try:
-                while True:
-                    if (byte_stream[cursor] & 0b11111011) == 0b11110000:
-                        com = {"type": "Start", "timer_value": 0}
-                        if not zero:
-                            for i in range(7):
-                                com["timer_value"] += (byte_stream[cursor + i + 1]) * (
-                                    256 ** (6 - i)
-                                )
-                        commands[t][key].append(com)
-                        cursor = cursor + 8
-                    if (byte_stream[cursor] & 0b11111100) == 0b11011100:
-                        cursor = cursor + 4
-                    if (byte_stream[cursor] & 0b10000000) == 0b00000000:
-                        com = {"type": "Single0"}
-                        com["event"] = (byte_stream[cursor]) >> 4 & 0b111
-                        com["cycles"] = (byte_stream[cursor]) & 0b1111
-                        commands[t][key].append(com)
-                        cursor = cursor + 1
-                    if (byte_stream[cursor] & 0b11100000) == 0b10000000:
-                        com = {"type": "Single1"}
-                        com["event"] = (byte_stream[cursor]) >> 2 & 0b111
-                        com["cycles"] = ((byte_stream[cursor]) & 0b11) * 256
-                        com["cycles"] += byte_stream[cursor + 1]
-                        commands[t][key].append(com)
-                        cursor = cursor + 2
-                    if (byte_stream[cursor] & 0b11100000) == 0b10100000:
-                        com = {"type": "Single2"}
-                        com["event"] = (byte_stream[cursor]) >> 2 & 0b111
-                        com["cycles"] = ((byte_stream[cursor]) & 0b11) * 256 * 256
-                        com["cycles"] += byte_stream[cursor + 1] * 256
-                        com["cycles"] += byte_stream[cursor + 2]
-                        commands[t][key].append(com)
-                        cursor = cursor + 3
-                    if (byte_stream[cursor] & 0b11110000) == 0b11000000:
-                        com = {"type": "Multiple0"}
-                        com["cycles"] = byte_stream[cursor + 1] & 0b1111
-                        events = (byte_stream[cursor] & 0b1111) << 4
-                        events = events + (byte_stream[cursor + 1] >> 4)
-                        for i in range(0, 8):
-                            e = (events >> i) & 0b1
-                            if e:
-                                com["event" + str(i)] = i
-                        commands[t][key].append(com)
-                        cursor = cursor + 2
-                    if (byte_stream[cursor] & 0b11111100) == 0b11010000:
-                        com = {"type": "Multiple1"}
-                        cycles = (byte_stream[cursor + 1] & 0b11) << 8
-                        com["cycles"] = cycles + (byte_stream[cursor + 2])
-                        events = (byte_stream[cursor] & 0b11) << 6
-                        events = events + (byte_stream[cursor + 1] >> 2)
-                        for i in range(0, 8):
-                            e = (events >> i) & 0b1
-                            if e:
-                                com["event" + str(i)] = i
-                        commands[t][key].append(com)
-                        cursor = cursor + 3
-                    if (byte_stream[cursor] & 0b11111100) == 0b11010100:
-                        com = {"type": "Multiple2"}
-                        cycles = (byte_stream[cursor + 1] & 0b11) << 16
-                        cycles = cycles + ((byte_stream[cursor + 2]) << 8)
-                        com["cycles"] = cycles + (byte_stream[cursor + 3])
-                        events = (byte_stream[cursor] & 0b11) << 6
-                        events = events + (byte_stream[cursor + 1] >> 2)
-                        for i in range(0, 8):
-                            e = (events >> i) & 0b1
-                            if e:
-                                com["event" + str(i)] = i
-                        commands[t][key].append(com)
-                        cursor = cursor + 4
-                    if (byte_stream[cursor] & 0b11110000) == 0b11100000:
-                        com = {"type": "Repeat0"}
-                        com["repeats"] = (byte_stream[cursor]) & 0b1111
-                        commands[t][key].append(com)
-                        cursor = cursor + 1
-                    if (byte_stream[cursor] & 0b11111100) == 0b11011000:
-                        com = {"type": "Repeat1"}
-                        com["repeats"] = ((byte_stream[cursor]) & 0b11) * 256
-                        com["repeats"] += byte_stream[cursor + 1]
-                        commands[t][key].append(com)
-                        cursor = cursor + 2
-                    if (byte_stream[cursor] & 0b11111111) == 0b11111110:
-                        cursor = cursor + 1
-                    if (byte_stream[cursor] & 0b11111111) == 0b11111111:
-                        com = {"type": "Event_Sync"}
-                        commands[t][key].append(com)
-                        cursor = cursor + 1
-            except IndexError:
-                pass
+            decoded = decode_trace_commands(byte_stream, zero)
+            commands[t][key] = commands_to_dicts(decoded) if as_dicts else decoded
 
     return commands
 
 
+def write_trace_words(path, words):
+    """Write trace words to `path`.
+
+    The format follows the file extension: ``.npy`` is a NumPy array file,
+    ``.bin`` is raw little-endian uint32 words, anything else is the text
+    format of one 8-digit hex word per line. Binary formats keep the buffer
+    as-is apart from the unused all-zero tail; text drops every zero word.
+    """
+    words = np.asarray(words, dtype=np.uint32)
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".bin", ".npy"):
+        words = np.trim_zeros(words, "b")
+        if ext == ".npy":
+            np.save(path, words)
+        else:
+            words.astype("<u4").tofile(path)
+        return
+
+    words = words[words != 0]
+    text = words.astype(">u4").tobytes().hex().encode()
+    lines = np.frombuffer(text, dtype="S8").tolist()
+    with open(path, "wb") as f:
+        f.write(b"\n".join(lines))
+
+
+def read_trace_words(path):
+    """Read trace words written by write_trace_words.
+
+    Binary trace files are memory-mapped rather than read into memory.
+
+    Returns:
+        np.ndarray (or np.memmap) of uint32 words.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        return np.load(path, mmap_mode="r")
+    if ext == ".bin":
+        if os.path.getsize(path) == 0:
+            return np.zeros(0, dtype=np.uint32)
+        return np.memmap(path, dtype="<u4", mode="r")
+
+    with open(path, "r") as f:
+        toks = f.read().split()
+    if all(len(t) == 8 for t in toks):
+        return np.frombuffer(bytes.fromhex("".join(toks)), dtype=">u4").astype(
+            np.uint32
+        )
+    return np.array([int(t, 16) for t in toks], dtype=np.uint32)
+
+
 def trim_trace_pkts(trace_pkts):
     for i in range(len(trace_pkts)):
         if trace_pkts[i] == "fefefefe" or trace_pkts[i] == "FEFEFEFE":
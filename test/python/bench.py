@@ -0,0 +1,177 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+
+import csv
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from aie.utils.bench import BenchmarkResult, benchmark, sweep, write_summary_csv
+from aie.utils.npukernel import NPUKernel
+from fake_runtime import FakeFuture, FakeNPUTensor, FakeResult, FakeRuntime
+
+
+class CyclingRuntime(FakeRuntime):
+    """A runtime whose runs take 1 to 4 us in turn."""
+
+    def run(self, kernel_handle, args, **kwargs):
+        super().run(kernel_handle, args, **kwargs)
+        return FakeResult(1000 * (self.runs % 4 + 1))
+
+
+def test_latency_benchmark():
+    runtime = CyclingRuntime()
+    t = FakeNPUTensor((16,))
+    result = benchmark(NPUKernel("k.xclbin", "k.bin"), [t], 2, 8, runtime=runtime)
+    assert runtime.loads == 1
+    assert runtime.runs == 10
+    assert result.iters == 8
+    assert set(result.samples) == {
+        "npu_time",
+        "sync_to_device",
+        "launch",
+        "wait",
+        "sync_from_device",
+        "total",
+    }
+    # The tensor is synced both ways in every iteration
+    assert t.syncs_to_device == 10
+    assert t.syncs_from_device == 10
+    stats = result.stats()
+    assert stats["min"] == 1000 and stats["max"] == 4000
+    assert stats["mean"] == 2500
+    assert stats["p50"] == np.percentile(result.samples["npu_time"], 50)
+    assert np.all(result.samples["total"] >= result.samples["wait"])
+
+
+def test_throughput_benchmark():
+    runtime = CyclingRuntime()
+    t = FakeNPUTensor((16,))
+    result = benchmark(
+        NPUKernel("k.xclbin", "k.bin"),
+        [t],
+        warmup=0,
+        iters=5,
+        mode="throughput",
+        runtime=runtime,
+    )
+    assert set(result.samples) == {"npu_time", "launch"}
+    assert result.throughput > 0
+    # There are no host accesses between the runs
+    assert t.syncs_to_device == 0
+    assert t.syncs_from_device == 0
+    with pytest.raises(ValueError):
+        benchmark(NPUKernel("k.xclbin", "k.bin"), [t], mode="fast", runtime=runtime)
+
+
+class AsyncFakeRuntime(FakeRuntime):
+    """Launches runs on one worker thread and records how many are in flight."""
+
+    RUN_LATENCY = 0.01
+
+    def __init__(self):
+        super().__init__()
+        self._npu = ThreadPoolExecutor(max_workers=1)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _execute(self):
+        time.sleep(self.RUN_LATENCY)
+        with self._lock:
+            self.in_flight -= 1
+
+    def run_async(self, kernel_handle, args, **kwargs):
+        for a in args:
+            a._wait_pending()
+            a.to("npu")
+        self.runs += 1
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return FakeFuture(
+            args, self._npu.submit(self._execute), int(self.RUN_LATENCY * 1e9)
+        )
+
+
+@pytest.mark.parametrize("depth", [1, 3])
+def test_throughput_runs_in_flight(depth):
+    runtime = AsyncFakeRuntime()
+    t = FakeNPUTensor((16,))
+    result = benchmark(
+        NPUKernel("k.xclbin", "k.bin"),
+        [t],
+        warmup=0,
+        iters=6,
+        mode="throughput",
+        runtime=runtime,
+        depth=depth,
+    )
+    assert runtime.runs == 6
+    # Runs of different argument copies are in flight together
+    assert runtime.max_in_flight == depth
+    if depth > 1:
+        # Launches do not wait for the previous runs
+        assert max(result.samples["launch"][:depth]) < runtime.RUN_LATENCY * 1e9
+    with pytest.raises(ValueError):
+        benchmark(NPUKernel("k.xclbin", "k.bin"), [t], mode="throughput", depth=0)
+
+
+def test_export(tmp_path):
+    result = BenchmarkResult(
+        "latency", {"npu_time": [3, 1, 2], "launch": [5, 5, 5]}, 30, {"M": 64}
+    )
+    result.to_csv(tmp_path / "runs.csv")
+    with open(tmp_path / "runs.csv") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["iteration", "npu_time", "launch"]
+    assert rows[1:] == [["0", "3", "5"], ["1", "1", "5"], ["2", "2", "5"]]
+
+    result.to_json(tmp_path / "runs.json")
+    with open(tmp_path / "runs.json") as f:
+        data = json.load(f)
+    assert data["params"] == {"M": 64}
+    assert data["samples"]["npu_time"] == [3, 1, 2]
+    assert data["stats"]["npu_time"]["p50"] == 2
+    assert data["throughput"] == pytest.approx(1e8)
+
+
+def test_sweep_builds_each_variant_once(tmp_path):
+    runtime = CyclingRuntime()
+    builds = []
+
+    def build(M, N):
+        builds.append((M, N))
+        return NPUKernel(f"{M}x{N}.xclbin", f"{M}x{N}.bin")
+
+    points = [{"M": 64, "N": 32}, {"M": 128, "N": 32}, {"M": 64, "N": 32}]
+    results = sweep(
+        build,
+        points,
+        lambda M, N: [FakeNPUTensor((M, N))],
+        warmup=1,
+        iters=3,
+        runtime=runtime,
+    )
+    assert builds == [(64, 32), (128, 32)]
+    assert [r.params for r in results] == points
+    assert all(r.iters == 3 for r in results)
+
+    write_summary_csv(results, tmp_path / "sweep.csv")
+    with open(tmp_path / "sweep.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["M"], r["N"]) for r in rows] == [
+        ("64", "32"),
+        ("128", "32"),
+        ("64", "32"),
+    ]
+    assert float(rows[0]["npu_time_p50"]) > 0
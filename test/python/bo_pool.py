@@ -0,0 +1,113 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+# REQUIRES: xrt_python_bindings
+
+import numpy as np
+import pytest
+
+from aie.utils.hostruntime.xrtruntime.bo_pool import (
+    PAGE_SIZE,
+    BufferPool,
+    get_buffer_pool,
+    size_class,
+)
+from aie.utils.hostruntime.xrtruntime.tensor import XRTTensor
+from fake_xrt import patch_pyxrt_bo
+
+
+@pytest.fixture(autouse=True)
+def fake_bo(monkeypatch):
+    patch_pyxrt_bo(monkeypatch)
+
+
+@pytest.fixture
+def pool():
+    pool = get_buffer_pool()
+    pool.trim()
+    pool.reset_stats()
+    yield pool
+    pool.trim()
+
+
+def test_size_class():
+    assert size_class(0) == PAGE_SIZE
+    assert size_class(PAGE_SIZE + 1) == 2 * PAGE_SIZE
+    assert size_class(9 * PAGE_SIZE) == 10 * PAGE_SIZE
+    for nbytes in [5 * PAGE_SIZE, 100 * PAGE_SIZE + 3, 1 << 24]:
+        assert nbytes <= size_class(nbytes) < nbytes * 5 // 4 + PAGE_SIZE
+
+
+def test_tensor_reuses_buffers(pool):
+    for _ in range(10):
+        t = XRTTensor.zeros((1000,), dtype=np.float32)
+        t[3] = 1.0
+        assert t[3] == 1.0
+        del t
+    stats = pool.stats()
+    assert stats["allocations"] == 1
+    assert stats["reuses"] == 9
+    assert stats["in_use_bytes"] == 0
+    assert stats["peak_in_use_bytes"] == size_class(4000)
+
+
+def test_reused_buffer_is_reinitialized(pool):
+    t = XRTTensor(np.full((16,), 7, dtype=np.int32), dtype=np.int32)
+    del t
+    t = XRTTensor((16,), dtype=np.int32)
+    assert pool.stats()["reuses"] == 1
+    assert np.all(t.numpy() == 0)
+
+
+def test_live_views_are_not_reused(pool):
+    t = XRTTensor(np.arange(16, dtype=np.int32), dtype=np.int32)
+    view = t.numpy()[4:]
+    del t
+    t2 = XRTTensor.ones((16,), dtype=np.int32)
+    assert pool.stats()["reuses"] == 0
+    assert np.array_equal(view, np.arange(4, 16, dtype=np.int32))
+    del t2
+
+
+@pytest.mark.parametrize(
+    "export",
+    [
+        lambda t: t.numpy(),
+        lambda t: np.asarray(t),
+        lambda t: t[2:],
+        lambda t: XRTTensor.wrap(t.numpy()[: 4 * 1024]),
+    ],
+)
+def test_exported_buffers_are_not_reused(pool, export):
+    t = XRTTensor((16 * 1024,), dtype=np.uint8)
+    # The buffer object is discarded even once the views are gone, since
+    # their lifetime is not tracked
+    export(t)
+    del t
+    stats = pool.stats()
+    assert stats["cached_buffers"] == 0
+    assert stats["in_use_bytes"] == 0
+
+
+def test_trim(pool):
+    tensors = [XRTTensor((1024 * n,), dtype=np.uint8) for n in [1, 8, 64]]
+    del tensors
+    stats = pool.stats()
+    assert stats["cached_buffers"] == 3
+    assert pool.trim(max_bytes=16 * 1024) == 64 * 1024
+    assert pool.trim() == 12 * 1024
+    assert pool.stats()["cached_bytes"] == 0
+
+
+def test_pool_limit():
+    pool = BufferPool(max_bytes=PAGE_SIZE)
+    bos = [pool.acquire(100) for _ in range(2)]
+    for bo, capacity in bos:
+        pool.release(bo, capacity)
+    stats = pool.stats()
+    assert stats["cached_buffers"] == 1
+    assert stats["frees"] == 1
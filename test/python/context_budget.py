@@ -0,0 +1,172 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+# REQUIRES: xrt_python_bindings
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from aie.utils.hostruntime.context_budget import ContextBudget
+from aie.utils.hostruntime.xrtruntime.hostruntime import CachedXRTRuntime
+from fake_xrt import FakeCachedXRTRuntime, make_kernel, patch_pyxrt
+
+# Hardware contexts the fake driver supports, for all processes
+CONTEXT_LIMIT = 4
+
+_mp = multiprocessing.get_context("fork")
+
+
+class FakeHwContext:
+    """Fails like the driver when more than CONTEXT_LIMIT contexts exist."""
+
+    active = None
+
+    def __init__(self, device, uuid):
+        with FakeHwContext.active.get_lock():
+            if FakeHwContext.active.value >= CONTEXT_LIMIT:
+                raise RuntimeError("No such file or directory")
+            FakeHwContext.active.value += 1
+        self._alive = True
+
+    def __del__(self):
+        if getattr(self, "_alive", False):
+            with FakeHwContext.active.get_lock():
+                FakeHwContext.active.value -= 1
+
+
+@pytest.fixture
+def kernels(monkeypatch, tmp_path):
+    patch_pyxrt(monkeypatch, hw_context=FakeHwContext)
+    monkeypatch.setattr(FakeHwContext, "active", _mp.Value("i", 0))
+    monkeypatch.setenv("XRT_CONTEXT_CACHE_SIZE", "3")
+    monkeypatch.setenv("XRT_CONTEXT_BUDGET", str(CONTEXT_LIMIT))
+    return [make_kernel(tmp_path, f"k{i}") for i in range(6)]
+
+
+def _load_all(kernels, budget_path, start, errors):
+    try:
+        runtime = FakeCachedXRTRuntime()
+        runtime._budget.path = budget_path
+        for i in range(3 * len(kernels)):
+            handle = runtime.load(kernels[(start + i) % len(kernels)])
+            del handle
+        runtime.cleanup()
+    except Exception as e:
+        errors.put(repr(e))
+
+
+def _run_processes(kernels, budget_path, n=3):
+    errors = _mp.Queue()
+    processes = [
+        _mp.Process(target=_load_all, args=(kernels, budget_path, i, errors))
+        for i in range(n)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join(timeout=60)
+        assert p.exitcode == 0
+    return [errors.get() for _ in range(errors.qsize())]
+
+
+def test_processes_share_context_budget(kernels, tmp_path):
+    budget_path = tmp_path / "contexts.json"
+    start = time.monotonic()
+    assert _run_processes(kernels, budget_path) == []
+    # No process waited for a slot until the timeout
+    assert time.monotonic() - start < CachedXRTRuntime.CONTEXT_WAIT_TIMEOUT
+    assert FakeHwContext.active.value == 0
+    # Every process released its slots when cleaning up
+    assert not any(ContextBudget(budget_path, CONTEXT_LIMIT).slots().values())
+
+
+def test_quota_and_dead_processes(tmp_path):
+    path = tmp_path / "contexts.json"
+    budget = ContextBudget(path, total=3, quota=2)
+    assert budget.reserve("a") is None
+    assert budget.reserve("b") is None
+    # The process has to evict one of its own contexts first
+    assert budget.reserve("c") == os.getpid()
+    budget.release("a")
+    assert budget.reserve("c") is None
+
+    # Slots of a process that exited are reclaimed
+    child = _mp.Process(target=lambda: ContextBudget(path, total=3).reserve("x"))
+    child.start()
+    child.join()
+    assert child.exitcode == 0
+    assert budget.slots() == {os.getpid(): 2}
+    budget.release_all()
+    assert str(child.pid) not in path.read_text()
+    assert budget.slots() == {}
+
+
+def test_eviction_requests(tmp_path):
+    path = tmp_path / "contexts.json"
+    budget = ContextBudget(path, total=2)
+    ready, done = _mp.Event(), _mp.Event()
+    requests = _mp.Value("i", -1)
+
+    def holder():
+        child = ContextBudget(path, total=2)
+        child.reserve("x")
+        ready.set()
+        done.wait(10)
+        requests.value = child.eviction_requests(force=True)
+
+    p = _mp.Process(target=holder)
+    p.start()
+    assert ready.wait(10)
+    assert budget.reserve("a") is None
+    # The child holds the least recently used slot
+    assert budget.reserve("b") == p.pid
+    assert budget.reserve("b") == p.pid
+    done.set()
+    p.join()
+    assert requests.value == 1
+
+
+def test_idle_holder(kernels, tmp_path):
+    budget_path = tmp_path / "contexts.json"
+    ready, done = _mp.Event(), _mp.Event()
+
+    def holder():
+        # Takes the whole budget without creating contexts or serving requests
+        budget = ContextBudget(budget_path, CONTEXT_LIMIT)
+        for i in range(CONTEXT_LIMIT):
+            budget.reserve(f"idle{i}")
+        ready.set()
+        done.wait(30)
+
+    p = _mp.Process(target=holder)
+    p.start()
+    try:
+        assert ready.wait(10)
+        runtime = FakeCachedXRTRuntime()
+        runtime._budget.path = budget_path
+        # The driver has room: the contexts are created while the requests are
+        # pending, and recorded in the slot table
+        start = time.monotonic()
+        handles = [runtime.load(k) for k in kernels[:3]]
+        assert time.monotonic() - start < 1.0
+        assert runtime._budget.slots() == {p.pid: CONTEXT_LIMIT, os.getpid(): 3}
+
+        # The driver is full: the runtime waits for a slot, then gives up
+        del handles
+        runtime.CONTEXT_WAIT_TIMEOUT = 0.2
+        with FakeHwContext.active.get_lock():
+            FakeHwContext.active.value += CONTEXT_LIMIT
+        with pytest.raises(RuntimeError):
+            runtime.load(kernels[3])
+        assert runtime._budget.slots()[os.getpid()] == 0
+        runtime.cleanup()
+    finally:
+        done.set()
+        p.join()
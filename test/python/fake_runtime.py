@@ -0,0 +1,85 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# Stand-ins for a host runtime and its tensors, to test the code built on top
+# of the host runtime without an NPU
+
+import numpy as np
+
+from aie.utils.hostruntime.hostruntime import HostRuntime, KernelFuture, KernelResult
+from aie.utils.hostruntime.tensor_class import CPUOnlyTensor
+
+
+class FakeResult(KernelResult):
+    def is_success(self):
+        return True
+
+
+class FakeFuture(KernelFuture):
+    """A run that completes with a concurrent.futures.Future."""
+
+    def __init__(self, args, future, npu_time=0):
+        super().__init__(args)
+        self._future = future
+        self._npu_time = npu_time
+
+    def _poll(self):
+        return self._future.done()
+
+    def _wait(self, timeout):
+        try:
+            self._future.result(timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def _collect(self):
+        self._future.result()
+        return FakeResult(self._npu_time)
+
+
+class FakeNPUTensor(CPUOnlyTensor):
+    """A tensor on the host that counts the syncs of its fake device copy."""
+
+    DEVICES = ["cpu", "npu"]
+    DEFAULT_DEVICE = "npu"
+
+    def __init__(self, shape_or_data, dtype=np.uint32, device="npu", **kwargs):
+        self.syncs_to_device = 0
+        self.syncs_from_device = 0
+        super().__init__(shape_or_data, dtype=dtype, device=device)
+
+    def _sync_to_device(self, size=None, offset=0):
+        self.syncs_to_device += 1
+
+    def _sync_from_device(self):
+        self.syncs_from_device += 1
+
+    def buffer_object(self):
+        self._ensure_device()
+        return self
+
+
+class FakeRuntime(HostRuntime):
+    """Counts the loads and runs; a run writes all of its arguments."""
+
+    def __init__(self):
+        self.loads = 0
+        self.runs = 0
+
+    def load(self, npu_kernel, **kwargs):
+        self.loads += 1
+        return npu_kernel
+
+    def run(self, kernel_handle, args, **kwargs):
+        self.runs += 1
+        for a in args:
+            a.to("npu")
+            a.mark_device_dirty()
+        return FakeResult(0)
+
+    def device(self):
+        return None
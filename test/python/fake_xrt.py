@@ -0,0 +1,123 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# Stand-ins for pyxrt, to test the XRT host runtimes without an NPU
+
+import numpy as np
+import pyxrt
+
+from aie.utils.hostruntime.xrtruntime import bo_pool
+from aie.utils.hostruntime.xrtruntime.hostruntime import (
+    CachedXRTRuntime,
+    XRTHostRuntime,
+)
+from aie.utils.npukernel import NPUKernel
+from fake_runtime import FakeNPUTensor
+
+
+class FakeXclbin:
+    def __init__(self, path):
+        pass
+
+    def get_uuid(self):
+        return "uuid"
+
+    def get_kernels(self):
+        return [FakeKernelInfo()]
+
+
+class FakeKernelInfo:
+    def get_name(self):
+        return "MLIR_AIE"
+
+
+class FakeKernel:
+    def __init__(self, context, name):
+        self.context = context
+
+    def group_id(self, index):
+        return 1
+
+    def __call__(self, *args):
+        return FakeRun()
+
+
+class FakeRun:
+    def wait(self):
+        return pyxrt.ert_cmd_state.ERT_CMD_STATE_COMPLETED
+
+
+class FakeDevice:
+    def __init__(self, index):
+        pass
+
+    def get_info(self, info):
+        return "NPU Phoenix"
+
+    def register_xclbin(self, xclbin):
+        pass
+
+
+class FakeBo:
+    """A buffer object in host memory."""
+
+    host_only = pyxrt.bo.host_only
+
+    def __init__(self, *args):
+        if isinstance(args[0], FakeBo):
+            # Sub-buffer: (parent, size, offset)
+            parent, size, offset = args
+            self._mem = parent._mem[offset : offset + size]
+        elif isinstance(args[1], np.ndarray):
+            # User pointer: (device, array, size, flags, group_id)
+            self._mem = memoryview(args[1].reshape(-1).view(np.uint8))
+        else:
+            # (device, size, flags, group_id)
+            self._mem = memoryview(bytearray(args[1]))
+
+    def map(self):
+        return self._mem
+
+    def sync(self, direction, size, offset):
+        pass
+
+
+class FakeXRTRuntime(XRTHostRuntime):
+    _tensor_class = FakeNPUTensor
+
+    def check_device_consistency(self):
+        pass
+
+
+class FakeCachedXRTRuntime(CachedXRTRuntime):
+    _tensor_class = FakeNPUTensor
+
+    def check_device_consistency(self):
+        pass
+
+
+def patch_pyxrt(monkeypatch, hw_context=lambda device, uuid: object()):
+    """Replace the pyxrt device, xclbin, hardware context and kernel with fakes."""
+    monkeypatch.setattr(pyxrt, "device", FakeDevice)
+    monkeypatch.setattr(pyxrt, "xclbin", FakeXclbin)
+    monkeypatch.setattr(pyxrt, "hw_context", hw_context)
+    monkeypatch.setattr(pyxrt, "kernel", FakeKernel)
+
+
+def patch_pyxrt_bo(monkeypatch):
+    """Replace the pyxrt buffer objects with buffers in host memory."""
+    monkeypatch.setattr(pyxrt, "device", FakeDevice)
+    monkeypatch.setattr(pyxrt, "bo", FakeBo)
+    monkeypatch.setattr(bo_pool, "_device", None)
+
+
+def make_kernel(tmp_path, name, insts=range(4)):
+    """An NPUKernel with an empty xclbin and the given instructions."""
+    xclbin_path = tmp_path / f"{name}.xclbin"
+    insts_path = tmp_path / f"{name}.bin"
+    xclbin_path.write_bytes(b"")
+    insts_path.write_bytes(np.array(insts, dtype=np.uint32).tobytes())
+    return NPUKernel(xclbin_path, insts_path)
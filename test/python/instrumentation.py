@@ -0,0 +1,109 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+# REQUIRES: xrt_python_bindings
+
+import json
+
+import numpy as np
+import pytest
+
+from aie.utils.hostruntime import instrumentation
+from aie.utils.hostruntime.instrumentation import ChromeTraceRecorder, MetricsRegistry
+from aie.utils.hostruntime.xrtruntime.tensor import XRTTensor
+from fake_runtime import FakeNPUTensor
+from fake_xrt import FakeCachedXRTRuntime, make_kernel, patch_pyxrt
+
+
+@pytest.fixture
+def kernels(monkeypatch, tmp_path):
+    patch_pyxrt(monkeypatch)
+    monkeypatch.setenv("XRT_CONTEXT_CACHE_SIZE", "1")
+    monkeypatch.setenv("XRT_CONTEXT_BUDGET", "0")
+    return [make_kernel(tmp_path, name) for name in ("k0", "k1")]
+
+
+def test_no_listeners():
+    assert not instrumentation.enabled()
+    # Reporting without listeners is a no-op
+    instrumentation.span("load", instrumentation.now())
+    instrumentation.count("bytes_to_device", 16)
+
+
+def test_runtime_metrics(kernels):
+    runtime = FakeCachedXRTRuntime()
+    with instrumentation.listening(MetricsRegistry()) as metrics:
+        h0 = runtime.load(kernels[0])
+        runtime.load(kernels[0])
+        h1 = runtime.load(kernels[1])
+        runtime.run(h1, [FakeNPUTensor((4,))])
+        runtime.run(h1, [FakeNPUTensor((4,))])
+    assert not instrumentation.enabled()
+
+    assert metrics.counter("context_cache_miss") == 2
+    assert metrics.counter("context_cache_hit", kernel="MLIR_AIE") == 1
+    assert metrics.counter("context_eviction") == 1
+    assert metrics.timing("load")["count"] == 3
+    assert metrics.timing("hw_context")["count"] == 2
+    for name in ("launch", "wait", "run"):
+        timing = metrics.timing(name, kernel="MLIR_AIE")
+        assert timing["count"] == 2
+        assert timing["min"] <= timing["mean"] <= timing["max"]
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["context_eviction"] == {"": 1}
+    assert snapshot["timings"]["launch"]["MLIR_AIE"]["count"] == 2
+    metrics.reset()
+    assert metrics.counter("context_cache_miss") == 0
+    runtime.cleanup()
+
+
+def test_sync_bytes():
+    metrics = MetricsRegistry()
+    t = XRTTensor((256,), dtype=np.int32)
+    with instrumentation.listening(metrics):
+        t.to("npu")
+        t.mark_device_dirty()
+        t.numpy()
+    assert metrics.counter("bytes_to_device") == 1024
+    assert metrics.counter("bytes_from_device") == 1024
+    assert metrics.timing("sync_to_device")["count"] == 1
+
+
+def test_chrome_trace(kernels, tmp_path):
+    runtime = FakeCachedXRTRuntime()
+    recorder = ChromeTraceRecorder()
+    with instrumentation.listening(recorder):
+        handle = runtime.load(kernels[0])
+        runtime.run(handle, [FakeNPUTensor((4,))])
+        instrumentation.count("bytes_to_device", 8)
+        instrumentation.count("bytes_to_device", 8)
+    events = recorder.trace_events()
+    names = [e["name"] for e in events if e["ph"] == "X"]
+    assert {"load", "launch", "wait", "run"} <= set(names)
+    counters = [
+        e["args"]["bytes_to_device"]
+        for e in events
+        if e["ph"] == "C" and e["name"] == "bytes_to_device"
+    ]
+    assert counters == [8, 16]
+
+    # AIE events in cycles are placed at the launch of the last run
+    aie_trace = [
+        {"name": "INSTR_VECTOR", "ph": "B", "ts": 5000, "pid": 1, "tid": 0},
+        {"name": "INSTR_VECTOR", "ph": "E", "ts": 7000, "pid": 1, "tid": 0},
+    ]
+    run = [e for e in events if e["name"] == "run"][-1]
+    path = tmp_path / "trace.json"
+    recorder.write(path, aie_trace, clock_mhz=1000.0)
+    with open(path) as f:
+        merged = json.load(f)["traceEvents"]
+    aie_events = [e for e in merged if e["name"] == "INSTR_VECTOR"]
+    assert aie_events[0]["ts"] == pytest.approx(run["ts"])
+    assert aie_events[1]["ts"] == pytest.approx(run["ts"] + 2.0)
+    # The input is not modified
+    assert aie_trace[0]["ts"] == 5000
+    runtime.cleanup()
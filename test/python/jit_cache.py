@@ -0,0 +1,157 @@
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+
+# RUN: %python %s | FileCheck %s
+
+"""
+Tests for the in-process and on-disk JIT kernel caches.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from aie.utils.compile.cache.disk_cache import KernelDiskCache, parse_size
+from aie.utils.compile.cache.lru_cache import LRUCache
+from aie.utils.compile.cache.utils import file_lock
+
+
+def compile_into(root, name, size):
+    """Fake compilation: write artifacts of `size` bytes into a staging dir."""
+    staging_dir = os.path.join(root, name, ".staging")
+    os.makedirs(staging_dir)
+    for artifact in ["insts.bin", "final.xclbin"]:
+        with open(os.path.join(staging_dir, artifact), "wb") as f:
+            f.write(b"\0" * (size // 2))
+    return staging_dir
+
+
+# CHECK-LABEL: lru_cache
+print("lru_cache")
+cache = LRUCache(max_size=2)
+cache["a"] = 1
+cache["b"] = 2
+assert cache["a"] == 1  # "b" is now the least recently used
+cache["c"] = 3
+# CHECK: ['a', 'c'] 1
+print(cache.keys(), cache.evictions)
+assert "b" not in cache and cache.get("b") is None
+cache.resize(1)
+# CHECK: ['c'] 2
+print(cache.keys(), cache.evictions)
+
+# CHECK-LABEL: parse_size
+print("parse_size")
+# CHECK: 0 1536 536870912 8589934592
+print(parse_size("0"), parse_size("1.5K"), parse_size("512M"), parse_size("8GB"))
+
+# CHECK-LABEL: disk_cache_publish
+print("disk_cache_publish")
+with tempfile.TemporaryDirectory() as root:
+    disk = KernelDiskCache(root, max_bytes=2500)
+    for key in ["k0", "k1"]:
+        assert not disk.contains(key)
+        assert disk.publish(key, compile_into(root, key, 1000), 0.5) == []
+        assert disk.contains(key)
+        assert not os.path.exists(os.path.join(root, key, ".staging"))
+        time.sleep(0.01)
+    disk.touch("k0")  # k1 is now the least recently used
+    # CHECK: ['k1']
+    print(disk.publish("k2", compile_into(root, "k2", 1000), 0.5))
+    # CHECK: ['k0', 'k2'] 2000
+    print(sorted(disk.entries()), disk.size())
+
+    # Entries being compiled are not evicted
+    with file_lock(os.path.join(root, "k0", ".lock")):
+        # CHECK: ['k2']
+        print(disk.publish("k3", compile_into(root, "k3", 2000), 0.5))
+    # CHECK: ['k0', 'k3']
+    print(sorted(disk.entries()))
+
+# CHECK-LABEL: disk_cache_age
+print("disk_cache_age")
+with tempfile.TemporaryDirectory() as root:
+    disk = KernelDiskCache(root, max_age=60)
+    disk.publish("old", compile_into(root, "old", 100))
+    disk.publish("new", compile_into(root, "new", 100))
+    # Directories left by older versions are picked up by the index
+    os.makedirs(os.path.join(root, "untracked"))
+    past = time.time() - 3600
+    os.utime(os.path.join(root, "untracked"), (past, past))
+    index = disk._read_index()
+    index["old"]["last_used"] = past
+    disk._write_index(index)
+    # CHECK: ['old', 'untracked']
+    print(sorted(disk.evict()))
+    # CHECK: ['new']
+    print(sorted(disk.entries()))
+    disk.clear()
+    # CHECK: {}
+    print(disk.entries())
+
+# CHECK-LABEL: dispatch_table
+print("dispatch_table")
+with tempfile.TemporaryDirectory() as root:
+    disk = KernelDiskCache(root)
+    disk.publish("k0", compile_into(root, "k0", 100))
+    source = os.path.join(root, "design.py")
+    with open(source, "w") as f:
+        f.write("# design\n")
+    disk.record_dispatch("call", "k0", [source])
+    # Another process reads the table from disk
+    other = KernelDiskCache(root)
+    # CHECK: k0 None
+    print(other.lookup_dispatch("call"), other.lookup_dispatch("other call"))
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    # CHECK: None
+    print(other.lookup_dispatch("call"))
+
+# CHECK-LABEL: dispatch_key
+print("dispatch_key")
+# The key must not depend on string hash randomization
+script = f"""
+import numpy as np
+from aie.utils.compile.cache.utils import _create_dispatch_key
+def design(a, b, f, name, shape=(16, 16)):
+    pass
+print(_create_dispatch_key(design, (1, 2.5, lambda x: x + 1), {{"name": "mm", "shape": (8, np.int32(4))}}, "aie2"))
+print(_create_dispatch_key(design, (1, 2.5, object()), {{}}, "aie2"))
+"""
+keys = [
+    subprocess.run(
+        [sys.executable, "-c", script],
+        env=dict(os.environ, PYTHONHASHSEED=str(seed)),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    for seed in [1, 2]
+]
+# CHECK: True 64 None
+print(keys[0] == keys[1], len(keys[0][0]), keys[0][1])
+
+# CHECK-LABEL: dispatch_key_closures
+print("dispatch_key_closures")
+from aie.utils.compile.cache.utils import _create_dispatch_key
+
+
+def make(n):
+    def design(a):
+        return a + n
+
+    return design
+
+
+# Designs built by a factory differ only in the values they capture
+keys = [_create_dispatch_key(make(n), (1,), {}, "aie2") for n in [16, 32, 16]]
+# CHECK: False True
+print(keys[0] == keys[1], keys[0] == keys[2])
+# CHECK: None
+print(_create_dispatch_key(make(object()), (1,), {}, "aie2"))
@@ -0,0 +1,115 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+# REQUIRES: xrt_python_bindings
+
+import asyncio
+import threading
+
+import pyxrt
+import pytest
+
+from aie.utils.hostruntime.hostruntime import HostRuntimeError
+from aie.utils.hostruntime.xrtruntime.hostruntime import XRTKernelFuture
+from fake_runtime import FakeNPUTensor
+
+
+class FakeRun:
+    """Stand-in for a pyxrt.run that completes when `finish` is called."""
+
+    def __init__(self, final_state=pyxrt.ert_cmd_state.ERT_CMD_STATE_COMPLETED):
+        self._finished = threading.Event()
+        self._final_state = final_state
+
+    def finish(self):
+        self._finished.set()
+
+    def state(self):
+        if self._finished.is_set():
+            return self._final_state
+        return pyxrt.ert_cmd_state.ERT_CMD_STATE_RUNNING
+
+    def wait(self):
+        self._finished.wait()
+        return self._final_state
+
+
+def test_future_wait_and_done():
+    run = FakeRun()
+    out = FakeNPUTensor((4,))
+    future = XRTKernelFuture(run, [out], start=0)
+    assert not future.done()
+    with pytest.raises(TimeoutError):
+        future.wait(timeout=0.01)
+    run.finish()
+    assert future.done()
+    result = future.wait()
+    assert result.is_success()
+    assert result.npu_time > 0
+    # The output is synced from the device on the first access
+    out.numpy()
+    out.numpy()
+    assert out.syncs_from_device == 1
+
+
+def test_future_owns_args():
+    run = FakeRun()
+    out = FakeNPUTensor((4,))
+    future = XRTKernelFuture(run, [out], start=0)
+    assert out._pending is future
+    # Accessing the tensor waits for the run to complete
+    threading.Timer(0.05, run.finish).start()
+    out[0]
+    assert future.done() and out._pending is None
+
+
+def test_future_callback():
+    run = FakeRun()
+    future = XRTKernelFuture(run, [], start=0)
+    called = threading.Event()
+    results = []
+
+    def callback(f):
+        results.append(f.wait().is_success())
+        called.set()
+
+    future.add_done_callback(callback)
+    run.finish()
+    assert called.wait(timeout=5)
+    # Callbacks added after completion run immediately
+    future.add_done_callback(lambda f: results.append(f.done()))
+    assert results == [True, True]
+
+
+def test_future_failure():
+    run = FakeRun(final_state=pyxrt.ert_cmd_state.ERT_CMD_STATE_ERROR)
+    out = FakeNPUTensor((4,))
+    future = XRTKernelFuture(run, [out], start=0)
+    run.finish()
+    with pytest.raises(HostRuntimeError):
+        future.wait()
+    assert isinstance(future.exception(), HostRuntimeError)
+    # The failure is reported by the future, not on tensor access
+    out[0]
+
+    run = FakeRun(final_state=pyxrt.ert_cmd_state.ERT_CMD_STATE_ERROR)
+    future = XRTKernelFuture(run, [], start=0, fail_on_error=False)
+    run.finish()
+    assert not future.wait().is_success()
+
+
+def test_future_await():
+    runs = [FakeRun(), FakeRun()]
+    futures = [XRTKernelFuture(run, [], start=0) for run in runs]
+
+    async def main():
+        for run in runs:
+            asyncio.get_running_loop().call_later(0.01, run.finish)
+        return await asyncio.gather(*futures)
+
+    results = asyncio.run(main())
+    assert [r.is_success() for r in results] == [True, True]
@@ -0,0 +1,116 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+
+import numpy as np
+import pytest
+
+from aie.utils.ml import DataShaper, LayoutPlan, layout_plan
+
+
+def reference_reorder(mat, order, defOrder):
+    """The reorder as a chain of numpy operations."""
+    pad_im, size, perm, pad_ex, brdcst, align = DataShaper(defOrder)._reorder_decode(
+        mat.shape, order
+    )
+    if sum(pad_im) > 0:
+        mat = np.pad(mat, tuple(zip([0] * len(pad_im), pad_im)), "constant")
+    mat = mat.reshape(*size).transpose(perm)
+    if sum(pad_ex) > 0:
+        mat = np.pad(mat, tuple(zip([0] * len(pad_ex), pad_ex)), "constant")
+    for idx, b in enumerate(brdcst):
+        if b > 1:
+            mat = np.repeat(mat, b, axis=idx)
+    for idx, a in reversed(tuple(enumerate(align))):
+        if a > 1:
+            mat = mat.reshape(mat.shape[: idx + 1] + (-1,))
+            pad = a - (mat.shape[-1] % a)
+            if pad < a:
+                mp = np.zeros((len(mat.shape), 2), dtype=int)
+                mp[-1, -1] = pad
+                mat = np.pad(mat, mp, "constant")
+    return mat.reshape(-1)
+
+
+CASES = [
+    ((16, 8, 8), "YCXC8", "CYX"),
+    ((64, 16, 1, 1), "OIYXI8O8", "OIYX"),
+    ((64, 64, 3, 3), "OIYXI8O8", "OIYX"),
+    ((8, 7, 7), "YXC", "CYX"),
+    ((32, 8, 3, 3), "OYXIO8", "OIYX"),
+    ((12, 4, 4), "YCXC8", "CYX"),
+    ((6, 10), "C*2R", "RC"),
+    ((6, 10), "R|16C", "RC"),
+    ((6, 10), "RC|8", "RC"),
+    ((6, 10), "R%2C", "RC"),
+]
+
+
+@pytest.mark.parametrize("shape,order,defOrder", CASES)
+def test_apply_matches_reference(shape, order, defOrder):
+    rng = np.random.default_rng(0)
+    mat = rng.integers(-128, 127, size=shape, dtype=np.int8)
+    expected = reference_reorder(mat, order, defOrder)
+    plan = layout_plan(shape, order, defOrder)
+    assert plan.size == expected.size
+    assert np.array_equal(plan.apply(mat), expected)
+    assert np.array_equal(DataShaper().reorder_mat(mat, order, defOrder), expected)
+
+
+@pytest.mark.parametrize(
+    "shape,order,defOrder", [c for c in CASES if layout_plan(*c).invertible]
+)
+def test_invert(shape, order, defOrder):
+    mat = np.arange(np.prod(shape), dtype=np.int32).reshape(shape)
+    plan = layout_plan(shape, order, defOrder)
+    reordered = plan.apply(mat)
+    assert np.array_equal(plan.invert(reordered), mat.reshape(-1))
+    ds = DataShaper()
+    assert np.array_equal(
+        ds.reorder_mat(reordered.reshape(shape), order, defOrder, inverse=True),
+        mat.reshape(-1),
+    )
+
+
+def test_plans_are_cached():
+    assert layout_plan((16, 8, 8), "YCXC8", "CYX") is layout_plan(
+        [16, 8, 8], "YCXC8", "CYX"
+    )
+    assert layout_plan((16, 8, 8), "YCXC8", "CYX") is not layout_plan(
+        (16, 8, 8), "YCXC8", "CYX8"
+    )
+
+
+def test_apply_into_out():
+    shape, order, defOrder = (64, 16, 1, 1), "OIYXI8O8", "OIYX"
+    mat = np.arange(np.prod(shape), dtype=np.int32).reshape(shape)
+    plan = layout_plan(shape, order, defOrder)
+    out = np.full(plan.size, -1, dtype=np.int32)
+    result = plan.apply(mat, out=out)
+    assert np.shares_memory(result, out)
+    assert np.array_equal(out, reference_reorder(mat, order, defOrder))
+    with pytest.raises(ValueError):
+        plan.apply(mat, out=np.empty(plan.size + 1, dtype=np.int32))
+    with pytest.raises(ValueError):
+        plan.apply(mat, out=np.empty(2 * plan.size, dtype=np.int32)[::2])
+    with pytest.raises(ValueError):
+        plan.apply(mat.reshape(-1))
+
+
+def test_apply_multithreaded():
+    shape, order, defOrder = (256, 64, 3, 3), "OIYXI8O8", "OIYX"
+    mat = np.random.default_rng(1).integers(0, 255, size=shape, dtype=np.uint8)
+    plan = layout_plan(shape, order, defOrder)
+    expected = reference_reorder(mat, order, defOrder)
+    assert np.array_equal(plan.apply(mat, threads=4), expected)
+    assert np.array_equal(plan.invert(expected, threads=4), mat.reshape(-1))
+
+
+def test_invert_unsupported():
+    plan = LayoutPlan((6, 10), "R%2C", "RC")
+    with pytest.raises(ValueError):
+        plan.invert(np.zeros(plan.size))
@@ -160,3 +160,42 @@ def test_two_external_functions_same_object():
 
     expected = (np.arange(32, dtype=np.int32) + 1) * 2
     np.testing.assert_array_equal(output_tensor.numpy(), expected)
+
+
+def test_precompile_two_external_functions():
+    """
+    precompile() compiles the ExternalFunctions concurrently and caches the
+    kernel, so the following call runs it without compiling.
+    """
+    from aie.utils.jit import cache_stats
+
+    def make_kernel(name, expr):
+        return ExternalFunction(
+            name,
+            source_string=f"""extern "C" {{
+                void {name}(int* in, int* out, int n) {{
+                    for (int i = 0; i < n; i++) out[i] = {expr};
+                }}
+            }}""",
+            arg_types=[
+                np.ndarray[(16,), np.dtype[np.int32]],
+                np.ndarray[(16,), np.dtype[np.int32]],
+                np.int32,
+            ],
+        )
+
+    add_three = make_kernel("add_three", "in[i] + 3")
+    scale_by_four = make_kernel("scale_by_four", "in[i] * 4")
+    input_tensor = iron.arange(32, dtype=np.int32)
+    output_tensor = iron.zeros((32,), dtype=np.int32)
+
+    args = (input_tensor, output_tensor, add_three, scale_by_four)
+    (kernel,) = iron.precompile([(add_then_scale, args)])
+    assert kernel is not None
+
+    memory_hits = cache_stats()["memory_hits"]
+    add_then_scale(*args)
+    assert cache_stats()["memory_hits"] == memory_hits + 1
+
+    expected = (np.arange(32, dtype=np.int32) + 3) * 4
+    np.testing.assert_array_equal(output_tensor.numpy(), expected)
@@ -306,3 +306,39 @@ def test_rand_bfloat16_boundary(dtype, tensorclass):
     arr = t.numpy()
     assert np.all(arr < 1.0)
     assert np.all(arr >= 0.0)
+
+
+def test_wrap_shares_tensor_memory():
+    """Test that wrapping a view of an XRTTensor shares its buffer object."""
+    src = XRTTensor(np.arange(16, dtype=np.int32), dtype=np.int32)
+    view = XRTTensor.wrap(src.numpy()[4:8])
+    assert view.shape == (4,)
+    assert np.shares_memory(view.numpy(), src.numpy())
+    view[0] = 100
+    assert src[4] == 100
+
+
+@pytest.mark.parametrize("aligned", [True, False])
+def test_wrap_array(aligned):
+    """Test that wrapping a NumPy array works with or without alignment."""
+    from aie.utils.hostruntime.xrtruntime.bo_pool import PAGE_SIZE, aligned_empty
+
+    array = aligned_empty((4, 8), np.float32)
+    assert array.ctypes.data % PAGE_SIZE == 0
+    if not aligned:
+        array = np.empty((33,), np.float32)[1:].reshape(4, 8)
+    array[...] = np.arange(32).reshape(4, 8)
+    t = XRTTensor.wrap(array)
+    assert t.dtype == np.float32 and t.shape == (4, 8)
+    assert np.array_equal(t.numpy(), array)
+    t.to("npu")
+
+
+def test_from_torch_no_copy():
+    """Test that from_torch shares memory with the torch tensor when asked to."""
+    torch = pytest.importorskip("torch")
+    src = XRTTensor(np.arange(8, dtype=np.float32), dtype=np.float32)
+    shared = XRTTensor.from_torch(src.to_torch(), copy=False)
+    assert np.shares_memory(shared.numpy(), src.numpy())
+    copied = XRTTensor.from_torch(src.to_torch())
+    assert not np.shares_memory(copied.numpy(), src.numpy())
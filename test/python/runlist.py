@@ -0,0 +1,135 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+# REQUIRES: xrt_python_bindings
+
+import numpy as np
+import pyxrt
+import pytest
+
+from aie.utils.hostruntime.hostruntime import HostRuntimeError
+from aie.utils.hostruntime.xrtruntime.hostruntime import XRTKernelHandle
+from fake_runtime import FakeNPUTensor
+from fake_xrt import FakeXRTRuntime, patch_pyxrt
+
+COMPLETED = pyxrt.ert_cmd_state.ERT_CMD_STATE_COMPLETED
+ERROR = pyxrt.ert_cmd_state.ERT_CMD_STATE_ERROR
+NEW = pyxrt.ert_cmd_state.ERT_CMD_STATE_NEW
+
+
+class FakeKernel:
+    def __init__(self, name, state=COMPLETED):
+        self.name = name
+        self.final_state = state
+
+
+class FakeRun:
+    """Stand-in for pyxrt.run that records its arguments."""
+
+    def __init__(self, kernel):
+        self.kernel = kernel
+        self.args = {}
+        self._state = NEW
+
+    def set_arg(self, index, value):
+        self.args[index] = value
+
+    def state(self):
+        return self._state
+
+
+class FakeRunList:
+    """Stand-in for pyxrt.runlist that completes its runs when executed."""
+
+    executed = []
+
+    def __init__(self, context):
+        self.context = context
+        self.runs = []
+
+    def add(self, run):
+        self.runs.append(run)
+
+    def execute(self):
+        FakeRunList.executed.append(
+            (self.context, [run.kernel.name for run in self.runs])
+        )
+        # The runs after a failed run stay new
+        for run in self.runs:
+            run._state = run.kernel.final_state
+            if run._state != COMPLETED:
+                break
+
+    def wait(self):
+        if any(run._state not in (COMPLETED, NEW) for run in self.runs):
+            raise RuntimeError("Command failed")
+
+
+@pytest.fixture
+def fake_xrt(monkeypatch):
+    patch_pyxrt(monkeypatch)
+    monkeypatch.setattr(pyxrt, "run", FakeRun, raising=False)
+    monkeypatch.setattr(pyxrt, "runlist", FakeRunList, raising=False)
+    FakeRunList.executed = []
+
+
+def handle(kernel, context):
+    insts = np.zeros(4, dtype=np.uint32)
+    return XRTKernelHandle(kernel, None, context, insts, insts_bo="insts")
+
+
+def test_runlist_segments(fake_xrt):
+    runtime = FakeXRTRuntime()
+    a, b, c = [FakeNPUTensor((4,)) for _ in range(3)]
+    runlist = runtime.runlist()
+    assert runlist.add(handle(FakeKernel("k0"), "ctx0"), [a, b]) == 0
+    assert runlist.add(handle(FakeKernel("k1"), "ctx0"), [b, c]) == 1
+    assert runlist.add(handle(FakeKernel("k2"), "ctx1"), [c, a]) == 2
+    results = runlist.run()
+    assert len(results) == 3
+    assert all(r.is_success() for r in results)
+    # Consecutive runs on one context are submitted together
+    assert FakeRunList.executed == [("ctx0", ["k0", "k1"]), ("ctx1", ["k2"])]
+    # The outputs are synced from the device on the next access
+    assert not a._host_valid and not c._host_valid
+
+    # A run list can be submitted again
+    runlist.run()
+    assert len(FakeRunList.executed) == 4
+
+
+def test_runlist_failure(fake_xrt):
+    runtime = FakeXRTRuntime()
+    a = FakeNPUTensor((4,))
+    runlist = runtime.runlist()
+    runlist.add(handle(FakeKernel("k0", state=ERROR), "ctx0"), [a])
+    runlist.add(handle(FakeKernel("k1"), "ctx1"), [a])
+    with pytest.raises(HostRuntimeError, match="Run 0"):
+        runlist.run()
+    # The runs after a failure are not submitted
+    assert FakeRunList.executed == [("ctx0", ["k0"])]
+    results = runlist.run(fail_on_error=False)
+    assert [r.is_success() for r in results] == [False, False]
+    assert results[1].npu_time == 0
+
+
+def test_runlist_failure_within_segment(fake_xrt):
+    runtime = FakeXRTRuntime()
+    a = FakeNPUTensor((4,))
+    runlist = runtime.runlist()
+    runlist.add(handle(FakeKernel("k0"), "ctx0"), [a])
+    runlist.add(handle(FakeKernel("k1", state=ERROR), "ctx0"), [a])
+    runlist.add(handle(FakeKernel("k2"), "ctx0"), [a])
+    runlist.add(handle(FakeKernel("k3"), "ctx1"), [a])
+    with pytest.raises(HostRuntimeError, match="Run 1"):
+        runlist.run()
+    assert FakeRunList.executed == [("ctx0", ["k0", "k1", "k2"])]
+    # The run after the failed one is never started
+    results = runlist.run(fail_on_error=False)
+    assert [r.is_success() for r in results] == [True, False, False, False]
+    assert results[2].ret == NEW
+    assert results[2].npu_time == 0 and results[3].npu_time == 0
@@ -0,0 +1,157 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from aie.utils.npukernel import NPUKernel
+from aie.utils.streaming import StreamingExecutor
+from fake_runtime import FakeFuture, FakeNPUTensor, FakeRuntime
+
+SYNC_LATENCY = 0.01
+RUN_LATENCY = 0.02
+
+
+class SlowTensor(FakeNPUTensor):
+    """A tensor with a separate fake device copy that takes a while to sync."""
+
+    def __init__(self, shape_or_data, dtype=np.uint32, device="npu", **kwargs):
+        super().__init__(shape_or_data, dtype=dtype, device=device)
+        self.device_data = self.data.copy()
+
+    def _sync_to_device(self, size=None, offset=0):
+        time.sleep(SYNC_LATENCY)
+        super()._sync_to_device(size, offset)
+        self.device_data[...] = self.data
+
+    def _sync_from_device(self):
+        time.sleep(SYNC_LATENCY)
+        super()._sync_from_device()
+        self.data[...] = self.device_data
+
+
+class StreamingRuntime(FakeRuntime):
+    """Runs `out = in + 1` on a single worker thread standing in for the NPU."""
+
+    def __init__(self):
+        super().__init__()
+        self._npu = ThreadPoolExecutor(max_workers=1)
+
+    def _execute(self, inp, out, *extra):
+        time.sleep(RUN_LATENCY)
+        out.device_data[...] = inp.device_data + 1
+        for e in extra:
+            out.device_data[...] += e.device_data
+
+    def run_async(self, kernel_handle, args, read_only=(), **kwargs):
+        self.runs += 1
+        for a in args:
+            a._wait_pending()
+            a.to("npu")
+        owned = [a for a in args if not any(a is r for r in read_only)]
+        return FakeFuture(
+            owned, self._npu.submit(self._execute, *args), int(RUN_LATENCY * 1e9)
+        )
+
+    def run(self, kernel_handle, args, **kwargs):
+        return self.run_async(kernel_handle, args, **kwargs).wait()
+
+
+def make_executor(depth, chunk_shape=(8, 4), **kwargs):
+    runtime = StreamingRuntime()
+    executor = StreamingExecutor(
+        NPUKernel("k.xclbin", "k.bin"),
+        chunk_shape,
+        depth=depth,
+        dtype=np.uint32,
+        runtime=runtime,
+        tensor_class=SlowTensor,
+        **kwargs,
+    )
+    return executor, runtime
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_stream_in_order(depth):
+    executor, runtime = make_executor(depth)
+    chunks = [np.full((8, 4), i, dtype=np.uint32) for i in range(7)]
+    outputs = list(executor.stream(iter(chunks)))
+    assert runtime.loads == 1
+    assert runtime.runs == 7
+    assert len(outputs) == 7
+    for i, out in enumerate(outputs):
+        assert np.array_equal(out, chunks[i] + 1)
+
+
+def test_map_pads_last_chunk():
+    executor, _ = make_executor(2)
+    array = np.arange(30 * 4, dtype=np.uint32).reshape(30, 4)
+    result = executor.map(array)
+    assert result.shape == (30, 4)
+    assert np.array_equal(result, array + 1)
+    assert executor.map(np.empty((0, 4), dtype=np.uint32)).shape == (0, 4)
+
+
+def test_chunk_too_large():
+    executor, _ = make_executor(2)
+    with pytest.raises(ValueError):
+        list(executor.stream([np.zeros((9, 4), dtype=np.uint32)]))
+
+
+def test_invalid_depth():
+    with pytest.raises(ValueError):
+        make_executor(0)
+
+
+def test_pipelining_overlaps_chunks():
+    chunks = [np.full((8, 4), i, dtype=np.uint32) for i in range(8)]
+
+    def elapsed(depth):
+        executor, _ = make_executor(depth)
+        start = time.perf_counter()
+        outputs = list(executor.stream(chunks))
+        assert all(np.array_equal(o, c + 1) for o, c in zip(outputs, chunks))
+        return time.perf_counter() - start
+
+    serial = elapsed(1)
+    # The syncs of a chunk overlap with the run of the previous one
+    assert elapsed(2) < 0.8 * serial
+
+
+def test_pipelining_with_extra_args():
+    chunks = [np.full((8, 4), i, dtype=np.uint32) for i in range(8)]
+    weights = SlowTensor(np.full((8, 4), 10, dtype=np.uint32))
+
+    def elapsed(depth):
+        executor, _ = make_executor(depth, extra_args=(weights,))
+        start = time.perf_counter()
+        outputs = list(executor.stream(chunks))
+        assert all(np.array_equal(o, c + 11) for o, c in zip(outputs, chunks))
+        return time.perf_counter() - start, executor
+
+    serial, _ = elapsed(1)
+    # The runs in flight share the weights instead of waiting for each other
+    pipelined, executor = elapsed(2)
+    assert pipelined < 0.8 * serial
+    assert weights._pending is None
+    # Reading the outputs does not sync them back to the device
+    for _, out in executor._ring:
+        assert out.syncs_to_device <= 1
+
+
+def test_copy_does_not_sync_from_device():
+    t = SlowTensor((4,), dtype=np.uint32)
+    t.mark_device_dirty()
+    t.device_data[...] = 7
+    t.copy_(np.arange(4, dtype=np.uint32))
+    assert np.array_equal(t.numpy(), np.arange(4))
+    t.to("npu")
+    assert np.array_equal(t.device_data, np.arange(4))
@@ -0,0 +1,178 @@
+import numpy as np
+
+from aie.helpers.taplib import (
+    DmaBdLimits,
+    TensorAccessPattern,
+    TensorAccessSequence,
+    TensorTiler2D,
+    bd_report,
+    minimize_bds,
+)
+from util import construct_test
+
+# RUN: %python %s | FileCheck %s
+
+
+def accesses(taps):
+    return [a for t in taps for a in t.access_generator()]
+
+
+def check_transfers(taps, transfers, limits, elem_bytes=4, ordered=True):
+    assert sum(len(t.taps) for t in transfers) == len(taps)
+    for t in transfers:
+        bd_taps = [bd.to_tap(t.taps[0].tensor_dims) for bd in t.bds]
+        expected, actual = accesses(t.taps), accesses(bd_taps)
+        if not ordered:
+            expected, actual = sorted(expected), sorted(actual)
+        assert expected == actual
+        for bd in t.bds:
+            assert limits.violations(bd.sizes, bd.strides, elem_bytes) == []
+            assert 0 <= bd.repeat_count <= limits.max_repeat_count
+            # A stride 0 iteration dimension is lowered to the repeat count
+            if bd.repeat_count:
+                assert len(bd.sizes) < 4 or bd.strides[0] != 0
+
+
+# CHECK-LABEL: dma_bd_limits
+@construct_test
+def dma_bd_limits():
+    shim = DmaBdLimits.shim_tile()
+    assert shim.max_wrap == 1023 and shim.max_step == 1 << 20 and shim.max_iter == 64
+    assert shim.violations([4, 8, 16], [128, 16, 1]) == []
+    assert shim.violations([64, 2, 8, 16], [0, 128, 16, 1]) == []
+    assert len(shim.violations([1, 1, 1, 1, 1], [1, 1, 1, 1, 1])) == 1
+    assert len(shim.violations([2048], [1])) == 1
+    assert shim.violations([2046], [1], elem_bytes=2) == []
+    assert len(shim.violations([3], [1], elem_bytes=2)) == 1
+    assert len(shim.violations([65, 2, 2, 8], [32, 16, 8, 1])) == 1
+    assert len(shim.violations([2, 8], [0, 1])) == 1
+    assert len(shim.violations([4, 4], [3, 1], elem_bytes=2)) == 1
+    assert len(DmaBdLimits.core_tile().violations([256, 4], [4, 1])) == 1
+
+    class TargetModel:
+        def is_shim_noc_tile(self, col, row):
+            return row == 0
+
+        def is_mem_tile(self, col, row):
+            return row == 1
+
+        def is_core_tile(self, col, row):
+            return row > 1
+
+        def get_num_bds(self, col, row):
+            return 48 if row == 1 else 16
+
+    tm = TargetModel()
+    assert DmaBdLimits.from_target_model(tm, 0, 0).name == "shim"
+    assert DmaBdLimits.from_target_model(tm, 0, 1).num_bds == 48
+    assert DmaBdLimits.from_target_model(tm, 0, 2).max_step == 1 << 13
+
+    # CHECK: Pass!
+    print("Pass!")
+
+
+# CHECK-LABEL: dma_minimize_bds
+@construct_test
+def dma_minimize_bds():
+    shim = DmaBdLimits.shim_tile()
+
+    # Tiles of a row-major matrix take one BD each
+    tiles = TensorTiler2D.simple_tiler((64, 128), (16, 32))
+    transfers = minimize_bds(tiles, shim)
+    assert [t.num_bds for t in transfers] == [1] * len(tiles)
+    assert transfers[0].contiguous_bytes == 128
+    check_transfers(tiles, transfers, shim)
+
+    # Merging consecutive dimensions: the whole matrix in one contiguous run, split to fit d0
+    whole = TensorAccessPattern((512, 512), 0, [8, 64, 512], [64 * 512, 512, 1])
+    transfers = minimize_bds([whole], shim)
+    assert transfers[0].num_bds == 1
+    assert transfers[0].bds[0].sizes[-1] * 4 <= 1023 * 4
+    assert transfers[0].burst_bytes == 256
+    check_transfers([whole], transfers, shim)
+
+    # Dimensions beyond the 4 of a BD are enumerated; outer repeats become repeat counts
+    tap = TensorAccessPattern((128, 64), 0, [3, 2, 4, 4, 8], [2048, 32, 512, 64, 1])
+    transfers = minimize_bds([tap], shim)
+    assert transfers[0].num_bds == 3
+    check_transfers([tap], transfers, shim)
+    tap = TensorAccessPattern((16, 16), 0, [200, 16], [0, 1])
+    transfers = minimize_bds([tap], shim)
+    assert transfers[0].num_bds == 1
+    bd = transfers[0].bds[0]
+    assert (bd.sizes, bd.strides, bd.repeat_count) == ([16], [1], 199)
+    check_transfers([tap], transfers, shim)
+    for repeats, num_bds in [(300, 2), (1000, 4)]:
+        tap = TensorAccessPattern((64, 64), 0, [repeats, 4, 8], [0, 64, 1])
+        transfers = minimize_bds([tap], shim)
+        assert transfers[0].num_bds == num_bds
+        assert all(bd.repeat_count == repeats // num_bds - 1 for bd in transfers[0].bds)
+        check_transfers([tap], transfers, shim)
+    tap = TensorAccessPattern((64, 64), 0, [3, 50, 4, 8], [1024, 0, 64, 1])
+    transfers = minimize_bds([tap], shim)
+    assert transfers[0].num_bds == 3
+    check_transfers([tap], transfers, shim)
+    # Repeats outside enumerated dimensions are enumerated too: repeat counts would replay
+    # each BD back to back (A A B B C C instead of A B C A B C)
+    core = DmaBdLimits.core_tile()
+    tas = TensorAccessSequence.from_taps(
+        [TensorAccessPattern((30000,), 0, [2, 3, 8], [0, 10000, 1])]
+    )
+    transfers = minimize_bds(tas, core)
+    assert transfers[0].num_bds == 6
+    assert all(bd.repeat_count == 0 for bd in transfers[0].bds)
+    bd_taps = [bd.to_tap((30000,)) for bd in transfers[0].bds]
+    assert accesses(bd_taps) == accesses(tas)
+
+    # A single element is a one word transfer
+    tap = TensorAccessPattern((64, 64), 5, [1], [1])
+    transfers = minimize_bds([tap], shim)
+    assert transfers[0].bds[0].sizes == [1]
+    check_transfers([tap], transfers, shim)
+
+    # Reordering the dimensions of a transposing pattern gives longer bursts
+    tap = TensorAccessPattern((32, 64), 0, [64, 32], [1, 64])
+    assert minimize_bds([tap], shim)[0].contiguous_bytes == 4
+    transfers = minimize_bds([tap], shim, allow_reorder=True)
+    assert transfers[0].contiguous_bytes == 32 * 64 * 4
+    check_transfers([tap], transfers, shim, ordered=False)
+
+    # Merging consecutive transfers into one BD
+    tiles = TensorTiler2D.simple_tiler((64, 128), (64, 32))
+    transfers = minimize_bds(tiles, shim, merge_transfers=True)
+    assert len(transfers) == 1 and transfers[0].num_bds == 1
+    check_transfers(tiles, transfers, shim)
+    report = bd_report(transfers)
+    assert report.splitlines()[-1].split() == ["total", "4", "1", str(64 * 128 * 4)]
+
+    # Core tile limits, 2 byte elements
+    tiles = TensorTiler2D.group_tiler((256, 512), (16, 16), (2, 4))
+    transfers = minimize_bds(tiles, core, elem_bytes=2)
+    check_transfers(tiles, transfers, core, elem_bytes=2)
+
+    # Random patterns are reproduced by the BDs
+    rng = np.random.default_rng(0)
+    for limits in [shim, DmaBdLimits.mem_tile(), core]:
+        for _ in range(50):
+            ndims = rng.integers(1, 6)
+            sizes = [int(s) for s in rng.integers(1, 12, ndims)]
+            strides = [int(s) for s in rng.integers(0, 300, ndims)]
+            sizes[-1], strides[-1] = int(rng.integers(1, 600)), 1
+            tap = TensorAccessPattern((1 << 16,), 0, sizes, strides)
+            if tap._wraps():
+                continue
+            check_transfers([tap], minimize_bds([tap], limits), limits)
+
+    # Patterns the DMA can not transfer
+    for tap, elem_bytes in [
+        (TensorAccessPattern((64, 64), 0, [8], [3]), 2),
+        (TensorAccessPattern((64, 64), 0, [3], [1]), 2),
+    ]:
+        try:
+            minimize_bds([tap], shim, elem_bytes=elem_bytes)
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
+    # CHECK: Pass!
+    print("Pass!")
@@ -0,0 +1,295 @@
+import itertools
+import math
+
+import numpy as np
+
+from aie.helpers.taplib import (
+    DmaBdLimits,
+    TensorTiler2D,
+    TensorTilerND,
+    minimize_bds,
+)
+from util import construct_test
+
+# RUN: %python %s | FileCheck %s
+
+
+def reference_step_tiler(
+    tensor_dims,
+    tile_dims,
+    repeats,
+    steps,
+    tile_order,
+    group_order,
+    iter_order,
+    pattern_repeat=1,
+):
+    # The accesses of every group, enumerated element by element
+    index = np.arange(math.prod(tensor_dims)).reshape(tensor_dims)
+    num_groups = [
+        tensor // (tile * repeat * step) * step
+        for tensor, tile, repeat, step in zip(tensor_dims, tile_dims, repeats, steps)
+    ]
+    groups = []
+    for iter_idx in itertools.product(*[range(num_groups[d]) for d in iter_order]):
+        group = dict(zip(iter_order, iter_idx))
+        accesses = []
+        for tile_idx in itertools.product(*[range(repeats[d]) for d in group_order]):
+            tile = dict(zip(group_order, tile_idx))
+            for elem_idx in itertools.product(
+                *[range(tile_dims[d]) for d in tile_order]
+            ):
+                elem = dict(zip(tile_order, elem_idx))
+                coords = []
+                for d in range(len(tensor_dims)):
+                    g = group[d]
+                    first = (g // steps[d]) * repeats[d] * steps[d] + g % steps[d]
+                    coords.append((first + tile[d] * steps[d]) * tile_dims[d] + elem[d])
+                accesses.append(int(index[tuple(coords)]))
+        groups.append(accesses * pattern_repeat)
+    return groups
+
+
+def check_against_reference(tas, reference):
+    assert len(tas) == len(reference)
+    for tap, accesses in zip(tas, reference):
+        assert list(tap.access_generator()) == accesses
+
+
+# CHECK-LABEL: tensor_tiler_nd
+@construct_test
+def tensor_tiler_nd():
+    # Simple tiles of 3D and 4D tensors in every order
+    for tensor_dims, tile_dims in [
+        ((4, 6, 8), (2, 3, 4)),
+        ((2, 4, 4, 6), (1, 2, 4, 3)),
+    ]:
+        n = len(tensor_dims)
+        ones = (1,) * n
+        for tile_order in [range(n), reversed(range(n))]:
+            for iter_order in [range(n), reversed(range(n))]:
+                tile_order, iter_order = list(tile_order), list(iter_order)
+                tas = TensorTilerND.simple_tiler(
+                    tensor_dims,
+                    tile_dims,
+                    tile_dim_order=tile_order,
+                    iter_dim_order=iter_order,
+                )
+                check_against_reference(
+                    tas,
+                    reference_step_tiler(
+                        tensor_dims,
+                        tile_dims,
+                        ones,
+                        ones,
+                        tile_order,
+                        list(range(n)),
+                        iter_order,
+                    ),
+                )
+                assert tas.covers() and not tas.has_overlaps()
+
+    # Groups with steps and pattern repeats of a rank 3 tensor
+    tensor_dims, tile_dims = (4, 8, 12), (2, 8, 3)
+    repeats, steps = (2, 1, 2), (1, 1, 2)
+    for group_order, pattern_repeat in [([0, 1, 2], 1), ([2, 0, 1], 2)]:
+        tas = TensorTilerND.step_tiler(
+            tensor_dims,
+            tile_dims,
+            repeats,
+            steps,
+            tile_group_dim_order=group_order,
+            pattern_repeat=pattern_repeat,
+        )
+        assert all(len(tap.sizes) <= 4 for tap in tas)
+        check_against_reference(
+            tas,
+            reference_step_tiler(
+                tensor_dims,
+                tile_dims,
+                repeats,
+                steps,
+                [0, 1, 2],
+                group_order,
+                [0, 1, 2],
+                pattern_repeat=pattern_repeat,
+            ),
+        )
+    assert (tas.access_count() == 2).all()
+
+    # Patterns that need more than the 4 dimensions of a DMA transfer
+    for group_order, pattern_repeat, tile_dim_order in [
+        ([0, 1, 2], 2, None),
+        ([0, 1, 2], 1, [1, 2, 0]),
+    ]:
+        try:
+            TensorTilerND.step_tiler(
+                tensor_dims,
+                tile_dims,
+                repeats,
+                steps,
+                tile_group_dim_order=group_order,
+                tile_dim_order=tile_dim_order,
+                pattern_repeat=pattern_repeat,
+            )
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
+    # Dimensions merge into few sizes and strides
+    tas = TensorTilerND.simple_tiler((8, 16, 32), (2, 16, 32))
+    assert tas[1].sizes == [1024] and tas[1].strides == [1]
+    assert tas[1].offset == 1024
+
+    # The same tilings as the TensorTiler2D
+    for tile_col_major, group_col_major, iter_col_major in itertools.product(
+        [False, True], repeat=3
+    ):
+        col_major = lambda b: [1, 0] if b else [0, 1]
+        kwargs_2d = dict(
+            tile_col_major=tile_col_major,
+            tile_group_col_major=group_col_major,
+            iter_col_major=iter_col_major,
+        )
+        kwargs_nd = dict(
+            tile_dim_order=col_major(tile_col_major),
+            tile_group_dim_order=col_major(group_col_major),
+            iter_dim_order=col_major(iter_col_major),
+        )
+        for args in [
+            ((16, 24), (4, 6), (2, 2)),
+            ((16, 24), (2, 3), (2, 4), (2, 2)),
+        ]:
+            if len(args) == 3:
+                tas_2d = TensorTiler2D.group_tiler(*args, **kwargs_2d)
+                tas_nd = TensorTilerND.group_tiler(*args, **kwargs_nd)
+            else:
+                tas_2d = TensorTiler2D.step_tiler(*args, **kwargs_2d)
+                tas_nd = TensorTilerND.step_tiler(*args, **kwargs_nd)
+            assert tas_2d.compare_access_orders(tas_nd)
+            for t2d, tnd in zip(tas_2d, tas_nd):
+                assert list(t2d.access_generator()) == list(tnd.access_generator())
+
+    # Partial groups
+    tas_2d = TensorTiler2D.group_tiler((12, 20), (2, 4), (4, 2), allow_partial=True)
+    tas_nd = TensorTilerND.group_tiler((12, 20), (2, 4), (4, 2), allow_partial=True)
+    assert tas_2d.compare_access_orders(tas_nd)
+    # Partial step groups, also with steps larger than the number of tiles
+    for args in [
+        ((12, 20), (2, 4), (4, 2), (1, 2)),
+        ((4, 8), (1, 4), (1, 3), (2, 3)),
+        ((6, 12), (2, 2), (3, 2), (4, 5)),
+    ]:
+        tas_2d = TensorTiler2D.step_tiler(*args, allow_partial=True)
+        tas_nd = TensorTilerND.step_tiler(*args, allow_partial=True)
+        assert len(tas_2d) == len(tas_nd)
+        for t2d, tnd in zip(tas_2d, tas_nd):
+            assert list(t2d.access_generator()) == list(tnd.access_generator())
+    tas = TensorTilerND.step_tiler(
+        (6, 10, 6), (1, 2, 3), (4, 2, 1), (1, 2, 1), allow_partial=True
+    )
+    assert tas.covers() and not tas.has_overlaps()
+
+    for bad_args in [
+        dict(tensor_dims=(4, 6, 8), tile_dims=(2, 4, 4)),
+        dict(tensor_dims=(4, 6, 8), tile_dims=(2, 3)),
+        dict(tensor_dims=(4, 6, 8), tile_dims=(2, 3, 4), tile_dim_order=[0, 0, 1]),
+        dict(tensor_dims=(4, 6, 8), tile_dims=(2, 3, 4), tile_group_dims=(3, 1, 1)),
+    ]:
+        try:
+            TensorTilerND.group_tiler(**bad_args)
+            assert False, f"Expected ValueError for {bad_args}"
+        except ValueError:
+            pass
+
+    # CHECK: Pass!
+    print("Pass!")
+
+
+# CHECK-LABEL: tensor_tiler_nd_search
+@construct_test
+def tensor_tiler_nd_search():
+    def brute_force(tensor_dims, elem_bytes, budget, multiples, max_burst):
+        # The best tile by enumerating the accesses of every candidate
+        best, best_score = None, None
+        for tile_dims in itertools.product(
+            *[
+                [t for t in range(m, d + 1, m) if d % t == 0]
+                for d, m in zip(tensor_dims, multiples)
+            ]
+        ):
+            if 2 * math.prod(tile_dims) * elem_bytes > budget:
+                continue
+            accesses = list(
+                TensorTilerND.simple_tiler(tensor_dims, tile_dims)[0].access_generator()
+            )
+            run = 1
+            while run < len(accesses) and accesses[run] == accesses[run - 1] + 1:
+                run += 1
+            burst = run * elem_bytes
+            if max_burst is not None:
+                burst = min(burst, max_burst)
+            score = (burst, math.prod(tile_dims), tile_dims)
+            if best_score is None or score > best_score:
+                best, best_score = tile_dims, score
+        return best
+
+    for tensor_dims, elem_bytes, budget, multiples, max_burst in [
+        ((16, 32, 24), 2, 2048, (1, 1, 1), None),
+        ((16, 32, 24), 4, 4096, (1, 2, 8), 64),
+        ((8, 6, 10, 12), 1, 600, (1, 1, 1, 4), None),
+        ((64, 48), 4, 1024, (1, 1), 256),
+    ]:
+        tile_dims = TensorTilerND.search_tile_dims(
+            tensor_dims,
+            elem_bytes,
+            budget_bytes=budget,
+            tile_multiples=multiples,
+            max_burst_bytes=max_burst,
+        )
+        assert tile_dims == brute_force(
+            tensor_dims, elem_bytes, budget, multiples, max_burst
+        )
+        tas = TensorTilerND.auto_tiler(
+            tensor_dims,
+            elem_bytes,
+            budget_bytes=budget,
+            tile_multiples=multiples,
+            max_burst_bytes=max_burst,
+        )
+        assert tas.covers() and not tas.has_overlaps()
+
+    class TargetModel:
+        def get_local_memory_size(self):
+            return 64 * 1024
+
+        def get_mem_tile_size(self):
+            return 512 * 1024
+
+    tm = TargetModel()
+    l1 = TensorTilerND.search_tile_dims((256, 256), 4, target_model=tm)
+    assert 2 * math.prod(l1) * 4 <= 64 * 1024
+    assert l1 == (32, 256)
+    l2 = TensorTilerND.search_tile_dims((256, 256), 4, target_model=tm, memory="L2")
+    assert l2 == (256, 256)
+
+    # Tiles transferred by a single core tile BD: rows of 509 words do not split into d0 and d1
+    core = DmaBdLimits.core_tile()
+    tensor_dims = (4, 4 * 509)
+    unlimited = TensorTilerND.search_tile_dims(tensor_dims, 4, budget_bytes=64 * 1024)
+    assert unlimited == (4, 4 * 509)
+    tile_dims = TensorTilerND.search_tile_dims(
+        tensor_dims, 4, budget_bytes=64 * 1024, limits=core
+    )
+    assert tile_dims != unlimited
+    tap = TensorTilerND.simple_tiler(tensor_dims, tile_dims)[0]
+    assert minimize_bds([tap], core)[0].num_bds == 1
+
+    try:
+        TensorTilerND.search_tile_dims((7, 7), 4, budget_bytes=4)
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+    # CHECK: Pass!
+    print("Pass!")
@@ -136,3 +136,138 @@ def tensor_tile_invalid():
 
     # CHECK: Pass!
     print("Pass!")
+
+
+# CHECK-LABEL: tensor_tile_accesses
+@construct_test
+def tensor_tile_accesses():
+    def reference_accesses(tensor_dims, offset, sizes, strides):
+        total_elems = np.prod(tensor_dims)
+        access_order = np.full(total_elems, -1)
+        access_count = np.zeros(total_elems)
+        for i, dims in enumerate(np.ndindex(*sizes)):
+            idx = (offset + np.dot(dims, strides)) % total_elems
+            access_order[idx] = i
+            access_count[idx] += 1
+        return access_order.reshape(tensor_dims), access_count.reshape(tensor_dims)
+
+    patterns = [
+        ((8, 16), 0, [8, 16], [16, 1]),
+        ((8, 16), 3, [4, 2, 4, 4], [2, 64, 16, 1]),
+        # Repeated accesses: the last one is reflected in the access order
+        ((8, 16), 5, [3, 4, 8], [0, 16, 1]),
+        ((8, 16), 100, [2, 16, 8], [1, 0, 16]),
+        # Wrap around the end of the tensor
+        ((4, 4), 10, [3, 4], [4, 1]),
+    ]
+    for tensor_dims, offset, sizes, strides in patterns:
+        expected_order, expected_count = reference_accesses(
+            tensor_dims, offset, sizes, strides
+        )
+        tap = TensorAccessPattern(tensor_dims, offset, sizes, strides)
+        for chunk_size in [1, 8, 1 << 20]:
+            tap._CHUNK_SIZE = chunk_size
+            tap._access_cache = None
+            access_order, access_count = tap.accesses()
+            assert (access_order == expected_order).all()
+            assert (access_count == expected_count).all()
+            assert (tap.access_order() == expected_order).all()
+            assert (tap.access_count() == expected_count).all()
+            assert list(tap.access_generator()) == [
+                (offset + np.dot(dims, strides)) % np.prod(tensor_dims)
+                for dims in np.ndindex(*sizes)
+            ]
+
+    # Small innermost dimensions are batched into chunks of the full chunk size
+    tap = TensorAccessPattern((8, 16), 0, [4, 32, 1], [32, 1, 1])
+    tap._CHUNK_SIZE = 8
+    assert [len(c) for c in tap._access_chunks()] == [8] * 16
+    assert (tap.access_count() == 1).all()
+
+    # The cached accesses can not be modified through the returned arrays
+    tap = TensorAccessPattern((8, 16), 0, [8, 16], [16, 1])
+    access_order = tap.access_order()
+    access_order[0, 0] = 42
+    assert tap.access_order()[0, 0] == 0
+
+    # The cache is invalidated if the pattern changes
+    tap._offset = 1
+    assert tap.access_order()[0, 0] == 127
+
+    # CHECK: Pass!
+    print("Pass!")
+
+
+# CHECK-LABEL: tensor_tile_symbolic
+@construct_test
+def tensor_tile_symbolic():
+    # Equivalent patterns are detected from their canonical forms
+    tile = TensorAccessPattern((8, 16), 4, sizes=[1, 2, 4, 8], strides=[0, 64, 16, 1])
+    assert tile.canonical_form() == (4, [8, 8], [16, 1])
+    assert tile.compare_access_orders(
+        TensorAccessPattern((8, 16), 4, sizes=[8, 8], strides=[16, 1])
+    )
+    assert not tile.compare_access_orders(
+        TensorAccessPattern((8, 16), 4, sizes=[8, 8], strides=[16, 2])
+    )
+    # Contiguous rows are one dimension; strides wrap around the tensor
+    assert TensorAccessPattern((8, 16), 0, [8, 16], [16, 1]).compare_access_orders(
+        TensorAccessPattern((8, 16), 0, [128], [1])
+    )
+    assert TensorAccessPattern((4, 4), 0, [2, 4], [16, 1]).compare_access_orders(
+        TensorAccessPattern((4, 4), 0, [8], [2 * 16 + 1])
+    ) == (
+        list(TensorAccessPattern((4, 4), 0, [2, 4], [16, 1]).access_generator())
+        == list(TensorAccessPattern((4, 4), 0, [8], [2 * 16 + 1]).access_generator())
+    )
+    # Tensors of different sizes
+    assert TensorAccessPattern((8, 16), 0, [4, 16], [16, 1]).compare_access_orders(
+        TensorAccessPattern((4, 32), 0, [64], [1])
+    )
+
+    # Huge patterns are compared without enumerating them
+    huge = TensorAccessPattern((1 << 20, 1 << 20), 0, [1 << 20, 1 << 20], [1 << 20, 1])
+    assert huge.compare_access_orders(
+        TensorAccessPattern((1 << 20, 1 << 20), 0, [1 << 10, 1 << 30], [1 << 30, 1])
+    )
+    tile_a = TensorAccessPattern((1 << 20, 1 << 20), 0, [1024, 1024], [1 << 20, 1])
+    tile_b = TensorAccessPattern((1 << 20, 1 << 20), 512, [1024, 1024], [1 << 20, 1])
+    tile_c = TensorAccessPattern((1 << 20, 1 << 20), 1024, [1024, 1024], [1 << 20, 1])
+    assert tile_a.overlaps(tile_b) and not tile_a.overlaps(tile_c)
+    assert huge.contains(tile_a) and not tile_a.contains(tile_b)
+
+    # Containment and overlap agree with the access counts
+    rng = np.random.default_rng(0)
+    tensor_dims = (6, 8)
+    taps = [
+        TensorAccessPattern((6, 8), 0, [6, 8], [8, 1]),
+        TensorAccessPattern((6, 8), 0, [3, 4], [16, 2]),
+        TensorAccessPattern((6, 8), 9, [2, 3], [8, 2]),
+        TensorAccessPattern((6, 8), 1, [2, 2, 3], [0, 8, 3]),
+        TensorAccessPattern((6, 8), 40, [4, 3], [3, 1]),
+    ]
+    for _ in range(60):
+        sizes = list(rng.integers(1, 5, size=rng.integers(1, 4)))
+        strides = list(rng.integers(0, 20, size=len(sizes)))
+        taps.append(
+            TensorAccessPattern(tensor_dims, int(rng.integers(0, 48)), sizes, strides)
+        )
+    for a in taps:
+        a_count = a.access_count()
+        for b in taps:
+            b_count = b.access_count()
+            assert a.contains(b) == (not np.any((b_count > 0) & (a_count == 0)))
+            assert a.overlaps(b) == np.any((a_count > 0) & (b_count > 0))
+            assert a.compare_access_orders(b) == (
+                list(a.access_generator()) == list(b.access_generator())
+            )
+
+    try:
+        tile.overlaps(TensorAccessPattern((16, 8), 4, sizes=[8, 8], strides=[16, 1]))
+        raise Exception("Should fail, different tensor dims")
+    except ValueError:
+        # Good
+        pass
+
+    # CHECK: Pass!
+    print("Pass!")
@@ -147,3 +147,57 @@ def tensor_tile_sequence_invalid():
 
     # CHECK: Pass!
     print("Pass!")
+
+
+# CHECK-LABEL: tensor_tile_sequence_coverage
+@construct_test
+def tensor_tile_sequence_coverage():
+    def brute_force(tas):
+        counts = [t.access_count() > 0 for t in tas]
+        covers = np.logical_or.reduce(counts).all()
+        has_overlaps = (np.sum(counts, axis=0) > 1).any()
+        return covers, has_overlaps
+
+    # 4x4 tiles of an 8x16 tensor
+    tiles = TensorAccessSequence(
+        (8, 16),
+        8,
+        sizes=[4, 4],
+        strides=[16, 1],
+        offset_fn=lambda step, _: (step // 4) * 64 + (step % 4) * 4,
+    )
+    assert tiles.covers() and not tiles.has_overlaps()
+    assert brute_force(tiles) == (True, False)
+
+    del tiles[5]
+    assert not tiles.covers() and not tiles.has_overlaps()
+    assert brute_force(tiles) == (False, False)
+
+    tiles.append(TensorAccessPattern((8, 16), 66, sizes=[4, 4], strides=[16, 1]))
+    assert not tiles.covers() and tiles.has_overlaps()
+    assert brute_force(tiles) == (False, True)
+
+    # Patterns that are not tiles: even and odd elements, repeated rows
+    evens = TensorAccessPattern((8, 16), 0, sizes=[2, 64], strides=[0, 2])
+    odds = TensorAccessPattern((8, 16), 1, sizes=[64], strides=[2])
+    tas = TensorAccessSequence.from_taps([evens, odds])
+    assert tas.covers() and not tas.has_overlaps()
+    assert brute_force(tas) == (True, False)
+    tas = TensorAccessSequence.from_taps(
+        [evens, TensorAccessPattern((8, 16), 3, sizes=[5, 7], strides=[11, 3])]
+    )
+    assert brute_force(tas) == (tas.covers(), tas.has_overlaps())
+
+    # Huge tensors are covered by tiles without enumerating them
+    n = 1 << 20
+    tiles = TensorAccessSequence(
+        (n, n),
+        4,
+        sizes=[n // 2, n // 2],
+        strides=[n, 1],
+        offset_fn=lambda step, _: (step // 2) * (n // 2) * n + (step % 2) * (n // 2),
+    )
+    assert tiles.covers() and not tiles.has_overlaps()
+
+    # CHECK: Pass!
+    print("Pass!")
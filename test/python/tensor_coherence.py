@@ -0,0 +1,74 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+
+import numpy as np
+
+from fake_runtime import FakeNPUTensor
+
+
+class CountingTensor(FakeNPUTensor):
+    """A tensor with a fake device that records the synced ranges."""
+
+    def __init__(self, shape_or_data, dtype=np.uint32, device="npu", **kwargs):
+        self.syncs = []
+        super().__init__(shape_or_data, dtype=dtype, device=device)
+
+    def _sync_to_device(self, size=None, offset=0):
+        super()._sync_to_device(size, offset)
+        self.syncs.append(("to", size, offset))
+
+    def _sync_from_device(self):
+        super()._sync_from_device()
+        self.syncs.append(("from",))
+
+
+def test_tensor_coherence():
+    """Test that syncs only happen when host and device copies diverge."""
+    t = CountingTensor.zeros((4, 8), dtype=np.int32)
+    t.to("npu")
+    assert t.syncs == [("to", None, 0)]
+
+    # Reads and writes on the host do not sync until the next kernel run
+    t.syncs.clear()
+    for i in range(4):
+        t[i, 2] = t[i, 2] + 1
+    assert t.syncs == []
+    # Only the written range is synced, and only once
+    t.to("npu")
+    t.to("npu")
+    assert t.syncs == [("to", 3 * 32 + 4, 8)]
+
+    # After the device wrote to the tensor, the first read syncs from device
+    t.syncs.clear()
+    t.mark_device_dirty()
+    assert t[0, 2] == 1
+    assert t[3, 2] == 1
+    assert np.array(t).shape == (4, 8)
+    assert t.syncs == [("from",)]
+
+    # A write after a device write first syncs the rest of the tensor
+    t.syncs.clear()
+    t.mark_device_dirty()
+    t[-1, -1] = 5
+    t.to("npu")
+    assert t.syncs == [("from",), ("to", 4, 31 * 4)]
+
+    # Writes that can not be tracked sync the whole tensor
+    t.syncs.clear()
+    t[t.data > 0] = 7
+    t.to("npu")
+    t.numpy()[0, 0] = 3
+    t.to("npu")
+    assert t.syncs == [("to", None, 0), ("to", None, 0)]
+
+    # Moving to the cpu and back
+    t.syncs.clear()
+    t.mark_device_dirty()
+    t.to("cpu")
+    t.to("npu")
+    assert t.syncs == [("from",)]
@@ -0,0 +1,78 @@
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+
+# RUN: %python %s | FileCheck %s
+
+"""
+Tests for the indexed trace queries of aie.utils.trace.TraceAnalysis.
+"""
+
+import os
+
+import numpy as np
+
+from aie.utils.trace import TraceAnalysis, get_cycles_summary
+
+PARSE_TRACE_DIR = os.path.join(os.path.dirname(__file__), "..", "parse-trace")
+
+
+def event(name, ts, ph, pid, tid):
+    return {"name": name, "ts": ts, "ph": ph, "pid": pid, "tid": tid, "args": {}}
+
+
+# CHECK-LABEL: golden_traces
+print("golden_traces")
+for test in ["test1", "test2"]:
+    path = os.path.join(PARSE_TRACE_DIR, test, "golden_json.txt")
+    analysis = TraceAnalysis(path)
+    for pid, (name, *cycles) in enumerate(get_cycles_summary(path)):
+        assert analysis.tile_names[pid] == name
+        assert analysis.kernel_cycles(pid).tolist() == cycles
+    # CHECK: test1 [72, 72, 72, 72]
+    # CHECK: test2 [109, 109, 109, 109]
+    print(test, analysis.kernel_cycles(0).tolist())
+
+# CHECK-LABEL: synthetic_trace
+print("synthetic_trace")
+events = [
+    {"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "core0"}},
+    {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "core1"}},
+]
+for pid, offset in [(0, 0), (1, 50)]:
+    for start in [0, 100]:
+        t = start + offset
+        events += [
+            event("INSTR_EVENT_0", t, "B", pid, 0),
+            event("INSTR_EVENT_0", t + 1, "E", pid, 0),
+            event("LOCK_STALL", t + 10, "B", pid, 1),
+            event("LOCK_STALL", t + 30, "E", pid, 1),
+            event("INSTR_EVENT_1", t + 80, "B", pid, 2),
+            event("INSTR_EVENT_1", t + 81, "E", pid, 2),
+        ]
+events.append(event("DMA_S2MM_0_STALLED_LOCK", 190, "B", 1, 3))
+analysis = TraceAnalysis(events)
+
+# CHECK: [80 80]
+print(analysis.kernel_cycles(0))
+# CHECK: [0 2 0]
+print(analysis.latency_histogram(1, bins=3, start="INSTR_EVENT_0")[0])
+# CHECK: [ 10 110]
+print(analysis.timestamps(0, "LOCK_STALL"))
+# CHECK: {'INSTR_EVENT_0': 2, 'INSTR_EVENT_1': 2, 'LOCK_STALL': 40}
+print(analysis.state_cycles(0))
+# CHECK: {'lock': 0.2, 'dma': 0.0, 'stream': 0.0, 'memory': 0.0}
+print(analysis.stall_fractions(0, window=(0, 200)))
+# The DMA stall of core1 is still active at the end of the trace
+# CHECK: {'lock': 0.3, 'dma': 0.1, 'stream': 0.0, 'memory': 0.0}
+print(analysis.stall_fractions(1, window=(100, 200)))
+# CHECK: 90
+print(analysis.overlap(0, 1))
+assert np.array_equal(analysis.overlap_matrix(), [[160, 90], [90, 160]])
+# CHECK: pid  tile   invocations  first  min  avg     max  lock_stall
+# CHECK: 0    core0  2            80     80   80.000  80   0.221       0.000
+# CHECK: 1    core1  2            80     80   80.000  80   0.448       0.227
+print(analysis.format_summary())
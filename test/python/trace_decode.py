@@ -0,0 +1,242 @@
+#
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+
+# RUN: %python %s | FileCheck %s
+
+"""
+Tests for the array based trace decoder in aie.utils.trace.utils.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from aie.utils.trace import (
+    TraceConfig,
+    TraceEventStore,
+    get_cycles_summary,
+    get_vector_time,
+    iter_trace_events,
+    parse_trace,
+)
+from aie.utils.trace.utils import (
+    TRACE_COMMAND_DTYPE,
+    CMD_MULTIPLE1,
+    CMD_SINGLE0,
+    convert_to_byte_stream,
+    convert_to_commands,
+    convert_words_to_byte_stream,
+    decode_trace_commands,
+    read_trace_words,
+    trace_pkts_de_interleave,
+    trace_words_de_interleave,
+    trim_trace_pkts,
+    trim_trace_words,
+    write_trace_words,
+)
+from aie.utils.trace.parse import (
+    INSTS_COL_SHIFT,
+    INSTS_ROW_SHIFT,
+    load_trace_event_config,
+    mlir_trace_event_writes,
+    parse_mlir_trace_events,
+    trace_event_sidecar_path,
+    write_trace_event_sidecar,
+)
+
+PARSE_TRACE_DIR = os.path.join(os.path.dirname(__file__), "..", "parse-trace")
+
+
+# CHECK-LABEL: decode_single_commands
+print("decode_single_commands")
+stream = [
+    0xF0, 0, 0, 0, 0, 0, 0x01, 0x02,  # Start, timer 0x102
+    0x35,  # Single0, event 3, 5 cycles
+    0x86, 0x10,  # Single1, event 1, 0x210 cycles
+    0xE3,  # Repeat0, 3 repeats
+    0xD1, 0x0D, 0x07,  # Multiple1, events 0b01000011, 0x107 cycles
+    0xFE,  # padding
+    0xFF,  # Event_Sync
+    0xA0, 0x01,  # Single2, truncated
+]  # fmt: skip
+commands = decode_trace_commands(stream, zero=False)
+assert commands.dtype == TRACE_COMMAND_DTYPE
+# CHECK: 6
+print(len(commands))
+assert commands["timer"][0] == 0x102
+assert commands["type"][1] == CMD_SINGLE0
+assert commands["events"][1] == 1 << 3 and commands["cycles"][1] == 5
+assert commands["type"][4] == CMD_MULTIPLE1
+assert commands["events"][4] == 0b01000011 and commands["cycles"][4] == 0x107
+# CHECK: {'type': 'Start', 'timer_value': 258}
+# CHECK: {'type': 'Single0', 'event': 3, 'cycles': 5}
+# CHECK: {'type': 'Single1', 'event': 1, 'cycles': 528}
+# CHECK: {'type': 'Repeat0', 'repeats': 3}
+# CHECK: {'type': 'Multiple1', 'cycles': 263, 'event0': 0, 'event1': 1, 'event6': 6}
+# CHECK: {'type': 'Event_Sync'}
+for c in convert_to_commands([{"2,0": stream}, {}, {}, {}], False)[0]["2,0"]:
+    print(c)
+
+# CHECK-LABEL: words_match_hex_strings
+print("words_match_hex_strings")
+for test in ["test1", "test2"]:
+    path = os.path.join(PARSE_TRACE_DIR, test, f"trace_{test}.txt")
+    with open(path, "r") as f:
+        trace_pkts = f.read().split("\n")
+    words = np.array([int(p, 16) for p in trace_pkts if p], dtype=np.uint32)
+
+    str_bytes = convert_to_byte_stream(
+        trace_pkts_de_interleave(trim_trace_pkts(trace_pkts))
+    )
+    word_bytes = convert_words_to_byte_stream(
+        trace_words_de_interleave(trim_trace_words(words))
+    )
+    for str_dict, word_dict in zip(str_bytes, word_bytes):
+        assert list(str_dict) == list(word_dict)
+        for loc in str_dict:
+            assert str_dict[loc] == word_dict[loc].tolist()
+
+    from_lists = convert_to_commands(str_bytes, False)
+    from_arrays = convert_to_commands(word_bytes, False)
+    assert from_lists == from_arrays
+    # CHECK: test1 Pass!
+    # CHECK: test2 Pass!
+    print(test, "Pass!")
+
+# CHECK-LABEL: binary_trace_files
+print("binary_trace_files")
+path = os.path.join(PARSE_TRACE_DIR, "test1", "trace_test1.txt")
+words = read_trace_words(path)
+with tempfile.TemporaryDirectory() as tmpdir:
+    for ext in [".bin", ".npy", ".txt"]:
+        out = os.path.join(tmpdir, "trace" + ext)
+        write_trace_words(out, words)
+        read_back = read_trace_words(out)
+        expected = words[words != 0] if ext == ".txt" else np.trim_zeros(words, "b")
+        assert np.array_equal(read_back, expected)
+        # CHECK: .bin memmap
+        # CHECK: .npy memmap
+        # CHECK: .txt ndarray
+        print(ext, type(read_back).__name__)
+        del read_back
+    # TraceConfig writes binary traces by default
+    config = TraceConfig(trace_size=words.nbytes)
+    assert config.trace_file == "trace.bin"
+    config.trace_file = os.path.join(tmpdir, config.trace_file)
+    config.write_trace(words)
+    read_back = config.read_trace()
+    assert np.array_equal(read_back, np.trim_zeros(words, "b"))
+    del read_back
+
+# CHECK-LABEL: streaming_matches_parse_trace
+print("streaming_matches_parse_trace")
+for test in ["test1", "test2"]:
+    path = os.path.join(PARSE_TRACE_DIR, test, f"trace_{test}.txt")
+    with open(os.path.join(PARSE_TRACE_DIR, test, f"aie_{test}.mlir"), "r") as f:
+        mlir_module_str = f.read()
+    expected = parse_trace(read_trace_words(path), mlir_module_str)
+    for chunk_words in [8, 24, 1 << 16]:
+        streamed = list(iter_trace_events(path, mlir_module_str, None, chunk_words))
+        assert len(streamed) == len(expected)
+        # Events of each tile come out in the same order
+        for pid in {e["pid"] for e in expected}:
+            assert [e for e in streamed if e["pid"] == pid] == [
+                e for e in expected if e["pid"] == pid
+            ]
+    # CHECK: test1 Pass!
+    # CHECK: test2 Pass!
+    print(test, "Pass!")
+
+# CHECK-LABEL: parallel_matches_serial
+print("parallel_matches_serial")
+path = os.path.join(PARSE_TRACE_DIR, "test2", "trace_test2.txt")
+with open(os.path.join(PARSE_TRACE_DIR, "test2", "aie_test2.mlir"), "r") as f:
+    mlir_module_str = f.read()
+serial = parse_trace(read_trace_words(path), mlir_module_str, workers=1)
+parallel = parse_trace(read_trace_words(path), mlir_module_str, workers=2)
+num_metadata = sum(e["ph"] == "M" for e in serial)
+assert len({e["pid"] for e in serial[num_metadata:]}) > 1
+assert len(parallel) == len(serial)
+assert parallel[:num_metadata] == serial[:num_metadata]
+# Tile events are ordered by (pid, tid, ts), independent of the workers
+tile_order = lambda e: (e["pid"], e["tid"], e["ts"])
+assert parallel[num_metadata:] == sorted(serial[num_metadata:], key=tile_order)
+assert parse_trace(read_trace_words(path), mlir_module_str, workers=3) == parallel
+# CHECK: test2 Pass!
+print("test2", "Pass!")
+
+# CHECK-LABEL: columnar_event_store
+print("columnar_event_store")
+for test in ["test1", "test2"]:
+    path = os.path.join(PARSE_TRACE_DIR, test, f"trace_{test}.txt")
+    with open(os.path.join(PARSE_TRACE_DIR, test, f"aie_{test}.mlir"), "r") as f:
+        mlir_module_str = f.read()
+    expected = parse_trace(read_trace_words(path), mlir_module_str)
+    store = parse_trace(read_trace_words(path), mlir_module_str, columnar=True)
+    assert isinstance(store, TraceEventStore)
+    assert list(store) == expected
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store.to_npz(os.path.join(tmpdir, "trace.npz"))
+        assert list(TraceEventStore.from_npz(os.path.join(tmpdir, "trace.npz"))) == (
+            expected
+        )
+        store.to_json(os.path.join(tmpdir, "trace.json"))
+        from_json = TraceEventStore.from_json(os.path.join(tmpdir, "trace.json"))
+        assert list(from_json) == expected
+        assert get_cycles_summary(store) == get_cycles_summary(expected)
+        assert get_vector_time(store) == get_vector_time(expected)
+    # CHECK: test1 Pass!
+    # CHECK: test2 Pass!
+    print(test, "Pass!")
+
+# CHECK-LABEL: vector_time_queries
+print("vector_time_queries")
+events = [{"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "core"}}]
+for name, ts, ph in [
+    ("INSTR_EVENT_0", 10, "B"),
+    ("INSTR_VECTOR", 12, "E"),  # no matching begin
+    ("INSTR_VECTOR", 14, "B"),
+    ("INSTR_VECTOR", 20, "E"),
+    ("INSTR_EVENT_0", 30, "B"),
+    ("INSTR_EVENT_1", 40, "B"),
+    ("INSTR_VECTOR", 44, "B"),
+    ("INSTR_VECTOR", 50, "E"),
+    ("INSTR_VECTOR", 60, "B"),  # no matching end
+    ("INSTR_EVENT_1", 70, "B"),
+]:
+    events.append({"name": name, "ts": ts, "ph": ph, "pid": 0, "tid": 0, "args": {}})
+store = TraceEventStore.from_events(events)
+# CHECK: [['core', 30]]
+print(get_cycles_summary(store))
+# CHECK: 0.15
+print(get_vector_time(store))
+
+# CHECK-LABEL: trace_event_config_sources
+print("trace_event_config_sources")
+for test in ["test1", "test2"]:
+    with open(os.path.join(PARSE_TRACE_DIR, test, f"aie_{test}.mlir"), "r") as f:
+        mlir_module_str = f.read()
+    expected, _ = parse_mlir_trace_events(mlir_module_str)
+    _, writes = mlir_trace_event_writes(mlir_module_str)
+    # v0.1 instruction binary for npu2 holding only WRITE ops
+    words = [4 << 16 | 1 << 8, 0, len(writes), 16 + 24 * len(writes)]
+    for address, row, col, value in writes:
+        address |= col << INSTS_COL_SHIFT | row << INSTS_ROW_SHIFT
+        words += [0, 0, address, 0, value, 24]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        insts_path = os.path.join(tmpdir, "insts.bin")
+        np.array(words, dtype=np.uint32).tofile(insts_path)
+        from_insts, _ = load_trace_event_config(insts_path)
+        sidecar = trace_event_sidecar_path(insts_path)
+        assert write_trace_event_sidecar(mlir_module_str, sidecar)
+        from_sidecar, _ = load_trace_event_config(sidecar)
+    assert from_insts == expected
+    assert from_sidecar == expected
+    # CHECK: test1 Pass!
+    # CHECK: test2 Pass!
+    print(test, "Pass!")
@@ -0,0 +1,66 @@
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 AMD Inc.
+
+# RUN: %pytest %s
+# REQUIRES: xrt_python_bindings
+
+import gc
+
+import pytest
+
+from fake_runtime import FakeNPUTensor
+from fake_xrt import FakeXRTRuntime, make_kernel, patch_pyxrt
+
+
+class UploadCountingTensor(FakeNPUTensor):
+    uploads = 0
+
+    def __init__(self, shape_or_data, **kwargs):
+        super().__init__(shape_or_data, **kwargs)
+        self._mark_host_dirty()
+
+    def _sync_to_device(self, size=None, offset=0):
+        UploadCountingTensor.uploads += 1
+
+
+class FakeRuntime(FakeXRTRuntime):
+    _tensor_class = UploadCountingTensor
+
+
+@pytest.fixture
+def kernels(monkeypatch, tmp_path):
+    patch_pyxrt(monkeypatch)
+    UploadCountingTensor.uploads = 0
+    return lambda name, insts: make_kernel(tmp_path, name, insts)
+
+
+def test_repeated_runs_upload_insts_once(kernels):
+    runtime = FakeRuntime()
+    handle = runtime.load(kernels("k0", [1, 2, 3]))
+    assert UploadCountingTensor.uploads == 1
+    out = UploadCountingTensor((4,))
+    for _ in range(5):
+        runtime.run(handle, [out])
+    # Only the output is uploaded, the first time
+    assert UploadCountingTensor.uploads == 2
+
+
+def test_identical_insts_are_shared(kernels):
+    runtime = FakeRuntime()
+    h0 = runtime.load(kernels("k0", [1, 2, 3]))
+    h1 = runtime.load(kernels("k1", [1, 2, 3]))
+    h2 = runtime.load(kernels("k2", [4, 5, 6]))
+    assert h0.insts_bo is h1.insts_bo
+    assert h0.insts_bo is not h2.insts_bo
+    assert UploadCountingTensor.uploads == 2
+
+    h0.release()
+    assert len(runtime._insts_bos) == 2
+    del h1
+    gc.collect()
+    assert len(runtime._insts_bos) == 1
+    h2.release()
+    assert runtime._insts_bos == {}
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# This file is licensed under the Apache License v2.0 with LLVM Exceptions.
+# See https://llvm.org/LICENSE.txt for license information.
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# (c) Copyright 2026 Advanced Micro Devices, Inc.
+"""
+Measure how parse_trace scales with the number of worker processes.
+
+A synthetic trace is generated for a whole-array npu2 design where every
+compute tile (8 columns x 4 rows = 32 tiles) is traced, together with the
+MLIR module holding the matching trace event configuration. The trace is
+then parsed with an increasing number of workers.
+
+Example:
+    python utils/trace_parse_benchmark.py --words-per-tile 65536 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from aie.utils.trace import parse_trace
+
+COLS = 8
+ROWS = range(2, 6)
+CORE_EVENTS_0 = 0x4B222125
+CORE_EVENTS_1 = 0x2D2C1A4F
+
+
+def make_header(col, row, pkt_type, pkt_id):
+    hdr = (col << 21) | (row << 16) | (pkt_type << 12) | pkt_id
+    if hdr.bit_count() % 2 == 0:
+        hdr |= 1 << 31  # headers have odd parity
+    return hdr
+
+
+def make_tile_bytes(rng, num_bytes):
+    """Start command followed by random 2-byte command pairs.
+
+    Each pair is a Single1, a Multiple0 or two Single0 commands.
+    """
+    kinds = rng.integers(0, 3, size=num_bytes // 2)
+    first = np.select(
+        [kinds == 0, kinds == 1],
+        [
+            0x80 | rng.integers(0, 0x20, kinds.size),
+            0xC0 | rng.integers(0, 16, kinds.size),
+        ],
+        rng.integers(0, 0x80, kinds.size),
+    )
+    second = np.where(
+        kinds == 2,
+        rng.integers(0, 0x80, kinds.size),
+        rng.integers(0, 256, kinds.size),
+    )
+    data = np.stack((first, second), axis=1).reshape(-1).astype(np.uint8)
+    data[:8] = [0xF0, 0, 0, 0, 0, 0, 0, 0]
+    return data[:num_bytes].view(">u4").astype(np.uint32)
+
+
+def make_trace(words_per_tile, seed=0):
+    """Interleave 7-word packets of every tile round robin, like the shim DMA."""
+    rng = np.random.default_rng(seed)
+    tiles = [(col, row) for col in range(COLS) for row in ROWS]
+    num_pkts = words_per_tile // 7
+    packets = np.zeros((num_pkts, len(tiles), 8), dtype=np.uint32)
+    for i, (col, row) in enumerate(tiles):
+        payload = make_tile_bytes(rng, num_pkts * 7 * 4)
+        packets[:, i, 0] = make_header(col, row, 0, i % 31 + 1)
+        packets[:, i, 1:] = payload.reshape(num_pkts, 7)
+    return packets.reshape(-1)
+
+
+def make_mlir():
+    tiles = "\n".join(
+        f"    %tile_{col}_{row} = aie.tile({col}, {row})"
+        for col in range(COLS)
+        for row in ROWS
+    )
+    writes = "\n".join(
+        f"      aiex.npu.write32 {{address = {addr} : ui32, column = {col} : i32, "
+        f"row = {row} : i32, value = {value} : ui32}}"
+        for col in range(COLS)
+        for row in ROWS
+        for addr, value in ((0x340E0, CORE_EVENTS_0), (0x340E4, CORE_EVENTS_1))
+    )
+    return f"""module {{
+  aie.device(npu2) {{
+{tiles}
+    aie.runtime_sequence @sequence() {{
+{writes}
+    }}
+  }}
+}}
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--words-per-tile",
+        type=int,
+        default=1 << 12,
+        help="Trace words generated for each of the 32 tiles",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Worker counts to measure",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per worker count")
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Collect the events in a TraceEventStore instead of a list of dicts",
+    )
+    args = parser.parse_args()
+
+    trace = make_trace(args.words_per_tile)
+    mlir_module_str = make_mlir()
+    print(
+        f"Synthetic trace: {COLS * len(ROWS)} tiles, {len(trace)} words "
+        f"({trace.nbytes / 2**20:.1f} MiB)"
+    )
+
+    print(f"{'workers':>8} {'best (s)':>10} {'speedup':>8} {'events':>10}")
+    baseline = None
+    for workers in args.workers:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            events = parse_trace(
+                trace, mlir_module_str, workers=workers, columnar=args.columnar
+            )
+            times.append(time.perf_counter() - start)
+        best = min(times)
+        baseline = baseline or best
+        print(f"{workers:>8} {best:>10.3f} {baseline / best:>7.2f}x {len(events):>10}")
+
+
+if __name__ == "__main__":
+    main()